@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+from typing import Any
 from typing import Optional
 import uuid
 
@@ -29,7 +30,7 @@ from .active_streaming_tool import ActiveStreamingTool
 from .base_agent import BaseAgent
 from .live_request_queue import LiveRequestQueue
 from .run_config import RunConfig
-from .transcription_entry import TranscriptionEntry
+from .transcription_cache import TranscriptionCache
 
 
 class LlmCallsLimitExceededError(Exception):
@@ -144,7 +145,7 @@ class InvocationContext(BaseModel):
   active_streaming_tools: Optional[dict[str, ActiveStreamingTool]] = None
   """The running streaming tools of this invocation."""
 
-  transcription_cache: Optional[list[TranscriptionEntry]] = None
+  transcription_cache: Optional[TranscriptionCache] = None
   """Caches necessary, data audio or contents, that are needed by transcription."""
 
   run_config: Optional[RunConfig] = None
@@ -155,6 +156,11 @@ class InvocationContext(BaseModel):
   of this invocation.
   """
 
+  _contents_caches: dict[tuple[Optional[str], str], Any] = {}
+  """The incrementally built LLM request contents of this invocation, keyed by
+  branch and agent name. Maintained by the contents request processor.
+  """
+
   def increment_llm_call_count(
       self,
   ):
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+from collections import deque
 from typing import Optional
 
 from google.genai import types
@@ -34,9 +35,22 @@ class LiveRequest(BaseModel):
 
 
 class LiveRequestQueue:
-  """Queue used to send LiveRequest in a live(bidirectional streaming) way."""
+  """Queue used to send LiveRequest in a live(bidirectional streaming) way.
 
-  def __init__(self):
+  The queue is unbounded by default. With a `max_size`, `send_async` waits
+  until the queue has room, so a fast client is slowed down to the pace at
+  which the requests are sent to the model. The sync send methods never wait,
+  so the agent itself can always send, e.g. function responses, even when the
+  queue is full.
+  """
+
+  def __init__(self, max_size: int = 0):
+    """Initializes the LiveRequestQueue.
+
+    Args:
+      max_size: The number of queued requests above which `send_async` waits.
+        0 never waits.
+    """
     # Ensure there's an event loop available in this thread
     try:
       asyncio.get_running_loop()
@@ -45,20 +59,97 @@ class LiveRequestQueue:
       loop = asyncio.new_event_loop()
       asyncio.set_event_loop(loop)
 
-    # Now create the queue (it will use the event loop we just ensured exists)
-    self._queue = asyncio.Queue()
+    self.max_size = max_size
+    self._requests: deque[LiveRequest] = deque()
+    # Now create the events (they will use the event loop we just ensured
+    # exists)
+    self._not_empty = asyncio.Event()
+    self._not_full = asyncio.Event()
+    self._not_full.set()
 
   def close(self):
-    self._queue.put_nowait(LiveRequest(close=True))
+    self.send(LiveRequest(close=True))
 
   def send_content(self, content: types.Content):
-    self._queue.put_nowait(LiveRequest(content=content))
+    self.send(LiveRequest(content=content))
 
   def send_realtime(self, blob: types.Blob):
-    self._queue.put_nowait(LiveRequest(blob=blob))
+    self.send(LiveRequest(blob=blob))
 
   def send(self, req: LiveRequest):
-    self._queue.put_nowait(req)
+    self._requests.append(req)
+    self._not_empty.set()
+    if self.full():
+      self._not_full.clear()
+
+  async def send_async(self, req: LiveRequest):
+    """Sends the request, after waiting for the queue to have room."""
+    while self.full():
+      await self._not_full.wait()
+    self.send(req)
+
+  def full(self) -> bool:
+    """Whether `send_async` would wait."""
+    return 0 < self.max_size <= len(self._requests)
+
+  def qsize(self) -> int:
+    """The number of queued requests."""
+    return len(self._requests)
 
   async def get(self) -> LiveRequest:
-    return await self._queue.get()
+    while not self._requests:
+      self._not_empty.clear()
+      await self._not_empty.wait()
+    req = self._requests.popleft()
+    if not self.full():
+      self._not_full.set()
+    return req
+
+  async def get_batch(self, max_blob_bytes: int) -> LiveRequest:
+    """Gets the next request, merged with the queued PCM audio following it.
+
+    Consecutive realtime PCM audio blobs of the same mime type are joined into
+    one blob of at most `max_blob_bytes`, so a backlog of small audio chunks is
+    sent to the model in fewer, larger frames. Other requests are returned
+    as is.
+
+    Args:
+      max_blob_bytes: The maximum size of a joined blob.
+
+    Returns:
+      The next request.
+    """
+    req = await self.get()
+    if not _is_pcm_audio_request(req):
+      return req
+    chunks = [req.blob.data]
+    size = len(req.blob.data)
+    while self._requests:
+      next_req = self._requests[0]
+      if (
+          not _is_pcm_audio_request(next_req)
+          or next_req.blob.mime_type != req.blob.mime_type
+          or size + len(next_req.blob.data) > max_blob_bytes
+      ):
+        break
+      self._requests.popleft()
+      chunks.append(next_req.blob.data)
+      size += len(next_req.blob.data)
+    if len(chunks) == 1:
+      return req
+    if not self.full():
+      self._not_full.set()
+    return LiveRequest(
+        blob=types.Blob(mime_type=req.blob.mime_type, data=b''.join(chunks))
+    )
+
+
+def _is_pcm_audio_request(req: LiveRequest) -> bool:
+  # Raw PCM chunks can be concatenated, unlike e.g. encoded audio or images.
+  return (
+      req.blob is not None
+      and req.content is None
+      and not req.close
+      and req.blob.data is not None
+      and (req.blob.mime_type or '').startswith('audio/pcm')
+  )
@@ -20,6 +20,7 @@ from typing import Any, AsyncGenerator, Awaitable, Callable, Literal, Optional,
 from google.genai import types
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 from pydantic import field_validator
 from pydantic import model_validator
 from typing_extensions import override
@@ -39,6 +40,7 @@ from ..models.registry import LLMRegistry
 from ..planners.base_planner import BasePlanner
 from ..tools.base_tool import BaseTool
 from ..tools.function_tool import FunctionTool
+from ..tools.function_tool import ToolExecutionMode
 from ..tools.tool_context import ToolContext
 from .base_agent import BaseAgent
 from .callback_context import CallbackContext
@@ -164,6 +166,14 @@ class LlmAgent(BaseAgent):
   NOTE: to use model's built-in code executor, don't set this field, add
   `google.adk.tools.built_in_code_execution` to tools instead.
   """
+
+  tool_execution_mode: ToolExecutionMode = ToolExecutionMode.INLINE
+  """Where to run the synchronous functions of the agent's function tools.
+
+  Use THREAD for tools doing blocking I/O and PROCESS for CPU-bound tools, so
+  they don't block the event loop. A FunctionTool can override it with its own
+  `execution_mode`. The pool sizes are set in RunConfig.
+  """
   # Advance features - End
 
   # TODO: remove below fields after migration. - Start
@@ -220,6 +230,11 @@ class LlmAgent(BaseAgent):
   """
   # Callbacks - End
 
+  _canonical_tools_cache: tuple[tuple[ToolUnion, ...], list[BaseTool]] = (
+      PrivateAttr(default=((), []))
+  )
+  """The tools that canonical_tools was built from, and the result."""
+
   @override
   async def _run_async_impl(
       self, ctx: InvocationContext
@@ -247,7 +262,7 @@ class LlmAgent(BaseAgent):
     if isinstance(self.model, BaseLlm):
       return self.model
     elif self.model:  # model is non-empty str
-      return LLMRegistry.new_llm(self.model)
+      return LLMRegistry.get_llm(self.model)
     else:  # find model from ancestors.
       ancestor_agent = self.parent_agent
       while ancestor_agent is not None:
@@ -282,7 +297,20 @@ class LlmAgent(BaseAgent):
 
     This method is only for use by Agent Development Kit.
     """
-    return [_convert_tool_union_to_tool(tool) for tool in self.tools]
+    # The converted tools are reused, e.g. so that the function tools wrapping
+    # plain functions keep their cached declarations across LLM calls. They're
+    # rebuilt whenever self.tools was reassigned or changed in place.
+    cached_tools, canonical_tools = self._canonical_tools_cache
+    if len(cached_tools) != len(self.tools) or any(
+        cached_tool is not tool
+        for cached_tool, tool in zip(cached_tools, self.tools)
+    ):
+      cached_tools = tuple(self.tools)
+      canonical_tools = [
+          _convert_tool_union_to_tool(tool) for tool in cached_tools
+      ]
+      self._canonical_tools_cache = (cached_tools, canonical_tools)
+    return list(canonical_tools)
 
   @property
   def _llm_flow(self) -> BaseLlmFlow:
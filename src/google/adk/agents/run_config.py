@@ -21,6 +21,10 @@ from google.genai import types
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import field_validator
+from pydantic import ValidationInfo
+
+from .transcription_cache import BaseAudioTranscriber
+from .transcription_cache import DEFAULT_MAX_AUDIO_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +39,7 @@ class RunConfig(BaseModel):
   """Configs for runtime behavior of agents."""
 
   model_config = ConfigDict(
+      arbitrary_types_allowed=True,
       extra='forbid',
   )
 
@@ -47,6 +52,15 @@ class RunConfig(BaseModel):
   save_input_blobs_as_artifacts: bool = False
   """Whether or not to save the input blobs as artifacts."""
 
+  offload_inline_data_min_bytes: Optional[int] = None
+  """
+  The size from which the inline data of the events appended to the session,
+  e.g. live audio or uploaded images, is saved in the artifact service instead.
+  The events in the session then reference the artifacts, which are only
+  loaded when the contents of an LLM request are built. If not set, inline
+  data is stored in the session.
+  """
+
   support_cfc: bool = False
   """
   Whether to support CFC (Compositional Function Calling). Only applicable for
@@ -64,6 +78,55 @@ class RunConfig(BaseModel):
   output_audio_transcription: Optional[types.AudioTranscriptionConfig] = None
   """Output transcription for live agents with audio response."""
 
+  max_transcription_audio_seconds: Optional[float] = DEFAULT_MAX_AUDIO_SECONDS
+  """
+  The duration of the most recent user audio of a live invocation that is kept
+  to be transcribed into the history of the agent it's transferred to. None
+  keeps all the audio.
+  """
+
+  audio_transcriber: Optional[BaseAudioTranscriber] = None
+  """
+  Transcribes the user audio of a live invocation on agent transfer. If not
+  set, Cloud Speech-to-Text is used.
+  """
+
+  parallel_tool_calls: bool = False
+  """
+  Whether to run the function calls of one model response concurrently.
+
+  Only enable this if the tools called in the same turn are independent of each
+  other. The merged function response keeps the order of the function calls.
+  """
+
+  max_parallel_tool_calls: Optional[int] = None
+  """
+  The maximum number of function calls to run at the same time when
+  parallel_tool_calls is enabled. If not set, all calls run at once.
+  """
+
+  tool_call_timeout: Optional[float] = None
+  """
+  The timeout in seconds of a single tool call. If a tool doesn't finish in
+  time, it's cancelled and the model gets an error response instead.
+
+  Function tools running in ToolExecutionMode.THREAD or PROCESS can't be
+  stopped: the model gets the error response, but the function keeps running
+  in its worker until it returns.
+  """
+
+  tool_thread_pool_size: Optional[int] = None
+  """
+  The number of worker threads shared by function tools running in
+  ToolExecutionMode.THREAD. If not set, the ThreadPoolExecutor default is used.
+  """
+
+  tool_process_pool_size: Optional[int] = None
+  """
+  The number of worker processes shared by function tools running in
+  ToolExecutionMode.PROCESS. If not set, it's the number of CPUs.
+  """
+
   max_llm_calls: int = 500
   """
   A limit on the total number of llm calls for a given run.
@@ -74,6 +137,30 @@ class RunConfig(BaseModel):
     - Less than or equal to 0: This allows for unbounded number of llm calls.
   """
 
+  @field_validator(
+      'max_parallel_tool_calls',
+      'tool_thread_pool_size',
+      'tool_process_pool_size',
+      'offload_inline_data_min_bytes',
+      mode='after',
+  )
+  @classmethod
+  def validate_positive_int(
+      cls, value: Optional[int], info: ValidationInfo
+  ) -> Optional[int]:
+    if value is not None and value <= 0:
+      raise ValueError(f'{info.field_name} should be greater than 0.')
+    return value
+
+  @field_validator('max_transcription_audio_seconds', mode='after')
+  @classmethod
+  def validate_positive_float(
+      cls, value: Optional[float], info: ValidationInfo
+  ) -> Optional[float]:
+    if value is not None and value <= 0:
+      raise ValueError(f'{info.field_name} should be greater than 0.')
+    return value
+
   @field_validator('max_llm_calls', mode='after')
   @classmethod
   def validate_max_llm_calls(cls, value: int) -> int:
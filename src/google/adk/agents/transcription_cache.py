@@ -0,0 +1,216 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import abc
+import asyncio
+from collections import deque
+import dataclasses
+import math
+import re
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from google.genai import types
+
+from .transcription_entry import TranscriptionEntry
+
+DEFAULT_MAX_AUDIO_SECONDS = 300.0
+"""The default duration of user audio kept, the limit of a streaming
+recognition of Cloud Speech-to-Text."""
+
+_DEFAULT_SAMPLE_RATE_HERTZ = 16000
+
+# The bytes per sample of the 16-bit PCM audio sent to live models.
+_SAMPLE_WIDTH = 2
+
+
+@dataclasses.dataclass
+class TranscriptionSegment:
+  """Consecutive data of one role in a transcription cache."""
+
+  role: str
+  """The role that created this data, typically "user" or "model"."""
+
+  data: Union[bytearray, types.Content]
+  """The joined PCM audio, or a content that doesn't need transcription."""
+
+  mime_type: Optional[str] = None
+  """The mime type of the audio."""
+
+  @property
+  def sample_rate_hertz(self) -> int:
+    """The sample rate of the audio, from its mime type."""
+    match = re.search(r'rate=(\d+)', self.mime_type or '')
+    return int(match.group(1)) if match else _DEFAULT_SAMPLE_RATE_HERTZ
+
+  @property
+  def audio_seconds(self) -> float:
+    """The duration of the audio, 0 for a content."""
+    if not isinstance(self.data, bytearray):
+      return 0.0
+    return len(self.data) / (self.sample_rate_hertz * _SAMPLE_WIDTH)
+
+
+class TranscriptionCache:
+  """The user audio and model contents of a live invocation, in order.
+
+  They are transcribed into the conversation history sent to the model of the
+  next agent on an agent transfer. Consecutive audio of a speaker is appended
+  to one growing buffer, so joining the chunks is linear in the audio size.
+  Once the audio is longer than `max_audio_seconds`, the oldest data is
+  dropped, so the cache and the transcription latency stay bounded on long
+  calls.
+  """
+
+  def __init__(
+      self, max_audio_seconds: Optional[float] = DEFAULT_MAX_AUDIO_SECONDS
+  ):
+    """Initializes the TranscriptionCache.
+
+    Args:
+      max_audio_seconds: The duration of the most recent audio kept. None keeps
+        all the audio.
+    """
+    self.max_audio_seconds = max_audio_seconds
+    self._segments: deque[TranscriptionSegment] = deque()
+    self._audio_seconds = 0.0
+
+  @property
+  def audio_seconds(self) -> float:
+    """The duration of the audio in the cache."""
+    return self._audio_seconds
+
+  def __len__(self) -> int:
+    return len(self._segments)
+
+  def __iter__(self) -> Iterator[TranscriptionSegment]:
+    return iter(self._segments)
+
+  def append(self, entry: TranscriptionEntry):
+    """Appends an audio blob or a content."""
+    if isinstance(entry.data, types.Content):
+      self._segments.append(
+          TranscriptionSegment(role=entry.role, data=entry.data)
+      )
+      return
+    if not entry.data.data:
+      return
+    last_segment = self._segments[-1] if self._segments else None
+    if (
+        last_segment is not None
+        and last_segment.role == entry.role
+        and last_segment.mime_type == entry.data.mime_type
+        and isinstance(last_segment.data, bytearray)
+    ):
+      segment = last_segment
+      added_seconds = -segment.audio_seconds
+      segment.data += entry.data.data
+    else:
+      segment = TranscriptionSegment(
+          role=entry.role,
+          data=bytearray(entry.data.data),
+          mime_type=entry.data.mime_type,
+      )
+      self._segments.append(segment)
+      added_seconds = 0.0
+    self._audio_seconds += added_seconds + segment.audio_seconds
+    self._evict()
+
+  def clear(self):
+    self._segments.clear()
+    self._audio_seconds = 0.0
+
+  def _evict(self):
+    """Drops the oldest data until the audio fits in max_audio_seconds."""
+    if self.max_audio_seconds is None:
+      return
+    while self._segments and self._audio_seconds > self.max_audio_seconds:
+      segment = self._segments[0]
+      excess_seconds = self._audio_seconds - self.max_audio_seconds
+      if segment.audio_seconds <= excess_seconds:
+        # Also drops the contents older than the kept audio.
+        self._segments.popleft()
+        self._audio_seconds -= segment.audio_seconds
+        continue
+      # Drops the beginning of the oldest audio, in whole samples. Deleting
+      # from the start of a bytearray doesn't move the rest of it.
+      bytes_per_second = segment.sample_rate_hertz * _SAMPLE_WIDTH
+      excess_bytes = math.ceil(excess_seconds * bytes_per_second)
+      excess_bytes += excess_bytes % _SAMPLE_WIDTH
+      del segment.data[:excess_bytes]
+      self._audio_seconds -= excess_bytes / bytes_per_second
+      return
+
+
+class BaseAudioTranscriber(abc.ABC):
+  """Transcribes the user audio of a transcription cache.
+
+  Set it in `RunConfig.audio_transcriber` to replace the default Cloud
+  Speech-to-Text transcriber.
+  """
+
+  @abc.abstractmethod
+  async def transcribe_audio(
+      self, audio: Union[bytes, bytearray], sample_rate_hertz: int
+  ) -> list[str]:
+    """Transcribes 16-bit mono PCM audio.
+
+    It's called on the event loop, so blocking work must run in a thread or in
+    another process.
+
+    Args:
+      audio: The audio. It isn't modified while it's being transcribed.
+      sample_rate_hertz: The sample rate of the audio.
+
+    Returns:
+      The transcripts of the consecutive parts of the audio.
+    """
+
+  async def transcribe(
+      self, transcription_cache: TranscriptionCache
+  ) -> list[types.Content]:
+    """Transcribes the cache into contents, keeping the order of speakers.
+
+    The audio segments are transcribed concurrently.
+
+    Args:
+      transcription_cache: The cache to transcribe. It must not be appended to
+        during the transcription.
+
+    Returns:
+      The contents of the transcripts of the user audio, and the cached
+      contents.
+    """
+    segments = list(transcription_cache)
+    transcripts = await asyncio.gather(*[
+        self.transcribe_audio(segment.data, segment.sample_rate_hertz)
+        for segment in segments
+        if isinstance(segment.data, bytearray)
+    ])
+    transcripts_iter = iter(transcripts)
+    contents = []
+    for segment in segments:
+      if isinstance(segment.data, types.Content):
+        contents.append(segment.data)
+        continue
+      for transcript in next(transcripts_iter):
+        contents.append(
+            types.Content(
+                role=segment.role.lower(), parts=[types.Part(text=transcript)]
+            )
+        )
+    return contents
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from fastapi.openapi.models import OAuth2
@@ -115,16 +116,33 @@ class AuthHandler:
     credential_key = self.get_credential_key()
 
     state[credential_key] = self.auth_config.exchanged_auth_credential
-    if not isinstance(
-        self.auth_config.auth_scheme, SecurityBase
-    ) or self.auth_config.auth_scheme.type_ not in (
-        AuthSchemeType.oauth2,
-        AuthSchemeType.openIdConnect,
-    ):
+    if not self._is_oauth_scheme():
       return
 
     state[credential_key] = self.exchange_auth_token()
 
+  async def parse_and_store_auth_response_async(self, state: State) -> None:
+    """Like parse_and_store_auth_response, but exchanges the token in a thread.
+
+    The token exchange is a blocking request to the token endpoint.
+    """
+
+    credential_key = self.get_credential_key()
+
+    state[credential_key] = self.auth_config.exchanged_auth_credential
+    if not self._is_oauth_scheme():
+      return
+
+    state[credential_key] = await asyncio.to_thread(self.exchange_auth_token)
+
+  def _is_oauth_scheme(self) -> bool:
+    return isinstance(
+        self.auth_config.auth_scheme, SecurityBase
+    ) and self.auth_config.auth_scheme.type_ in (
+        AuthSchemeType.oauth2,
+        AuthSchemeType.openIdConnect,
+    )
+
   def _validate(self) -> None:
     if not self.auth_scheme:
       raise ValueError("auth_scheme is empty.")
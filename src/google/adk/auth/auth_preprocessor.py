@@ -66,7 +66,8 @@ class _AuthLlmRequestProcessor(BaseLlmRequestProcessor):
         # function call
         request_euc_function_call_ids.add(function_call_response.id)
         auth_config = AuthConfig.model_validate(function_call_response.response)
-        AuthHandler(auth_config=auth_config).parse_and_store_auth_response(
+        auth_handler = AuthHandler(auth_config=auth_config)
+        await auth_handler.parse_and_store_auth_response_async(
             state=invocation_context.session.state
         )
       break
@@ -0,0 +1,224 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import concurrent.futures
+import dataclasses
+import hashlib
+import logging
+import threading
+import time
+from typing import Callable
+from typing import Optional
+
+from .auth_credential import AuthCredential
+from .auth_schemes import AuthScheme
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_MARGIN_SECONDS = 300.0
+"""How long before its expiry a credential is refreshed in the background."""
+
+_DEFAULT_MAX_SIZE = 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedCredential:
+  """An exchanged credential and its expiry."""
+
+  credential: AuthCredential
+
+  expires_at: Optional[float] = None
+  """The expiry, in seconds since the epoch. Credentials without an expiry are
+  returned but not cached."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _Entry:
+  cached_credential: CachedCredential
+  refresh_at: float
+
+
+class CredentialCache:
+  """A thread-safe cache of exchanged credentials.
+
+  A credential is fetched once and reused until it expires. From
+  `refresh_margin_seconds` before its expiry, or from half its lifetime for
+  short-lived credentials, it's still returned while a background thread
+  fetches the next one, so the callers don't wait for the token endpoint.
+  Concurrent fetches of the same key are collapsed into one request.
+
+  Usage:
+  ```
+  key = CredentialCache.get_key(auth_scheme, auth_credential)
+  credential = await credential_cache.get_or_fetch_async(key, fetch)
+  ```
+  """
+
+  def __init__(
+      self,
+      refresh_margin_seconds: float = DEFAULT_REFRESH_MARGIN_SECONDS,
+      max_size: int = _DEFAULT_MAX_SIZE,
+  ):
+    """Initializes the CredentialCache.
+
+    Args:
+      refresh_margin_seconds: How long before its expiry a credential is
+        refreshed in the background.
+      max_size: The number of credentials kept. The least recently used ones
+        are dropped first.
+    """
+    self.refresh_margin_seconds = refresh_margin_seconds
+    self.max_size = max_size
+    self._entries: OrderedDict[str, _Entry] = OrderedDict()
+    self._fetches: dict[str, concurrent.futures.Future[CachedCredential]] = {}
+    self._lock = threading.Lock()
+
+  @staticmethod
+  def get_key(
+      auth_scheme: Optional[AuthScheme],
+      auth_credential: Optional[AuthCredential],
+  ) -> str:
+    """Returns the cache key of the credential exchanged for the inputs.
+
+    The key is a digest, so the cache doesn't hold the raw secrets as keys.
+    """
+    digest = hashlib.sha256()
+    for model in (auth_scheme, auth_credential):
+      digest.update(model.model_dump_json().encode() if model else b'')
+      digest.update(b'\0')
+    return digest.hexdigest()
+
+  def get_or_fetch(
+      self, key: str, fetch: Callable[[], CachedCredential]
+  ) -> AuthCredential:
+    """Returns the cached credential, or fetches it.
+
+    Args:
+      key: The key of the credential.
+      fetch: Blocking function exchanging the credential. It's also called in
+        a background thread to refresh the credential before it expires.
+
+    Returns:
+      The exchanged credential.
+
+    Raises:
+      Exception: The error raised by `fetch`, to all the callers waiting for
+        it.
+    """
+    with self._lock:
+      credential = self._get_cached(key, fetch)
+      if credential is not None:
+        return credential
+      future = self._fetches.get(key)
+      is_fetching = future is None
+      if is_fetching:
+        future = self._start_fetch(key)
+    if is_fetching:
+      self._fetch(key, fetch, future)
+    return future.result().credential
+
+  async def get_or_fetch_async(
+      self, key: str, fetch: Callable[[], CachedCredential]
+  ) -> AuthCredential:
+    """Like get_or_fetch, but fetches in a thread to not block the event loop.
+
+    A cached credential is returned without a thread switch.
+    """
+    with self._lock:
+      credential = self._get_cached(key, fetch)
+    if credential is not None:
+      return credential
+    return await asyncio.to_thread(self.get_or_fetch, key, fetch)
+
+  def invalidate(self, key: str):
+    """Drops the cached credential, e.g. when it's rejected before expiry."""
+    with self._lock:
+      self._entries.pop(key, None)
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
+
+  def _get_cached(
+      self, key: str, fetch: Callable[[], CachedCredential]
+  ) -> Optional[AuthCredential]:
+    """Returns the unexpired credential. Must be called with the lock held."""
+    entry = self._entries.get(key)
+    if entry is None:
+      return None
+    now = time.time()
+    if now >= entry.cached_credential.expires_at:
+      del self._entries[key]
+      return None
+    self._entries.move_to_end(key)
+    if now >= entry.refresh_at and key not in self._fetches:
+      future = self._start_fetch(key)
+      threading.Thread(
+          target=self._fetch, args=(key, fetch, future), daemon=True
+      ).start()
+    return entry.cached_credential.credential
+
+  def _start_fetch(
+      self, key: str
+  ) -> concurrent.futures.Future[CachedCredential]:
+    """Registers a fetch of the key. Must be called with the lock held."""
+    future = concurrent.futures.Future()
+    self._fetches[key] = future
+    return future
+
+  def _fetch(
+      self,
+      key: str,
+      fetch: Callable[[], CachedCredential],
+      future: concurrent.futures.Future[CachedCredential],
+  ):
+    try:
+      cached_credential = fetch()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.warning('Failed to fetch credential: %s', e)
+      with self._lock:
+        del self._fetches[key]
+      future.set_exception(e)
+      return
+    except BaseException:
+      with self._lock:
+        del self._fetches[key]
+      future.cancel()
+      raise
+    with self._lock:
+      del self._fetches[key]
+      if cached_credential.expires_at is not None:
+        self._store(key, cached_credential)
+    future.set_result(cached_credential)
+
+  def _store(self, key: str, cached_credential: CachedCredential):
+    """Caches the credential. Must be called with the lock held."""
+    now = time.time()
+    lifetime = cached_credential.expires_at - now
+    refresh_at = max(
+        now + lifetime / 2,
+        cached_credential.expires_at - self.refresh_margin_seconds,
+    )
+    self._entries[key] = _Entry(cached_credential, refresh_at)
+    self._entries.move_to_end(key)
+    while len(self._entries) > self.max_size:
+      self._entries.popitem(last=False)
+
+
+default_credential_cache = CredentialCache()
+"""The credential cache shared by the credential exchangers of the process."""
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from enum import Enum
 import importlib.util
 import json
@@ -20,6 +21,7 @@ import os
 import sys
 import traceback
 from typing import Any
+from typing import AsyncGenerator
 from typing import Generator
 from typing import Optional
 import uuid
@@ -154,15 +156,72 @@ def run_evals(
     session_service=None,
     artifact_service=None,
     print_detailed_results=False,
+    max_concurrency: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
 ) -> Generator[EvalResult, None, None]:
+  """Returns a summary of eval runs. See `run_evals_async`."""
+  from ..evaluation.evaluation_engine import iterate_sync
+
+  yield from iterate_sync(
+      run_evals_async(
+          eval_set_to_evals,
+          root_agent,
+          reset_func,
+          eval_metrics,
+          session_service=session_service,
+          artifact_service=artifact_service,
+          print_detailed_results=print_detailed_results,
+          max_concurrency=max_concurrency,
+          checkpoint_path=checkpoint_path,
+      )
+  )
+
+
+async def run_evals_async(
+    eval_set_to_evals: dict[str, list[str]],
+    root_agent: Agent,
+    reset_func: Optional[Any],
+    eval_metrics: list[EvalMetric],
+    session_service=None,
+    artifact_service=None,
+    print_detailed_results=False,
+    max_concurrency: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+) -> AsyncGenerator[EvalResult, None]:
+  """Runs the evals concurrently and yields their results as they complete.
+
+  Args:
+    eval_set_to_evals: The eval set files, mapped to the names of the evals to
+      run. All the evals of a file are run when empty.
+    root_agent: The agent to evaluate.
+    reset_func: The function that resets the data of the agent before an eval.
+    eval_metrics: The metrics to evaluate.
+    session_service: The session service of the eval sessions.
+    artifact_service: The artifact service of the eval sessions.
+    print_detailed_results: Whether to print the detailed results.
+    max_concurrency: The maximum number of evals that run at the same time.
+      Defaults to DEFAULT_MAX_CONCURRENCY. The evals run one at a time with a
+      reset_func.
+    checkpoint_path: The path of a file that the responses of the completed
+      evals are saved to, so that a rerun only runs the other evals and the
+      evals whose data changed.
+
+  Yields:
+    The results of the evals, in the order they complete.
+  """
   try:
-    from ..evaluation.agent_evaluator import EvaluationGenerator
-    from ..evaluation.response_evaluator import ResponseEvaluator
-    from ..evaluation.trajectory_evaluator import TrajectoryEvaluator
+    from ..evaluation.evaluation_engine import EvalCase
+    from ..evaluation.evaluation_engine import EvaluationEngine
+
+    # Fails early when the eval dependencies are not installed.
+    from ..evaluation.response_evaluator import ResponseEvaluator  # pylint: disable=unused-import
+    from ..evaluation.trajectory_evaluator import TrajectoryEvaluator  # pylint: disable=unused-import
   except ModuleNotFoundError as e:
     raise ModuleNotFoundError(MISSING_EVAL_DEPENDENCIES_MESSAGE) from e
 
-  """Returns a summary of eval runs."""
+  eval_cases = []
+  # case_id -> (eval_set_file, eval_name)
+  eval_names = {}
   for eval_set_file, evals_to_run in eval_set_to_evals.items():
     with open(eval_set_file, "r", encoding="utf-8") as file:
       eval_items = json.load(file)  # Load JSON into a list
@@ -171,100 +230,128 @@ def run_evals(
 
     for eval_item in eval_items:
       eval_name = eval_item["name"]
-      eval_data = eval_item["data"]
-      initial_session = eval_item.get("initial_session", {})
-
       if evals_to_run and eval_name not in evals_to_run:
         continue
+      case_id = f"{eval_set_file}:{eval_name}"
+      eval_names[case_id] = (eval_set_file, eval_name)
+      eval_cases.append(
+          EvalCase(
+              case_id=case_id,
+              data=eval_item["data"],
+              initial_session=eval_item.get("initial_session", {}),
+              session_id=f"{EVAL_SESSION_ID_PREFIX}{str(uuid.uuid4())}",
+          )
+      )
+
+  engine = EvaluationEngine(
+      root_agent,
+      reset_func=reset_func,
+      max_concurrency=max_concurrency,
+      session_service=session_service,
+      artifact_service=artifact_service,
+      checkpoint_path=checkpoint_path,
+  )
+  async for case_result in engine.run(eval_cases):
+    eval_set_file, eval_name = eval_names[case_result.case_id]
+    print(f"Ran Eval: {eval_set_file}:{eval_name}")
+    if case_result.error is not None:
+      print(f"Error: {case_result.error}")
+      continue
+
+    try:
+      # The evaluators may call remote services, so the scores are computed
+      # in a thread while the other evals keep running.
+      eval_metric_results = await asyncio.to_thread(
+          _evaluate_metrics,
+          eval_metrics,
+          case_result.responses,
+          print_detailed_results,
+      )
+    except Exception as e:
+      print(f"Error: {e}")
+      logger.info("Error: %s", str(traceback.format_exc()))
+      continue
+
+    final_eval_status = EvalStatus.NOT_EVALUATED
+
+    # Go over the all the eval statuses and mark the final eval status as
+    # passed if all of them pass, otherwise mark the final eval status to
+    # failed.
+    for eval_metric_result in eval_metric_results:
+      eval_status = eval_metric_result[1].eval_status
+      if eval_status == EvalStatus.PASSED:
+        final_eval_status = EvalStatus.PASSED
+      elif eval_status == EvalStatus.NOT_EVALUATED:
+        continue
+      elif eval_status == EvalStatus.FAILED:
+        final_eval_status = EvalStatus.FAILED
+        break
+      else:
+        raise ValueError("Unknown eval status.")
+
+    yield EvalResult(
+        eval_set_file=eval_set_file,
+        eval_id=eval_name,
+        final_eval_status=final_eval_status,
+        eval_metric_results=eval_metric_results,
+        session_id=case_result.session_id,
+    )
+
+    if final_eval_status == EvalStatus.PASSED:
+      result = "✅ Passed"
+    else:
+      result = "❌ Failed"
+
+    print(f"Result: {result}\n")
+
+
+def _evaluate_metrics(
+    eval_metrics: list[EvalMetric],
+    scrape_result: list[dict[str, Any]],
+    print_detailed_results: bool,
+) -> list[tuple[EvalMetric, EvalMetricResult]]:
+  """Evaluates the metrics of the responses to an eval."""
+  from ..evaluation.response_evaluator import ResponseEvaluator
+  from ..evaluation.trajectory_evaluator import TrajectoryEvaluator
+
+  eval_metric_results = []
+  for eval_metric in eval_metrics:
+    eval_metric_result = None
+    if eval_metric.metric_name == TOOL_TRAJECTORY_SCORE_KEY:
+      score = TrajectoryEvaluator.evaluate(
+          [scrape_result], print_detailed_results=print_detailed_results
+      )
+      eval_metric_result = _get_eval_metric_result(eval_metric, score)
+    elif eval_metric.metric_name == RESPONSE_MATCH_SCORE_KEY:
+      score = ResponseEvaluator.evaluate(
+          [scrape_result],
+          [RESPONSE_MATCH_SCORE_KEY],
+          print_detailed_results=print_detailed_results,
+      )
+      eval_metric_result = _get_eval_metric_result(
+          eval_metric, score["rouge_1/mean"].item()
+      )
+    elif eval_metric.metric_name == RESPONSE_EVALUATION_SCORE_KEY:
+      score = ResponseEvaluator.evaluate(
+          [scrape_result],
+          [RESPONSE_EVALUATION_SCORE_KEY],
+          print_detailed_results=print_detailed_results,
+      )
+      eval_metric_result = _get_eval_metric_result(
+          eval_metric, score["coherence/mean"].item()
+      )
+    else:
+      logger.warning("`%s` is not supported.", eval_metric.metric_name)
+      eval_metric_result = EvalMetricResult(
+          score=None, eval_status=EvalStatus.NOT_EVALUATED
+      )
 
-      try:
-        print(f"Running Eval: {eval_set_file}:{eval_name}")
-        session_id = f"{EVAL_SESSION_ID_PREFIX}{str(uuid.uuid4())}"
-
-        scrape_result = EvaluationGenerator._process_query_with_root_agent(
-            data=eval_data,
-            root_agent=root_agent,
-            reset_func=reset_func,
-            initial_session=initial_session,
-            session_id=session_id,
-            session_service=session_service,
-            artifact_service=artifact_service,
-        )
-
-        eval_metric_results = []
-        for eval_metric in eval_metrics:
-          eval_metric_result = None
-          if eval_metric.metric_name == TOOL_TRAJECTORY_SCORE_KEY:
-            score = TrajectoryEvaluator.evaluate(
-                [scrape_result], print_detailed_results=print_detailed_results
-            )
-            eval_metric_result = _get_eval_metric_result(eval_metric, score)
-          elif eval_metric.metric_name == RESPONSE_MATCH_SCORE_KEY:
-            score = ResponseEvaluator.evaluate(
-                [scrape_result],
-                [RESPONSE_MATCH_SCORE_KEY],
-                print_detailed_results=print_detailed_results,
-            )
-            eval_metric_result = _get_eval_metric_result(
-                eval_metric, score["rouge_1/mean"].item()
-            )
-          elif eval_metric.metric_name == RESPONSE_EVALUATION_SCORE_KEY:
-            score = ResponseEvaluator.evaluate(
-                [scrape_result],
-                [RESPONSE_EVALUATION_SCORE_KEY],
-                print_detailed_results=print_detailed_results,
-            )
-            eval_metric_result = _get_eval_metric_result(
-                eval_metric, score["coherence/mean"].item()
-            )
-          else:
-            logger.warning("`%s` is not supported.", eval_metric.metric_name)
-            eval_metric_results.append((
-                eval_metric,
-                EvalMetricResult(eval_status=EvalStatus.NOT_EVALUATED),
-            ))
-
-          eval_metric_results.append((
-              eval_metric,
-              eval_metric_result,
-          ))
-          _print_eval_metric_result(eval_metric, eval_metric_result)
-
-        final_eval_status = EvalStatus.NOT_EVALUATED
-
-        # Go over the all the eval statuses and mark the final eval status as
-        # passed if all of them pass, otherwise mark the final eval status to
-        # failed.
-        for eval_metric_result in eval_metric_results:
-          eval_status = eval_metric_result[1].eval_status
-          if eval_status == EvalStatus.PASSED:
-            final_eval_status = EvalStatus.PASSED
-          elif eval_status == EvalStatus.NOT_EVALUATED:
-            continue
-          elif eval_status == EvalStatus.FAILED:
-            final_eval_status = EvalStatus.FAILED
-            break
-          else:
-            raise ValueError("Unknown eval status.")
-
-        yield EvalResult(
-            eval_set_file=eval_set_file,
-            eval_id=eval_name,
-            final_eval_status=final_eval_status,
-            eval_metric_results=eval_metric_results,
-            session_id=session_id,
-        )
-
-        if final_eval_status == EvalStatus.PASSED:
-          result = "✅ Passed"
-        else:
-          result = "❌ Failed"
-
-        print(f"Result: {result}\n")
-
-      except Exception as e:
-        print(f"Error: {e}")
-        logger.info("Error: %s", str(traceback.format_exc()))
+    eval_metric_results.append((
+        eval_metric,
+        eval_metric_result,
+    ))
+    _print_eval_metric_result(eval_metric, eval_metric_result)
+  return eval_metric_results
 
 
 def _get_eval_metric_result(eval_metric, score):
@@ -199,11 +199,29 @@ def cli_run(
     default=False,
     help="Optional. Whether to print detailed results on console or not.",
 )
+@click.option(
+    "--max_concurrency",
+    type=click.IntRange(min=1),
+    help=(
+        "Optional. The maximum number of evals that run at the same time."
+        " Defaults to 4, or to 1 for agents with a reset_data function."
+    ),
+)
+@click.option(
+    "--checkpoint_file_path",
+    help=(
+        "Optional. The path of a file that the responses of the completed"
+        " evals are saved to. A rerun with the same file only runs the evals"
+        " that didn't complete."
+    ),
+)
 def cli_eval(
     agent_module_file_path: str,
     eval_set_file_path: tuple[str],
     config_file_path: str,
     print_detailed_results: bool,
+    max_concurrency: Optional[int],
+    checkpoint_file_path: Optional[str],
 ):
   """Evaluates an agent given the eval sets.
 
@@ -227,6 +245,11 @@ def cli_eval(
   CONFIG_FILE_PATH: The path to config file.
 
   PRINT_DETAILED_RESULTS: Prints detailed results on the console.
+
+  MAX_CONCURRENCY: The maximum number of evals that run at the same time.
+
+  CHECKPOINT_FILE_PATH: The file that the progress is saved to, to resume an
+  interrupted run.
   """
   envs.load_dotenv_for_agent(agent_module_file_path, ".")
 
@@ -237,7 +260,7 @@ def cli_eval(
     from .cli_eval import get_evaluation_criteria_or_default
     from .cli_eval import get_root_agent
     from .cli_eval import parse_and_get_evals_to_run
-    from .cli_eval import run_evals
+    from .cli_eval import run_evals_async
     from .cli_eval import try_get_reset_func
   except ModuleNotFoundError:
     raise click.ClickException(MISSING_EVAL_DEPENDENCIES_MESSAGE)
@@ -256,16 +279,22 @@ def cli_eval(
 
   eval_set_to_evals = parse_and_get_evals_to_run(eval_set_file_path)
 
-  try:
-    eval_results = list(
-        run_evals(
+  async def _collect_eval_results() -> list[EvalResult]:
+    return [
+        eval_result
+        async for eval_result in run_evals_async(
             eval_set_to_evals,
             root_agent,
             reset_func,
             eval_metrics,
             print_detailed_results=print_detailed_results,
+            max_concurrency=max_concurrency,
+            checkpoint_path=checkpoint_file_path,
         )
-    )
+    ]
+
+  try:
+    eval_results = asyncio.run(_collect_eval_results())
   except ModuleNotFoundError:
     raise click.ClickException(MISSING_EVAL_DEPENDENCIES_MESSAGE)
 
@@ -339,6 +368,15 @@ def cli_eval(
     default=False,
     help="Optional. Whether to enable cloud trace for telemetry.",
 )
+@click.option(
+    "--trace_spill_db_path",
+    type=str,
+    default="",
+    help=(
+        "Optional. The path of a SQLite file that traces evicted from memory"
+        " are kept in until they expire, for the /debug/trace endpoint."
+    ),
+)
 @click.argument(
     "agents_dir",
     type=click.Path(
@@ -354,6 +392,7 @@ def cli_web(
     allow_origins: Optional[list[str]] = None,
     port: int = 8000,
     trace_to_cloud: bool = False,
+    trace_spill_db_path: str = "",
 ):
   """Starts a FastAPI server with Web UI for agents.
 
@@ -399,6 +438,7 @@ def cli_web(
       allow_origins=allow_origins,
       web=True,
       trace_to_cloud=trace_to_cloud,
+      trace_spill_db_path=trace_spill_db_path,
       lifespan=_lifespan,
   )
   config = uvicorn.Config(
@@ -461,6 +501,15 @@ def cli_web(
     default=False,
     help="Optional. Whether to enable cloud trace for telemetry.",
 )
+@click.option(
+    "--trace_spill_db_path",
+    type=str,
+    default="",
+    help=(
+        "Optional. The path of a SQLite file that traces evicted from memory"
+        " are kept in until they expire, for the /debug/trace endpoint."
+    ),
+)
 # The directory of agents, where each sub-directory is a single agent.
 # By default, it is the current working directory
 @click.argument(
@@ -478,6 +527,7 @@ def cli_api_server(
     allow_origins: Optional[list[str]] = None,
     port: int = 8000,
     trace_to_cloud: bool = False,
+    trace_spill_db_path: str = "",
 ):
   """Starts a FastAPI server for agents.
 
@@ -502,6 +552,7 @@ def cli_api_server(
           allow_origins=allow_origins,
           web=False,
           trace_to_cloud=trace_to_cloud,
+          trace_spill_db_path=trace_spill_db_path,
       ),
       host="0.0.0.0",
       port=port,
@@ -65,6 +65,7 @@ from ..sessions.database_session_service import DatabaseSessionService
 from ..sessions.in_memory_session_service import InMemorySessionService
 from ..sessions.session import Session
 from ..sessions.vertex_ai_session_service import VertexAiSessionService
+from ..utils.log_utils import LazyLogMessage
 from .cli_eval import EVAL_SESSION_ID_PREFIX
 from .cli_eval import EvalMetric
 from .cli_eval import EvalMetricResult
@@ -72,15 +73,26 @@ from .cli_eval import EvalStatus
 from .utils import create_empty_state
 from .utils import envs
 from .utils import evals
+from .utils.trace_store import TraceStore
 
 logger = logging.getLogger(__name__)
 
 _EVAL_SET_FILE_EXTENSION = ".evalset.json"
 
+# The maximum number of runs in a /run_batch request.
+_MAX_RUN_BATCH_SIZE = 100
+
+# The maximum number of sessions that a /run_batch request runs concurrently.
+_RUN_BATCH_MAX_CONCURRENCY = 8
+
+# The number of client messages of a live websocket queued for the model,
+# above which the websocket stops being read.
+_LIVE_REQUEST_QUEUE_MAX_SIZE = 64
+
 
 class ApiServerSpanExporter(export.SpanExporter):
 
-  def __init__(self, trace_dict):
+  def __init__(self, trace_dict: TraceStore):
     self.trace_dict = trace_dict
 
   def export(
@@ -111,6 +123,17 @@ class AgentRunRequest(BaseModel):
   streaming: bool = False
 
 
+class AgentRunBatchRequest(BaseModel):
+  requests: list[AgentRunRequest]
+
+
+class AgentRunBatchResult(BaseModel):
+  session_id: str
+  events: list[Event] = []
+  # The error of the run, if it failed.
+  error: Optional[str] = None
+
+
 class AddSessionToEvalSetRequest(BaseModel):
   eval_id: str
   session_id: str
@@ -120,6 +143,8 @@ class AddSessionToEvalSetRequest(BaseModel):
 class RunEvalRequest(BaseModel):
   eval_ids: list[str]  # if empty, then all evals in the eval set are run.
   eval_metrics: list[EvalMetric]
+  # The maximum number of evals that run at the same time.
+  max_concurrency: Optional[int] = None
 
 
 class RunEvalResult(BaseModel):
@@ -137,10 +162,11 @@ def get_fast_api_app(
     allow_origins: Optional[list[str]] = None,
     web: bool,
     trace_to_cloud: bool = False,
+    trace_spill_db_path: str = "",
     lifespan: Optional[Lifespan[FastAPI]] = None,
 ) -> FastAPI:
-  # InMemory tracing dict.
-  trace_dict: dict[str, Any] = {}
+  # Bounded in-memory tracing dict, optionally spilling to a sqlite file.
+  trace_dict = TraceStore(spill_db_path=trace_spill_db_path)
 
   # Set up tracing in the FastAPI server.
   provider = TracerProvider()
@@ -244,10 +270,12 @@ def get_fast_api_app(
       "/apps/{app_name}/users/{user_id}/sessions/{session_id}",
       response_model_exclude_none=True,
   )
-  def get_session(app_name: str, user_id: str, session_id: str) -> Session:
+  async def get_session(
+      app_name: str, user_id: str, session_id: str
+  ) -> Session:
     # Connect to managed session if agent_engine_id is set.
     app_name = agent_engine_id if agent_engine_id else app_name
-    session = session_service.get_session(
+    session = await session_service.get_session_async(
         app_name=app_name, user_id=user_id, session_id=session_id
     )
     if not session:
@@ -258,14 +286,15 @@ def get_fast_api_app(
       "/apps/{app_name}/users/{user_id}/sessions",
       response_model_exclude_none=True,
   )
-  def list_sessions(app_name: str, user_id: str) -> list[Session]:
+  async def list_sessions(app_name: str, user_id: str) -> list[Session]:
     # Connect to managed session if agent_engine_id is set.
     app_name = agent_engine_id if agent_engine_id else app_name
+    list_sessions_response = await session_service.list_sessions_async(
+        app_name=app_name, user_id=user_id
+    )
     return [
         session
-        for session in session_service.list_sessions(
-            app_name=app_name, user_id=user_id
-        ).sessions
+        for session in list_sessions_response.sessions
         # Remove sessions that were generated as a part of Eval.
         if not session.id.startswith(EVAL_SESSION_ID_PREFIX)
     ]
@@ -274,7 +303,7 @@ def get_fast_api_app(
       "/apps/{app_name}/users/{user_id}/sessions/{session_id}",
       response_model_exclude_none=True,
   )
-  def create_session_with_id(
+  async def create_session_with_id(
       app_name: str,
       user_id: str,
       session_id: str,
@@ -283,7 +312,7 @@ def get_fast_api_app(
     # Connect to managed session if agent_engine_id is set.
     app_name = agent_engine_id if agent_engine_id else app_name
     if (
-        session_service.get_session(
+        await session_service.get_session_async(
             app_name=app_name, user_id=user_id, session_id=session_id
         )
         is not None
@@ -294,7 +323,7 @@ def get_fast_api_app(
       )
 
     logger.info("New session created: %s", session_id)
-    return session_service.create_session(
+    return await session_service.create_session_async(
         app_name=app_name, user_id=user_id, state=state, session_id=session_id
     )
 
@@ -302,7 +331,7 @@ def get_fast_api_app(
       "/apps/{app_name}/users/{user_id}/sessions",
       response_model_exclude_none=True,
   )
-  def create_session(
+  async def create_session(
       app_name: str,
       user_id: str,
       state: Optional[dict[str, Any]] = None,
@@ -311,7 +340,7 @@ def get_fast_api_app(
     app_name = agent_engine_id if agent_engine_id else app_name
 
     logger.info("New session created")
-    return session_service.create_session(
+    return await session_service.create_session_async(
         app_name=app_name, user_id=user_id, state=state
     )
 
@@ -385,7 +414,7 @@ def get_fast_api_app(
       )
 
     # Get the session
-    session = session_service.get_session(
+    session = await session_service.get_session_async(
         app_name=app_name, user_id=req.user_id, session_id=req.session_id
     )
     assert session, "Session not found."
@@ -451,7 +480,7 @@ def get_fast_api_app(
   async def run_eval(
       app_name: str, eval_set_id: str, req: RunEvalRequest
   ) -> list[RunEvalResult]:
-    from .cli_eval import run_evals
+    from .cli_eval import run_evals_async
 
     """Runs an eval given the details in the eval request."""
     # Create a mapping from eval set file to all the evals that needed to be
@@ -466,16 +495,18 @@ def get_fast_api_app(
           "Eval ids to run list is empty. We will all evals in the eval set."
       )
     root_agent = await _get_root_agent_async(app_name)
-    eval_results = list(
-        run_evals(
+    eval_results = [
+        eval_result
+        async for eval_result in run_evals_async(
             eval_set_to_evals,
             root_agent,
             getattr(root_agent, "reset_data", None),
             req.eval_metrics,
             session_service=session_service,
             artifact_service=artifact_service,
+            max_concurrency=req.max_concurrency,
         )
-    )
+    ]
 
     run_eval_results = []
     for eval_result in eval_results:
@@ -492,10 +523,10 @@ def get_fast_api_app(
     return run_eval_results
 
   @app.delete("/apps/{app_name}/users/{user_id}/sessions/{session_id}")
-  def delete_session(app_name: str, user_id: str, session_id: str):
+  async def delete_session(app_name: str, user_id: str, session_id: str):
     # Connect to managed session if agent_engine_id is set.
     app_name = agent_engine_id if agent_engine_id else app_name
-    session_service.delete_session(
+    await session_service.delete_session_async(
         app_name=app_name, user_id=user_id, session_id=session_id
     )
 
@@ -590,11 +621,16 @@ def get_fast_api_app(
   async def agent_run(req: AgentRunRequest) -> list[Event]:
     # Connect to managed session if agent_engine_id is set.
     app_id = agent_engine_id if agent_engine_id else req.app_name
-    session = session_service.get_session(
+    session = await session_service.get_session_async(
         app_name=app_id, user_id=req.user_id, session_id=req.session_id
     )
     if not session:
       raise HTTPException(status_code=404, detail="Session not found")
+    return await _run_agent_async(req, session)
+
+  async def _run_agent_async(
+      req: AgentRunRequest, session: Session
+  ) -> list[Event]:
     runner = await _get_runner_async(req.app_name)
     events = [
         event
@@ -602,17 +638,78 @@ def get_fast_api_app(
             user_id=req.user_id,
             session_id=req.session_id,
             new_message=req.new_message,
+            session=session,
         )
     ]
-    logger.info("Generated %s events in agent run: %s", len(events), events)
+    logger.info("Generated %s events in agent run", len(events))
+    logger.debug("Events of agent run: %s", LazyLogMessage(str, events))
     return events
 
+  @app.post("/run_batch", response_model_exclude_none=True)
+  async def agent_run_batch(
+      req: AgentRunBatchRequest,
+  ) -> list[AgentRunBatchResult]:
+    """Runs many messages, for different sessions, in one request.
+
+    The runs of different sessions are concurrent, while the runs of a session
+    are in the order of the requests. A failed run doesn't fail the others.
+    """
+    if len(req.requests) > _MAX_RUN_BATCH_SIZE:
+      raise HTTPException(
+          status_code=400,
+          detail=(
+              f"Too many runs in the batch: {len(req.requests)}. The maximum"
+              f" is {_MAX_RUN_BATCH_SIZE}."
+          ),
+      )
+
+    # (app_name, user_id, session_id) -> the indexes of the runs of a session.
+    session_runs: dict[tuple[str, str, str], list[int]] = {}
+    for index, run_req in enumerate(req.requests):
+      session_runs.setdefault(
+          (run_req.app_name, run_req.user_id, run_req.session_id), []
+      ).append(index)
+
+    results: list[Optional[AgentRunBatchResult]] = [None] * len(req.requests)
+    semaphore = asyncio.Semaphore(_RUN_BATCH_MAX_CONCURRENCY)
+
+    async def run_session(indexes: list[int]):
+      async with semaphore:
+        first_req = req.requests[indexes[0]]
+        session = None
+        for index in indexes:
+          run_req = req.requests[index]
+          try:
+            if session is None:
+              # The session is fetched once for all the runs of the session.
+              session = await session_service.get_session_async(
+                  app_name=agent_engine_id or run_req.app_name,
+                  user_id=first_req.user_id,
+                  session_id=first_req.session_id,
+              )
+              if not session:
+                raise ValueError("Session not found")
+            events = await _run_agent_async(run_req, session)
+            results[index] = AgentRunBatchResult(
+                session_id=run_req.session_id, events=events
+            )
+          except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception("Error in batch run: %s", e)
+            results[index] = AgentRunBatchResult(
+                session_id=run_req.session_id, error=str(e)
+            )
+
+    await asyncio.gather(
+        *[run_session(indexes) for indexes in session_runs.values()]
+    )
+    return results
+
   @app.post("/run_sse")
   async def agent_run_sse(req: AgentRunRequest) -> StreamingResponse:
     # Connect to managed session if agent_engine_id is set.
     app_id = agent_engine_id if agent_engine_id else req.app_name
     # SSE endpoint
-    session = session_service.get_session(
+    session = await session_service.get_session_async(
         app_name=app_id, user_id=req.user_id, session_id=req.session_id
     )
     if not session:
@@ -628,10 +725,14 @@ def get_fast_api_app(
             session_id=req.session_id,
             new_message=req.new_message,
             run_config=RunConfig(streaming_mode=stream_mode),
+            session=session,
         ):
           # Format as SSE data
           sse_event = event.model_dump_json(exclude_none=True, by_alias=True)
-          logger.info("Generated event in agent run streaming: %s", sse_event)
+          logger.debug(
+              "Generated event in agent run streaming: %s",
+              LazyLogMessage(str, sse_event),
+          )
           yield f"data: {sse_event}\n\n"
       except Exception as e:
         logger.exception("Error in event_generator: %s", e)
@@ -653,7 +754,7 @@ def get_fast_api_app(
   ):
     # Connect to managed session if agent_engine_id is set.
     app_id = agent_engine_id if agent_engine_id else app_name
-    session = session_service.get_session(
+    session = await session_service.get_session_async(
         app_name=app_id, user_id=user_id, session_id=session_id
     )
     session_events = session.events if session else []
@@ -710,7 +811,7 @@ def get_fast_api_app(
 
     # Connect to managed session if agent_engine_id is set.
     app_id = agent_engine_id if agent_engine_id else app_name
-    session = session_service.get_session(
+    session = await session_service.get_session_async(
         app_name=app_id, user_id=user_id, session_id=session_id
     )
     if not session:
@@ -719,7 +820,7 @@ def get_fast_api_app(
       await websocket.close(code=1002, reason="Session not found")
       return
 
-    live_request_queue = LiveRequestQueue()
+    live_request_queue = LiveRequestQueue(max_size=_LIVE_REQUEST_QUEUE_MAX_SIZE)
 
     async def forward_events():
       runner = await _get_runner_async(app_name)
@@ -734,8 +835,12 @@ def get_fast_api_app(
       try:
         while True:
           data = await websocket.receive_text()
-          # Validate and send the received message to the live queue.
-          live_request_queue.send(LiveRequest.model_validate_json(data))
+          # Validate and send the received message to the live queue. Waits
+          # while the queue is full, so the client is slowed down instead of
+          # the queue growing.
+          await live_request_queue.send_async(
+              LiveRequest.model_validate_json(data)
+          )
       except ValidationError as ve:
         logger.error("Validation error in process_messages: %s", ve)
 
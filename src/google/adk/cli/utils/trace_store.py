@@ -0,0 +1,197 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import json
+import sqlite3
+import threading
+import time
+from typing import Any
+from typing import Optional
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 60 * 60
+
+# Evicted traces are written to the spill file in batches of this size.
+_SPILL_BATCH_SIZE = 50
+
+# Expired spilled traces are deleted once every this many batches.
+_SPILL_CLEANUP_INTERVAL = 100
+
+
+def _estimate_size(key: str, attributes: dict[str, Any]) -> int:
+  """Estimates the memory used by the attributes of a trace.
+
+  Span attributes are mostly strings, e.g. the serialized LLM request and
+  response, so their lengths are a good enough estimate.
+  """
+  size = len(key)
+  for name, value in attributes.items():
+    size += len(name)
+    size += len(value) if isinstance(value, (str, bytes)) else 8
+  return size
+
+
+class TraceStore:
+  """A bounded store of span attributes, keyed by event id.
+
+  The least recently used traces are evicted once the store holds more than
+  `max_entries` traces or `max_bytes` of estimated attribute size, and traces
+  expire `ttl_seconds` after they are stored. Evicted traces can be spilled to
+  a sqlite file, so they stay available until they expire without taking
+  memory.
+
+  It is thread safe, as spans are exported from the threads that end them.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_entries: int = DEFAULT_MAX_ENTRIES,
+      max_bytes: int = DEFAULT_MAX_BYTES,
+      ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+      spill_db_path: str = "",
+  ):
+    """Initializes the TraceStore.
+
+    Args:
+      max_entries: The maximum number of traces kept in memory.
+      max_bytes: The maximum estimated size of the traces kept in memory.
+      ttl_seconds: Seconds a trace is kept for. None keeps traces until they
+        are evicted.
+      spill_db_path: The path of a sqlite file that evicted traces are spilled
+        to. Evicted traces are dropped if empty.
+    """
+    self.max_entries = max_entries
+    self.max_bytes = max_bytes
+    self.ttl_seconds = ttl_seconds
+
+    # event_id -> (attributes, estimated size, expire time)
+    self._traces: OrderedDict[str, tuple[dict[str, Any], int, float]] = (
+        OrderedDict()
+    )
+    self._size = 0
+    self._lock = threading.Lock()
+
+    self._spill_db: Optional[sqlite3.Connection] = None
+    # Evicted traces not written to the spill file yet.
+    self._pending_spills: OrderedDict[
+        str, tuple[dict[str, Any], int, float]
+    ] = OrderedDict()
+    self._spill_count = 0
+    if spill_db_path:
+      self._spill_db = sqlite3.connect(spill_db_path, check_same_thread=False)
+      # It's a cache, so trade durability for not syncing on every spill.
+      self._spill_db.execute("PRAGMA synchronous = OFF")
+      self._spill_db.execute(
+          "CREATE TABLE IF NOT EXISTS traces (event_id TEXT PRIMARY KEY,"
+          " attributes TEXT NOT NULL, expire_time REAL NOT NULL)"
+      )
+
+  @property
+  def size(self) -> int:
+    """The estimated size of the traces kept in memory."""
+    return self._size
+
+  def __len__(self) -> int:
+    return len(self._traces)
+
+  def __contains__(self, event_id: str) -> bool:
+    return self.get(event_id) is not None
+
+  def __setitem__(self, event_id: str, attributes: dict[str, Any]):
+    expire_time = (
+        time.time() + self.ttl_seconds if self.ttl_seconds else float("inf")
+    )
+    size = _estimate_size(event_id, attributes)
+    with self._lock:
+      self._pop(event_id)
+      self._traces[event_id] = (attributes, size, expire_time)
+      self._size += size
+      self._evict()
+
+  def get(
+      self, event_id: str, default: Optional[dict[str, Any]] = None
+  ) -> Optional[dict[str, Any]]:
+    """Returns the attributes of the trace of an event."""
+    with self._lock:
+      trace = self._traces.get(event_id)
+      if trace is not None:
+        attributes, _, expire_time = trace
+        if expire_time > time.time():
+          self._traces.move_to_end(event_id)
+          return attributes
+        self._pop(event_id)
+        return default
+      if self._spill_db is not None:
+        self._flush_spills()
+        row = self._spill_db.execute(
+            "SELECT attributes FROM traces WHERE event_id = ? AND"
+            " expire_time > ?",
+            (event_id, time.time()),
+        ).fetchone()
+        if row:
+          return json.loads(row[0])
+      return default
+
+  def close(self):
+    """Closes the spill file."""
+    with self._lock:
+      if self._spill_db is not None:
+        self._flush_spills()
+        self._spill_db.close()
+        self._spill_db = None
+
+  def _pop(self, event_id: str):
+    trace = self._traces.pop(event_id, None)
+    if trace is not None:
+      self._size -= trace[1]
+
+  def _evict(self):
+    while self._traces and (
+        len(self._traces) > self.max_entries or self._size > self.max_bytes
+    ):
+      event_id, trace = self._traces.popitem(last=False)
+      self._size -= trace[1]
+      if self._spill_db is not None:
+        self._pending_spills[event_id] = trace
+    if len(self._pending_spills) >= _SPILL_BATCH_SIZE:
+      self._flush_spills()
+
+  def _flush_spills(self):
+    if not self._pending_spills:
+      return
+    now = time.time()
+    rows = [
+        (event_id, json.dumps(attributes), expire_time)
+        for event_id, (
+            attributes,
+            _,
+            expire_time,
+        ) in self._pending_spills.items()
+        if expire_time > now
+    ]
+    self._pending_spills.clear()
+    with self._spill_db:
+      self._spill_db.executemany(
+          "INSERT OR REPLACE INTO traces VALUES (?, ?, ?)", rows
+      )
+      self._spill_count += 1
+      if self._spill_count % _SPILL_CLEANUP_INTERVAL == 0:
+        self._spill_db.execute(
+            "DELETE FROM traces WHERE expire_time <= ?", (now,)
+        )
@@ -16,13 +16,21 @@ import logging
 
 from .base_code_executor import BaseCodeExecutor
 from .code_executor_context import CodeExecutorContext
+from .input_file_store import ArtifactInputFileStore
+from .input_file_store import BaseInputFileStore
+from .input_file_store import LocalInputFileStore
+from .process_pool_code_executor import ProcessPoolCodeExecutor
 from .unsafe_local_code_executor import UnsafeLocalCodeExecutor
 
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    'ArtifactInputFileStore',
     'BaseCodeExecutor',
+    'BaseInputFileStore',
     'CodeExecutorContext',
+    'LocalInputFileStore',
+    'ProcessPoolCodeExecutor',
     'UnsafeLocalCodeExecutor',
 ]
 
@@ -0,0 +1,134 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The worker process of ProcessPoolCodeExecutor.
+
+It's run as a script, so it only depends on the standard library and doesn't
+import the ADK. The config is passed as a JSON argument. The worker reads one
+JSON request per line from stdin and writes one JSON response per line to
+stdout, while the output of the executed code is captured.
+"""
+
+import base64
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
+import importlib
+import io
+import json
+import os
+import shutil
+import sys
+import traceback
+
+try:
+  import resource
+except ImportError:  # Not available on Windows.
+  resource = None
+
+
+def _write(stream, message):
+  stream.write(json.dumps(message) + '\n')
+  stream.flush()
+
+
+def _set_cpu_time_limit(seconds):
+  if not seconds or resource is None:
+    return
+  usage = resource.getrusage(resource.RUSAGE_SELF)
+  used = int(usage.ru_utime + usage.ru_stime)
+  _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+  soft = used + seconds
+  if hard != resource.RLIM_INFINITY:
+    soft = min(soft, hard)
+  resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _write_input_file(file, files_dir):
+  """Writes an input file to the working directory.
+
+  Files with a content hash are cached in files_dir, so they are only sent
+  once to the worker.
+  """
+  name = os.path.basename(file['name'])
+  content_hash = file.get('content_hash')
+  if not content_hash:
+    with open(name, 'wb') as f:
+      f.write(base64.b64decode(file['content']))
+    return
+  cached_path = os.path.join(files_dir, os.path.basename(content_hash))
+  if 'content' in file:
+    with open(cached_path, 'wb') as f:
+      f.write(base64.b64decode(file['content']))
+  shutil.copyfile(cached_path, name)
+
+
+def _execute(request, globals_, files_dir):
+  stdout = io.StringIO()
+  stderr = io.StringIO()
+  with redirect_stdout(stdout), redirect_stderr(stderr):
+    try:
+      for file in request.get('input_files', []):
+        _write_input_file(file, files_dir)
+      exec(compile(request['code'], '<code>', 'exec'), globals_)
+    except BaseException as e:  # pylint: disable=broad-exception-caught
+      # Skips the frame of this function.
+      traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+  return {'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+
+def main():
+  # Doesn't let the code import the modules next to this script.
+  del sys.path[0]
+  config = json.loads(sys.argv[1])
+
+  # The protocol uses the original stdin and stdout. The code gets an empty
+  # stdin, and output written to the stdout file descriptor directly, e.g. by
+  # C extensions, goes to stderr instead of corrupting the protocol.
+  requests = os.fdopen(os.dup(0), 'r', encoding='utf-8')
+  responses = os.fdopen(os.dup(1), 'w', encoding='utf-8')
+  os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+  os.dup2(2, 1)
+  sys.stdin = io.StringIO()
+
+  for module in config.get('preload_modules', []):
+    try:
+      importlib.import_module(module)
+    except ImportError:
+      pass
+
+  memory_limit = config.get('memory_limit_bytes')
+  if memory_limit and resource is not None:
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+  _write(responses, {'ready': True})
+
+  # execution_id -> the globals of the stateful execution.
+  globals_by_execution_id = {}
+  for line in requests:
+    request = json.loads(line)
+    for execution_id in request.get('dropped_execution_ids', []):
+      globals_by_execution_id.pop(execution_id, None)
+    execution_id = request.get('execution_id')
+    if execution_id:
+      globals_ = globals_by_execution_id.setdefault(
+          execution_id, {'__name__': '__main__'}
+      )
+    else:
+      globals_ = {'__name__': '__main__'}
+    _set_cpu_time_limit(config.get('cpu_time_limit_seconds'))
+    _write(responses, _execute(request, globals_, config['files_dir']))
+
+
+if __name__ == '__main__':
+  main()
@@ -13,13 +13,25 @@
 # limitations under the License.
 
 import abc
+import asyncio
+import base64
+import dataclasses
+import logging
+from typing import ClassVar
 from typing import List
+from typing import Optional
 
 from pydantic import BaseModel
+from pydantic import Field
+from pydantic import InstanceOf
 
 from ..agents.invocation_context import InvocationContext
 from .code_execution_utils import CodeExecutionInput
 from .code_execution_utils import CodeExecutionResult
+from .code_execution_utils import File
+from .input_file_store import BaseInputFileStore
+
+logger = logging.getLogger(__name__)
 
 
 class BaseCodeExecutor(BaseModel):
@@ -39,6 +51,8 @@ class BaseCodeExecutor(BaseModel):
       code blocks.
     execution_result_delimiters: The delimiters to format the code execution
       result.
+    input_file_store: The store of the input files extracted by
+      optimize_data_file.
   """
 
   optimize_data_file: bool = False
@@ -79,6 +93,21 @@ class BaseCodeExecutor(BaseModel):
   The delimiters to format the code execution result.
   """
 
+  input_file_store: Optional[InstanceOf[BaseInputFileStore]] = Field(
+      default=None, exclude=True
+  )
+  """
+  The store of the input files extracted by optimize_data_file.
+
+  When set, only the content hashes of the files are kept in the session
+  state. None keeps the files in the session state.
+  """
+
+  # Whether `execute_code` loads the input files only referenced by their hash
+  # itself, e.g. only when they aren't cached in the runtime yet. Otherwise,
+  # they are loaded before the execution.
+  _loads_input_files: ClassVar[bool] = False
+
   @abc.abstractmethod
   def execute_code(
       self,
@@ -95,3 +124,51 @@ class BaseCodeExecutor(BaseModel):
       The code execution result.
     """
     pass
+
+  async def execute_code_async(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    """Executes code without blocking the event loop.
+
+    By default, `execute_code` is run in a separate thread. Executors that can
+    wait for the execution asynchronously should override it.
+
+    Args:
+      invocation_context: The invocation context of the code execution.
+      code_execution_input: The code execution input.
+
+    Returns:
+      The code execution result.
+    """
+    return await asyncio.to_thread(
+        self.execute_code, invocation_context, code_execution_input
+    )
+
+  def _load_input_file(
+      self, invocation_context: InvocationContext, file: File
+  ) -> Optional[File]:
+    """Returns the file with its content, loaded from the store if needed.
+
+    The store is read synchronously, so this must not be called on the event
+    loop.
+
+    Args:
+      invocation_context: The invocation context of the code execution.
+      file: The input file, possibly only referenced by its content hash.
+
+    Returns:
+      The file with its content, or None if it's missing from the store.
+    """
+    if file.content or not file.content_hash:
+      return file
+    content = (
+        self.input_file_store.get(invocation_context, file.content_hash)
+        if self.input_file_store
+        else None
+    )
+    if content is None:
+      logger.warning('Input file %s is missing from the store.', file.name)
+      return None
+    return dataclasses.replace(file, content=base64.b64encode(content).decode())
@@ -43,6 +43,12 @@ class File:
   The mime type of the file (e.g., "image/png").
   """
 
+  content_hash: Optional[str] = None
+  """
+  The hash of the file content in the input file store of the code executor.
+  The content is empty when the file is only referenced by its hash.
+  """
+
 
 @dataclasses.dataclass
 class CodeExecutionInput:
@@ -109,12 +109,17 @@ class CodeExecutorContext:
   ):
     """Adds the input files to the code executor context.
 
+    Only the content hash is kept for the files that have one.
+
     Args:
       input_files: The input files to add to the code executor context.
     """
     if _INPUT_FILE_KEY not in self._session_state:
       self._session_state[_INPUT_FILE_KEY] = []
     for input_file in input_files:
+      if input_file.content_hash:
+        # The content is kept in the input file store, not in the state.
+        input_file = dataclasses.replace(input_file, content='')
       self._session_state[_INPUT_FILE_KEY].append(
           dataclasses.asdict(input_file)
       )
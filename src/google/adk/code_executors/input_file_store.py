@@ -0,0 +1,197 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed stores of the input files of code executors."""
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Optional
+import weakref
+
+from google.genai import types
+
+from ..agents.invocation_context import InvocationContext
+from ..artifacts.base_artifact_service import BaseArtifactService
+
+_ARTIFACT_PREFIX = 'user:code_executor_input_files/'
+
+
+def compute_content_hash(content: bytes) -> str:
+  """Returns the content hash that identifies a file in the stores."""
+  return hashlib.sha256(content).hexdigest()
+
+
+class BaseInputFileStore(abc.ABC):
+  """A store of input files, keyed by the hash of their content.
+
+  The code executor context only keeps the hashes of the input files in the
+  session state, so the session doesn't grow with the data files. The same
+  content is only stored once.
+  """
+
+  @abc.abstractmethod
+  def put(self, invocation_context: InvocationContext, content: bytes) -> str:
+    """Stores the content of a file, unless it's already stored.
+
+    Args:
+      invocation_context: The invocation context of the file upload.
+      content: The raw bytes of the file.
+
+    Returns:
+      The content hash of the file.
+    """
+
+  @abc.abstractmethod
+  def get(
+      self, invocation_context: InvocationContext, content_hash: str
+  ) -> Optional[bytes]:
+    """Gets the content of a file.
+
+    Args:
+      invocation_context: The invocation context of the code execution.
+      content_hash: The content hash returned by `put`.
+
+    Returns:
+      The raw bytes of the file, or None if not found.
+    """
+
+
+class LocalInputFileStore(BaseInputFileStore):
+  """Stores the input files in a local directory, shared by all sessions."""
+
+  def __init__(self, directory: str):
+    """Initializes the LocalInputFileStore.
+
+    Args:
+      directory: The directory to store the files in. It's created if missing.
+    """
+    self.directory = os.path.abspath(directory)
+
+  def get_path(self, content_hash: str) -> str:
+    """Returns the path of the file with the content hash."""
+    if not content_hash.isalnum():
+      raise ValueError(f'Invalid content hash: {content_hash}')
+    return os.path.join(self.directory, content_hash[:2], content_hash)
+
+  def put(self, invocation_context: InvocationContext, content: bytes) -> str:
+    content_hash = compute_content_hash(content)
+    path = self.get_path(content_hash)
+    if os.path.exists(path):
+      return content_hash
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Writes to a temporary file first, so readers never see a partial file.
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+      with os.fdopen(fd, 'wb') as f:
+        f.write(content)
+      os.replace(temp_path, path)
+    except BaseException:
+      os.remove(temp_path)
+      raise
+    return content_hash
+
+  def get(
+      self, invocation_context: InvocationContext, content_hash: str
+  ) -> Optional[bytes]:
+    try:
+      with open(self.get_path(content_hash), 'rb') as f:
+        return f.read()
+    except FileNotFoundError:
+      return None
+
+
+class ArtifactInputFileStore(BaseInputFileStore):
+  """Stores the input files as user artifacts of the artifact service.
+
+  The files are saved in the user namespace, so they are shared by the
+  sessions of a user. They are listed with the other artifacts of the user,
+  e.g. by `list_artifact_keys` and the `load_artifacts` tool.
+  """
+
+  def __init__(self):
+    # id(artifact service) -> (a weak reference to the artifact service, the
+    # (app_name, user_id, content_hash) of the files known to be saved in it).
+    # Artifact services can't be dict keys, as they aren't hashable.
+    self._saved: dict[
+        int,
+        tuple[weakref.ref[BaseArtifactService], set[tuple[str, str, str]]],
+    ] = {}
+    self._lock = threading.Lock()
+
+  def put(self, invocation_context: InvocationContext, content: bytes) -> str:
+    artifact_service = self._get_artifact_service(invocation_context)
+    content_hash = compute_content_hash(content)
+    key = (
+        invocation_context.app_name,
+        invocation_context.user_id,
+        content_hash,
+    )
+    with self._lock:
+      if key in self._get_saved(artifact_service):
+        return content_hash
+    artifact_kwargs = dict(
+        app_name=invocation_context.app_name,
+        user_id=invocation_context.user_id,
+        session_id=invocation_context.session.id,
+        filename=_ARTIFACT_PREFIX + content_hash,
+    )
+    if not artifact_service.list_versions(**artifact_kwargs):
+      artifact_service.save_artifact(
+          **artifact_kwargs,
+          artifact=types.Part.from_bytes(
+              data=content, mime_type='application/octet-stream'
+          ),
+      )
+    with self._lock:
+      self._get_saved(artifact_service).add(key)
+    return content_hash
+
+  def get(
+      self, invocation_context: InvocationContext, content_hash: str
+  ) -> Optional[bytes]:
+    artifact = self._get_artifact_service(invocation_context).load_artifact(
+        app_name=invocation_context.app_name,
+        user_id=invocation_context.user_id,
+        session_id=invocation_context.session.id,
+        filename=_ARTIFACT_PREFIX + content_hash,
+    )
+    if not artifact or not artifact.inline_data:
+      return None
+    return artifact.inline_data.data
+
+  def _get_saved(
+      self, artifact_service: BaseArtifactService
+  ) -> set[tuple[str, str, str]]:
+    service_id = id(artifact_service)
+    entry = self._saved.get(service_id)
+    if entry is None or entry[0]() is not artifact_service:
+      # Drops the entries of the artifact services that are gone, including a
+      # previous one with the same id.
+      self._saved = {
+          key: value for key, value in self._saved.items() if value[0]()
+      }
+      entry = self._saved[service_id] = (weakref.ref(artifact_service), set())
+    return entry[1]
+
+  def _get_artifact_service(
+      self, invocation_context: InvocationContext
+  ) -> BaseArtifactService:
+    if invocation_context.artifact_service is None:
+      raise ValueError('Artifact service is not initialized.')
+    return invocation_context.artifact_service
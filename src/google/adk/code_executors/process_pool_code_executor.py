@@ -0,0 +1,392 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import json
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import weakref
+from typing import Any
+from typing import ClassVar
+from typing import Optional
+
+from pydantic import Field
+from pydantic import PrivateAttr
+from typing_extensions import override
+
+from ..agents.invocation_context import InvocationContext
+from .base_code_executor import BaseCodeExecutor
+from .code_execution_utils import CodeExecutionInput
+from .code_execution_utils import CodeExecutionResult
+from .code_execution_utils import File
+
+_WORKER_PATH = os.path.join(
+    os.path.dirname(__file__), '_process_pool_worker.py'
+)
+
+_WORKER_STARTUP_TIMEOUT = 60.0
+"""Seconds to wait for a worker to import the preloaded modules."""
+
+
+class _WorkerExitedError(Exception):
+  """The worker process exited before responding."""
+
+
+class _Worker:
+  """A worker process, executing one code at a time.
+
+  The responses are read by a background thread, so they can be waited for
+  with a timeout.
+  """
+
+  def __init__(self, config: dict[str, Any]):
+    self.root_dir = tempfile.mkdtemp(prefix='adk_code_executor_')
+    working_dir = os.path.join(self.root_dir, 'work')
+    files_dir = os.path.join(self.root_dir, 'files')
+    os.mkdir(working_dir)
+    os.mkdir(files_dir)
+    self.process = subprocess.Popen(
+        [
+            sys.executable,
+            _WORKER_PATH,
+            json.dumps(dict(config, files_dir=files_dir)),
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        cwd=working_dir,
+    )
+    self.executions = 0
+    self.execution_ids: set[str] = set()
+    # The stateful executions whose globals the worker should drop.
+    self.dropped_execution_ids: set[str] = set()
+    # The content hashes of the input files cached by the worker.
+    self.content_hashes: set[str] = set()
+    self._ready = False
+    self._responses: queue.Queue[Optional[dict[str, Any]]] = queue.Queue()
+    threading.Thread(target=self._read_responses, daemon=True).start()
+
+  def run(self, request: dict[str, Any], timeout: Optional[float]):
+    """Sends the request to the worker and waits for the response.
+
+    Raises:
+      TimeoutError: If the worker didn't respond in time.
+      _WorkerExitedError: If the worker exited.
+    """
+    if not self._ready:
+      self._get_response(_WORKER_STARTUP_TIMEOUT)
+      self._ready = True
+    try:
+      self.process.stdin.write(json.dumps(request).encode() + b'\n')
+      self.process.stdin.flush()
+    except (BrokenPipeError, OSError) as e:
+      raise _WorkerExitedError() from e
+    self.executions += 1
+    return self._get_response(timeout)
+
+  def exit_message(self) -> str:
+    returncode = self.process.wait()
+    if returncode < 0:
+      try:
+        return (
+            'Code execution worker was killed by'
+            f' {signal.Signals(-returncode).name}.'
+        )
+      except ValueError:
+        pass
+    return f'Code execution worker exited with code {returncode}.'
+
+  def kill(self):
+    self.process.kill()
+    self.process.wait()
+    for stream in (self.process.stdin, self.process.stdout):
+      try:
+        stream.close()
+      except OSError:
+        pass
+    shutil.rmtree(self.root_dir, ignore_errors=True)
+
+  def _get_response(self, timeout: Optional[float]) -> dict[str, Any]:
+    try:
+      response = self._responses.get(timeout=timeout)
+    except queue.Empty as e:
+      raise TimeoutError() from e
+    if response is None:
+      raise _WorkerExitedError()
+    return response
+
+  def _read_responses(self):
+    try:
+      for line in self.process.stdout:
+        self._responses.put(json.loads(line))
+    except (OSError, ValueError):
+      pass
+    self._responses.put(None)
+
+
+def _kill_workers(workers: list[_Worker]):
+  for worker in workers:
+    worker.kill()
+
+
+class ProcessPoolCodeExecutor(BaseCodeExecutor):
+  """A code executor that executes code in a pool of local Python processes.
+
+  The worker processes are started once, with `preload_modules` already
+  imported, and reused for many executions, so executions don't pay for the
+  interpreter startup. The executions run outside the server process and are
+  waited for without blocking the event loop.
+
+  When `stateful` is True, the executions of a session always go to the same
+  worker and share their globals. The state of a session is lost when its
+  worker is recycled, times out or crashes, or when it's the least recently
+  used of more than `max_stateful_executions` sessions.
+
+  The limits restrict the resources of the code, but the code runs with the
+  permissions of the server, so this executor is not a sandbox for untrusted
+  code.
+
+  Attributes:
+    pool_size: The number of worker processes.
+    preload_modules: The modules imported by the workers when they start.
+      Modules that are not installed are skipped.
+    max_executions_per_worker: The number of executions after which a worker
+      is replaced with a new one. None never replaces the workers.
+    max_stateful_executions: The number of stateful executions whose globals
+      are kept. The globals of the least recently used ones are dropped above
+      it.
+    timeout_seconds: Seconds an execution may take before its worker is
+      killed. None disables the timeout.
+    cpu_time_limit_seconds: The CPU seconds an execution may use before its
+      worker is killed. None disables the limit. Only supported on Unix.
+    memory_limit_bytes: The address space a worker may use. Allocations above
+      it raise MemoryError in the code. None disables the limit. Only
+      supported on Unix.
+  """
+
+  pool_size: int = Field(default=2, ge=1)
+  """
+  The number of worker processes.
+  """
+
+  preload_modules: list[str] = Field(default_factory=lambda: ['pandas'])
+  """
+  The modules imported by the workers when they start. Modules that are not
+  installed are skipped.
+  """
+
+  max_executions_per_worker: Optional[int] = 100
+  """
+  The number of executions after which a worker is replaced with a new one.
+  None never replaces the workers.
+  """
+
+  max_stateful_executions: int = Field(default=1000, ge=1)
+  """
+  The number of stateful executions whose globals are kept. The globals of the
+  least recently used ones are dropped above it.
+  """
+
+  timeout_seconds: Optional[float] = 60.0
+  """
+  Seconds an execution may take before its worker is killed. None disables
+  the timeout.
+  """
+
+  cpu_time_limit_seconds: Optional[int] = None
+  """
+  The CPU seconds an execution may use before its worker is killed. None
+  disables the limit. Only supported on Unix.
+  """
+
+  memory_limit_bytes: Optional[int] = None
+  """
+  The address space a worker may use. Allocations above it raise MemoryError
+  in the code. None disables the limit. Only supported on Unix.
+  """
+
+  _loads_input_files: ClassVar[bool] = True
+
+  _workers: list[_Worker] = PrivateAttr(default_factory=list)
+  _busy_workers: set[_Worker] = PrivateAttr(default_factory=set)
+  # execution_id -> the worker holding the globals of the stateful execution,
+  # from the least to the most recently used.
+  _sticky_workers: collections.OrderedDict[str, _Worker] = PrivateAttr(
+      default_factory=collections.OrderedDict
+  )
+  _condition: threading.Condition = PrivateAttr(
+      default_factory=threading.Condition
+  )
+  _closed: bool = PrivateAttr(default=False)
+  _finalizer: weakref.finalize = PrivateAttr()
+
+  def __init__(self, **data):
+    """Initializes the ProcessPoolCodeExecutor.
+
+    The workers are started on the first execution. They are stopped by
+    `close()`, when the executor is garbage collected, or at exit.
+    """
+    super().__init__(**data)
+    # Doesn't reference the executor, so that it can be collected.
+    self._finalizer = weakref.finalize(self, _kill_workers, self._workers)
+
+  @override
+  def execute_code(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    execution_id = code_execution_input.execution_id if self.stateful else None
+    worker = self._acquire_worker(execution_id)
+    with self._condition:
+      dropped_execution_ids = worker.dropped_execution_ids
+      worker.dropped_execution_ids = set()
+    healthy = False
+    try:
+      input_files = []
+      for file in code_execution_input.input_files:
+        input_file = self._get_input_file_request(
+            invocation_context, worker, file
+        )
+        if input_file:
+          input_files.append(input_file)
+      request = {
+          'code': code_execution_input.code,
+          'input_files': input_files,
+          'execution_id': execution_id,
+          'dropped_execution_ids': sorted(dropped_execution_ids),
+      }
+      response = worker.run(request, self.timeout_seconds)
+      healthy = True
+      worker.content_hashes.update(
+          file['content_hash'] for file in input_files if file['content_hash']
+      )
+    except TimeoutError:
+      return CodeExecutionResult(
+          stderr=(
+              f'Code execution timed out after {self.timeout_seconds} seconds.'
+          )
+      )
+    except _WorkerExitedError:
+      return CodeExecutionResult(stderr=worker.exit_message())
+    finally:
+      self._release_worker(worker, healthy)
+    return CodeExecutionResult(
+        stdout=response['stdout'], stderr=response['stderr'], output_files=[]
+    )
+
+  def close(self):
+    """Stops the worker processes."""
+    with self._condition:
+      self._closed = True
+      # Keeps the list, which is shared with the finalizer.
+      workers = list(self._workers)
+      self._workers.clear()
+      self._busy_workers.clear()
+      self._sticky_workers.clear()
+      self._condition.notify_all()
+    self._finalizer.detach()
+    _kill_workers(workers)
+
+  def _acquire_worker(self, execution_id: Optional[str]) -> _Worker:
+    """Waits for the worker of the execution, or any idle worker."""
+    with self._condition:
+      if self._closed:
+        raise RuntimeError('ProcessPoolCodeExecutor is closed.')
+      while len(self._workers) < self.pool_size:
+        self._workers.append(self._start_worker())
+      while True:
+        worker = self._sticky_workers.get(execution_id)
+        if worker is not None:
+          self._sticky_workers.move_to_end(execution_id)
+        else:
+          idle_workers = [
+              w for w in self._workers if w not in self._busy_workers
+          ]
+          if idle_workers:
+            # Spreads the stateful executions over the workers.
+            worker = min(idle_workers, key=lambda w: len(w.execution_ids))
+            if execution_id:
+              self._sticky_workers[execution_id] = worker
+              worker.execution_ids.add(execution_id)
+              self._drop_least_recently_used_executions()
+        if worker is not None and worker not in self._busy_workers:
+          self._busy_workers.add(worker)
+          return worker
+        self._condition.wait()
+        if self._closed:
+          raise RuntimeError('ProcessPoolCodeExecutor is closed.')
+
+  def _drop_least_recently_used_executions(self):
+    """Drops the stateful executions above `max_stateful_executions`.
+
+    Their workers drop the globals on their next execution.
+    """
+    while len(self._sticky_workers) > self.max_stateful_executions:
+      execution_id, worker = self._sticky_workers.popitem(last=False)
+      worker.execution_ids.discard(execution_id)
+      worker.dropped_execution_ids.add(execution_id)
+
+  def _release_worker(self, worker: _Worker, healthy: bool):
+    """Makes the worker available again, or replaces it with a new one."""
+    with self._condition:
+      self._busy_workers.discard(worker)
+      recycle = not healthy or (
+          self.max_executions_per_worker is not None
+          and worker.executions >= self.max_executions_per_worker
+      )
+      if recycle and worker in self._workers:
+        self._workers[self._workers.index(worker)] = self._start_worker()
+        for execution_id in worker.execution_ids:
+          self._sticky_workers.pop(execution_id, None)
+      self._condition.notify_all()
+    if recycle:
+      worker.kill()
+
+  def _get_input_file_request(
+      self,
+      invocation_context: InvocationContext,
+      worker: _Worker,
+      file: File,
+  ) -> Optional[dict[str, Any]]:
+    """Returns the input file, without the content if the worker has it.
+
+    The content of a file only referenced by its hash is loaded from the
+    store only when the worker doesn't have it. Returns None if it's missing
+    from the store.
+    """
+    if file.content_hash in worker.content_hashes:
+      return {'name': file.name, 'content_hash': file.content_hash}
+    file = self._load_input_file(invocation_context, file)
+    if file is None:
+      return None
+    return {
+        'name': file.name,
+        'content_hash': file.content_hash,
+        'content': file.content,
+    }
+
+  def _start_worker(self) -> _Worker:
+    return _Worker({
+        'preload_modules': self.preload_modules,
+        'cpu_time_limit_seconds': self.cpu_time_limit_seconds,
+        'memory_limit_bytes': self.memory_limit_bytes,
+    })
@@ -69,3 +69,13 @@ class UnsafeLocalCodeExecutor(BaseCodeExecutor):
         stderr=error,
         output_files=[],
     )
+
+  @override
+  async def execute_code_async(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    # The stdout is redirected for the whole process, so the code is executed
+    # in the event loop thread to not capture the output of other threads.
+    return self.execute_code(invocation_context, code_execution_input)
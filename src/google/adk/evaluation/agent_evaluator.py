@@ -82,6 +82,7 @@ class AgentEvaluator:
       num_runs=NUM_RUNS,
       agent_name=None,
       initial_session_file=None,
+      max_concurrency=None,
   ):
     """Evaluates an Agent given eval data.
 
@@ -97,6 +98,8 @@ class AgentEvaluator:
       agent_name: The name of the agent.
       initial_session_file: File that contains initial session state that is
         needed by all the evals in the eval dataset.
+      max_concurrency: The maximum number of eval dataset entries that are run
+        at the same time.
     """
     test_files = []
     if isinstance(eval_dataset_file_path_or_dir, str) and os.path.isdir(
@@ -126,6 +129,7 @@ class AgentEvaluator:
           num_runs,
           agent_name=agent_name,
           initial_session={"state": initial_session_state},
+          max_concurrency=max_concurrency,
       )
 
       if AgentEvaluator._response_evaluation_required(criteria, [dataset]):
@@ -247,7 +251,12 @@ class AgentEvaluator:
 
   @staticmethod
   def _generate_responses(
-      agent_module, eval_dataset, num_runs, agent_name=None, initial_session={}
+      agent_module,
+      eval_dataset,
+      num_runs,
+      agent_name=None,
+      initial_session={},
+      max_concurrency=None,
   ):
     """Generates evaluation responses by running the agent module multiple times."""
     return EvaluationGenerator.generate_responses(
@@ -256,6 +265,7 @@ class AgentEvaluator:
         repeat_num=num_runs,
         agent_name=agent_name,
         initial_session=initial_session,
+        max_concurrency=max_concurrency,
     )
 
   @staticmethod
@@ -0,0 +1,331 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Any
+from typing import AsyncGenerator
+from typing import AsyncIterable
+from typing import Awaitable
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import Optional
+from typing import TypeVar
+import uuid
+
+from ..agents.base_agent import BaseAgent
+from ..artifacts.base_artifact_service import BaseArtifactService
+from ..artifacts.in_memory_artifact_service import InMemoryArtifactService
+from ..sessions.base_session_service import BaseSessionService
+from ..sessions.in_memory_session_service import InMemorySessionService
+from .evaluation_generator import EvaluationGenerator
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+DEFAULT_MAX_CONCURRENCY = 4
+"""The default number of cases that run at the same time, for agents without a
+reset function."""
+
+
+@dataclasses.dataclass
+class EvalCase:
+  """An eval case: the turns of a conversation with the agent."""
+
+  case_id: str
+  """The unique ID of the case, used to resume from a checkpoint."""
+
+  data: list[dict[str, Any]]
+  """The turns, with the query and the expected tool use and reference."""
+
+  initial_session: dict[str, Any] = dataclasses.field(default_factory=dict)
+  """The app name, user ID and state of the session of the case."""
+
+  session_id: Optional[str] = None
+  """The ID of the session of the case. A random one if None."""
+
+
+@dataclasses.dataclass
+class EvalCaseResult:
+  """The responses of the agent to an eval case."""
+
+  case_id: str
+  session_id: str
+
+  responses: list[dict[str, Any]]
+  """The turns of the case, with the actual response and tool use."""
+
+  error: Optional[str] = None
+  """The error that failed the case. Failed cases aren't checkpointed."""
+
+  case_hash: Optional[str] = None
+  """The hash of the case the responses were generated for. A checkpointed
+  result is only reused if the case didn't change."""
+
+
+class EvaluationEngine:
+  """Generates the responses to eval cases concurrently on one event loop.
+
+  Each case runs in its own session, and at most `max_concurrency` cases run
+  at the same time. The results are yielded as the cases complete, so they can
+  be evaluated while the other cases still run.
+
+  Agents with a reset function run one case at a time, as the reset function
+  would reset the data of the cases still running.
+
+  When a checkpoint file is set, the results of the completed cases are
+  appended to it, and the cases found in it are not run again, unless their
+  data changed.
+
+  Usage:
+  ```
+  engine = EvaluationEngine(root_agent, max_concurrency=8)
+  async for result in engine.run(eval_cases):
+    ...
+  ```
+  """
+
+  def __init__(
+      self,
+      root_agent: BaseAgent,
+      *,
+      reset_func: Optional[Callable[[], Any]] = None,
+      max_concurrency: Optional[int] = None,
+      session_service: Optional[BaseSessionService] = None,
+      artifact_service: Optional[BaseArtifactService] = None,
+      checkpoint_path: Optional[str] = None,
+  ):
+    """Initializes the EvaluationEngine.
+
+    Args:
+      root_agent: The agent to evaluate.
+      reset_func: Called before each case to reset the data of the agent. The
+        cases then run one at a time.
+      max_concurrency: The maximum number of cases that run at the same time.
+        Defaults to DEFAULT_MAX_CONCURRENCY, or to 1 with a reset_func.
+      session_service: The session service of the case sessions. Defaults to
+        an InMemorySessionService.
+      artifact_service: The artifact service of the case sessions. Defaults to
+        an InMemoryArtifactService.
+      checkpoint_path: The path of a JSON lines file that the results of the
+        completed cases are appended to, to resume from it.
+    """
+    if max_concurrency is not None and max_concurrency < 1:
+      raise ValueError(
+          f"max_concurrency must be at least 1, got {max_concurrency}."
+      )
+    if reset_func is None:
+      max_concurrency = max_concurrency or DEFAULT_MAX_CONCURRENCY
+    else:
+      if max_concurrency is not None and max_concurrency > 1:
+        logger.warning(
+            "Running the eval cases one at a time instead of %s, as the agent"
+            " has a reset function.",
+            max_concurrency,
+        )
+      max_concurrency = 1
+    self.root_agent = root_agent
+    self.reset_func = reset_func
+    self.max_concurrency = max_concurrency
+    self.session_service = session_service or InMemorySessionService()
+    self.artifact_service = artifact_service or InMemoryArtifactService()
+    self.checkpoint_path = checkpoint_path
+
+  async def run(
+      self, eval_cases: Iterable[EvalCase]
+  ) -> AsyncGenerator[EvalCaseResult, None]:
+    """Runs the eval cases and yields their results as they complete.
+
+    Args:
+      eval_cases: The cases to run. Their case IDs must be unique.
+
+    Yields:
+      The results, in the order the cases complete. The results found in the
+      checkpoint file are yielded first.
+    """
+    checkpointed_results = self._load_checkpoint()
+    semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def run_case(eval_case: EvalCase) -> EvalCaseResult:
+      async with semaphore:
+        return await self._run_case(eval_case)
+
+    tasks = []
+    for eval_case in eval_cases:
+      checkpointed_result = checkpointed_results.get(eval_case.case_id)
+      if (
+          checkpointed_result
+          and checkpointed_result.case_hash == _get_case_hash(eval_case)
+      ):
+        yield checkpointed_result
+      else:
+        tasks.append(asyncio.create_task(run_case(eval_case)))
+
+    try:
+      for task in asyncio.as_completed(tasks):
+        result = await task
+        if result.error is None:
+          self._save_checkpoint(result)
+        yield result
+    finally:
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+
+  async def _run_case(self, eval_case: EvalCase) -> EvalCaseResult:
+    session_id = eval_case.session_id or str(uuid.uuid4())
+    try:
+      responses = (
+          await EvaluationGenerator._process_query_with_root_agent_async(
+              data=eval_case.data,
+              root_agent=self.root_agent,
+              reset_func=self.reset_func,
+              initial_session=eval_case.initial_session,
+              session_id=session_id,
+              session_service=self.session_service,
+              artifact_service=self.artifact_service,
+          )
+      )
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.exception("Eval case %s failed.", eval_case.case_id)
+      return EvalCaseResult(
+          case_id=eval_case.case_id,
+          session_id=session_id,
+          responses=[],
+          error=str(e),
+      )
+    return EvalCaseResult(
+        case_id=eval_case.case_id,
+        session_id=session_id,
+        responses=responses,
+        case_hash=_get_case_hash(eval_case),
+    )
+
+  def _load_checkpoint(self) -> dict[str, EvalCaseResult]:
+    if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+      return {}
+    results = {}
+    with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+      for line in f:
+        try:
+          result = EvalCaseResult(**json.loads(line))
+        except (ValueError, TypeError):
+          # E.g. the last line, when the previous run was killed while writing
+          # it.
+          logger.warning("Skipping invalid checkpoint line: %s", line)
+          continue
+        results[result.case_id] = result
+    return results
+
+  def _save_checkpoint(self, result: EvalCaseResult):
+    if not self.checkpoint_path:
+      return
+    with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+      f.write(json.dumps(dataclasses.asdict(result), default=str) + "\n")
+
+
+def _get_case_hash(eval_case: EvalCase) -> str:
+  """Returns the hash of the data and initial session of the case."""
+  case = json.dumps(
+      [eval_case.data, eval_case.initial_session], sort_keys=True, default=str
+  )
+  return hashlib.sha256(case.encode()).hexdigest()
+
+
+def run_coroutine_sync(coroutine: Awaitable[_T]) -> _T:
+  """Runs a coroutine to completion from synchronous code.
+
+  The coroutine runs in a new thread when the caller is already running an
+  event loop, e.g. in an async test.
+  """
+  try:
+    asyncio.get_running_loop()
+  except RuntimeError:
+    return asyncio.run(coroutine)
+
+  result = []
+  error = []
+
+  def run():
+    try:
+      result.append(asyncio.run(coroutine))
+    except BaseException as e:  # pylint: disable=broad-exception-caught
+      error.append(e)
+
+  thread = threading.Thread(target=run)
+  thread.start()
+  thread.join()
+  if error:
+    raise error[0]
+  return result[0]
+
+
+_DONE = object()
+
+
+def iterate_sync(
+    async_iterable: AsyncIterable[_T],
+) -> Generator[_T, None, None]:
+  """Iterates over an async iterable from synchronous code.
+
+  The iterable is consumed on an event loop in a new thread, so the items are
+  yielded as they are produced, also when the caller is already running an
+  event loop. Closing the generator cancels the iteration.
+  """
+  items = queue.Queue()
+  loop = asyncio.new_event_loop()
+
+  async def consume():
+    async for item in async_iterable:
+      items.put((item, None))
+
+  task = loop.create_task(consume())
+
+  def run():
+    try:
+      loop.run_until_complete(task)
+      items.put((_DONE, None))
+    except BaseException as e:  # pylint: disable=broad-exception-caught
+      items.put((_DONE, e))
+    finally:
+      loop.run_until_complete(loop.shutdown_asyncgens())
+      loop.run_until_complete(loop.shutdown_default_executor())
+      loop.close()
+
+  thread = threading.Thread(target=run)
+  thread.start()
+  try:
+    while True:
+      item, error = items.get()
+      if item is _DONE:
+        if error:
+          raise error
+        return
+      yield item
+  finally:
+    try:
+      loop.call_soon_threadsafe(task.cancel)
+    except RuntimeError:
+      pass  # The loop is already closed.
+    thread.join()
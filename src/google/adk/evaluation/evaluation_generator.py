@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextvars
 import importlib
+from typing import Any
+from typing import Optional
 import uuid
 
 from google.genai import types
@@ -27,6 +30,12 @@ from ..sessions.in_memory_session_service import InMemorySessionService
 from ..sessions.session import Session
 from .evaluation_constants import EvalConstants
 
+# The eval data of the case run by the current task, read by the mock tool
+# callback, as the cases run concurrently with the same agents.
+_current_eval_dataset: contextvars.ContextVar[
+    Optional[list[dict[str, Any]]]
+] = contextvars.ContextVar("current_eval_dataset", default=None)
+
 
 class EvaluationGenerator:
   """Generates evaluation responses for agents."""
@@ -38,6 +47,7 @@ class EvaluationGenerator:
       repeat_num=3,
       agent_name=None,
       initial_session={},
+      max_concurrency=None,
   ):
     """Returns evaluation responses for the given dataset and agent.
 
@@ -49,18 +59,63 @@ class EvaluationGenerator:
       agent_name: The name of the agent that should be evaluated. This is
         usually the sub-agent.
       initial_session: Initial session for the eval data.
+      max_concurrency: The maximum number of eval data entries that are run
+        at the same time. Defaults to DEFAULT_MAX_CONCURRENCY, or to 1 for
+        agents with a reset_data function.
     """
-    results = []
-
-    for _ in range(repeat_num):
-      for data in eval_dataset:
-        results.append(
-            EvaluationGenerator._process_query(
-                data, agent_module_path, agent_name, initial_session
-            )
+    from .evaluation_engine import run_coroutine_sync
+
+    return run_coroutine_sync(
+        EvaluationGenerator.generate_responses_async(
+            eval_dataset,
+            agent_module_path,
+            repeat_num=repeat_num,
+            agent_name=agent_name,
+            initial_session=initial_session,
+            max_concurrency=max_concurrency,
         )
+    )
 
-    return results
+  @staticmethod
+  async def generate_responses_async(
+      eval_dataset,
+      agent_module_path,
+      repeat_num=3,
+      agent_name=None,
+      initial_session={},
+      max_concurrency=None,
+  ):
+    """Returns evaluation responses, running the entries concurrently.
+
+    See `generate_responses`. The responses are in the order of the repeats
+    and the dataset entries.
+    """
+    from .evaluation_engine import EvalCase
+    from .evaluation_engine import EvaluationEngine
+
+    agent_to_evaluate, reset_func = EvaluationGenerator._load_agent(
+        agent_module_path, agent_name
+    )
+    engine = EvaluationEngine(
+        agent_to_evaluate,
+        reset_func=reset_func,
+        max_concurrency=max_concurrency,
+    )
+    eval_cases = [
+        EvalCase(
+            case_id=f"{repeat}:{index}",
+            data=data,
+            initial_session=initial_session,
+        )
+        for repeat in range(repeat_num)
+        for index, data in enumerate(eval_dataset)
+    ]
+    results = {}
+    async for result in engine.run(eval_cases):
+      if result.error is not None:
+        raise RuntimeError(f"Eval data {result.case_id} failed: {result.error}")
+      results[result.case_id] = result.responses
+    return [results[eval_case.case_id] for eval_case in eval_cases]
 
   @staticmethod
   def generate_responses_from_session(session_path, eval_dataset):
@@ -89,10 +144,9 @@ class EvaluationGenerator:
     return results
 
   @staticmethod
-  def _process_query(data, module_name, agent_name=None, initial_session={}):
-    """Process a query using the agent and evaluation dataset."""
-    module_path = f"{module_name}"
-    agent_module = importlib.import_module(module_path)
+  def _load_agent(module_name, agent_name=None):
+    """Returns the agent to evaluate and the reset function of its module."""
+    agent_module = importlib.import_module(module_name)
     root_agent = agent_module.agent.root_agent
 
     reset_func = getattr(agent_module.agent, "reset_data", None)
@@ -101,6 +155,14 @@ class EvaluationGenerator:
     if agent_name:
       agent_to_evaluate = root_agent.find_agent(agent_name)
       assert agent_to_evaluate, f"Sub-Agent `{agent_name}` not found."
+    return agent_to_evaluate, reset_func
+
+  @staticmethod
+  def _process_query(data, module_name, agent_name=None, initial_session={}):
+    """Process a query using the agent and evaluation dataset."""
+    agent_to_evaluate, reset_func = EvaluationGenerator._load_agent(
+        module_name, agent_name
+    )
 
     return EvaluationGenerator._process_query_with_root_agent(
         data, agent_to_evaluate, reset_func, initial_session
@@ -117,6 +179,31 @@ class EvaluationGenerator:
       artifact_service=None,
   ):
     """Process a query using the agent and evaluation dataset."""
+    from .evaluation_engine import run_coroutine_sync
+
+    return run_coroutine_sync(
+        EvaluationGenerator._process_query_with_root_agent_async(
+            data,
+            root_agent,
+            reset_func,
+            initial_session=initial_session,
+            session_id=session_id,
+            session_service=session_service,
+            artifact_service=artifact_service,
+        )
+    )
+
+  @staticmethod
+  async def _process_query_with_root_agent_async(
+      data,
+      root_agent,
+      reset_func,
+      initial_session={},
+      session_id=None,
+      session_service=None,
+      artifact_service=None,
+  ):
+    """Process a query using the agent and evaluation dataset."""
 
     # we don't know which tools belong to which agent
     # so we just apply to any agents that has certain tool outputs
@@ -127,12 +214,9 @@ class EvaluationGenerator:
         if EvalConstants.MOCK_TOOL_OUTPUT in expected:
           all_mock_tools.add(expected[EvalConstants.TOOL_NAME])
 
-    eval_data_copy = data.copy()
     EvaluationGenerator.apply_before_tool_callback(
         root_agent,
-        lambda *args: EvaluationGenerator.before_tool_callback(
-            *args, eval_dataset=eval_data_copy
-        ),
+        EvaluationGenerator._mock_tool_callback,
         all_mock_tools,
     )
 
@@ -143,7 +227,7 @@ class EvaluationGenerator:
     user_id = initial_session.get("user_id", "test_user_id")
     session_id = session_id if session_id else str(uuid.uuid4())
 
-    _ = session_service.create_session(
+    _ = await session_service.create_session_async(
         app_name=app_name,
         user_id=user_id,
         state=initial_session.get("state", {}),
@@ -163,28 +247,36 @@ class EvaluationGenerator:
     if callable(reset_func):
       reset_func()
 
-    responses = data.copy()
-
-    for index, eval_entry in enumerate(responses):
-      response = None
-      query = eval_entry["query"]
-      content = types.Content(role="user", parts=[types.Part(text=query)])
-      turn_actual_tool_uses = []
-
-      for event in runner.run(
-          user_id=user_id, session_id=session_id, new_message=content
-      ):
-        if event.is_final_response() and event.content and event.content.parts:
-          response = event.content.parts[0].text
-        elif event.get_function_calls():
-          for call in event.get_function_calls():
-            turn_actual_tool_uses.append({
-                EvalConstants.TOOL_NAME: call.name,
-                EvalConstants.TOOL_INPUT: call.args,
-            })
-
-      responses[index]["actual_tool_use"] = turn_actual_tool_uses
-      responses[index]["response"] = response
+    # Copies the entries, as the same data may be run concurrently.
+    responses = [eval_entry.copy() for eval_entry in data]
+    eval_dataset_token = _current_eval_dataset.set(data.copy())
+    try:
+      for index, eval_entry in enumerate(responses):
+        response = None
+        query = eval_entry["query"]
+        content = types.Content(role="user", parts=[types.Part(text=query)])
+        turn_actual_tool_uses = []
+
+        async for event in runner.run_async(
+            user_id=user_id, session_id=session_id, new_message=content
+        ):
+          if (
+              event.is_final_response()
+              and event.content
+              and event.content.parts
+          ):
+            response = event.content.parts[0].text
+          elif event.get_function_calls():
+            for call in event.get_function_calls():
+              turn_actual_tool_uses.append({
+                  EvalConstants.TOOL_NAME: call.name,
+                  EvalConstants.TOOL_INPUT: call.args,
+              })
+
+        responses[index]["actual_tool_use"] = turn_actual_tool_uses
+        responses[index]["response"] = response
+    finally:
+      _current_eval_dataset.reset(eval_dataset_token)
 
     return responses
 
@@ -226,6 +318,16 @@ class EvaluationGenerator:
       responses[index]["response"] = response
     return responses
 
+  @staticmethod
+  def _mock_tool_callback(tool, args, tool_context):
+    """Returns the mock tool output of the eval case run by the current task."""
+    eval_dataset = _current_eval_dataset.get()
+    if eval_dataset is None:
+      return None
+    return EvaluationGenerator.before_tool_callback(
+        tool, args, tool_context, eval_dataset
+    )
+
   @staticmethod
   def before_tool_callback(tool, args, tool_context, eval_dataset):
     """Intercept specific tool calls and return predefined outputs
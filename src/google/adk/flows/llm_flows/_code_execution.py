@@ -16,13 +16,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import copy
 import dataclasses
+import logging
 import os
 import re
 from typing import AsyncGenerator
-from typing import Generator
 from typing import Optional
 from typing import TYPE_CHECKING
 
@@ -45,6 +46,8 @@ from ._base_llm_processor import BaseLlmResponseProcessor
 if TYPE_CHECKING:
   from ...models.llm_request import LlmRequest
 
+logger = logging.getLogger(__name__)
+
 
 @dataclasses.dataclass
 class DataFileUtil:
@@ -122,7 +125,7 @@ class _CodeExecutionRequestProcessor(BaseLlmRequestProcessor):
     if not invocation_context.agent.code_executor:
       return
 
-    for event in _run_pre_processor(invocation_context, llm_request):
+    async for event in _run_pre_processor(invocation_context, llm_request):
       yield event
 
     # Convert the code execution parts to text parts.
@@ -152,17 +155,17 @@ class _CodeExecutionResponseProcessor(BaseLlmResponseProcessor):
     if llm_response.partial:
       return
 
-    for event in _run_post_processor(invocation_context, llm_response):
+    async for event in _run_post_processor(invocation_context, llm_response):
       yield event
 
 
 response_processor = _CodeExecutionResponseProcessor()
 
 
-def _run_pre_processor(
+async def _run_pre_processor(
     invocation_context: InvocationContext,
     llm_request: LlmRequest,
-) -> Generator[Event, None, None]:
+) -> AsyncGenerator[Event, None]:
   """Pre-process the user message by adding the user message to the Colab notebook."""
   from ...agents.llm_agent import LlmAgent
 
@@ -189,8 +192,8 @@ def _run_pre_processor(
   # [Step 1] Extract data files from the session_history and store them in
   # memory. Meanwhile, mutate the inline data file to text part in session
   # history from all turns.
-  all_input_files = _extrac_and_replace_inline_files(
-      code_executor_context, llm_request
+  all_input_files = await _extrac_and_replace_inline_files(
+      invocation_context, code_executor_context, llm_request
   )
 
   # [Step 2] Run Explore_Df code on the data files from the current turn. We
@@ -222,11 +225,11 @@ def _run_pre_processor(
         content=code_content,
     )
 
-    code_execution_result = code_executor.execute_code(
+    code_execution_result = await code_executor.execute_code_async(
         invocation_context,
         CodeExecutionInput(
             code=code_str,
-            input_files=[file],
+            input_files=await _load_input_files(invocation_context, [file]),
             execution_id=_get_or_set_execution_id(
                 invocation_context, code_executor_context
             ),
@@ -249,10 +252,10 @@ def _run_pre_processor(
     llm_request.contents.append(copy.deepcopy(execution_result_event.content))
 
 
-def _run_post_processor(
+async def _run_post_processor(
     invocation_context: InvocationContext,
     llm_response,
-) -> Generator[Event, None, None]:
+) -> AsyncGenerator[Event, None]:
   """Post-process the model response by extracting and executing the first code block."""
   agent = invocation_context.agent
   code_executor = agent.code_executor
@@ -289,11 +292,13 @@ def _run_post_processor(
       actions=EventActions(),
   )
 
-  code_execution_result = code_executor.execute_code(
+  code_execution_result = await code_executor.execute_code_async(
       invocation_context,
       CodeExecutionInput(
           code=code_str,
-          input_files=code_executor_context.get_input_files(),
+          input_files=await _load_input_files(
+              invocation_context, code_executor_context.get_input_files()
+          ),
           execution_id=_get_or_set_execution_id(
               invocation_context, code_executor_context
           ),
@@ -314,11 +319,13 @@ def _run_post_processor(
   llm_response.content = None
 
 
-def _extrac_and_replace_inline_files(
+async def _extrac_and_replace_inline_files(
+    invocation_context: InvocationContext,
     code_executor_context: CodeExecutorContext,
     llm_request: LlmRequest,
 ) -> list[File]:
   """Extracts and replaces inline files with file names in the LLM request."""
+  input_file_store = invocation_context.agent.code_executor.input_file_store
   all_input_files = code_executor_context.get_input_files()
   saved_file_names = set(f.name for f in all_input_files)
 
@@ -346,20 +353,55 @@ def _extrac_and_replace_inline_files(
       )
 
       # Add the inlne data as input file to the code executor context.
+      if file_name in saved_file_names:
+        continue
+      encoded_content = CodeExecutionUtils.get_encoded_file_content(
+          part.inline_data.data
+      )
       file = File(
           name=file_name,
-          content=CodeExecutionUtils.get_encoded_file_content(
-              part.inline_data.data
-          ).decode(),
+          content=encoded_content.decode(),
           mime_type=mime_type,
       )
-      if file_name not in saved_file_names:
-        code_executor_context.add_input_files([file])
-        all_input_files.append(file)
+      if input_file_store:
+        file = dataclasses.replace(
+            file,
+            content_hash=await asyncio.to_thread(
+                input_file_store.put,
+                invocation_context,
+                base64.b64decode(encoded_content),
+            ),
+        )
+      code_executor_context.add_input_files([file])
+      all_input_files.append(file)
 
   return all_input_files
 
 
+async def _load_input_files(
+    invocation_context: InvocationContext, input_files: list[File]
+) -> list[File]:
+  """Loads the content of the input files only referenced by their hash.
+
+  Executors loading the input files themselves get the files unchanged, so
+  the files already cached in their runtime aren't loaded.
+  """
+  code_executor = invocation_context.agent.code_executor
+  if code_executor._loads_input_files or all(
+      file.content or not file.content_hash for file in input_files
+  ):
+    return input_files
+
+  def load() -> list[File]:
+    loaded_files = (
+        code_executor._load_input_file(invocation_context, file)
+        for file in input_files
+    )
+    return [file for file in loaded_files if file]
+
+  return await asyncio.to_thread(load)
+
+
 def _get_or_set_execution_id(
     invocation_context: InvocationContext,
     code_executor_context: CodeExecutorContext,
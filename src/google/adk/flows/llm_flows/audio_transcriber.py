@@ -13,97 +13,77 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import threading
+from typing import Optional
+from typing import Union
 
 from google.cloud import speech
-from google.genai import types as genai_types
+from typing_extensions import override
 
-if TYPE_CHECKING:
-  from ...agents.invocation_context import InvocationContext
+from ...agents.transcription_cache import BaseAudioTranscriber
 
+# The maximum audio bytes of a streaming recognition request.
+_STREAMING_CHUNK_BYTES = 16 * 1024
 
-class AudioTranscriber:
-  """Transcribes audio using Google Cloud Speech-to-Text."""
+_client: Optional[speech.SpeechClient] = None
+_client_lock = threading.Lock()
 
-  def __init__(self):
-    self.client = speech.SpeechClient()
 
-  def transcribe_file(
-      self, invocation_context: InvocationContext
-  ) -> list[genai_types.Content]:
-    """Transcribe audio, bundling consecutive segments from the same speaker.
+def _get_client() -> speech.SpeechClient:
+  """Returns the Speech-to-Text client shared by all the transcriptions."""
+  global _client
+  with _client_lock:
+    if _client is None:
+      _client = speech.SpeechClient()
+    return _client
 
-    The ordering of speakers will be preserved. Audio blobs will be merged for
-    the same speaker as much as we can do reduce the transcription latency.
 
-    Args:
-        invocation_context: The invocation context to access the transcription
-          cache.
-
-    Returns:
-        A list of Content objects containing the transcribed text.
-    """
-
-    bundled_audio = []
-    current_speaker = None
-    current_audio_data = b''
-    contents = []
-
-    # Step1: merge audio blobs
-    for transcription_entry in invocation_context.transcription_cache or []:
-      speaker, audio_data = (
-          transcription_entry.role,
-          transcription_entry.data,
-      )
-
-      if isinstance(audio_data, genai_types.Content):
-        if current_speaker is not None:
-          bundled_audio.append((current_speaker, current_audio_data))
-          current_speaker = None
-          current_audio_data = b''
-        bundled_audio.append((speaker, audio_data))
-        continue
-
-      if not audio_data.data:
-        continue
-
-      if speaker == current_speaker:
-        current_audio_data += audio_data.data
-      else:
-        if current_speaker is not None:
-          bundled_audio.append((current_speaker, current_audio_data))
-        current_speaker = speaker
-        current_audio_data = audio_data.data
+class AudioTranscriber(BaseAudioTranscriber):
+  """Transcribes audio using Google Cloud Speech-to-Text.
 
-    # Append the last audio segment if any
-    if current_speaker is not None:
-      bundled_audio.append((current_speaker, current_audio_data))
+  The audio is streamed to the API in chunks from a worker thread, so the
+  event loop isn't blocked and audio longer than one minute is supported.
+  """
 
-    # reset cache
-    invocation_context.transcription_cache = []
+  def __init__(self, language_code: str = 'en-US'):
+    """Initializes the AudioTranscriber.
 
-    # Step2: transcription
-    for speaker, data in bundled_audio:
-      if speaker == 'user':
-        audio = speech.RecognitionAudio(content=data)
-
-        config = speech.RecognitionConfig(
+    Args:
+      language_code: The language of the audio, as a BCP-47 language tag.
+    """
+    self.language_code = language_code
+
+  @override
+  async def transcribe_audio(
+      self, audio: Union[bytes, bytearray], sample_rate_hertz: int
+  ) -> list[str]:
+    return await asyncio.to_thread(
+        self._streaming_recognize, audio, sample_rate_hertz
+    )
+
+  def _streaming_recognize(
+      self, audio: Union[bytes, bytearray], sample_rate_hertz: int
+  ) -> list[str]:
+    config = speech.StreamingRecognitionConfig(
+        config=speech.RecognitionConfig(
             encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
-            language_code='en-US',
+            sample_rate_hertz=sample_rate_hertz,
+            language_code=self.language_code,
         )
-
-        response = self.client.recognize(config=config, audio=audio)
-
-        for result in response.results:
-          transcript = result.alternatives[0].transcript
-
-          parts = [genai_types.Part(text=transcript)]
-          role = speaker.lower()
-          content = genai_types.Content(role=role, parts=parts)
-          contents.append(content)
-      else:
-        # don't need to transcribe model which are already text
-        contents.append(data)
-
-    return contents
+    )
+    audio_view = memoryview(audio)
+    requests = (
+        speech.StreamingRecognizeRequest(
+            audio_content=bytes(audio_view[i : i + _STREAMING_CHUNK_BYTES])
+        )
+        for i in range(0, len(audio_view), _STREAMING_CHUNK_BYTES)
+    )
+    transcripts = []
+    for response in _get_client().streaming_recognize(
+        config=config, requests=requests
+    ):
+      for result in response.results:
+        if result.alternatives:
+          transcripts.append(result.alternatives[0].transcript)
+    return transcripts
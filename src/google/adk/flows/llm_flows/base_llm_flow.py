@@ -29,6 +29,9 @@ from ...agents.callback_context import CallbackContext
 from ...agents.invocation_context import InvocationContext
 from ...agents.live_request_queue import LiveRequestQueue
 from ...agents.run_config import StreamingMode
+from ...agents.transcription_cache import BaseAudioTranscriber
+from ...agents.transcription_cache import DEFAULT_MAX_AUDIO_SECONDS
+from ...agents.transcription_cache import TranscriptionCache
 from ...agents.transcription_entry import TranscriptionEntry
 from ...events.event import Event
 from ...models.base_llm_connection import BaseLlmConnection
@@ -48,6 +51,39 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The maximum size of the realtime audio blob that consecutive queued audio
+# chunks are joined into, i.e. about 1s of 16kHz 16-bit PCM audio.
+_MAX_REALTIME_BLOB_BATCH_BYTES = 32 * 1024
+
+
+def _build_model_response_event(
+    model_response_event: Event, llm_response: LlmResponse
+) -> Event:
+  """Builds the event of an LLM response from the model response event.
+
+  Same as validating the merged non-None fields of both, but reuses the
+  already validated content and grounding metadata of the response instead of
+  dumping and re-validating them, as it runs for every streamed chunk.
+
+  Args:
+    model_response_event: The event holding the fields shared by all the
+      events of an LLM call, e.g. its id and author.
+    llm_response: The LLM response, whose non-None fields take precedence.
+
+  Returns:
+    The new event. Its content is shared with the LLM response.
+  """
+  fields = {
+      name: value
+      for name in Event.model_fields
+      if (value := getattr(model_response_event, name)) is not None
+  }
+  fields['actions'] = model_response_event.actions.model_copy(deep=True)
+  for name in LlmResponse.model_fields:
+    if (value := getattr(llm_response, name)) is not None:
+      fields[name] = value
+  return Event.model_construct(**fields)
+
 
 class BaseLlmFlow(ABC):
   """A basic flow that calls the LLM in a loop until a final response is generated.
@@ -85,13 +121,14 @@ class BaseLlmFlow(ABC):
         with tracer.start_as_current_span('send_data'):
 
           if invocation_context.transcription_cache:
-            from . import audio_transcriber
-
-            audio_transcriber = audio_transcriber.AudioTranscriber()
-            contents = audio_transcriber.transcribe_file(invocation_context)
+            # Detached, so it's not appended to during the transcription.
+            transcription_cache = invocation_context.transcription_cache
+            invocation_context.transcription_cache = None
+            contents = await self._get_audio_transcriber(
+                invocation_context
+            ).transcribe(transcription_cache)
             logger.debug('Sending history to model: %s', contents)
             await llm_connection.send_history(contents)
-            invocation_context.transcription_cache = None
             trace_send_data(invocation_context, event_id, contents)
           else:
             await llm_connection.send_history(llm_request.contents)
@@ -143,45 +180,63 @@ class BaseLlmFlow(ABC):
       invocation_context: InvocationContext,
   ):
     """Sends data to model."""
+    live_request_queue = invocation_context.live_request_queue
     while True:
-      live_request_queue = invocation_context.live_request_queue
-      try:
-        # Streamlit's execution model doesn't preemptively yield to the event
-        # loop. Therefore, we must explicitly introduce timeouts to allow the
-        # event loop to process events.
-        # TODO: revert back(remove timeout) once we move off streamlit.
-        live_request = await asyncio.wait_for(
-            live_request_queue.get(), timeout=0.25
-        )
+      # Waits for the next request without polling, so idle live sessions
+      # don't wake up the event loop.
+      live_request = await live_request_queue.get_batch(
+          _MAX_REALTIME_BLOB_BATCH_BYTES
+      )
+      if invocation_context.active_streaming_tools:
         # duplicate the live_request to all the active streams
         logger.debug(
             'Sending live request %s to active streams: %s',
             live_request,
             invocation_context.active_streaming_tools,
         )
-        if invocation_context.active_streaming_tools:
-          for active_streaming_tool in (
-              invocation_context.active_streaming_tools
-          ).values():
-            if active_streaming_tool.stream:
-              active_streaming_tool.stream.send(live_request)
-        await asyncio.sleep(0)
-      except asyncio.TimeoutError:
-        continue
+        for active_streaming_tool in (
+            invocation_context.active_streaming_tools
+        ).values():
+          if active_streaming_tool.stream:
+            active_streaming_tool.stream.send(live_request)
       if live_request.close:
         await llm_connection.close()
         return
       if live_request.blob:
         # Cache audio data here for transcription
-        if not invocation_context.transcription_cache:
-          invocation_context.transcription_cache = []
-        invocation_context.transcription_cache.append(
+        self._get_transcription_cache(invocation_context).append(
             TranscriptionEntry(role='user', data=live_request.blob)
         )
         await llm_connection.send_realtime(live_request.blob)
       if live_request.content:
         await llm_connection.send_content(live_request.content)
 
+  def _get_transcription_cache(
+      self, invocation_context: InvocationContext
+  ) -> TranscriptionCache:
+    if invocation_context.transcription_cache is None:
+      run_config = invocation_context.run_config
+      invocation_context.transcription_cache = TranscriptionCache(
+          max_audio_seconds=(
+              run_config.max_transcription_audio_seconds
+              if run_config
+              else DEFAULT_MAX_AUDIO_SECONDS
+          )
+      )
+    return invocation_context.transcription_cache
+
+  def _get_audio_transcriber(
+      self, invocation_context: InvocationContext
+  ) -> BaseAudioTranscriber:
+    if (
+        invocation_context.run_config
+        and invocation_context.run_config.audio_transcriber
+    ):
+      return invocation_context.run_config.audio_transcriber
+    from .audio_transcriber import AudioTranscriber
+
+    return AudioTranscriber()
+
   async def _receive_from_model(
       self,
       llm_connection: BaseLlmConnection,
@@ -211,9 +266,7 @@ class BaseLlmFlow(ABC):
                 and event.content.parts[0].text
                 and not event.partial
             ):
-              if not invocation_context.transcription_cache:
-                invocation_context.transcription_cache = []
-              invocation_context.transcription_cache.append(
+              self._get_transcription_cache(invocation_context).append(
                   TranscriptionEntry(role='model', data=event.content)
               )
             yield event
@@ -536,14 +589,19 @@ class BaseLlmFlow(ABC):
       llm_response: LlmResponse,
       model_response_event: Event,
   ) -> Event:
-    model_response_event = Event.model_validate({
-        **model_response_event.model_dump(exclude_none=True),
-        **llm_response.model_dump(exclude_none=True),
-    })
+    model_response_event = _build_model_response_event(
+        model_response_event, llm_response
+    )
 
     if model_response_event.content:
       function_calls = model_response_event.get_function_calls()
       if function_calls:
+        # The content is shared with the LLM response, copy it before
+        # populating the function call ids.
+        model_response_event.content = model_response_event.content.model_copy(
+            deep=True
+        )
+        function_calls = model_response_event.get_function_calls()
         functions.populate_client_function_call_id(model_response_event)
         model_response_event.long_running_tool_ids = (
             functions.get_long_running_function_calls(
@@ -23,6 +23,7 @@ from typing_extensions import override
 from ...agents.invocation_context import InvocationContext
 from ...events.event import Event
 from ...models.llm_request import LlmRequest
+from ...sessions import _media_offload
 from ._base_llm_processor import BaseLlmRequestProcessor
 from .functions import remove_client_function_call_id
 from .functions import REQUEST_EUC_FUNCTION_CALL_NAME
@@ -42,11 +43,24 @@ class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
       return
 
     if agent.include_contents != 'none':
-      llm_request.contents = _get_contents(
-          invocation_context.branch,
-          invocation_context.session.events,
-          agent.name,
+      cache_key = (invocation_context.branch, agent.name)
+      contents_cache = invocation_context._contents_caches.get(cache_key)
+      if contents_cache is None:
+        contents_cache = _ContentsCache(invocation_context.branch, agent.name)
+        invocation_context._contents_caches[cache_key] = contents_cache
+      contents = contents_cache.get_contents(invocation_context.session.events)
+      # The cached contents keep the loaded data, so each offloaded media is
+      # only loaded once per invocation.
+      await _media_offload.load_offloaded_data(
+          contents,
+          artifact_service=invocation_context.artifact_service,
+          app_name=invocation_context.app_name,
+          user_id=invocation_context.user_id,
+          session_id=invocation_context.session.id,
       )
+      # The callbacks and processors may edit the contents of the request in
+      # place, which must not change the cached ones.
+      llm_request.contents = [_copy_content(content) for content in contents]
 
     # Maintain async generator behavior
     if False:  # Ensures it behaves as a generator
@@ -196,10 +210,75 @@ def _get_contents(
   Returns:
     A list of contents.
   """
-  filtered_events = []
-  # Parse the events, leaving the contents and the function calls and
-  # responses from the current agent.
-  for event in events:
+  return _ContentsCache(current_branch, agent_name).get_contents(events)
+
+
+class _ContentsCache:
+  """Incrementally builds the contents of the LLM requests of an agent.
+
+  Session events are only appended during an invocation, so the events
+  filtered and converted for the previous LLM call are kept, and only the new
+  events are processed. As long as every function_response event directly
+  follows its function_call event, rearranging the function responses changes
+  nothing and the converted contents are reused as is. Otherwise, e.g. once an
+  async function_response arrives later, the contents are rearranged from the
+  cached filtered events on every call.
+
+  NOTE: the returned contents are the cached ones, so they must be copied
+  before they are handed out to be edited.
+  """
+
+  def __init__(self, current_branch: Optional[str], agent_name: str = ''):
+    self._current_branch = current_branch
+    self._agent_name = agent_name
+    self._reset()
+
+  def _reset(self):
+    self._num_events = 0
+    self._last_event: Optional[Event] = None
+    self._filtered_events: list[Event] = []
+    # The converted contents by id of the filtered event, with the event kept
+    # alive so that its id isn't reused.
+    self._converted: dict[int, tuple[Event, types.Content]] = {}
+    self._contents: list[types.Content] = []
+    self._in_order = True
+    self._function_call_ids: set[str] = set()
+    self._function_response_ids: set[str] = set()
+
+  def get_contents(self, events: list[Event]) -> list[types.Content]:
+    """Returns the contents for the events, which extend the previous ones."""
+    if len(events) < self._num_events or (
+        self._num_events
+        and events[self._num_events - 1] is not self._last_event
+    ):
+      # The events were rewritten rather than appended.
+      self._reset()
+
+    for event in events[self._num_events :]:
+      filtered_event = self._filter_event(event)
+      if filtered_event:
+        self._append(filtered_event)
+    self._num_events = len(events)
+    self._last_event = events[-1] if events else None
+
+    if self._in_order:
+      return list(self._contents)
+
+    result_events = _rearrange_events_for_latest_function_response(
+        self._filtered_events
+    )
+    result_events = _rearrange_events_for_async_function_responses_in_history(
+        result_events
+    )
+    return [
+        self._converted[id(event)][1]
+        if id(event) in self._converted
+        else _to_request_content(event)
+        for event in result_events
+    ]
+
+  def _filter_event(self, event: Event) -> Optional[Event]:
+    """Returns the event to include in the contents, if any."""
     if (
         not event.content
         or not event.content.role
@@ -209,31 +288,86 @@ def _get_contents(
       # Skip events without content, or generated neither by user nor by model
       # or has empty text.
       # E.g. events purely for mutating session states.
-      continue
-    if not _is_event_belongs_to_branch(current_branch, event):
+      return None
+    if not _is_event_belongs_to_branch(self._current_branch, event):
       # Skip events not belong to current branch.
-      continue
+      return None
     if _is_auth_event(event):
       # skip auth event
-      continue
-    filtered_events.append(
-        _convert_foreign_event(event)
-        if _is_other_agent_reply(agent_name, event)
-        else event
-    )
+      return None
+    if _is_other_agent_reply(self._agent_name, event):
+      return _convert_foreign_event(event)
+    return event
+
+  def _append(self, event: Event):
+    self._filtered_events.append(event)
+    content = _to_request_content(event)
+    self._converted[id(event)] = (event, content)
+    if not self._in_order:
+      return
+    if self._is_in_order(event):
+      self._contents.append(content)
+    else:
+      self._in_order = False
+      self._contents = []
+
+  def _is_in_order(self, event: Event) -> bool:
+    """Whether the rearrangement of function responses keeps the event as is.
 
-  result_events = _rearrange_events_for_latest_function_response(
-      filtered_events
+    That holds while all function call ids are unique and each function_response
+    event directly follows the function_call event it responds to.
+    """
+    function_calls = event.get_function_calls()
+    function_responses = event.get_function_responses()
+    if function_responses:
+      if function_calls or len(self._filtered_events) < 2:
+        return False
+      previous_event = self._filtered_events[-2]
+      if previous_event.get_function_responses():
+        return False
+      response_ids = [
+          function_response.id for function_response in function_responses
+      ]
+      if not _are_new_ids(response_ids, self._function_response_ids):
+        return False
+      call_ids = {
+          function_call.id
+          for function_call in previous_event.get_function_calls()
+      }
+      if not call_ids.issuperset(response_ids):
+        return False
+      self._function_response_ids.update(response_ids)
+    elif function_calls:
+      call_ids = [function_call.id for function_call in function_calls]
+      if not _are_new_ids(call_ids, self._function_call_ids):
+        return False
+      self._function_call_ids.update(call_ids)
+    return True
+
+
+def _copy_content(content: types.Content) -> types.Content:
+  """Copies the content and its parts, sharing the values of the parts.
+
+  Unlike a deep copy, the data of the parts, e.g. media bytes, isn't copied.
+  """
+  if not content.parts:
+    return content.model_copy()
+  return content.model_copy(
+      update={'parts': [part.model_copy() for part in content.parts]}
   )
-  result_events = _rearrange_events_for_async_function_responses_in_history(
-      result_events
+
+
+def _to_request_content(event: Event) -> types.Content:
+  content = copy.deepcopy(event.content)
+  remove_client_function_call_id(content)
+  return content
+
+
+def _are_new_ids(ids: list[Optional[str]], seen_ids: set[str]) -> bool:
+  """Whether the ids are set, distinct and not seen before."""
+  return (
+      None not in ids and len(set(ids)) == len(ids) and seen_ids.isdisjoint(ids)
   )
-  contents = []
-  for event in result_events:
-    content = copy.deepcopy(event.content)
-    remove_client_function_call_id(content)
-    contents.append(content)
-  return contents
 
 
 def _is_other_agent_reply(current_agent_name: str, event: Event) -> bool:
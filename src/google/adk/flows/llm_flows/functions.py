@@ -136,60 +136,75 @@ async def handle_function_calls_async(
   if not isinstance(agent, LlmAgent):
     return
 
-  function_calls = function_call_event.get_function_calls()
-
-  function_response_events: list[Event] = []
-  for function_call in function_calls:
-    if filters and function_call.id not in filters:
-      continue
-    tool, tool_context = _get_tool_and_context(
-        invocation_context,
-        function_call_event,
-        function_call,
-        tools_dict,
+  function_calls = [
+      function_call
+      for function_call in function_call_event.get_function_calls()
+      if not filters or function_call.id in filters
+  ]
+  tools_and_contexts = [
+      _get_tool_and_context(
+          invocation_context,
+          function_call_event,
+          function_call,
+          tools_dict,
+      )
+      for function_call in function_calls
+  ]
+
+  run_config = invocation_context.run_config
+  if run_config.parallel_tool_calls and len(function_calls) > 1:
+    semaphore = (
+        asyncio.Semaphore(run_config.max_parallel_tool_calls)
+        if run_config.max_parallel_tool_calls
+        else None
     )
-    # do not use "args" as the variable name, because it is a reserved keyword
-    # in python debugger.
-    function_args = function_call.args or {}
-    function_response: Optional[dict] = None
 
-    # before_tool_callback (sync or async)
-    if agent.before_tool_callback:
-      function_response = agent.before_tool_callback(
-          tool=tool, args=function_args, tool_context=tool_context
-      )
-      if inspect.isawaitable(function_response):
-        function_response = await function_response
+    async def _run_with_limit(function_call, tool, tool_context):
+      if not semaphore:
+        return await _handle_function_call_async(
+            invocation_context, function_call, tool, tool_context
+        )
+      async with semaphore:
+        return await _handle_function_call_async(
+            invocation_context, function_call, tool, tool_context
+        )
 
-    if not function_response:
-      function_response = await __call_tool_async(
-          tool, args=function_args, tool_context=tool_context
+    tasks = [
+        asyncio.create_task(_run_with_limit(function_call, tool, tool_context))
+        for function_call, (tool, tool_context) in zip(
+            function_calls, tools_and_contexts
+        )
+    ]
+    try:
+      await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+      # Once a call failed, or if this one is cancelled, the other calls are
+      # cancelled rather than left running unobserved.
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+    for task in tasks:
+      if not task.cancelled() and task.exception():
+        raise task.exception()
+    # The results are in the order of the function calls, so the merged
+    # response keeps the original call order.
+    results = [task.result() for task in tasks]
+  else:
+    results = []
+    for function_call, (tool, tool_context) in zip(
+        function_calls, tools_and_contexts
+    ):
+      results.append(
+          await _handle_function_call_async(
+              invocation_context, function_call, tool, tool_context
+          )
       )
 
-    # after_tool_callback (sync or async)
-    if agent.after_tool_callback:
-      altered_function_response = agent.after_tool_callback(
-          tool=tool,
-          args=function_args,
-          tool_context=tool_context,
-          tool_response=function_response,
-      )
-      if inspect.isawaitable(altered_function_response):
-        altered_function_response = await altered_function_response
-      if altered_function_response is not None:
-        function_response = altered_function_response
-
-    if tool.is_long_running:
-      # Allow long running function to return None to not provide function response.
-      if not function_response:
-        continue
-
-    # Builds the function response event.
-    function_response_event = __build_response_event(
-        tool, function_response, tool_context, invocation_context
-    )
-    function_response_events.append(function_response_event)
-
+  function_response_events: list[Event] = [
+      function_response_event
+      for function_response_event in results
+      if function_response_event
+  ]
   if not function_response_events:
     return None
   merged_event = merge_parallel_function_response_events(
@@ -208,6 +223,68 @@ async def handle_function_calls_async(
   return merged_event
 
 
+async def _handle_function_call_async(
+    invocation_context: InvocationContext,
+    function_call: types.FunctionCall,
+    tool: BaseTool,
+    tool_context: ToolContext,
+) -> Optional[Event]:
+  """Calls a single function and returns its function response event."""
+  from ...agents.llm_agent import LlmAgent
+
+  agent = cast(LlmAgent, invocation_context.agent)
+  # do not use "args" as the variable name, because it is a reserved keyword
+  # in python debugger.
+  function_args = function_call.args or {}
+  function_response: Optional[dict] = None
+
+  # before_tool_callback (sync or async)
+  if agent.before_tool_callback:
+    function_response = agent.before_tool_callback(
+        tool=tool, args=function_args, tool_context=tool_context
+    )
+    if inspect.isawaitable(function_response):
+      function_response = await function_response
+
+  if not function_response:
+    timeout = invocation_context.run_config.tool_call_timeout
+    try:
+      function_response = await asyncio.wait_for(
+          __call_tool_async(
+              tool, args=function_args, tool_context=tool_context
+          ),
+          timeout=timeout,
+      )
+    except asyncio.TimeoutError:
+      logger.warning('Tool %s timed out after %s seconds.', tool.name, timeout)
+      function_response = {
+          'error': f'Tool {tool.name} timed out after {timeout} seconds.'
+      }
+
+  # after_tool_callback (sync or async)
+  if agent.after_tool_callback:
+    altered_function_response = agent.after_tool_callback(
+        tool=tool,
+        args=function_args,
+        tool_context=tool_context,
+        tool_response=function_response,
+    )
+    if inspect.isawaitable(altered_function_response):
+      altered_function_response = await altered_function_response
+    if altered_function_response is not None:
+      function_response = altered_function_response
+
+  if tool.is_long_running:
+    # Allow long running function to return None to not provide function response.
+    if not function_response:
+      return None
+
+  # Builds the function response event.
+  return __build_response_event(
+      tool, function_response, tool_context, invocation_context
+  )
+
+
 async def handle_function_calls_live(
     invocation_context: InvocationContext,
     function_call_event: Event,
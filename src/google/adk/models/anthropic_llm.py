@@ -16,24 +16,28 @@
 
 from __future__ import annotations
 
-from functools import cached_property
+import asyncio
+import json
 import logging
 import os
 from typing import Any
 from typing import AsyncGenerator
+from typing import AsyncIterable
 from typing import Generator
 from typing import Iterable
 from typing import Literal
 from typing import Optional, Union
 from typing import TYPE_CHECKING
+import weakref
 
-from anthropic import AnthropicVertex
+from anthropic import AsyncAnthropicVertex
 from anthropic import NOT_GIVEN
 from anthropic import types as anthropic_types
 from google.genai import types
 from pydantic import BaseModel
 from typing_extensions import override
 
+from ..utils.log_utils import LazyLogMessage
 from .base_llm import BaseLlm
 from .llm_response import LlmResponse
 
@@ -46,6 +50,16 @@ logger = logging.getLogger(__name__)
 
 MAX_TOKEN = 1024
 
+_anthropic_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], AsyncAnthropicVertex]
+] = weakref.WeakKeyDictionary()
+"""Shared Anthropic clients, keyed by event loop and then by project/region."""
+
+_anthropic_clients_without_loop: dict[tuple[str, str], AsyncAnthropicVertex] = (
+    {}
+)
+"""Shared Anthropic clients for callers without a running event loop."""
+
 
 class ClaudeRequest(BaseModel):
   system_instruction: str
@@ -152,6 +166,69 @@ def message_to_generate_content_response(
   )
 
 
+async def stream_events_to_generate_content_responses(
+    events: AsyncIterable[anthropic_types.RawMessageStreamEvent],
+) -> AsyncGenerator[LlmResponse, None]:
+  """Converts the events of a streamed message to LlmResponses.
+
+  Text deltas are yielded as partial responses as soon as they arrive. Once the
+  stream ends, the whole message, including the tool_use blocks assembled from
+  their streamed input json, is yielded as one final non-partial response.
+  """
+  blocks: dict[int, dict[str, Any]] = {}
+  async for event in events:
+    if event.type == "content_block_start":
+      content_block = event.content_block
+      if content_block.type == "text":
+        blocks[event.index] = {"type": "text", "text": [content_block.text]}
+      elif content_block.type == "tool_use":
+        blocks[event.index] = {
+            "type": "tool_use",
+            "id": content_block.id,
+            "name": content_block.name,
+            "input": [],
+        }
+    elif event.type == "content_block_delta" and event.index in blocks:
+      delta = event.delta
+      if delta.type == "text_delta":
+        blocks[event.index]["text"].append(delta.text)
+        yield LlmResponse(
+            content=types.Content(
+                role="model", parts=[types.Part.from_text(text=delta.text)]
+            ),
+            partial=True,
+        )
+      elif delta.type == "input_json_delta":
+        blocks[event.index]["input"].append(delta.partial_json)
+
+  content_blocks = []
+  for _, block in sorted(blocks.items()):
+    if block["type"] == "text":
+      content_blocks.append(
+          anthropic_types.TextBlock(text="".join(block["text"]), type="text")
+      )
+    else:
+      content_blocks.append(
+          anthropic_types.ToolUseBlock(
+              id=block["id"],
+              name=block["name"],
+              input=json.loads("".join(block["input"]) or "{}"),
+              type="tool_use",
+          )
+      )
+  if content_blocks:
+    yield LlmResponse(
+        content=types.Content(
+            role="model",
+            parts=[content_block_to_part(cb) for cb in content_blocks],
+        )
+    )
+
+
+def _build_response_log(response: BaseModel) -> str:
+  return response.model_dump_json(indent=2, exclude_none=True)
+
+
 def _update_type_string(value_dict: dict[str, Any]):
   """Updates 'type' field to expected JSON schema format."""
   if "type" in value_dict:
@@ -230,7 +307,7 @@ class Claude(BaseLlm):
         if llm_request.tools_dict
         else NOT_GIVEN
     )
-    message = self._anthropic_client.messages.create(
+    request_args = dict(
         model=llm_request.model,
         system=llm_request.config.system_instruction,
         messages=messages,
@@ -238,14 +315,29 @@ class Claude(BaseLlm):
         tool_choice=tool_choice,
         max_tokens=MAX_TOKEN,
     )
-    logger.info(
-        "Claude response: %s",
-        message.model_dump_json(indent=2, exclude_none=True),
-    )
-    yield message_to_generate_content_response(message)
+    if stream:
+      async with await self._anthropic_client.messages.create(
+          **request_args, stream=True
+      ) as events:
+        async for llm_response in stream_events_to_generate_content_responses(
+            events
+        ):
+          if not llm_response.partial:
+            logger.info(
+                "Claude response: %s",
+                LazyLogMessage(_build_response_log, llm_response),
+            )
+          yield llm_response
+    else:
+      message = await self._anthropic_client.messages.create(**request_args)
+      logger.info(
+          "Claude response: %s", LazyLogMessage(_build_response_log, message)
+      )
+      yield message_to_generate_content_response(message)
 
-  @cached_property
-  def _anthropic_client(self) -> AnthropicVertex:
+  @property
+  def _anthropic_client(self) -> AsyncAnthropicVertex:
+    # Looked up on each access, as the shared clients are per event loop.
     if (
         "GOOGLE_CLOUD_PROJECT" not in os.environ
         or "GOOGLE_CLOUD_LOCATION" not in os.environ
@@ -255,7 +347,39 @@ class Claude(BaseLlm):
           " Anthropic on Vertex."
       )
 
-    return AnthropicVertex(
-        project_id=os.environ["GOOGLE_CLOUD_PROJECT"],
-        region=os.environ["GOOGLE_CLOUD_LOCATION"],
+    return _get_shared_anthropic_client(
+        os.environ["GOOGLE_CLOUD_PROJECT"], os.environ["GOOGLE_CLOUD_LOCATION"]
+    )
+
+
+def _get_shared_anthropic_client(
+    project_id: str, region: str
+) -> AsyncAnthropicVertex:
+  """Returns an Anthropic client shared by all callers on the same project.
+
+  Sharing the client reuses its connection pool across Claude instances. The
+  pool is bound to the event loop it is first used on, so clients are only
+  shared within an event loop.
+
+  Args:
+    project_id: The Google Cloud project.
+    region: The Google Cloud region.
+
+  Returns:
+    The Anthropic client.
+  """
+  try:
+    loop = asyncio.get_running_loop()
+    clients = _anthropic_clients.get(loop)
+    if clients is None:
+      clients = _anthropic_clients.setdefault(loop, {})
+  except RuntimeError:
+    clients = _anthropic_clients_without_loop
+
+  key = (project_id, region)
+  client = clients.get(key)
+  if client is None:
+    client = clients.setdefault(
+        key, AsyncAnthropicVertex(project_id=project_id, region=region)
     )
+  return client
@@ -13,19 +13,25 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
 import contextlib
 from functools import cached_property
 import logging
+import os
 import sys
 from typing import AsyncGenerator
 from typing import cast
+from typing import Optional
 from typing import TYPE_CHECKING
+import weakref
 
 from google.genai import Client
 from google.genai import types
 from typing_extensions import override
 
 from .. import version
+from ..utils.log_utils import LazyLogMessage
+from ..utils.log_utils import truncate
 from .base_llm import BaseLlm
 from .base_llm_connection import BaseLlmConnection
 from .gemini_llm_connection import GeminiLlmConnection
@@ -38,6 +44,24 @@ logger = logging.getLogger(__name__)
 
 _NEW_LINE = '\n'
 _EXCLUDED_PART_FIELD = {'inline_data': {'data'}}
+_MAX_CONTENT_LOG_LENGTH = 2_000
+
+# The environment variables the genai Client reads its backend config from.
+_CLIENT_ENV_VARS = (
+    'GOOGLE_GENAI_USE_VERTEXAI',
+    'GOOGLE_API_KEY',
+    'GEMINI_API_KEY',
+    'GOOGLE_CLOUD_PROJECT',
+    'GOOGLE_CLOUD_LOCATION',
+)
+
+_api_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, Client]
+] = weakref.WeakKeyDictionary()
+"""Shared api clients, keyed by event loop and then by client options."""
+
+_api_clients_without_loop: dict[str, Client] = {}
+"""Shared api clients for callers without a running event loop."""
 
 
 class Gemini(BaseLlm):
@@ -49,6 +73,14 @@ class Gemini(BaseLlm):
 
   model: str = 'gemini-1.5-flash'
 
+  http_options: Optional[types.HttpOptions] = None
+  """Extra HTTP options for the api client.
+
+  Clients are shared by all Gemini instances with the same options. Use
+  `client_args` and `async_client_args` to tune the connection pool, e.g.
+  `{'limits': httpx.Limits(max_connections=100, keepalive_expiry=30)}`.
+  """
+
   @staticmethod
   @override
   def supported_models() -> list[str]:
@@ -86,7 +118,7 @@ class Gemini(BaseLlm):
         self._api_backend,
         stream,
     )
-    logger.info(_build_request_log(llm_request))
+    logger.info('%s', LazyLogMessage(_build_request_log, llm_request))
 
     if stream:
       responses = await self.api_client.aio.models.generate_content_stream(
@@ -102,7 +134,7 @@ class Gemini(BaseLlm):
       # previous partial content. The only difference is bidi rely on
       # complete_turn flag to detect end while sse depends on finish_reason.
       async for response in responses:
-        logger.info(_build_response_log(response))
+        logger.info('%s', LazyLogMessage(_build_response_log, response))
         llm_response = LlmResponse.create(response)
         if (
             llm_response.content
@@ -142,19 +174,21 @@ class Gemini(BaseLlm):
           contents=llm_request.contents,
           config=llm_request.config,
       )
-      logger.info(_build_response_log(response))
+      logger.info('%s', LazyLogMessage(_build_response_log, response))
       yield LlmResponse.create(response)
 
-  @cached_property
+  @property
   def api_client(self) -> Client:
     """Provides the api client.
 
+    It's looked up on each access, as the shared clients are per event loop
+    and the model may be used from several loops, e.g. by successive
+    `asyncio.run` calls.
+
     Returns:
       The api client.
     """
-    return Client(
-        http_options=types.HttpOptions(headers=self._tracking_headers)
-    )
+    return _get_shared_api_client(self._build_http_options())
 
   @cached_property
   def _api_backend(self) -> str:
@@ -171,20 +205,32 @@ class Gemini(BaseLlm):
     }
     return tracking_headers
 
-  @cached_property
+  def _build_http_options(
+      self, api_version: Optional[str] = None
+  ) -> types.HttpOptions:
+    http_options = (
+        self.http_options.model_copy()
+        if self.http_options
+        else types.HttpOptions()
+    )
+    http_options.headers = {
+        **(http_options.headers or {}),
+        **self._tracking_headers,
+    }
+    if api_version:
+      http_options.api_version = api_version
+    return http_options
+
+  @property
   def _live_api_client(self) -> Client:
     if self._api_backend == 'vertex':
       # use default api version for vertex
-      return Client(
-          http_options=types.HttpOptions(headers=self._tracking_headers)
-      )
+      return _get_shared_api_client(self._build_http_options())
     else:
       # use v1alpha for ml_dev
       api_version = 'v1alpha'
-      return Client(
-          http_options=types.HttpOptions(
-              headers=self._tracking_headers, api_version=api_version
-          )
+      return _get_shared_api_client(
+          self._build_http_options(api_version=api_version)
       )
 
   @contextlib.asynccontextmanager
@@ -211,6 +257,35 @@ class Gemini(BaseLlm):
       yield GeminiLlmConnection(live_session)
 
 
+def _get_shared_api_client(http_options: types.HttpOptions) -> Client:
+  """Returns an api client shared by all callers with the same options.
+
+  The connection pool of a client is bound to the event loop it is first used
+  on, so clients are only shared within an event loop.
+
+  Args:
+    http_options: The HTTP options of the client.
+
+  Returns:
+    The api client.
+  """
+  try:
+    clients = _api_clients.get(asyncio.get_running_loop())
+    if clients is None:
+      clients = _api_clients.setdefault(asyncio.get_running_loop(), {})
+  except RuntimeError:
+    clients = _api_clients_without_loop
+
+  key = repr((
+      http_options,
+      tuple(os.environ.get(env_var) for env_var in _CLIENT_ENV_VARS),
+  ))
+  client = clients.get(key)
+  if client is None:
+    client = clients.setdefault(key, Client(http_options=http_options))
+  return client
+
+
 def _build_function_declaration_log(
     func_decl: types.FunctionDeclaration,
 ) -> str:
@@ -240,13 +315,16 @@ def _build_request_log(req: LlmRequest) -> str:
       else []
   )
   contents_logs = [
-      content.model_dump_json(
-          exclude_none=True,
-          exclude={
-              'parts': {
-                  i: _EXCLUDED_PART_FIELD for i in range(len(content.parts))
-              }
-          },
+      truncate(
+          content.model_dump_json(
+              exclude_none=True,
+              exclude={
+                  'parts': {
+                      i: _EXCLUDED_PART_FIELD for i in range(len(content.parts))
+                  }
+              },
+          ),
+          _MAX_CONTENT_LOG_LENGTH,
       )
       for content in req.contents
   ]
@@ -47,6 +47,8 @@ from pydantic import BaseModel
 from pydantic import Field
 from typing_extensions import override
 
+from ..utils.log_utils import LazyLogMessage
+from ..utils.log_utils import truncate
 from .base_llm import BaseLlm
 from .llm_request import LlmRequest
 from .llm_response import LlmResponse
@@ -55,12 +57,14 @@ logger = logging.getLogger(__name__)
 
 _NEW_LINE = "\n"
 _EXCLUDED_PART_FIELD = {"inline_data": {"data"}}
+_MAX_CONTENT_LOG_LENGTH = 2_000
 
 
 class FunctionChunk(BaseModel):
   id: Optional[str]
   name: Optional[str]
   args: Optional[str]
+  index: Optional[int] = 0
 
 
 class TextChunk(BaseModel):
@@ -95,7 +99,7 @@ class LiteLLMClient:
   def completion(
       self, model, messages, tools, stream=False, **kwargs
   ) -> Union[ModelResponse, CustomStreamWrapper]:
-    """Synchronously calls completion. This is used for streaming only.
+    """Synchronously calls completion.
 
     Args:
       model: The model to use.
@@ -374,6 +378,7 @@ def _model_response_to_chunk(
               id=tool_call.id,
               name=tool_call.function.name,
               args=tool_call.function.arguments,
+              index=getattr(tool_call, "index", 0),
           ), finish_reason
 
     if finish_reason and not (
@@ -526,13 +531,16 @@ def _build_request_log(req: LlmRequest) -> str:
       else []
   )
   contents_logs = [
-      content.model_dump_json(
-          exclude_none=True,
-          exclude={
-              "parts": {
-                  i: _EXCLUDED_PART_FIELD for i in range(len(content.parts))
-              }
-          },
+      truncate(
+          content.model_dump_json(
+              exclude_none=True,
+              exclude={
+                  "parts": {
+                      i: _EXCLUDED_PART_FIELD for i in range(len(content.parts))
+                  }
+              },
+          ),
+          _MAX_CONTENT_LOG_LENGTH,
       )
       for content in req.contents
   ]
@@ -612,7 +620,7 @@ class LiteLlm(BaseLlm):
     """
 
     self._maybe_append_user_content(llm_request)
-    logger.info(_build_request_log(llm_request))
+    logger.info("%s", LazyLogMessage(_build_request_log, llm_request))
 
     messages, tools = _get_completion_inputs(llm_request)
 
@@ -624,21 +632,24 @@ class LiteLlm(BaseLlm):
     completion_args.update(self._additional_args)
 
     if stream:
-      text = ""
-      function_name = ""
-      function_args = ""
-      function_id = None
+      text_parts = []
+      # Tool calls are streamed in pieces, keyed by their index in the
+      # response. Each piece may carry a part of the name or the arguments.
+      function_calls: dict[int, dict[str, Any]] = {}
       completion_args["stream"] = True
-      for part in self.llm_client.completion(**completion_args):
+      async for part in await self.llm_client.acompletion(**completion_args):
         for chunk, finish_reason in _model_response_to_chunk(part):
           if isinstance(chunk, FunctionChunk):
+            function_call = function_calls.setdefault(
+                chunk.index or 0, {"id": None, "name": [], "args": []}
+            )
             if chunk.name:
-              function_name += chunk.name
+              function_call["name"].append(chunk.name)
             if chunk.args:
-              function_args += chunk.args
-            function_id = chunk.id or function_id
+              function_call["args"].append(chunk.args)
+            function_call["id"] = chunk.id or function_call["id"]
           elif isinstance(chunk, TextChunk):
-            text += chunk.text
+            text_parts.append(chunk.text)
             yield _message_to_generate_content_response(
                 ChatCompletionAssistantMessage(
                     role="assistant",
@@ -646,7 +657,7 @@ class LiteLlm(BaseLlm):
                 ),
                 is_partial=True,
             )
-          if finish_reason == "tool_calls" and function_id:
+          if finish_reason == "tool_calls" and function_calls:
             yield _message_to_generate_content_response(
                 ChatCompletionAssistantMessage(
                     role="assistant",
@@ -654,23 +665,24 @@ class LiteLlm(BaseLlm):
                     tool_calls=[
                         ChatCompletionMessageToolCall(
                             type="function",
-                            id=function_id,
+                            id=function_call["id"],
                             function=Function(
-                                name=function_name,
-                                arguments=function_args,
+                                name="".join(function_call["name"]),
+                                arguments="".join(function_call["args"]),
                             ),
                         )
+                        for _, function_call in sorted(function_calls.items())
                     ],
                 )
             )
-            function_name = ""
-            function_args = ""
-            function_id = None
-          elif finish_reason == "stop" and text:
+            function_calls = {}
+          elif finish_reason == "stop" and text_parts:
             yield _message_to_generate_content_response(
-                ChatCompletionAssistantMessage(role="assistant", content=text)
+                ChatCompletionAssistantMessage(
+                    role="assistant", content="".join(text_parts)
+                )
             )
-            text = ""
+            text_parts = []
 
     else:
       response = await self.llm_client.acompletion(**completion_args)
@@ -16,10 +16,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from functools import lru_cache
 import logging
 import re
 from typing import TYPE_CHECKING
+import weakref
 
 if TYPE_CHECKING:
   from .base_llm import BaseLlm
@@ -34,6 +36,18 @@ Key is the regex that matches the model name.
 Value is the class that implements the model.
 """
 
+_llm_instances: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, BaseLlm]
+] = weakref.WeakKeyDictionary()
+"""Shared LLM instances created by `LLMRegistry.get_llm`.
+
+Keyed by the event loop the instances are used on, as the HTTP clients they
+hold are bound to that loop. Value is a map from model name to the instance.
+"""
+
+_llm_instances_without_loop: dict[str, BaseLlm] = {}
+"""Shared LLM instances for callers without a running event loop."""
+
 
 class LLMRegistry:
   """Registry for LLMs."""
@@ -51,6 +65,26 @@ class LLMRegistry:
 
     return LLMRegistry.resolve(model)(model=model)
 
+  @staticmethod
+  def get_llm(model: str) -> BaseLlm:
+    """Returns a shared LLM instance for the model.
+
+    Unlike `new_llm`, the instance and its api client are reused across
+    invocations, agents and sessions running on the same event loop, so each
+    LLM call doesn't pay for a new client and connection pool.
+
+    Args:
+        model: The model name.
+
+    Returns:
+        The LLM instance.
+    """
+    instances = _get_llm_instances_for_current_loop()
+    llm = instances.get(model)
+    if llm is None:
+      llm = instances.setdefault(model, LLMRegistry.new_llm(model))
+    return llm
+
   @staticmethod
   def _register(model_name_regex: str, llm_cls: type[BaseLlm]):
     """Registers a new LLM class.
@@ -100,3 +134,14 @@ class LLMRegistry:
         return llm_class
 
     raise ValueError(f'Model {model} not found.')
+
+
+def _get_llm_instances_for_current_loop() -> dict[str, BaseLlm]:
+  try:
+    loop = asyncio.get_running_loop()
+  except RuntimeError:
+    return _llm_instances_without_loop
+  instances = _llm_instances.get(loop)
+  if instances is None:
+    instances = _llm_instances.setdefault(loop, {})
+  return instances
@@ -38,6 +38,7 @@ from .artifacts.in_memory_artifact_service import InMemoryArtifactService
 from .events.event import Event
 from .memory.base_memory_service import BaseMemoryService
 from .memory.in_memory_memory_service import InMemoryMemoryService
+from .sessions import _media_offload
 from .sessions.base_session_service import BaseSessionService
 from .sessions.in_memory_session_service import InMemorySessionService
 from .sessions.session import Session
@@ -159,6 +160,7 @@ class Runner:
       session_id: str,
       new_message: types.Content,
       run_config: RunConfig = RunConfig(),
+      session: Optional[Session] = None,
   ) -> AsyncGenerator[Event, None]:
     """Main entry method to run the agent in this runner.
 
@@ -167,16 +169,24 @@ class Runner:
       session_id: The session ID of the session.
       new_message: A new message to append to the session.
       run_config: The run config for the agent.
+      session: The session, if the caller already got it from the session
+        service. It's then not fetched again.
 
     Yields:
       The events generated by the agent.
     """
     with tracer.start_as_current_span('invocation'):
-      session = self.session_service.get_session(
-          app_name=self.app_name, user_id=user_id, session_id=session_id
-      )
-      if not session:
-        raise ValueError(f'Session not found: {session_id}')
+      if session is None:
+        session = await self.session_service.get_session_async(
+            app_name=self.app_name, user_id=user_id, session_id=session_id
+        )
+        if not session:
+          raise ValueError(f'Session not found: {session_id}')
+      elif session.id != session_id or session.user_id != user_id:
+        raise ValueError(
+            f'Session {session.id} of user {session.user_id} does not match'
+            f' session {session_id} of user {user_id}.'
+        )
 
       invocation_context = self._new_invocation_context(
           session,
@@ -186,7 +196,7 @@ class Runner:
       root_agent = self.agent
 
       if new_message:
-        self._append_new_message_to_session(
+        await self._append_new_message_to_session(
             session,
             new_message,
             invocation_context,
@@ -196,10 +206,10 @@ class Runner:
       invocation_context.agent = self._find_agent_to_run(session, root_agent)
       async for event in invocation_context.agent.run_async(invocation_context):
         if not event.partial:
-          self.session_service.append_event(session=session, event=event)
+          await self._append_event(session, event, invocation_context)
         yield event
 
-  def _append_new_message_to_session(
+  async def _append_new_message_to_session(
       self,
       session: Session,
       new_message: types.Content,
@@ -241,7 +251,34 @@ class Runner:
         author='user',
         content=new_message,
     )
-    self.session_service.append_event(session=session, event=event)
+    await self._append_event(session, event, invocation_context)
+
+  async def _append_event(
+      self,
+      session: Session,
+      event: Event,
+      invocation_context: InvocationContext,
+  ):
+    """Appends the event to the session, offloading its large inline data.
+
+    The session gets a copy of the event referencing the offloaded data, so
+    the event yielded to the caller keeps its data.
+    """
+    run_config = invocation_context.run_config
+    if (
+        self.artifact_service
+        and run_config
+        and run_config.offload_inline_data_min_bytes
+    ):
+      event = await _media_offload.offload_inline_data(
+          event,
+          artifact_service=self.artifact_service,
+          app_name=self.app_name,
+          user_id=session.user_id,
+          session_id=session.id,
+          min_bytes=run_config.offload_inline_data_min_bytes,
+      )
+    await self.session_service.append_event_async(session=session, event=event)
 
   async def run_live(
       self,
@@ -294,7 +331,7 @@ class Runner:
           )
 
     async for event in invocation_context.agent.run_live(invocation_context):
-      self.session_service.append_event(session=session, event=event)
+      await self._append_event(session, event, invocation_context)
       yield event
 
   async def close_session(self, session: Session):
@@ -305,7 +342,7 @@ class Runner:
     """
     if self.memory_service:
       await self.memory_service.add_session_to_memory(session)
-    self.session_service.close_session(session=session)
+    await self.session_service.close_session_async(session=session)
 
   def _find_agent_to_run(
       self, session: Session, root_agent: BaseAgent
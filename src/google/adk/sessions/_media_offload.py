@@ -0,0 +1,172 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offloads the inline media of session events to the artifact service.
+
+The offloaded parts are replaced with file data parts referencing the
+artifact, so the sessions don't store the bytes. The references are resolved
+back into inline data when the contents of an LLM request are built.
+
+The artifact service is synchronous, so it's called in a thread to not block
+the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+from google.genai import types
+
+from ..artifacts.base_artifact_service import BaseArtifactService
+from ..events.event import Event
+
+logger = logging.getLogger(__name__)
+
+_ARTIFACT_URI_SCHEME = 'artifact://'
+
+_FILENAME_PREFIX = 'media/'
+
+
+async def offload_inline_data(
+    event: Event,
+    *,
+    artifact_service: BaseArtifactService,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    min_bytes: int,
+) -> Event:
+  """Saves the large inline data of the event as artifacts.
+
+  Args:
+    event: The event to append to the session.
+    artifact_service: The artifact service to save the data in.
+    app_name: The app name of the session.
+    user_id: The user ID of the session.
+    session_id: The ID of the session.
+    min_bytes: The size from which inline data is offloaded.
+
+  Returns:
+    The event itself if nothing was offloaded, otherwise a copy of it with the
+    offloaded parts replaced by references. The event is not modified.
+  """
+  if not event.content or not event.content.parts:
+    return event
+  parts = list(event.content.parts)
+  offloaded = False
+  for i, part in enumerate(parts):
+    blob = part.inline_data
+    if blob is None or blob.data is None or len(blob.data) < min_bytes:
+      continue
+    filename = f'{_FILENAME_PREFIX}{event.id}_{i}'
+    version = await asyncio.to_thread(
+        artifact_service.save_artifact,
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        artifact=types.Part(inline_data=blob),
+    )
+    parts[i] = part.model_copy(
+        update={
+            'inline_data': None,
+            'file_data': types.FileData(
+                file_uri=f'{_ARTIFACT_URI_SCHEME}{filename}#{version}',
+                mime_type=blob.mime_type,
+                display_name=blob.display_name,
+            ),
+        }
+    )
+    offloaded = True
+  if not offloaded:
+    return event
+  return event.model_copy(
+      update={'content': event.content.model_copy(update={'parts': parts})}
+  )
+
+
+async def load_offloaded_data(
+    contents: list[types.Content],
+    *,
+    artifact_service: Optional[BaseArtifactService],
+    app_name: str,
+    user_id: str,
+    session_id: str,
+):
+  """Replaces the references to offloaded data with the data, in place.
+
+  The artifacts are loaded concurrently. Contents without references are left
+  as is, so loading the same contents again is a no-op.
+
+  Args:
+    contents: The contents of an LLM request.
+    artifact_service: The artifact service the data was saved in.
+    app_name: The app name of the session.
+    user_id: The user ID of the session.
+    session_id: The ID of the session.
+  """
+  references = [
+      (content, i)
+      for content in contents
+      for i, part in enumerate(content.parts or [])
+      if _is_reference(part)
+  ]
+  if not references:
+    return
+
+  async def load(part: types.Part) -> types.Part:
+    filename, version = _parse_reference(part.file_data.file_uri)
+    artifact = None
+    if artifact_service is not None:
+      artifact = await asyncio.to_thread(
+          artifact_service.load_artifact,
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+          version=version,
+      )
+    if artifact is None or artifact.inline_data is None:
+      logger.warning('Offloaded media not found: %s', part.file_data.file_uri)
+      return types.Part(text=f'Missing media: {filename}')
+    return part.model_copy(
+        update={'inline_data': artifact.inline_data, 'file_data': None}
+    )
+
+  parts = await asyncio.gather(
+      *(load(content.parts[i]) for content, i in references)
+  )
+  for (content, i), part in zip(references, parts):
+    content.parts[i] = part
+
+
+def _parse_reference(file_uri: str) -> tuple[str, Optional[int]]:
+  """Returns the filename and version of the artifact, None for the latest."""
+  path = file_uri[len(_ARTIFACT_URI_SCHEME) :]
+  filename, separator, version = path.rpartition('#')
+  if not separator:
+    return path, None
+  return filename, int(version) if version.isdigit() else None
+
+
+def _is_reference(part: types.Part) -> bool:
+  return bool(
+      part.file_data
+      and part.file_data.file_uri
+      and part.file_data.file_uri.startswith(
+          _ARTIFACT_URI_SCHEME + _FILENAME_PREFIX
+      )
+  )
@@ -126,6 +126,77 @@ class BaseSessionService(abc.ABC):
     session.events.append(event)
     return event
 
+  # The async variants below are what the Runner and the API server call. The
+  # default implementations delegate to the sync methods, which is fine for
+  # services that don't do I/O. Services backed by a database or a remote API
+  # should override them so that the event loop is never blocked.
+
+  async def create_session_async(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      state: Optional[dict[str, Any]] = None,
+      session_id: Optional[str] = None,
+  ) -> Session:
+    """Creates a new session. See `create_session`."""
+    return self.create_session(
+        app_name=app_name,
+        user_id=user_id,
+        state=state,
+        session_id=session_id,
+    )
+
+  async def get_session_async(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      config: Optional[GetSessionConfig] = None,
+  ) -> Optional[Session]:
+    """Gets a session. See `get_session`."""
+    return self.get_session(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        config=config,
+    )
+
+  async def list_sessions_async(
+      self, *, app_name: str, user_id: str
+  ) -> ListSessionsResponse:
+    """Lists all the sessions. See `list_sessions`."""
+    return self.list_sessions(app_name=app_name, user_id=user_id)
+
+  async def delete_session_async(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> None:
+    """Deletes a session. See `delete_session`."""
+    return self.delete_session(
+        app_name=app_name, user_id=user_id, session_id=session_id
+    )
+
+  async def list_events_async(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+  ) -> ListEventsResponse:
+    """Lists events in a session. See `list_events`."""
+    return self.list_events(
+        app_name=app_name, user_id=user_id, session_id=session_id
+    )
+
+  async def close_session_async(self, *, session: Session):
+    """Closes a session. See `close_session`."""
+    return self.close_session(session=session)
+
+  async def append_event_async(self, session: Session, event: Event) -> Event:
+    """Appends an event to a session object. See `append_event`."""
+    return self.append_event(session=session, event=event)
+
   def __update_session_state(self, session: Session, event: Event):
     """Updates the session state based on the event."""
     if not event.actions or not event.actions.state_delta:
@@ -11,11 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import copy
 from datetime import datetime
 import json
 import logging
-from typing import Any, Optional
+import threading
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import TypeVar
 import uuid
 
 from sqlalchemy import Boolean
@@ -46,6 +51,7 @@ from typing_extensions import override
 from tzlocal import get_localzone
 
 from ..events.event import Event
+from ..utils.log_utils import LazyLogMessage
 from . import _session_util
 from .base_session_service import BaseSessionService
 from .base_session_service import GetSessionConfig
@@ -54,11 +60,21 @@ from .base_session_service import ListSessionsResponse
 from .session import Session
 from .state import State
 
-
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_KEY_LENGTH = 128
 DEFAULT_MAX_VARCHAR_LENGTH = 256
+_MAX_PENDING_EVENTS = 100
+"""The number of buffered events of a session that triggers a write in
+write-behind mode."""
+
+_NUM_FLUSH_LOCKS = 64
+"""The number of locks serializing the writes of the buffered events."""
+
+_FLUSH_LOCK_POLL_SECONDS = 0.005
+"""How often an async flush checks whether the lock of its session is free."""
+
+_T = TypeVar("_T")
 
 
 class DynamicJSON(TypeDecorator):
@@ -242,29 +258,36 @@ class StorageUserState(Base):
 class DatabaseSessionService(BaseSessionService):
   """A session service that uses a database for storage."""
 
-  def __init__(self, db_url: str):
+  def __init__(
+      self,
+      db_url: str,
+      *,
+      async_db_url: Optional[str] = None,
+      write_behind: bool = False,
+      **kwargs: Any,
+  ):
     """
     Args:
         db_url: The database URL to connect to.
+        async_db_url: The URL of the same database with an async driver, e.g.
+          `postgresql+asyncpg://...` or `sqlite+aiosqlite:///...`. When set,
+          the `*_async` methods run on SQLAlchemy's async engine. Otherwise
+          they run the sync implementation in a worker thread. The drivers
+          are installed with the `async-db` extra.
+        write_behind: Whether to buffer appended events and write them in one
+          transaction, instead of one transaction per event. Buffered events
+          are written when a final response is appended, when too many are
+          buffered, before a read of their session, and on `flush()`. Until
+          then, they are only in the in-memory session and are lost if the
+          process exits. The events of a session are written in order.
+        **kwargs: Extra arguments passed to the engines, e.g. `pool_size`,
+          `max_overflow`, `pool_recycle` or `pool_pre_ping`.
     """
     # 1. Create DB engine for db connection
     # 2. Create all tables based on schema
     # 3. Initialize all properties
 
-    try:
-      db_engine = create_engine(db_url)
-    except Exception as e:
-      if isinstance(e, ArgumentError):
-        raise ValueError(
-            f"Invalid database URL format or argument '{db_url}'."
-        ) from e
-      if isinstance(e, ImportError):
-        raise ValueError(
-            f"Database related module not found for URL '{db_url}'."
-        ) from e
-      raise ValueError(
-          f"Failed to create database engine for URL '{db_url}'"
-      ) from e
+    db_engine = _create_engine(create_engine, db_url, **kwargs)
 
     # Get the local timezone
     local_timezone = get_localzone()
@@ -279,10 +302,61 @@ class DatabaseSessionService(BaseSessionService):
         sessionmaker(bind=self.db_engine)
     )
 
+    # Async DB engine and session factory, used by the `*_async` methods.
+    self.async_db_engine = None
+    self.AsyncDatabaseSessionFactory = None
+    if async_db_url:
+      from sqlalchemy.ext.asyncio import async_sessionmaker
+      from sqlalchemy.ext.asyncio import create_async_engine
+
+      self.async_db_engine = _create_engine(
+          create_async_engine, async_db_url, **kwargs
+      )
+      self.AsyncDatabaseSessionFactory = async_sessionmaker(
+          bind=self.async_db_engine
+      )
+
+    # An in-memory SQLite database lives in a single connection that can't be
+    # shared with a worker thread, so there is nothing to offload to.
+    self._offload_to_thread = not (
+        self.db_engine.dialect.name == "sqlite"
+        and self.db_engine.url.database in (None, "", ":memory:")
+    )
+
+    self._write_behind = write_behind
+    # The buffered events in write-behind mode, by session key, in the order
+    # they were buffered. The events are grouped by the session object they
+    # were appended to, and each object is written with its own staleness
+    # check, like without buffering.
+    self._pending_events: dict[
+        tuple[str, str, str], list[tuple[Session, list[Event]]]
+    ] = {}
+    self._pending_events_lock = threading.Lock()
+    # Serialize the writes of the buffered events of a session, so that they
+    # are written in order. The sessions are spread over a fixed number of
+    # locks.
+    self._flush_locks = [threading.Lock() for _ in range(_NUM_FLUSH_LOCKS)]
+
     # Uncomment to recreate DB every time
     # Base.metadata.drop_all(self.db_engine)
     Base.metadata.create_all(self.db_engine)
 
+  def _run(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Runs `fn(sessionFactory, *args, **kwargs)` in a new DB session."""
+    with self.DatabaseSessionFactory() as sessionFactory:
+      return fn(sessionFactory, *args, **kwargs)
+
+  async def _run_async(
+      self, fn: Callable[..., _T], *args: Any, **kwargs: Any
+  ) -> _T:
+    """Runs `fn(sessionFactory, *args, **kwargs)` without blocking the loop."""
+    if self.AsyncDatabaseSessionFactory:
+      async with self.AsyncDatabaseSessionFactory() as sessionFactory:
+        return await sessionFactory.run_sync(fn, *args, **kwargs)
+    if self._offload_to_thread:
+      return await asyncio.to_thread(self._run, fn, *args, **kwargs)
+    return self._run(fn, *args, **kwargs)
+
   @override
   def create_session(
       self,
@@ -292,70 +366,20 @@ class DatabaseSessionService(BaseSessionService):
       state: Optional[dict[str, Any]] = None,
       session_id: Optional[str] = None,
   ) -> Session:
-    # 1. Populate states.
-    # 2. Build storage session object
-    # 3. Add the object to the table
-    # 4. Build the session object with generated id
-    # 5. Return the session
+    return self._run(_create_session, app_name, user_id, state, session_id)
 
-    with self.DatabaseSessionFactory() as sessionFactory:
-
-      # Fetch app and user states from storage
-      storage_app_state = sessionFactory.get(StorageAppState, (app_name))
-      storage_user_state = sessionFactory.get(
-          StorageUserState, (app_name, user_id)
-      )
-
-      app_state = storage_app_state.state if storage_app_state else {}
-      user_state = storage_user_state.state if storage_user_state else {}
-
-      # Create state tables if not exist
-      if not storage_app_state:
-        storage_app_state = StorageAppState(app_name=app_name, state={})
-        sessionFactory.add(storage_app_state)
-      if not storage_user_state:
-        storage_user_state = StorageUserState(
-            app_name=app_name, user_id=user_id, state={}
-        )
-        sessionFactory.add(storage_user_state)
-
-      # Extract state deltas
-      app_state_delta, user_state_delta, session_state = _extract_state_delta(
-          state
-      )
-
-      # Apply state delta
-      app_state.update(app_state_delta)
-      user_state.update(user_state_delta)
-
-      # Store app and user state
-      if app_state_delta:
-        storage_app_state.state = app_state
-      if user_state_delta:
-        storage_user_state.state = user_state
-
-      # Store the session
-      storage_session = StorageSession(
-          app_name=app_name,
-          user_id=user_id,
-          id=session_id,
-          state=session_state,
-      )
-      sessionFactory.add(storage_session)
-      sessionFactory.commit()
-
-      sessionFactory.refresh(storage_session)
-
-      # Merge states for response
-      merged_state = _merge_state(app_state, user_state, session_state)
-      session = Session(
-          app_name=str(storage_session.app_name),
-          user_id=str(storage_session.user_id),
-          id=str(storage_session.id),
-          state=merged_state,
-          last_update_time=storage_session.update_time.timestamp(),
-      )
-      return session
+  @override
+  async def create_session_async(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      state: Optional[dict[str, Any]] = None,
+      session_id: Optional[str] = None,
+  ) -> Session:
+    return await self._run_async(
+        _create_session, app_name, user_id, state, session_id
+    )
 
   @override
   def get_session(
@@ -366,193 +390,198 @@ class DatabaseSessionService(BaseSessionService):
       session_id: str,
       config: Optional[GetSessionConfig] = None,
   ) -> Optional[Session]:
-    # 1. Get the storage session entry from session table
-    # 2. Get all the events based on session id and filtering config
-    # 3. Convert and return the session
-    with self.DatabaseSessionFactory() as sessionFactory:
-      storage_session = sessionFactory.get(
-          StorageSession, (app_name, user_id, session_id)
-      )
-      if storage_session is None:
-        return None
-
-      storage_events = (
-          sessionFactory.query(StorageEvent)
-          .filter(StorageEvent.session_id == storage_session.id)
-          .filter(
-              StorageEvent.timestamp < config.after_timestamp
-              if config
-              else True
-          )
-          .limit(config.num_recent_events if config else None)
-          .order_by(StorageEvent.timestamp.asc())
-          .all()
-      )
-
-      # Fetch states from storage
-      storage_app_state = sessionFactory.get(StorageAppState, (app_name))
-      storage_user_state = sessionFactory.get(
-          StorageUserState, (app_name, user_id)
-      )
+    self._flush_session((app_name, user_id, session_id))
+    return self._run(_get_session, app_name, user_id, session_id, config)
 
-      app_state = storage_app_state.state if storage_app_state else {}
-      user_state = storage_user_state.state if storage_user_state else {}
-      session_state = storage_session.state
-
-      # Merge states
-      merged_state = _merge_state(app_state, user_state, session_state)
-
-      # Convert storage session to session
-      session = Session(
-          app_name=app_name,
-          user_id=user_id,
-          id=session_id,
-          state=merged_state,
-          last_update_time=storage_session.update_time.timestamp(),
-      )
-      session.events = [
-          Event(
-              id=e.id,
-              author=e.author,
-              branch=e.branch,
-              invocation_id=e.invocation_id,
-              content=_session_util.decode_content(e.content),
-              actions=e.actions,
-              timestamp=e.timestamp.timestamp(),
-              long_running_tool_ids=e.long_running_tool_ids,
-              grounding_metadata=e.grounding_metadata,
-              partial=e.partial,
-              turn_complete=e.turn_complete,
-              error_code=e.error_code,
-              error_message=e.error_message,
-              interrupted=e.interrupted,
-          )
-          for e in storage_events
-      ]
-    return session
+  @override
+  async def get_session_async(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      config: Optional[GetSessionConfig] = None,
+  ) -> Optional[Session]:
+    await self._flush_session_async((app_name, user_id, session_id))
+    return await self._run_async(
+        _get_session, app_name, user_id, session_id, config
+    )
 
   @override
   def list_sessions(
       self, *, app_name: str, user_id: str
   ) -> ListSessionsResponse:
-    with self.DatabaseSessionFactory() as sessionFactory:
-      results = (
-          sessionFactory.query(StorageSession)
-          .filter(StorageSession.app_name == app_name)
-          .filter(StorageSession.user_id == user_id)
-          .all()
-      )
-      sessions = []
-      for storage_session in results:
-        session = Session(
-            app_name=app_name,
-            user_id=user_id,
-            id=storage_session.id,
-            state={},
-            last_update_time=storage_session.update_time.timestamp(),
-        )
-        sessions.append(session)
-      return ListSessionsResponse(sessions=sessions)
+    for session_key in self._get_pending_session_keys(app_name, user_id):
+      self._flush_session(session_key)
+    return self._run(_list_sessions, app_name, user_id)
+
+  @override
+  async def list_sessions_async(
+      self, *, app_name: str, user_id: str
+  ) -> ListSessionsResponse:
+    for session_key in self._get_pending_session_keys(app_name, user_id):
+      await self._flush_session_async(session_key)
+    return await self._run_async(_list_sessions, app_name, user_id)
 
   @override
   def delete_session(
       self, app_name: str, user_id: str, session_id: str
   ) -> None:
-    with self.DatabaseSessionFactory() as sessionFactory:
-      stmt = delete(StorageSession).where(
-          StorageSession.app_name == app_name,
-          StorageSession.user_id == user_id,
-          StorageSession.id == session_id,
-      )
-      sessionFactory.execute(stmt)
-      sessionFactory.commit()
+    self._flush_session((app_name, user_id, session_id))
+    self._run(_delete_session, app_name, user_id, session_id)
+
+  @override
+  async def delete_session_async(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> None:
+    await self._flush_session_async((app_name, user_id, session_id))
+    await self._run_async(_delete_session, app_name, user_id, session_id)
 
   @override
   def append_event(self, session: Session, event: Event) -> Event:
-    logger.info(f"Append event: {event} to session {session.id}")
+    logger.info(
+        "Append event: %s to session %s",
+        LazyLogMessage(str, event),
+        session.id,
+    )
 
     if event.partial:
       return event
 
-    # 1. Check if timestamp is stale
-    # 2. Update session attributes based on event config
-    # 3. Store event to table
-    with self.DatabaseSessionFactory() as sessionFactory:
-      storage_session = sessionFactory.get(
-          StorageSession, (session.app_name, session.user_id, session.id)
-      )
+    if self._write_behind:
+      super().append_event(session=session, event=event)
+      if self._buffer_event(session, event):
+        self._flush_session(_get_session_key(session))
+      return event
 
-      if storage_session.update_time.timestamp() > session.last_update_time:
-        raise ValueError(
-            f"Session last_update_time {session.last_update_time} is later than"
-            f" the upate_time in storage {storage_session.update_time}"
-        )
+    self._run(_append_events, session, [event])
 
-      # Fetch states from storage
-      storage_app_state = sessionFactory.get(
-          StorageAppState, (session.app_name)
-      )
-      storage_user_state = sessionFactory.get(
-          StorageUserState, (session.app_name, session.user_id)
-      )
+    # Also update the in-memory session
+    super().append_event(session=session, event=event)
+    return event
 
-      app_state = storage_app_state.state if storage_app_state else {}
-      user_state = storage_user_state.state if storage_user_state else {}
-      session_state = storage_session.state
-
-      # Extract state delta
-      app_state_delta = {}
-      user_state_delta = {}
-      session_state_delta = {}
-      if event.actions:
-        if event.actions.state_delta:
-          app_state_delta, user_state_delta, session_state_delta = (
-              _extract_state_delta(event.actions.state_delta)
-          )
-
-      # Merge state
-      app_state.update(app_state_delta)
-      user_state.update(user_state_delta)
-      session_state.update(session_state_delta)
-
-      # Update storage
-      storage_app_state.state = app_state
-      storage_user_state.state = user_state
-      storage_session.state = session_state
-
-      storage_event = StorageEvent(
-          id=event.id,
-          invocation_id=event.invocation_id,
-          author=event.author,
-          branch=event.branch,
-          actions=event.actions,
-          session_id=session.id,
-          app_name=session.app_name,
-          user_id=session.user_id,
-          timestamp=datetime.fromtimestamp(event.timestamp),
-          long_running_tool_ids=event.long_running_tool_ids,
-          grounding_metadata=event.grounding_metadata,
-          partial=event.partial,
-          turn_complete=event.turn_complete,
-          error_code=event.error_code,
-          error_message=event.error_message,
-          interrupted=event.interrupted,
-      )
-      if event.content:
-        storage_event.content = _session_util.encode_content(event.content)
+  @override
+  async def append_event_async(self, session: Session, event: Event) -> Event:
+    logger.info(
+        "Append event: %s to session %s",
+        LazyLogMessage(str, event),
+        session.id,
+    )
 
-      sessionFactory.add(storage_event)
+    if event.partial:
+      return event
 
-      sessionFactory.commit()
-      sessionFactory.refresh(storage_session)
+    if self._write_behind:
+      super().append_event(session=session, event=event)
+      if self._buffer_event(session, event):
+        await self._flush_session_async(_get_session_key(session))
+      return event
 
-      # Update timestamp with commit time
-      session.last_update_time = storage_session.update_time.timestamp()
+    await self._run_async(_append_events, session, [event])
 
     # Also update the in-memory session
     super().append_event(session=session, event=event)
     return event
 
+  def flush(self) -> None:
+    """Writes the events buffered in write-behind mode to the database.
+
+    If a write fails, the events not written are buffered again and the error
+    is raised.
+    """
+    for session_key in self._get_pending_session_keys():
+      self._flush_session(session_key)
+
+  async def flush_async(self) -> None:
+    """Writes the events buffered in write-behind mode to the database.
+
+    If a write fails, the events not written are buffered again and the error
+    is raised.
+    """
+    for session_key in self._get_pending_session_keys():
+      await self._flush_session_async(session_key)
+
+  def _flush_session(self, session_key: tuple[str, str, str]):
+    """Writes the buffered events of a session, after the ones being written."""
+    if session_key not in self._pending_events:
+      return
+    with self._get_flush_lock(session_key):
+      pending_events = self._take_pending_events(session_key)
+      for i, (session, events) in enumerate(pending_events):
+        try:
+          self._run(_append_events, session, events)
+        except BaseException:
+          self._restore_pending_events(session_key, pending_events[i:])
+          raise
+
+  async def _flush_session_async(self, session_key: tuple[str, str, str]):
+    """Like _flush_session, but doesn't block the event loop."""
+    if session_key not in self._pending_events:
+      return
+    flush_lock = self._get_flush_lock(session_key)
+    # The lock may be held by another thread, or by another task of this
+    # event loop, which must keep running to release it.
+    while not flush_lock.acquire(blocking=False):
+      await asyncio.sleep(_FLUSH_LOCK_POLL_SECONDS)
+    try:
+      pending_events = self._take_pending_events(session_key)
+      for i, (session, events) in enumerate(pending_events):
+        try:
+          await self._run_async(_append_events, session, events)
+        except BaseException:
+          self._restore_pending_events(session_key, pending_events[i:])
+          raise
+    finally:
+      flush_lock.release()
+
+  def _get_flush_lock(
+      self, session_key: tuple[str, str, str]
+  ) -> threading.Lock:
+    return self._flush_locks[hash(session_key) % len(self._flush_locks)]
+
+  def _buffer_event(self, session: Session, event: Event) -> bool:
+    """Buffers the event and returns whether its session should be flushed."""
+    with self._pending_events_lock:
+      pending_events = self._pending_events.setdefault(
+          _get_session_key(session), []
+      )
+      if not pending_events or pending_events[-1][0] is not session:
+        pending_events.append((session, []))
+      pending_events[-1][1].append(event)
+      return (
+          event.is_final_response()
+          or sum(len(events) for _, events in pending_events)
+          >= _MAX_PENDING_EVENTS
+      )
+
+  def _get_pending_session_keys(
+      self, app_name: Optional[str] = None, user_id: Optional[str] = None
+  ) -> list[tuple[str, str, str]]:
+    """Returns the keys of the sessions with buffered events, of the user."""
+    with self._pending_events_lock:
+      return [
+          session_key
+          for session_key in self._pending_events
+          if app_name is None or session_key[:2] == (app_name, user_id)
+      ]
+
+  def _take_pending_events(
+      self, session_key: tuple[str, str, str]
+  ) -> list[tuple[Session, list[Event]]]:
+    with self._pending_events_lock:
+      return self._pending_events.pop(session_key, [])
+
+  def _restore_pending_events(
+      self,
+      session_key: tuple[str, str, str],
+      pending_events: list[tuple[Session, list[Event]]],
+  ):
+    """Buffers again events taken from the buffer, before the newer ones."""
+    with self._pending_events_lock:
+      self._pending_events[session_key] = (
+          pending_events + self._pending_events.get(session_key, [])
+      )
+
   @override
   def list_events(
       self,
@@ -564,6 +593,288 @@ class DatabaseSessionService(BaseSessionService):
     raise NotImplementedError()
 
 
+def _create_engine(create_fn, db_url: str, **kwargs: Any):
+  """Creates a sync or async DB engine, normalizing the errors."""
+  try:
+    return create_fn(db_url, **kwargs)
+  except Exception as e:
+    if isinstance(e, ArgumentError):
+      raise ValueError(
+          f"Invalid database URL format or argument '{db_url}'."
+      ) from e
+    if isinstance(e, ImportError):
+      raise ValueError(
+          f"Database related module not found for URL '{db_url}'."
+      ) from e
+    raise ValueError(
+        f"Failed to create database engine for URL '{db_url}'"
+    ) from e
+
+
+def _create_session(
+    sessionFactory: DatabaseSessionFactory,
+    app_name: str,
+    user_id: str,
+    state: Optional[dict[str, Any]],
+    session_id: Optional[str],
+) -> Session:
+  # 1. Populate states.
+  # 2. Build storage session object
+  # 3. Add the object to the table
+  # 4. Build the session object with generated id
+  # 5. Return the session
+
+  # Fetch app and user states from storage
+  storage_app_state = sessionFactory.get(StorageAppState, (app_name))
+  storage_user_state = sessionFactory.get(StorageUserState, (app_name, user_id))
+
+  app_state = storage_app_state.state if storage_app_state else {}
+  user_state = storage_user_state.state if storage_user_state else {}
+
+  # Create state tables if not exist
+  if not storage_app_state:
+    storage_app_state = StorageAppState(app_name=app_name, state={})
+    sessionFactory.add(storage_app_state)
+  if not storage_user_state:
+    storage_user_state = StorageUserState(
+        app_name=app_name, user_id=user_id, state={}
+    )
+    sessionFactory.add(storage_user_state)
+
+  # Extract state deltas
+  app_state_delta, user_state_delta, session_state = _extract_state_delta(state)
+
+  # Apply state delta
+  app_state.update(app_state_delta)
+  user_state.update(user_state_delta)
+
+  # Store app and user state
+  if app_state_delta:
+    storage_app_state.state = app_state
+  if user_state_delta:
+    storage_user_state.state = user_state
+
+  # Store the session
+  storage_session = StorageSession(
+      app_name=app_name,
+      user_id=user_id,
+      id=session_id,
+      state=session_state,
+  )
+  sessionFactory.add(storage_session)
+  sessionFactory.commit()
+
+  sessionFactory.refresh(storage_session)
+
+  # Merge states for response
+  merged_state = _merge_state(app_state, user_state, session_state)
+  session = Session(
+      app_name=str(storage_session.app_name),
+      user_id=str(storage_session.user_id),
+      id=str(storage_session.id),
+      state=merged_state,
+      last_update_time=storage_session.update_time.timestamp(),
+  )
+  return session
+
+
+def _get_session(
+    sessionFactory: DatabaseSessionFactory,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    config: Optional[GetSessionConfig],
+) -> Optional[Session]:
+  # 1. Get the storage session entry from session table
+  # 2. Get all the events based on session id and filtering config
+  # 3. Convert and return the session
+  storage_session = sessionFactory.get(
+      StorageSession, (app_name, user_id, session_id)
+  )
+  if storage_session is None:
+    return None
+
+  storage_events = (
+      sessionFactory.query(StorageEvent)
+      .filter(StorageEvent.session_id == storage_session.id)
+      .filter(
+          StorageEvent.timestamp < config.after_timestamp if config else True
+      )
+      .limit(config.num_recent_events if config else None)
+      .order_by(StorageEvent.timestamp.asc())
+      .all()
+  )
+
+  # Fetch states from storage
+  storage_app_state = sessionFactory.get(StorageAppState, (app_name))
+  storage_user_state = sessionFactory.get(StorageUserState, (app_name, user_id))
+
+  app_state = storage_app_state.state if storage_app_state else {}
+  user_state = storage_user_state.state if storage_user_state else {}
+  session_state = storage_session.state
+
+  # Merge states
+  merged_state = _merge_state(app_state, user_state, session_state)
+
+  # Convert storage session to session
+  session = Session(
+      app_name=app_name,
+      user_id=user_id,
+      id=session_id,
+      state=merged_state,
+      last_update_time=storage_session.update_time.timestamp(),
+  )
+  session.events = [
+      Event(
+          id=e.id,
+          author=e.author,
+          branch=e.branch,
+          invocation_id=e.invocation_id,
+          content=_session_util.decode_content(e.content),
+          actions=e.actions,
+          timestamp=e.timestamp.timestamp(),
+          long_running_tool_ids=e.long_running_tool_ids,
+          grounding_metadata=e.grounding_metadata,
+          partial=e.partial,
+          turn_complete=e.turn_complete,
+          error_code=e.error_code,
+          error_message=e.error_message,
+          interrupted=e.interrupted,
+      )
+      for e in storage_events
+  ]
+  return session
+
+
+def _list_sessions(
+    sessionFactory: DatabaseSessionFactory, app_name: str, user_id: str
+) -> ListSessionsResponse:
+  results = (
+      sessionFactory.query(StorageSession)
+      .filter(StorageSession.app_name == app_name)
+      .filter(StorageSession.user_id == user_id)
+      .all()
+  )
+  sessions = []
+  for storage_session in results:
+    session = Session(
+        app_name=app_name,
+        user_id=user_id,
+        id=storage_session.id,
+        state={},
+        last_update_time=storage_session.update_time.timestamp(),
+    )
+    sessions.append(session)
+  return ListSessionsResponse(sessions=sessions)
+
+
+def _delete_session(
+    sessionFactory: DatabaseSessionFactory,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+) -> None:
+  stmt = delete(StorageSession).where(
+      StorageSession.app_name == app_name,
+      StorageSession.user_id == user_id,
+      StorageSession.id == session_id,
+  )
+  sessionFactory.execute(stmt)
+  sessionFactory.commit()
+
+
+def _append_events(
+    sessionFactory: DatabaseSessionFactory,
+    session: Session,
+    events: list[Event],
+) -> None:
+  # 1. Check if timestamp is stale
+  # 2. Update session attributes based on the merged config of the events
+  # 3. Store events to table in one transaction
+  storage_session = sessionFactory.get(
+      StorageSession, (session.app_name, session.user_id, session.id)
+  )
+
+  if storage_session.update_time.timestamp() > session.last_update_time:
+    raise ValueError(
+        f"Session last_update_time {session.last_update_time} is later than"
+        f" the upate_time in storage {storage_session.update_time}"
+    )
+
+  # Extract and merge state deltas, later events win
+  app_state_delta = {}
+  user_state_delta = {}
+  session_state_delta = {}
+  for event in events:
+    if event.actions and event.actions.state_delta:
+      (
+          event_app_state_delta,
+          event_user_state_delta,
+          event_session_state_delta,
+      ) = _extract_state_delta(event.actions.state_delta)
+      app_state_delta.update(event_app_state_delta)
+      user_state_delta.update(event_user_state_delta)
+      session_state_delta.update(event_session_state_delta)
+
+  # Update storage, only touching the states that changed
+  if app_state_delta:
+    storage_app_state = sessionFactory.get(StorageAppState, (session.app_name))
+    app_state = storage_app_state.state
+    app_state.update(app_state_delta)
+    storage_app_state.state = app_state
+  if user_state_delta:
+    storage_user_state = sessionFactory.get(
+        StorageUserState, (session.app_name, session.user_id)
+    )
+    user_state = storage_user_state.state
+    user_state.update(user_state_delta)
+    storage_user_state.state = user_state
+  if session_state_delta:
+    session_state = storage_session.state
+    session_state.update(session_state_delta)
+    storage_session.state = session_state
+  # Always bumps the update time, which the staleness check relies on.
+  storage_session.update_time = func.now()
+
+  sessionFactory.add_all(
+      [_to_storage_event(session, event) for event in events]
+  )
+
+  sessionFactory.commit()
+  sessionFactory.refresh(storage_session)
+
+  # Update timestamp with commit time
+  session.last_update_time = storage_session.update_time.timestamp()
+
+
+def _get_session_key(session: Session) -> tuple[str, str, str]:
+  return (session.app_name, session.user_id, session.id)
+
+
+def _to_storage_event(session: Session, event: Event) -> StorageEvent:
+  storage_event = StorageEvent(
+      id=event.id,
+      invocation_id=event.invocation_id,
+      author=event.author,
+      branch=event.branch,
+      actions=event.actions,
+      session_id=session.id,
+      app_name=session.app_name,
+      user_id=session.user_id,
+      timestamp=datetime.fromtimestamp(event.timestamp),
+      long_running_tool_ids=event.long_running_tool_ids,
+      grounding_metadata=event.grounding_metadata,
+      partial=event.partial,
+      turn_complete=event.turn_complete,
+      error_code=event.error_code,
+      error_message=event.error_message,
+      interrupted=event.interrupted,
+  )
+  if event.content:
+    storage_event.content = _session_util.encode_content(event.content)
+  return storage_event
+
+
 def convert_event(event: StorageEvent) -> Event:
   """Converts a storage event to an event."""
   return Event(
@@ -68,7 +68,7 @@ class InMemorySessionService(BaseSessionService):
       self.sessions[app_name][user_id] = {}
     self.sessions[app_name][user_id][session_id] = session
 
-    copied_session = copy.deepcopy(session)
+    copied_session = _snapshot_session(session)
     return self._merge_state(app_name, user_id, copied_session)
 
   @override
@@ -88,21 +88,20 @@ class InMemorySessionService(BaseSessionService):
       return None
 
     session = self.sessions[app_name][user_id].get(session_id)
-    copied_session = copy.deepcopy(session)
 
+    events = session.events
     if config:
       if config.num_recent_events:
-        copied_session.events = copied_session.events[
-            -config.num_recent_events :
-        ]
+        events = events[-config.num_recent_events :]
       elif config.after_timestamp:
-        i = len(session.events) - 1
+        i = len(events) - 1
         while i >= 0:
-          if copied_session.events[i].timestamp < config.after_timestamp:
+          if events[i].timestamp < config.after_timestamp:
             break
           i -= 1
         if i >= 0:
-          copied_session.events = copied_session.events[i:]
+          events = events[i:]
+    copied_session = _snapshot_session(session, events)
 
     return self._merge_state(app_name, user_id, copied_session)
 
@@ -139,10 +138,15 @@ class InMemorySessionService(BaseSessionService):
 
     sessions_without_events = []
     for session in self.sessions[app_name][user_id].values():
-      copied_session = copy.deepcopy(session)
-      copied_session.events = []
-      copied_session.state = {}
-      sessions_without_events.append(copied_session)
+      sessions_without_events.append(
+          Session(
+              app_name=session.app_name,
+              user_id=session.user_id,
+              id=session.id,
+              state={},
+              last_update_time=session.last_update_time,
+          )
+      )
     return ListSessionsResponse(sessions=sessions_without_events)
 
   @override
@@ -204,3 +208,28 @@ class InMemorySessionService(BaseSessionService):
       session_id: str,
   ) -> ListEventsResponse:
     raise NotImplementedError()
+
+
+def _snapshot_session(
+    session: Session, events: Optional[list[Event]] = None
+) -> Session:
+  """Returns a copy-on-write snapshot of a stored session.
+
+  Events are append-only and never modified after they are stored, so the
+  snapshot shares the event objects with the stored session and only gets its
+  own list. Appending to the snapshot doesn't change the stored session. The
+  state is still deep-copied, as its values may be mutated in place.
+
+  Args:
+    session: The stored session.
+    events: The events of the snapshot. Defaults to all events of the session.
+
+  Returns:
+    The snapshot of the session.
+  """
+  return session.model_copy(
+      update={
+          'state': copy.deepcopy(session.state),
+          'events': list(session.events if events is None else events),
+      }
+  )
@@ -11,10 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+from datetime import timezone
 import logging
 import re
+import threading
 import time
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+import urllib.parse
 
 from dateutil import parser
 from google import genai
@@ -29,13 +35,76 @@ from .base_session_service import ListEventsResponse
 from .base_session_service import ListSessionsResponse
 from .session import Session
 
-
 isoparse = parser.isoparse
 logger = logging.getLogger(__name__)
 
+# The session creation operation is polled with exponential backoff, from the
+# initial delay up to the max delay, for at most the max wait.
+_LRO_INITIAL_POLL_DELAY = 0.1
+_LRO_MAX_POLL_DELAY = 1.0
+_LRO_MAX_WAIT_SECONDS = 6.0
+
+# The number of events requested per page when listing the session events.
+_EVENTS_PAGE_SIZE = 100
+
+# The maximum number of sessions whose events are cached.
+_MAX_CACHED_SESSIONS = 100
+
+# The events of a cached session are listed again from this many seconds
+# before its last cached event, to also get the events appended since with a
+# slightly earlier timestamp, e.g. by another writer with a skewed clock.
+_EVENTS_RELIST_WINDOW_SECONDS = 60.0
+
+
+class _SessionEvents:
+  """The events of a session fetched so far, sorted by timestamp.
+
+  Events are immutable once appended, so a session fetched before only needs
+  the events appended since. These are listed from shortly before the last
+  event fetched, and the known ones are skipped by id.
+  """
+
+  def __init__(self):
+    self.events: list[Event] = []
+    self.event_ids: set[str] = set()
+    # The timestamp of the last event.
+    self.last_timestamp: Optional[float] = None
+
+  def copy(self) -> '_SessionEvents':
+    session_events = _SessionEvents()
+    session_events.events = list(self.events)
+    session_events.event_ids = set(self.event_ids)
+    session_events.last_timestamp = self.last_timestamp
+    return session_events
+
+  def add(self, api_events: list[dict[str, Any]]):
+    """Adds the events of a list events response, skipping known ones."""
+    added = False
+    for api_event in api_events:
+      event = _from_api_event(api_event)
+      if event.id in self.event_ids:
+        continue
+      self.event_ids.add(event.id)
+      self.events.append(event)
+      added = True
+      if self.last_timestamp is None or event.timestamp > self.last_timestamp:
+        self.last_timestamp = event.timestamp
+    if added:
+      self.events.sort(key=lambda event: event.timestamp)
+
 
 class VertexAiSessionService(BaseSessionService):
-  """Connects to the managed Vertex AI Session Service."""
+  """Connects to the managed Vertex AI Session Service.
+
+  The async methods don't block the event loop, and the session and its events
+  are fetched concurrently. The events of the recently fetched sessions are
+  cached, so fetching a session again only lists the events appended since.
+
+  The cache assumes that the events of a session are appended in timestamp
+  order, e.g. by a single writer. Events appended by other writers are only
+  fetched if their timestamp is at most _EVENTS_RELIST_WINDOW_SECONDS before
+  the last cached event.
+  """
 
   def __init__(
       self,
@@ -48,6 +117,13 @@ class VertexAiSessionService(BaseSessionService):
     client = genai.Client(vertexai=True, project=project, location=location)
     self.api_client = client._api_client
 
+    # (reasoning_engine_id, session_id) -> the events fetched so far, in least
+    # recently used order.
+    self._events_cache: OrderedDict[tuple[str, str], _SessionEvents] = (
+        OrderedDict()
+    )
+    self._events_cache_lock = threading.Lock()
+
   @override
   def create_session(
       self,
@@ -59,22 +135,17 @@ class VertexAiSessionService(BaseSessionService):
   ) -> Session:
     reasoning_engine_id = _parse_reasoning_engine_id(app_name)
 
-    session_json_dict = {'user_id': user_id}
-    if state:
-      session_json_dict['session_state'] = state
-
     api_response = self.api_client.request(
         http_method='POST',
         path=f'reasoningEngines/{reasoning_engine_id}/sessions',
-        request_dict=session_json_dict,
+        request_dict=_create_session_request(user_id, state),
     )
     logger.info(f'Create Session response {api_response}')
 
     session_id = api_response['name'].split('/')[-3]
     operation_id = api_response['name'].split('/')[-1]
 
-    max_retry_attempt = 5
-    while max_retry_attempt >= 0:
+    for delay in _lro_poll_delays():
       lro_response = self.api_client.request(
           http_method='GET',
           path=f'operations/{operation_id}',
@@ -84,8 +155,7 @@ class VertexAiSessionService(BaseSessionService):
       if lro_response.get('done', None):
         break
 
-      time.sleep(1)
-      max_retry_attempt -= 1
+      time.sleep(delay)
 
     # Get session resource
     get_session_api_response = self.api_client.request(
@@ -93,18 +163,48 @@ class VertexAiSessionService(BaseSessionService):
         path=f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}',
         request_dict={},
     )
+    return _from_api_session(app_name, user_id, get_session_api_response)
 
-    update_timestamp = isoparse(
-        get_session_api_response['updateTime']
-    ).timestamp()
-    session = Session(
-        app_name=str(app_name),
-        user_id=str(user_id),
-        id=str(session_id),
-        state=get_session_api_response.get('sessionState', {}),
-        last_update_time=update_timestamp,
+  @override
+  async def create_session_async(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      state: Optional[dict[str, Any]] = None,
+      session_id: Optional[str] = None,
+  ) -> Session:
+    reasoning_engine_id = _parse_reasoning_engine_id(app_name)
+
+    api_response = await self.api_client.async_request(
+        http_method='POST',
+        path=f'reasoningEngines/{reasoning_engine_id}/sessions',
+        request_dict=_create_session_request(user_id, state),
     )
-    return session
+    logger.info(f'Create Session response {api_response}')
+
+    session_id = api_response['name'].split('/')[-3]
+    operation_id = api_response['name'].split('/')[-1]
+
+    for delay in _lro_poll_delays():
+      lro_response = await self.api_client.async_request(
+          http_method='GET',
+          path=f'operations/{operation_id}',
+          request_dict={},
+      )
+
+      if lro_response.get('done', None):
+        break
+
+      await asyncio.sleep(delay)
+
+    # Get session resource
+    get_session_api_response = await self.api_client.async_request(
+        http_method='GET',
+        path=f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}',
+        request_dict={},
+    )
+    return _from_api_session(app_name, user_id, get_session_api_response)
 
   @override
   def get_session(
@@ -123,50 +223,64 @@ class VertexAiSessionService(BaseSessionService):
         path=f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}',
         request_dict={},
     )
+    session = _from_api_session(app_name, user_id, get_session_api_response)
 
-    session_id = get_session_api_response['name'].split('/')[-1]
-    update_timestamp = isoparse(
-        get_session_api_response['updateTime']
-    ).timestamp()
-    session = Session(
-        app_name=str(app_name),
-        user_id=str(user_id),
-        id=str(session_id),
-        state=get_session_api_response.get('sessionState', {}),
-        last_update_time=update_timestamp,
+    cache_key = (reasoning_engine_id, session.id)
+    session_events, after_timestamp, complete = self._start_events_fetch(
+        cache_key, config
     )
+    page_token = None
+    while True:
+      list_events_api_response = self.api_client.request(
+          http_method='GET',
+          path=_list_events_path(
+              reasoning_engine_id, session.id, after_timestamp, page_token
+          ),
+          request_dict={},
+      )
+      # Handles empty response case
+      if list_events_api_response.get('httpHeaders', None):
+        break
+      session_events.add(list_events_api_response['sessionEvents'])
+      page_token = list_events_api_response.get('nextPageToken', None)
+      if not page_token:
+        break
+    if complete:
+      self._finish_events_fetch(cache_key, session_events)
 
-    list_events_api_response = self.api_client.request(
-        http_method='GET',
-        path=f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}/events',
-        request_dict={},
+    session.events = _filter_events(
+        session_events.events, session.last_update_time, config
     )
+    return session
 
-    # Handles empty response case
-    if list_events_api_response.get('httpHeaders', None):
-      return session
-
-    session.events = [
-        _from_api_event(event)
-        for event in list_events_api_response['sessionEvents']
-    ]
-    session.events = [
-        event for event in session.events if event.timestamp <= update_timestamp
-    ]
-    session.events.sort(key=lambda event: event.timestamp)
-
-    if config:
-      if config.num_recent_events:
-        session.events = session.events[-config.num_recent_events :]
-      elif config.after_timestamp:
-        i = len(session.events) - 1
-        while i >= 0:
-          if session.events[i].timestamp < config.after_timestamp:
-            break
-          i -= 1
-        if i >= 0:
-          session.events = session.events[i:]
+  @override
+  async def get_session_async(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      config: Optional[GetSessionConfig] = None,
+  ) -> Session:
+    reasoning_engine_id = _parse_reasoning_engine_id(app_name)
 
+    # The session resource and its events are fetched concurrently.
+    get_session_api_response, session_events = await asyncio.gather(
+        self.api_client.async_request(
+            http_method='GET',
+            path=(
+                f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}'
+            ),
+            request_dict={},
+        ),
+        self._list_session_events_async(
+            reasoning_engine_id, session_id, config
+        ),
+    )
+    session = _from_api_session(app_name, user_id, get_session_api_response)
+    session.events = _filter_events(
+        session_events.events, session.last_update_time, config
+    )
     return session
 
   @override
@@ -180,22 +294,20 @@ class VertexAiSessionService(BaseSessionService):
         path=f'reasoningEngines/{reasoning_engine_id}/sessions?filter=user_id={user_id}',
         request_dict={},
     )
+    return _from_api_sessions(app_name, user_id, api_response)
 
-    # Handles empty response case
-    if api_response.get('httpHeaders', None):
-      return ListSessionsResponse()
-
-    sessions = []
-    for api_session in api_response['sessions']:
-      session = Session(
-          app_name=app_name,
-          user_id=user_id,
-          id=api_session['name'].split('/')[-1],
-          state={},
-          last_update_time=isoparse(api_session['updateTime']).timestamp(),
-      )
-      sessions.append(session)
-    return ListSessionsResponse(sessions=sessions)
+  @override
+  async def list_sessions_async(
+      self, *, app_name: str, user_id: str
+  ) -> ListSessionsResponse:
+    reasoning_engine_id = _parse_reasoning_engine_id(app_name)
+
+    api_response = await self.api_client.async_request(
+        http_method='GET',
+        path=f'reasoningEngines/{reasoning_engine_id}/sessions?filter=user_id={user_id}',
+        request_dict={},
+    )
+    return _from_api_sessions(app_name, user_id, api_response)
 
   def delete_session(
       self, *, app_name: str, user_id: str, session_id: str
@@ -206,6 +318,19 @@ class VertexAiSessionService(BaseSessionService):
         path=f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}',
         request_dict={},
     )
+    self._forget_events((reasoning_engine_id, session_id))
+
+  @override
+  async def delete_session_async(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> None:
+    reasoning_engine_id = _parse_reasoning_engine_id(app_name)
+    await self.api_client.async_request(
+        http_method='DELETE',
+        path=f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}',
+        request_dict={},
+    )
+    self._forget_events((reasoning_engine_id, session_id))
 
   @override
   def list_events(
@@ -221,18 +346,23 @@ class VertexAiSessionService(BaseSessionService):
         path=f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}/events',
         request_dict={},
     )
+    return _from_api_events(api_response)
 
-    logger.info(f'List events response {api_response}')
-
-    # Handles empty response case
-    if api_response.get('httpHeaders', None):
-      return ListEventsResponse()
-
-    session_events = api_response['sessionEvents']
-
-    return ListEventsResponse(
-        events=[_from_api_event(event) for event in session_events]
+  @override
+  async def list_events_async(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+  ) -> ListEventsResponse:
+    reasoning_engine_id = _parse_reasoning_engine_id(app_name)
+    api_response = await self.api_client.async_request(
+        http_method='GET',
+        path=f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}/events',
+        request_dict={},
     )
+    return _from_api_events(api_response)
 
   @override
   def append_event(self, session: Session, event: Event) -> Event:
@@ -248,6 +378,215 @@ class VertexAiSessionService(BaseSessionService):
 
     return event
 
+  @override
+  async def append_event_async(self, session: Session, event: Event) -> Event:
+    # Update the in-memory session.
+    super().append_event(session=session, event=event)
+
+    reasoning_engine_id = _parse_reasoning_engine_id(session.app_name)
+    await self.api_client.async_request(
+        http_method='POST',
+        path=f'reasoningEngines/{reasoning_engine_id}/sessions/{session.id}:appendEvent',
+        request_dict=_convert_event_to_json(event),
+    )
+
+    return event
+
+  async def _list_session_events_async(
+      self,
+      reasoning_engine_id: str,
+      session_id: str,
+      config: Optional[GetSessionConfig],
+  ) -> _SessionEvents:
+    cache_key = (reasoning_engine_id, session_id)
+    session_events, after_timestamp, complete = self._start_events_fetch(
+        cache_key, config
+    )
+    page_token = None
+    while True:
+      list_events_api_response = await self.api_client.async_request(
+          http_method='GET',
+          path=_list_events_path(
+              reasoning_engine_id, session_id, after_timestamp, page_token
+          ),
+          request_dict={},
+      )
+      # Handles empty response case
+      if list_events_api_response.get('httpHeaders', None):
+        break
+      session_events.add(list_events_api_response['sessionEvents'])
+      page_token = list_events_api_response.get('nextPageToken', None)
+      if not page_token:
+        break
+    if complete:
+      self._finish_events_fetch(cache_key, session_events)
+    return session_events
+
+  def _start_events_fetch(
+      self, cache_key: tuple[str, str], config: Optional[GetSessionConfig]
+  ) -> tuple[_SessionEvents, Optional[str], bool]:
+    """Returns the events fetched so far and the timestamp to list from.
+
+    A cached session only lists the events from shortly before its last event
+    on. Otherwise all the events are listed, unless only the events after a
+    timestamp are requested, which the server filters. The most recent events
+    are picked from all the events, as the events can't be listed newest
+    first.
+
+    Returns:
+      The events fetched so far, the API timestamp to list the events from, and
+      whether the events will be all the events of the session, to cache them.
+    """
+    with self._events_cache_lock:
+      cached_events = self._events_cache.get(cache_key)
+      if cached_events is not None:
+        self._events_cache.move_to_end(cache_key)
+        # Copied, as the cache may be read while the new events are added.
+        cached_events = cached_events.copy()
+    if cached_events is not None:
+      if cached_events.last_timestamp is None:
+        return cached_events, None, True
+      return (
+          cached_events,
+          _format_timestamp(
+              cached_events.last_timestamp - _EVENTS_RELIST_WINDOW_SECONDS
+          ),
+          True,
+      )
+    if config and not config.num_recent_events and config.after_timestamp:
+      return (
+          _SessionEvents(),
+          _format_timestamp(config.after_timestamp),
+          False,
+      )
+    return _SessionEvents(), None, True
+
+  def _finish_events_fetch(
+      self, cache_key: tuple[str, str], session_events: _SessionEvents
+  ):
+    with self._events_cache_lock:
+      cached_events = self._events_cache.get(cache_key)
+      # Keeps the cached events if a concurrent fetch got more of them.
+      if cached_events is None or len(cached_events.event_ids) <= len(
+          session_events.event_ids
+      ):
+        self._events_cache[cache_key] = session_events
+      self._events_cache.move_to_end(cache_key)
+      while len(self._events_cache) > _MAX_CACHED_SESSIONS:
+        self._events_cache.popitem(last=False)
+
+  def _forget_events(self, cache_key: tuple[str, str]):
+    with self._events_cache_lock:
+      self._events_cache.pop(cache_key, None)
+
+
+def _lro_poll_delays() -> Iterator[float]:
+  """Yields the delays between the polls of a long-running operation."""
+  delay = _LRO_INITIAL_POLL_DELAY
+  waited = 0.0
+  while waited < _LRO_MAX_WAIT_SECONDS:
+    yield delay
+    waited += delay
+    delay = min(delay * 2, _LRO_MAX_POLL_DELAY)
+
+
+def _create_session_request(
+    user_id: str, state: Optional[dict[str, Any]]
+) -> dict[str, Any]:
+  session_json_dict = {'user_id': user_id}
+  if state:
+    session_json_dict['session_state'] = state
+  return session_json_dict
+
+
+def _from_api_session(
+    app_name: str, user_id: str, api_session: dict[str, Any]
+) -> Session:
+  return Session(
+      app_name=str(app_name),
+      user_id=str(user_id),
+      id=str(api_session['name'].split('/')[-1]),
+      state=api_session.get('sessionState', {}),
+      last_update_time=isoparse(api_session['updateTime']).timestamp(),
+  )
+
+
+def _from_api_sessions(
+    app_name: str, user_id: str, api_response: dict[str, Any]
+) -> ListSessionsResponse:
+  # Handles empty response case
+  if api_response.get('httpHeaders', None):
+    return ListSessionsResponse()
+
+  sessions = []
+  for api_session in api_response['sessions']:
+    session = Session(
+        app_name=app_name,
+        user_id=user_id,
+        id=api_session['name'].split('/')[-1],
+        state={},
+        last_update_time=isoparse(api_session['updateTime']).timestamp(),
+    )
+    sessions.append(session)
+  return ListSessionsResponse(sessions=sessions)
+
+
+def _from_api_events(api_response: dict[str, Any]) -> ListEventsResponse:
+  logger.info(f'List events response {api_response}')
+
+  # Handles empty response case
+  if api_response.get('httpHeaders', None):
+    return ListEventsResponse()
+
+  session_events = api_response['sessionEvents']
+
+  return ListEventsResponse(
+      events=[_from_api_event(event) for event in session_events]
+  )
+
+
+def _list_events_path(
+    reasoning_engine_id: str,
+    session_id: str,
+    after_timestamp: Optional[str],
+    page_token: Optional[str],
+) -> str:
+  query = {'pageSize': _EVENTS_PAGE_SIZE}
+  if after_timestamp:
+    query['filter'] = f'timestamp>="{after_timestamp}"'
+  if page_token:
+    query['pageToken'] = page_token
+  return (
+      f'reasoningEngines/{reasoning_engine_id}/sessions/{session_id}/events?'
+      + urllib.parse.urlencode(query)
+  )
+
+
+def _format_timestamp(timestamp: float) -> str:
+  return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(
+      '%Y-%m-%dT%H:%M:%S.%fZ'
+  )
+
+
+def _filter_events(
+    events: list[Event],
+    update_timestamp: float,
+    config: Optional[GetSessionConfig],
+) -> list[Event]:
+  """Returns copies of the session events to return, sorted by timestamp.
+
+  The cached events are copied, so the returned sessions don't share them.
+  """
+  events = [event for event in events if event.timestamp <= update_timestamp]
+  if config:
+    if config.num_recent_events:
+      events = events[-config.num_recent_events :]
+    elif config.after_timestamp:
+      events = [
+          event for event in events if event.timestamp >= config.after_timestamp
+      ]
+  return [event.model_copy(deep=True) for event in events]
+
 
 def _convert_event_to_json(event: Event):
   metadata_json = {
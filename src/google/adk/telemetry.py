@@ -21,21 +21,108 @@
 #    Agent Development Kit should be focused on the higher-level
 #    constructs of the framework that are not observable by the SDK.
 
+from enum import Enum
 import json
 from typing import Any
+from typing import Callable
 
 from google.genai import types
 from opentelemetry import trace
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
 
 from .agents.invocation_context import InvocationContext
 from .events.event import Event
 from .models.llm_request import LlmRequest
 from .models.llm_response import LlmResponse
-
+from .utils.log_utils import truncate
 
 tracer = trace.get_tracer('gcp.vertex.agent')
 
 
+class PayloadCaptureMode(Enum):
+  """How the payloads, e.g. LLM requests and responses, are put on spans."""
+
+  OFF = 'off'
+  """Payloads are not captured."""
+
+  TRUNCATED = 'truncated'
+  """Payloads are truncated to `max_payload_length` characters."""
+
+  SAMPLED = 'sampled'
+  """Payloads are captured in full for `payload_sample_rate` of the traces."""
+
+  FULL = 'full'
+  """Payloads are captured in full."""
+
+
+class TelemetryConfig(BaseModel):
+  """Configs for the telemetry recorded by the Agent Development Kit."""
+
+  model_config = ConfigDict(extra='forbid')
+
+  payload_capture: PayloadCaptureMode = PayloadCaptureMode.FULL
+  """How payloads are captured as span attributes."""
+
+  max_payload_length: int = Field(default=10_000, gt=0)
+  """The maximum number of characters of a payload in TRUNCATED mode."""
+
+  payload_sample_rate: float = Field(default=0.1, ge=0.0, le=1.0)
+  """The ratio of traces whose payloads are captured in SAMPLED mode."""
+
+
+_telemetry_config = TelemetryConfig()
+
+_NOT_CAPTURED_PAYLOAD = '{}'
+"""Placeholder for payloads that are not captured, as the dev UI expects one."""
+
+
+def set_telemetry_config(config: TelemetryConfig):
+  """Sets the telemetry config of the process.
+
+  Example:
+    set_telemetry_config(
+        TelemetryConfig(payload_capture=PayloadCaptureMode.TRUNCATED)
+    )
+
+  Args:
+    config: The telemetry config.
+  """
+  global _telemetry_config
+  _telemetry_config = config
+
+
+def get_telemetry_config() -> TelemetryConfig:
+  """Returns the telemetry config of the process."""
+  return _telemetry_config
+
+
+def _is_payload_sampled(span: trace.Span, sample_rate: float) -> bool:
+  # Samples by trace id, so that all spans of an invocation agree, like the
+  # TraceIdRatioBased sampler of OpenTelemetry.
+  trace_id = span.get_span_context().trace_id
+  return (trace_id & 0xFFFFFFFFFFFFFFFF) < sample_rate * 2**64
+
+
+def _set_payload_attribute(
+    span: trace.Span, key: str, build_payload: Callable[[], str]
+):
+  """Sets a payload attribute, only serializing it if it is captured."""
+  config = _telemetry_config
+  mode = config.payload_capture
+  if mode == PayloadCaptureMode.OFF or (
+      mode == PayloadCaptureMode.SAMPLED
+      and not _is_payload_sampled(span, config.payload_sample_rate)
+  ):
+    span.set_attribute(key, _NOT_CAPTURED_PAYLOAD)
+    return
+  payload = build_payload()
+  if mode == PayloadCaptureMode.TRUNCATED:
+    payload = truncate(payload, config.max_payload_length)
+  span.set_attribute(key, payload)
+
+
 def trace_tool_call(
     args: dict[str, Any],
 ):
@@ -45,8 +132,12 @@ def trace_tool_call(
     args: The arguments to the tool call.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
-  span.set_attribute('gcp.vertex.agent.tool_call_args', json.dumps(args))
+  _set_payload_attribute(
+      span, 'gcp.vertex.agent.tool_call_args', lambda: json.dumps(args)
+  )
 
 
 def trace_tool_response(
@@ -67,14 +158,17 @@ def trace_tool_response(
       function response for sequential function calls.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
   span.set_attribute(
       'gcp.vertex.agent.invocation_id', invocation_context.invocation_id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.tool_response',
-      function_response_event.model_dump_json(exclude_none=True),
+      lambda: function_response_event.model_dump_json(exclude_none=True),
   )
 
   # Setting empty llm request and response (as UI expect these) while not
@@ -104,6 +198,8 @@ def trace_call_llm(
     llm_response: The LLM response object.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   # Special standard Open Telemetry GenaI attributes that indicate
   # that this is a span related to a Generative AI system.
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
@@ -113,14 +209,21 @@ def trace_call_llm(
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
   # Consider removing once GenAI SDK provides a way to record this info.
-  span.set_attribute(
-      'gcp.vertex.agent.llm_request',
-      json.dumps(_build_llm_request_for_trace(llm_request)),
-  )
+  # The request is the same for all chunks of a streamed response, so it is
+  # only serialized for the first one.
+  if 'gcp.vertex.agent.llm_request' not in (
+      getattr(span, 'attributes', None) or {}
+  ):
+    _set_payload_attribute(
+        span,
+        'gcp.vertex.agent.llm_request',
+        lambda: json.dumps(_build_llm_request_for_trace(llm_request)),
+    )
   # Consider removing once GenAI SDK provides a way to record this info.
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.llm_response',
-      llm_response.model_dump_json(exclude_none=True),
+      lambda: llm_response.model_dump_json(exclude_none=True),
   )
 
 
@@ -140,15 +243,18 @@ def trace_send_data(
     data: A list of content objects.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute(
       'gcp.vertex.agent.invocation_id', invocation_context.invocation_id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
   # Once instrumentation is added to the GenAI SDK, consider whether this
   # information still needs to be recorded by the Agent Development Kit.
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.data',
-      json.dumps([
+      lambda: json.dumps([
           types.Content(role=content.role, parts=content.parts).model_dump(
               exclude_none=True
           )
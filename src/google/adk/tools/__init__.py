@@ -22,6 +22,7 @@ from .vertex_ai_search_tool import VertexAiSearchTool
 from .example_tool import ExampleTool
 from .exit_loop_tool import exit_loop
 from .function_tool import FunctionTool
+from .function_tool import ToolExecutionMode
 from .get_user_choice_tool import get_user_choice_tool as get_user_choice
 from .load_artifacts_tool import load_artifacts_tool as load_artifacts
 from .load_memory_tool import load_memory_tool as load_memory
@@ -47,5 +48,6 @@ __all__ = [
     'LongRunningFunctionTool',
     'preload_memory',
     'ToolContext',
+    'ToolExecutionMode',
     'transfer_to_agent',
 ]
@@ -112,6 +112,9 @@ class IntegrationConnectorTool(BaseTool):
   @override
   def _get_declaration(self) -> FunctionDeclaration:
     """Returns the function declaration in the Gemini Schema format."""
+    return self._get_cached_declaration(self._build_declaration)
+
+  def _build_declaration(self) -> FunctionDeclaration:
     schema_dict = self.rest_api_tool._operation_parser.get_json_schema()
     for field in self.EXCLUDE_FIELDS:
       if field in schema_dict['properties']:
@@ -137,7 +140,9 @@ class IntegrationConnectorTool(BaseTool):
     args['operation'] = self.operation
     args['action'] = self.action
     logger.info('Running tool: %s with args: %s', self.name, args)
-    return self.rest_api_tool.call(args=args, tool_context=tool_context)
+    return await self.rest_api_tool.run_async(
+        args=args, tool_context=tool_context
+    )
 
   def __str__(self):
     return (
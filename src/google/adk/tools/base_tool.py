@@ -17,6 +17,7 @@ from __future__ import annotations
 from abc import ABC
 import os
 from typing import Any
+from typing import Callable
 from typing import Optional
 from typing import TYPE_CHECKING
 
@@ -41,6 +42,9 @@ class BaseTool(ABC):
   """Whether the tool is a long running operation, which typically returns a
   resource id first and finishes the operation later."""
 
+  _declarations: Optional[dict[str, Optional[types.FunctionDeclaration]]] = None
+  """The declarations cached by _get_cached_declaration, by API variant."""
+
   def __init__(self, *, name, description, is_long_running: bool = False):
     self.name = name
     self.description = description
@@ -61,6 +65,30 @@ class BaseTool(ABC):
     """
     return None
 
+  def _get_cached_declaration(
+      self,
+      build_declaration: Callable[[], Optional[types.FunctionDeclaration]],
+  ) -> Optional[types.FunctionDeclaration]:
+    """Returns the declaration of this tool, built once per API variant.
+
+    For tools whose declaration doesn't change once they are created, so that it
+    isn't rebuilt for every LLM call. The returned declaration is shared, don't
+    modify it.
+
+    Args:
+      build_declaration: Builds the declaration for the current API variant.
+
+    Returns:
+      The FunctionDeclaration of this tool, or None.
+    """
+    if self._declarations is None:
+      self._declarations = {}
+    declarations = self._declarations
+    api_variant = self._api_variant
+    if api_variant not in declarations:
+      declarations[api_variant] = build_declaration()
+    return declarations[api_variant]
+
   async def run_async(
       self, *, args: dict[str, Any], tool_context: ToolContext
   ) -> Any:
@@ -12,7 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import concurrent.futures
+import contextvars
+from enum import Enum
+from functools import cached_property
+from functools import partial
 import inspect
+import multiprocessing
+import threading
 from typing import Any
 from typing import Callable
 from typing import Optional
@@ -25,19 +33,95 @@ from .base_tool import BaseTool
 from .tool_context import ToolContext
 
 
+class ToolExecutionMode(Enum):
+  """Where the synchronous function of a FunctionTool runs."""
+
+  INLINE = 'inline'
+  """Runs the function in the event loop. Only for fast, non-blocking code."""
+  THREAD = 'thread'
+  """Runs the function in a shared thread pool, e.g. for blocking I/O."""
+  PROCESS = 'process'
+  """Runs the function in a shared process pool, e.g. for CPU-bound code.
+
+  The function and its arguments must be picklable, and the function can't
+  take a `tool_context`, as its changes would be lost in the worker process.
+  When PROCESS is the mode of the agent, the functions taking a
+  `tool_context` run in THREAD mode instead.
+  """
+
+
+# The shared executor of each mode, with its max_workers.
+_executors: dict[
+    ToolExecutionMode, tuple[concurrent.futures.Executor, Optional[int]]
+] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(
+    mode: ToolExecutionMode, max_workers: Optional[int]
+) -> concurrent.futures.Executor:
+  """Returns the shared executor of the mode, with the pool size.
+
+  An executor of another pool size is replaced, and shut down once its
+  pending calls are done.
+  """
+  with _executors_lock:
+    executor, executor_max_workers = _executors.get(mode, (None, None))
+    if executor is not None and executor_max_workers == max_workers:
+      return executor
+    replaced_executor = executor
+    if mode == ToolExecutionMode.PROCESS:
+      # The workers are spawned rather than forked, as forking a process
+      # running threads can deadlock the child.
+      executor = concurrent.futures.ProcessPoolExecutor(
+          max_workers=max_workers,
+          mp_context=multiprocessing.get_context('spawn'),
+      )
+    else:
+      executor = concurrent.futures.ThreadPoolExecutor(
+          max_workers=max_workers, thread_name_prefix='adk_function_tool'
+      )
+    _executors[mode] = (executor, max_workers)
+  if replaced_executor is not None:
+    replaced_executor.shutdown(wait=False)
+  return executor
+
+
 class FunctionTool(BaseTool):
   """A tool that wraps a user-defined Python function.
 
   Attributes:
     func: The function to wrap.
+    execution_mode: Where to run `func` if it is synchronous. If not set, the
+      `tool_execution_mode` of the calling agent is used.
   """
 
-  def __init__(self, func: Callable[..., Any]):
+  def __init__(
+      self,
+      func: Callable[..., Any],
+      *,
+      execution_mode: Optional[ToolExecutionMode] = None,
+  ):
     super().__init__(name=func.__name__, description=func.__doc__)
     self.func = func
+    self.execution_mode = execution_mode
+    if execution_mode == ToolExecutionMode.PROCESS and (
+        'tool_context' in self._signature.parameters
+    ):
+      raise ValueError(
+          f'Function {self.name} takes a tool_context and cannot run in'
+          ' ToolExecutionMode.PROCESS.'
+      )
+
+  @cached_property
+  def _signature(self) -> inspect.Signature:
+    return inspect.signature(self.func)
 
   @override
   def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+    return self._get_cached_declaration(self._build_declaration)
+
+  def _build_declaration(self) -> types.FunctionDeclaration:
     function_decl = types.FunctionDeclaration.model_validate(
         build_function_declaration(
             func=self.func,
@@ -55,8 +139,7 @@ class FunctionTool(BaseTool):
       self, *, args: dict[str, Any], tool_context: ToolContext
   ) -> Any:
     args_to_call = args.copy()
-    signature = inspect.signature(self.func)
-    if 'tool_context' in signature.parameters:
+    if 'tool_context' in self._signature.parameters:
       args_to_call['tool_context'] = tool_context
 
     # Before invoking the function, we check for if the list of args passed in
@@ -78,9 +161,42 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
 
     if inspect.iscoroutinefunction(self.func):
       return await self.func(**args_to_call) or {}
-    else:
+
+    execution_mode = self._get_execution_mode(tool_context)
+    if execution_mode == ToolExecutionMode.INLINE:
       return self.func(**args_to_call) or {}
 
+    run_config = tool_context._invocation_context.run_config
+    if execution_mode == ToolExecutionMode.PROCESS:
+      executor = _get_executor(
+          execution_mode, run_config.tool_process_pool_size
+      )
+      func = partial(self.func, **args_to_call)
+    else:
+      executor = _get_executor(execution_mode, run_config.tool_thread_pool_size)
+      # Keeps the context variables, e.g. the current trace span, in the
+      # worker thread.
+      func = partial(contextvars.copy_context().run, self.func, **args_to_call)
+    return (
+        await asyncio.get_running_loop().run_in_executor(executor, func) or {}
+    )
+
+  def _get_execution_mode(self, tool_context: ToolContext) -> ToolExecutionMode:
+    if self.execution_mode:
+      return self.execution_mode
+    agent_mode = getattr(
+        tool_context._invocation_context.agent, 'tool_execution_mode', None
+    )
+    if not isinstance(agent_mode, ToolExecutionMode):
+      return ToolExecutionMode.INLINE
+    if (
+        agent_mode == ToolExecutionMode.PROCESS
+        and 'tool_context' in self._signature.parameters
+    ):
+      # The changes to the tool context wouldn't reach the agent.
+      return ToolExecutionMode.THREAD
+    return agent_mode
+
   # TODO(hangfei): fix call live for function stream.
   async def _call_live(
       self,
@@ -90,7 +206,6 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
       invocation_context,
   ) -> Any:
     args_to_call = args.copy()
-    signature = inspect.signature(self.func)
     if (
         self.name in invocation_context.active_streaming_tools
         and invocation_context.active_streaming_tools[self.name].stream
@@ -98,7 +213,7 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
       args_to_call['input_stream'] = invocation_context.active_streaming_tools[
           self.name
       ].stream
-    if 'tool_context' in signature.parameters:
+    if 'tool_context' in self._signature.parameters:
       args_to_call['tool_context'] = tool_context
     async for item in self.func(**args_to_call):
       yield item
@@ -111,10 +226,13 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
     Returns:
       A list of strings, where each string is the name of a mandatory parameter.
     """
-    signature = inspect.signature(self.func)
+    return self._mandatory_args
+
+  @cached_property
+  def _mandatory_args(self) -> list[str]:
     mandatory_params = []
 
-    for name, param in signature.parameters.items():
+    for name, param in self._signature.parameters.items():
       # A parameter is mandatory if:
       # 1. It has no default value (param.default is inspect.Parameter.empty)
       # 2. It's not a variable positional (*args) or variable keyword (**kwargs) parameter
@@ -16,12 +16,14 @@ __all__ = []
 
 try:
   from .conversion_utils import adk_to_mcp_tool_type, gemini_to_json_schema
+  from .mcp_session_pool import MCPSessionPool
   from .mcp_tool import MCPTool
   from .mcp_toolset import MCPToolset
 
   __all__.extend([
       'adk_to_mcp_tool_type',
       'gemini_to_json_schema',
+      'MCPSessionPool',
       'MCPTool',
       'MCPToolset',
   ])
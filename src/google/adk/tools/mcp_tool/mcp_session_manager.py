@@ -1,7 +1,7 @@
 from contextlib import AsyncExitStack
 import functools
 import sys
-from typing import Any, TextIO
+from typing import Any, Callable, Optional, TextIO
 import anyio
 from pydantic import BaseModel
 
@@ -94,6 +94,52 @@ def retry_on_closed_resource(async_reinit_func_name: str):
   return decorator
 
 
+class _ObservedReadStream:
+  """Delegates to the read stream of a transport and reports its end.
+
+  The end of the read stream is how a session sees that the server went away,
+  e.g. that the stdio process exited.
+  """
+
+  def __init__(self, stream: Any, on_end: Callable[[], None]):
+    self._stream = stream
+    self._on_end = on_end
+
+  def __getattr__(self, name: str) -> Any:
+    return getattr(self._stream, name)
+
+  async def __aenter__(self):
+    await self._stream.__aenter__()
+    return self
+
+  async def __aexit__(self, *exc_info):
+    try:
+      return await self._stream.__aexit__(*exc_info)
+    finally:
+      self._on_end()
+
+  def __aiter__(self):
+    return self
+
+  async def __anext__(self):
+    try:
+      return await self._stream.__anext__()
+    except StopAsyncIteration:
+      self._on_end()
+      raise
+
+  async def receive(self):
+    try:
+      return await self._stream.receive()
+    except (
+        anyio.EndOfStream,
+        anyio.ClosedResourceError,
+        anyio.BrokenResourceError,
+    ):
+      self._on_end()
+      raise
+
+
 class MCPSessionManager:
   """Manages MCP client sessions.
 
@@ -142,6 +188,7 @@ class MCPSessionManager:
       connection_params: StdioServerParameters | SseServerParams,
       exit_stack: AsyncExitStack,
       errlog: TextIO = sys.stderr,
+      on_transport_closed: Optional[Callable[[], None]] = None,
   ) -> ClientSession:
     """Initializes an MCP client session.
 
@@ -150,6 +197,8 @@ class MCPSessionManager:
         exit_stack: AsyncExitStack to manage the session lifecycle.
         errlog: (Optional) TextIO stream for error logging. Use only for
           initializing a local stdio MCP session.
+        on_transport_closed: (Optional) Called in the event loop when the
+          transport stops receiving messages, e.g. when the server exited.
 
     Returns:
         ClientSession: The initialized MCP client session.
@@ -170,7 +219,11 @@ class MCPSessionManager:
           f' {connection_params}'
       )
 
-    transports = await exit_stack.enter_async_context(client)
-    session = await exit_stack.enter_async_context(ClientSession(*transports))
+    read_stream, write_stream = await exit_stack.enter_async_context(client)
+    if on_transport_closed:
+      read_stream = _ObservedReadStream(read_stream, on_transport_closed)
+    session = await exit_stack.enter_async_context(
+        ClientSession(read_stream, write_stream)
+    )
     await session.initialize()
     return session
@@ -0,0 +1,329 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack
+import logging
+import sys
+import time
+from typing import Any
+from typing import AsyncGenerator
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+from typing import TextIO
+from typing import TypeVar
+
+import anyio
+
+from .mcp_session_manager import MCPSessionManager
+from .mcp_session_manager import SseServerParams
+
+# Attempt to import MCP Tool from the MCP library, and hints user to upgrade
+# their Python version to 3.10 if it fails.
+try:
+  from mcp import ClientSession
+  from mcp import StdioServerParameters
+  from mcp.types import ErrorData
+  from mcp.types import ListToolsResult
+except ImportError as e:
+  import sys
+
+  if sys.version_info < (3, 10):
+    raise ImportError(
+        'MCP Tool requires Python 3.10 or above. Please upgrade your Python'
+        ' version.'
+    ) from e
+  else:
+    raise e
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar('_T')
+
+_CONNECTION_CLOSED = -32000
+"""The MCP error code of requests failed by a closed connection."""
+
+
+def _is_connection_closed(error: Exception) -> bool:
+  if isinstance(error, (anyio.ClosedResourceError, anyio.BrokenResourceError)):
+    return True
+  error_data = getattr(error, 'error', None)
+  return (
+      isinstance(error_data, ErrorData)
+      and error_data.code == _CONNECTION_CLOSED
+  )
+
+
+async def _wait_first(*coroutines: Awaitable[Any]):
+  """Waits until one of the coroutines completes, and cancels the others."""
+  tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+  try:
+    await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+  finally:
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _MCPConnection:
+  """A connection to the MCP server, owned by a background task.
+
+  The MCP clients are anyio context managers that must be entered and exited
+  in the same task, so each connection lives in a task of its own and can be
+  closed independently of the others.
+  """
+
+  def __init__(self, session: ClientSession, stop: asyncio.Event):
+    self.session = session
+    self.in_flight = 0
+    self._stop = stop
+    self.task: Optional[asyncio.Task] = None
+
+  @property
+  def is_alive(self) -> bool:
+    return self.task is not None and not self.task.done()
+
+  @property
+  def is_stopped(self) -> bool:
+    return self._stop.is_set()
+
+  async def close(self):
+    self._stop.set()
+    if self.task:
+      await asyncio.gather(self.task, return_exceptions=True)
+
+
+class MCPSessionPool:
+  """A pool of sessions to one MCP server, shared by the tools of a toolset.
+
+  Concurrent tool calls are spread over `size` connections, e.g. `size`
+  processes of a stdio MCP server. A connection is replaced once for all tools
+  when its transport closes, e.g. when the server process exits, or when it's
+  found closed by a tool call or by the periodic health check. The
+  `list_tools` result is cached for `list_tools_ttl` seconds.
+
+  Usage:
+  ```
+  pool = MCPSessionPool(connection_params=connection_params, size=4)
+  await pool.start()
+  result = await pool.call_tool('echo', {'text': 'hello'})
+  ...
+  await pool.close()
+  ```
+  """
+
+  def __init__(
+      self,
+      *,
+      connection_params: StdioServerParameters | SseServerParams,
+      size: int = 1,
+      list_tools_ttl: float = 60.0,
+      health_check_interval: Optional[float] = None,
+      errlog: TextIO = sys.stderr,
+  ):
+    """Initializes the MCPSessionPool.
+
+    Args:
+      connection_params: The connection parameters to the MCP server.
+      size: The number of connections to the MCP server.
+      list_tools_ttl: Seconds a `list_tools` result is reused for. 0 disables
+        the cache.
+      health_check_interval: Seconds between pings of the connections. None
+        disables the health check; closed connections are then only replaced
+        when they are found closed by a call.
+      errlog: TextIO stream for error logging of local stdio MCP servers.
+    """
+    if size < 1:
+      raise ValueError(f'Pool size must be at least 1, got {size}.')
+    self.connection_params = connection_params
+    self.size = size
+    self.list_tools_ttl = list_tools_ttl
+    self.health_check_interval = health_check_interval
+    self.errlog = errlog
+
+    self._connections: list[_MCPConnection] = []
+    self._reconnect_lock = asyncio.Lock()
+    self._list_tools_lock = asyncio.Lock()
+    self._list_tools_result: Optional[ListToolsResult] = None
+    self._list_tools_expire_time = 0.0
+    self._health_check_task: Optional[asyncio.Task] = None
+    self._background_tasks: set[asyncio.Future] = set()
+    self._closed = False
+
+  @property
+  def sessions(self) -> list[ClientSession]:
+    """The sessions of the current connections."""
+    return [connection.session for connection in self._connections]
+
+  async def start(self):
+    """Connects to the MCP server."""
+    self._closed = False
+    self._connections = list(
+        await asyncio.gather(*[self._connect() for _ in range(self.size)])
+    )
+    if self.health_check_interval:
+      self._health_check_task = asyncio.create_task(self._check_health_loop())
+
+  async def close(self):
+    """Closes all connections to the MCP server."""
+    self._closed = True
+    if self._health_check_task:
+      self._health_check_task.cancel()
+      await asyncio.gather(self._health_check_task, return_exceptions=True)
+      self._health_check_task = None
+    connections, self._connections = self._connections, []
+    await asyncio.gather(
+        *[connection.close() for connection in connections],
+        *self._background_tasks,
+        return_exceptions=True,
+    )
+
+  async def call_tool(
+      self, name: str, arguments: Optional[dict[str, Any]] = None
+  ) -> Any:
+    """Calls a tool on the least busy connection.
+
+    Args:
+      name: The name of the tool.
+      arguments: The arguments of the tool call.
+
+    Returns:
+      The CallToolResult of the MCP server.
+    """
+    return await self._run(
+        lambda session: session.call_tool(name, arguments=arguments)
+    )
+
+  async def list_tools(self) -> ListToolsResult:
+    """Lists the tools of the MCP server, cached for list_tools_ttl seconds."""
+    async with self._list_tools_lock:
+      if (
+          self._list_tools_result is None
+          or time.monotonic() >= self._list_tools_expire_time
+      ):
+        self._list_tools_result = await self._run(
+            lambda session: session.list_tools()
+        )
+        self._list_tools_expire_time = time.monotonic() + self.list_tools_ttl
+      return self._list_tools_result
+
+  async def check_health(self):
+    """Pings every connection and replaces the ones that don't respond."""
+    for connection in list(self._connections):
+      if connection.is_alive:
+        try:
+          await asyncio.wait_for(connection.session.send_ping(), timeout=10)
+          continue
+        except Exception as e:  # pylint: disable=broad-exception-caught
+          logger.warning('MCP connection failed the health check: %s', e)
+      await self._reconnect(connection)
+
+  async def _run(self, func: Callable[[ClientSession], Awaitable[_T]]) -> _T:
+    """Runs func on the least busy session, reconnecting once if it's closed."""
+    async with self._acquire() as connection:
+      try:
+        return await func(connection.session)
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        if not _is_connection_closed(e):
+          raise
+        await self._reconnect(connection)
+    async with self._acquire() as connection:
+      return await func(connection.session)
+
+  @asynccontextmanager
+  async def _acquire(self) -> AsyncGenerator[_MCPConnection, None]:
+    if not self._connections:
+      raise RuntimeError('MCPSessionPool is not started.')
+    connection = min(
+        self._connections, key=lambda c: (not c.is_alive, c.in_flight)
+    )
+    connection.in_flight += 1
+    try:
+      yield connection
+    finally:
+      connection.in_flight -= 1
+
+  async def _reconnect(self, connection: _MCPConnection):
+    """Replaces a connection, once for all tools that found it closed."""
+    async with self._reconnect_lock:
+      if self._closed or connection not in self._connections:
+        # Closed, or already replaced for a concurrent call.
+        return
+      index = self._connections.index(connection)
+      self._connections[index] = await self._connect()
+    self._run_in_background(connection.close())
+
+  def _on_connection_done(self, connection: _MCPConnection):
+    # The server went away, e.g. the stdio process exited. Reconnect eagerly
+    # instead of waiting for the next call to fail.
+    if not self._closed and not connection.is_stopped:
+      self._run_in_background(self._reconnect_quietly(connection))
+
+  async def _reconnect_quietly(self, connection: _MCPConnection):
+    try:
+      await self._reconnect(connection)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.warning('Failed to reconnect to the MCP server: %s', e)
+
+  def _run_in_background(self, coroutine: Awaitable[Any]):
+    task = asyncio.ensure_future(coroutine)
+    self._background_tasks.add(task)
+    task.add_done_callback(self._background_tasks.discard)
+
+  async def _connect(self) -> _MCPConnection:
+    ready: asyncio.Future[_MCPConnection] = (
+        asyncio.get_running_loop().create_future()
+    )
+    stop = asyncio.Event()
+    transport_closed = asyncio.Event()
+
+    async def run_connection():
+      try:
+        async with AsyncExitStack() as exit_stack:
+          session = await MCPSessionManager.initialize_session(
+              connection_params=self.connection_params,
+              exit_stack=exit_stack,
+              errlog=self.errlog,
+              on_transport_closed=transport_closed.set,
+          )
+          ready.set_result(_MCPConnection(session, stop))
+          # Ends with the transport, so that _on_connection_done replaces the
+          # connection as soon as the server goes away.
+          await _wait_first(stop.wait(), transport_closed.wait())
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        if not ready.done():
+          ready.set_exception(e)
+        else:
+          logger.warning('MCP connection closed with error: %s', e)
+      finally:
+        if not ready.done():
+          ready.set_exception(ConnectionError('MCP connection was cancelled.'))
+
+    task = asyncio.create_task(run_connection())
+    connection = await ready
+    connection.task = task
+    task.add_done_callback(lambda _: self._on_connection_done(connection))
+    return connection
+
+  async def _check_health_loop(self):
+    while not self._closed:
+      await asyncio.sleep(self.health_check_interval)
+      try:
+        await self.check_health()
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning('MCP health check failed: %s', e)
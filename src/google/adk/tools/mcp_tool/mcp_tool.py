@@ -18,6 +18,7 @@ from google.genai.types import FunctionDeclaration
 from typing_extensions import override
 
 from .mcp_session_manager import MCPSessionManager, retry_on_closed_resource
+from .mcp_session_pool import MCPSessionPool
 
 # Attempt to import MCP Tool from the MCP library, and hints user to upgrade
 # their Python version to 3.10 if it fails.
@@ -57,6 +58,7 @@ class MCPTool(BaseTool):
       mcp_session_manager: MCPSessionManager,
       auth_scheme: Optional[AuthScheme] = None,
       auth_credential: Optional[AuthCredential] | None = None,
+      mcp_session_pool: Optional[MCPSessionPool] = None,
   ):
     """Initializes a MCPTool.
 
@@ -71,6 +73,8 @@ class MCPTool(BaseTool):
         mcp_session: The MCP session to use to call the tool.
         auth_scheme: The authentication scheme to use.
         auth_credential: The authentication credential to use.
+        mcp_session_pool: The pool of MCP sessions to call the tool with. When
+          set, it is used instead of mcp_session.
 
     Raises:
         ValueError: If mcp_tool or mcp_session is None.
@@ -84,6 +88,7 @@ class MCPTool(BaseTool):
     self.mcp_tool = mcp_tool
     self.mcp_session = mcp_session
     self.mcp_session_manager = mcp_session_manager
+    self.mcp_session_pool = mcp_session_pool
     # TODO(cheliu): Support passing auth to MCP Server.
     self.auth_scheme = auth_scheme
     self.auth_credential = auth_credential
@@ -98,6 +103,9 @@ class MCPTool(BaseTool):
     Returns:
         FunctionDeclaration: The Gemini function declaration for the tool.
     """
+    return self._get_cached_declaration(self._build_declaration)
+
+  def _build_declaration(self) -> FunctionDeclaration:
     schema_dict = self.mcp_tool.inputSchema
     parameters = to_gemini_schema(schema_dict)
     function_decl = FunctionDeclaration(
@@ -119,6 +127,8 @@ class MCPTool(BaseTool):
     """
     # TODO(cheliu): Support passing tool context to MCP Server.
     try:
+      if self.mcp_session_pool:
+        return await self.mcp_session_pool.call_tool(self.name, arguments=args)
       response = await self.mcp_session.call_tool(self.name, arguments=args)
       return response
     except Exception as e:
@@ -17,7 +17,8 @@ import sys
 from types import TracebackType
 from typing import List, Optional, TextIO, Tuple, Type
 
-from .mcp_session_manager import MCPSessionManager, SseServerParams, retry_on_closed_resource
+from .mcp_session_manager import MCPSessionManager, SseServerParams
+from .mcp_session_pool import MCPSessionPool
 
 # Attempt to import MCP Tool from the MCP library, and hints user to upgrade
 # their Python version to 3.10 if it fails.
@@ -99,6 +100,7 @@ class MCPToolset:
       either `StdioServerParameters` or `SseServerParams`.
     exit_stack: The async exit stack to manage the connection to the MCP server.
     session: The MCP session being initialized with the connection.
+    session_pool: The pool of MCP sessions used by the tools.
   """
 
   def __init__(
@@ -107,6 +109,9 @@ class MCPToolset:
       connection_params: StdioServerParameters | SseServerParams,
       errlog: TextIO = sys.stderr,
       exit_stack=AsyncExitStack(),
+      pool_size: int = 1,
+      list_tools_ttl: float = 60.0,
+      health_check_interval: Optional[float] = None,
   ):
     """Initializes the MCPToolset.
 
@@ -167,6 +172,11 @@ class MCPToolset:
       connection_params: The connection parameters to the MCP server. Can be:
         `StdioServerParameters` for using local mcp server (e.g. using `npx` or
         `python3`); or `SseServerParams` for a local/remote SSE server.
+      pool_size: The number of connections to the MCP server, e.g. processes of
+        a stdio MCP server, that concurrent tool calls are spread over.
+      list_tools_ttl: Seconds the list of tools of the MCP server is cached.
+      health_check_interval: Seconds between health checks of the connections.
+        None disables the health check.
     """
     if not connection_params:
       raise ValueError('Missing connection params in MCPToolset.')
@@ -179,6 +189,13 @@ class MCPToolset:
         exit_stack=self.exit_stack,
         errlog=self.errlog,
     )
+    self.session_pool = MCPSessionPool(
+        connection_params=self.connection_params,
+        size=pool_size,
+        list_tools_ttl=list_tools_ttl,
+        health_check_interval=health_check_interval,
+        errlog=self.errlog,
+    )
 
   @classmethod
   async def from_server(
@@ -187,6 +204,9 @@ class MCPToolset:
       connection_params: StdioServerParameters | SseServerParams,
       async_exit_stack: Optional[AsyncExitStack] = None,
       errlog: TextIO = sys.stderr,
+      pool_size: int = 1,
+      list_tools_ttl: float = 60.0,
+      health_check_interval: Optional[float] = None,
   ) -> Tuple[List[MCPTool], AsyncExitStack]:
     """Retrieve all tools from the MCP connection.
 
@@ -205,6 +225,9 @@ class MCPToolset:
       connection_params: The connection parameters to the MCP server.
       async_exit_stack: The async exit stack to use. If not provided, a new
         AsyncExitStack will be created.
+      pool_size: The number of connections to the MCP server.
+      list_tools_ttl: Seconds the list of tools of the MCP server is cached.
+      health_check_interval: Seconds between health checks of the connections.
 
     Returns:
       A tuple of the list of MCPTools and the AsyncExitStack.
@@ -218,6 +241,9 @@ class MCPToolset:
         connection_params=connection_params,
         exit_stack=async_exit_stack,
         errlog=errlog,
+        pool_size=pool_size,
+        list_tools_ttl=list_tools_ttl,
+        health_check_interval=health_check_interval,
     )
 
     await async_exit_stack.enter_async_context(toolset)
@@ -225,27 +251,31 @@ class MCPToolset:
     return (tools, async_exit_stack)
 
   async def _initialize(self) -> ClientSession:
-    """Connects to the MCP Server and initializes the ClientSession."""
-    self.session = await self.session_manager.create_session()
+    """Connects to the MCP Server and initializes the ClientSessions."""
+    await self.session_pool.start()
+    self.session = self.session_pool.sessions[0]
     return self.session
 
   async def _exit(self):
-    """Closes the connection to MCP Server."""
+    """Closes the connections to MCP Server."""
+    await self.session_pool.close()
     await self.exit_stack.aclose()
 
-  @retry_on_closed_resource('_initialize')
   async def load_tools(self) -> List[MCPTool]:
     """Loads all tools from the MCP Server.
 
+    The list of tools is cached for `list_tools_ttl` seconds.
+
     Returns:
       A list of MCPTools imported from the MCP Server.
     """
-    tools_response: ListToolsResult = await self.session.list_tools()
+    tools_response: ListToolsResult = await self.session_pool.list_tools()
     return [
         MCPTool(
             mcp_tool=tool,
             mcp_session=self.session,
             mcp_session_manager=self.session_manager,
+            mcp_session_pool=self.session_pool,
         )
         for tool in tools_response.tools
     ]
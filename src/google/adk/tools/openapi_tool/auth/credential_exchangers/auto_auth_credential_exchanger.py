@@ -94,12 +94,29 @@ class AutoAuthCredentialExchanger(BaseAuthCredentialExchanger):
     if not auth_credential:
       return None
 
-    exchanger_class = self.exchangers.get(
-        auth_credential.auth_type if auth_credential else None
-    )
+    exchanger = self._get_exchanger(auth_credential)
+    if not exchanger:
+      return auth_credential
+    return exchanger.exchange_credential(auth_scheme, auth_credential)
+
+  async def exchange_credential_async(
+      self,
+      auth_scheme: AuthScheme,
+      auth_credential: Optional[AuthCredential] = None,
+  ) -> Optional[AuthCredential]:
+    """Like exchange_credential, but doesn't block the event loop."""
+    if not auth_credential:
+      return None
 
-    if not exchanger_class:
+    exchanger = self._get_exchanger(auth_credential)
+    if not exchanger:
       return auth_credential
+    return await exchanger.exchange_credential_async(
+        auth_scheme, auth_credential
+    )
 
-    exchanger = exchanger_class()
-    return exchanger.exchange_credential(auth_scheme, auth_credential)
+  def _get_exchanger(
+      self, auth_credential: AuthCredential
+  ) -> Optional[BaseAuthCredentialExchanger]:
+    exchanger_class = self.exchangers.get(auth_credential.auth_type)
+    return exchanger_class() if exchanger_class else None
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import abc
+import asyncio
 from typing import Optional
 
 from .....auth.auth_credential import (
@@ -53,3 +54,17 @@ class BaseAuthCredentialExchanger:
         NotImplementedError: If the method is not implemented by a subclass.
     """
     raise NotImplementedError("Subclasses must implement exchange_credential.")
+
+  async def exchange_credential_async(
+      self,
+      auth_scheme: AuthScheme,
+      auth_credential: Optional[AuthCredential] = None,
+  ) -> AuthCredential:
+    """Like exchange_credential, but doesn't block the event loop.
+
+    Runs exchange_credential in a thread by default. Exchangers that don't do
+    I/O or that cache their credentials can override it.
+    """
+    return await asyncio.to_thread(
+        self.exchange_credential, auth_scheme, auth_credential
+    )
@@ -115,3 +115,11 @@ class OAuth2CredentialExchanger(BaseAuthCredentialExchanger):
       return self.generate_auth_token(auth_credential)
 
     return None
+
+  async def exchange_credential_async(
+      self,
+      auth_scheme: AuthScheme,
+      auth_credential: Optional[AuthCredential] = None,
+  ) -> AuthCredential:
+    """Like exchange_credential, which doesn't do I/O, so no thread is used."""
+    return self.exchange_credential(auth_scheme, auth_credential)
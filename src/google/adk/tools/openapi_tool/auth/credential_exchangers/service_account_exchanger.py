@@ -14,6 +14,8 @@
 
 """Credential fetcher for Google Service Account."""
 
+import datetime
+import functools
 from typing import Optional
 
 import google.auth
@@ -28,6 +30,9 @@ from .....auth.auth_credential import (
     HttpCredentials,
 )
 from .....auth.auth_schemes import AuthScheme
+from .....auth.credential_cache import CachedCredential
+from .....auth.credential_cache import CredentialCache
+from .....auth.credential_cache import default_credential_cache
 from .base_credential_exchanger import AuthCredentialMissingError, BaseAuthCredentialExchanger
 
 
@@ -37,8 +42,20 @@ class ServiceAccountCredentialExchanger(BaseAuthCredentialExchanger):
   Uses the default service credential if `use_default_credential = True`.
   Otherwise, uses the service account credential provided in the auth
   credential.
+
+  The access tokens are cached until they expire, and refreshed in the
+  background shortly before, so the exchanges don't fetch a token each time.
   """
 
+  def __init__(self, credential_cache: Optional[CredentialCache] = None):
+    """Initializes the ServiceAccountCredentialExchanger.
+
+    Args:
+      credential_cache: The cache of the access tokens. Defaults to the cache
+        shared by the process.
+    """
+    self.credential_cache = credential_cache or default_credential_cache
+
   def exchange_credential(
       self,
       auth_scheme: AuthScheme,
@@ -57,6 +74,30 @@ class ServiceAccountCredentialExchanger(BaseAuthCredentialExchanger):
     Returns:
         An AuthCredential in HTTPBearer format, containing the access token.
     """
+    self._check_credential(auth_credential)
+    return self.credential_cache.get_or_fetch(
+        self._get_cache_key(auth_credential),
+        functools.partial(self._fetch_access_token, auth_credential),
+    )
+
+  async def exchange_credential_async(
+      self,
+      auth_scheme: AuthScheme,
+      auth_credential: Optional[AuthCredential] = None,
+  ) -> AuthCredential:
+    """Like exchange_credential, but fetches the token in a thread."""
+    self._check_credential(auth_credential)
+    return await self.credential_cache.get_or_fetch_async(
+        self._get_cache_key(auth_credential),
+        functools.partial(self._fetch_access_token, auth_credential),
+    )
+
+  def _get_cache_key(self, auth_credential: AuthCredential) -> str:
+    # The token only depends on the service account and the scopes, so it's
+    # shared by the tools of all the auth schemes.
+    return CredentialCache.get_key(None, auth_credential)
+
+  def _check_credential(self, auth_credential: Optional[AuthCredential]):
     if (
         auth_credential is None
         or auth_credential.service_account is None
@@ -71,6 +112,10 @@ class ServiceAccountCredentialExchanger(BaseAuthCredentialExchanger):
           " credential in a hosted service like Cloud Run."
       )
 
+  def _fetch_access_token(
+      self, auth_credential: AuthCredential
+  ) -> CachedCredential:
+    """Fetches an access token from the token endpoint. Blocking."""
     try:
       if auth_credential.service_account.use_default_credential:
         credentials, _ = google.auth.default()
@@ -89,9 +134,15 @@ class ServiceAccountCredentialExchanger(BaseAuthCredentialExchanger):
               credentials=HttpCredentials(token=credentials.token),
           ),
       )
-      return updated_credential
-
     except Exception as e:
       raise AuthCredentialMissingError(
           f"Failed to exchange service account token: {e}"
       ) from e
+
+    # google-auth sets a naive UTC expiry. Tokens without one aren't cached.
+    expires_at = None
+    if isinstance(credentials.expiry, datetime.datetime):
+      expires_at = credentials.expiry.replace(
+          tzinfo=datetime.timezone.utc
+      ).timestamp()
+    return CachedCredential(updated_credential, expires_at=expires_at)
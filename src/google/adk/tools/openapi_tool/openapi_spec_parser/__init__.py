@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .http_client_pool import HttpClientConfig
+from .http_client_pool import HttpClientPool
 from .openapi_spec_parser import OpenApiSpecParser, OperationEndpoint, ParsedOperation
 from .openapi_toolset import OpenAPIToolset
 from .operation_parser import OperationParser
@@ -19,6 +21,8 @@ from .rest_api_tool import AuthPreparationState, RestApiTool, snake_to_lower_cam
 from .tool_auth_handler import ToolAuthHandler
 
 __all__ = [
+    'HttpClientConfig',
+    'HttpClientPool',
     'OpenApiSpecParser',
     'OperationEndpoint',
     'ParsedOperation',
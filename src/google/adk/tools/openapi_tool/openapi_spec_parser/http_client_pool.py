@@ -0,0 +1,130 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from functools import cache
+import importlib.util
+from typing import Optional
+from urllib.parse import urlsplit
+import weakref
+
+import httpx
+from pydantic import BaseModel
+from pydantic import ConfigDict
+
+
+@cache
+def _is_http2_available() -> bool:
+  return importlib.util.find_spec("h2") is not None
+
+
+class HttpClientConfig(BaseModel):
+  """Configs for the HTTP connections of RestApiTool."""
+
+  model_config = ConfigDict(extra="forbid")
+
+  timeout: float = 60.0
+  """Seconds to wait for the server to send or receive data."""
+
+  connect_timeout: float = 10.0
+  """Seconds to wait for a connection to be established."""
+
+  max_connections: int = 20
+  """Maximum number of concurrent connections to a host.
+
+  Further requests to the host wait for a connection to be free.
+  """
+
+  max_keepalive_connections: int = 20
+  """Maximum number of idle connections kept alive for a host.
+
+  Connections above this limit are closed once idle, even when requests are
+  waiting, so it shouldn't be lower than max_connections under steady load.
+  """
+
+  keepalive_expiry: float = 5.0
+  """Seconds an idle connection is kept alive."""
+
+  http2: bool = True
+  """Whether to use HTTP/2 when the server supports it.
+
+  Only has effect when the `h2` package is installed.
+  """
+
+  max_response_size: int = 10 * 1024 * 1024
+  """Maximum number of bytes read from a response body.
+
+  The body is streamed and reading stops once this limit is reached, so large
+  payloads are truncated instead of being loaded fully into memory.
+  """
+
+
+class HttpClientPool:
+  """A pool of HTTP clients shared by the RestApiTools of a toolset.
+
+  Each host gets its own client with a bounded number of keep-alive
+  connections. Clients are bound to the event loop they are created in, so
+  they are kept per event loop.
+  """
+
+  def __init__(self, config: Optional[HttpClientConfig] = None):
+    """Initializes the HttpClientPool.
+
+    Args:
+      config: The configs of the HTTP connections. Defaults to
+        HttpClientConfig().
+    """
+    self.config = config or HttpClientConfig()
+    self._clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]
+    ] = weakref.WeakKeyDictionary()
+
+  def get_client(self, url: str) -> httpx.AsyncClient:
+    """Returns the client for the host of the url in the running event loop.
+
+    Args:
+      url: The url that will be requested with the client.
+
+    Returns:
+      The shared client for the host.
+    """
+    clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+    url_parts = urlsplit(url)
+    host = f"{url_parts.scheme}://{url_parts.netloc}"
+    client = clients.get(host)
+    if client is None or client.is_closed:
+      client = clients[host] = self._create_client()
+    return client
+
+  def _create_client(self) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            self.config.timeout, connect=self.config.connect_timeout
+        ),
+        limits=httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        ),
+        http2=self.config.http2 and _is_http2_available(),
+        follow_redirects=True,
+    )
+
+  async def close(self):
+    """Closes the clients created in the running event loop."""
+    clients = self._clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+      await client.aclose()
@@ -25,6 +25,8 @@ import yaml
 
 from ....auth.auth_credential import AuthCredential
 from ....auth.auth_schemes import AuthScheme
+from .http_client_pool import HttpClientConfig
+from .http_client_pool import HttpClientPool
 from .openapi_spec_parser import OpenApiSpecParser
 from .rest_api_tool import RestApiTool
 
@@ -61,6 +63,7 @@ class OpenAPIToolset:
       spec_str_type: Literal["json", "yaml"] = "json",
       auth_scheme: Optional[AuthScheme] = None,
       auth_credential: Optional[AuthCredential] = None,
+      http_client_config: Optional[HttpClientConfig] = None,
   ):
     """Initializes the OpenAPIToolset.
 
@@ -94,9 +97,12 @@ class OpenAPIToolset:
       auth_credential: The auth credential to use for all tools. Use
         AuthCredential or use helpers in
         `google.adk.tools.openapi_tool.auth.auth_helpers`
+      http_client_config: The configs of the HTTP connections shared by all
+        tools, e.g. timeouts and connection pool limits.
     """
     if not spec_dict:
       spec_dict = self._load_spec(spec_str, spec_str_type)
+    self._http_client_pool = HttpClientPool(http_client_config)
     self.tools: Final[List[RestApiTool]] = list(self._parse(spec_dict))
     if auth_scheme or auth_credential:
       self._configure_auth_all(auth_scheme, auth_credential)
@@ -121,6 +127,10 @@ class OpenAPIToolset:
     matching_tool = filter(lambda t: t.name == tool_name, self.tools)
     return next(matching_tool, None)
 
+  async def close(self):
+    """Closes the HTTP connections opened by the tools."""
+    await self._http_client_pool.close()
+
   def _load_spec(
       self, spec_str: str, spec_type: Literal["json", "yaml"]
   ) -> Dict[str, Any]:
@@ -139,6 +149,7 @@ class OpenAPIToolset:
     tools = []
     for o in operations:
       tool = RestApiTool.from_parsed_operation(o)
+      tool.configure_http_client_pool(self._http_client_pool)
       logger.info("Parsed tool: %s", tool.name)
       tools.append(tool)
     return tools
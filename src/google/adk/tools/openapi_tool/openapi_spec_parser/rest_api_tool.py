@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 from typing import Any
 from typing import Dict
 from typing import List
@@ -24,6 +25,7 @@ from typing import Union
 from fastapi.openapi.models import Operation
 from google.genai.types import FunctionDeclaration
 from google.genai.types import Schema
+import httpx
 import requests
 from typing_extensions import override
 
@@ -36,9 +38,11 @@ from ..auth.auth_helpers import dict_to_auth_scheme
 from ..auth.credential_exchangers.auto_auth_credential_exchanger import AutoAuthCredentialExchanger
 from ..common.common import ApiParameter
 from ..common.common import to_snake_case
+from .http_client_pool import HttpClientPool
 from .openapi_spec_parser import OperationEndpoint
 from .openapi_spec_parser import ParsedOperation
 from .operation_parser import OperationParser
+from .tool_auth_handler import AuthPreparationResult
 from .tool_auth_handler import ToolAuthHandler
 
 
@@ -173,6 +177,41 @@ def to_gemini_schema(openapi_schema: Optional[Dict[str, Any]] = None) -> Schema:
 
 AuthPreparationState = Literal["pending", "done"]
 
+_default_http_client_pool = HttpClientPool()
+"""The HTTP clients used by RestApiTools that are not part of a toolset."""
+
+
+def _to_httpx_request_params(request_params: Dict[str, Any]) -> Dict[str, Any]:
+  """Converts requests.request() params to httpx.AsyncClient.stream() params."""
+  httpx_params = dict(request_params)
+  # httpx deprecates per-request cookies, so they are sent as a header.
+  cookies = httpx_params.pop("cookies", None)
+  if cookies:
+    httpx_params["headers"] = {
+        **httpx_params["headers"],
+        "Cookie": "; ".join(f"{k}={v}" for k, v in cookies.items()),
+    }
+  # httpx expects raw bodies as `content` and only form fields as `data`.
+  if isinstance(httpx_params.get("data"), (str, bytes)):
+    httpx_params["content"] = httpx_params.pop("data")
+  return httpx_params
+
+
+async def _read_response_body(
+    response: httpx.Response, max_size: int
+) -> Tuple[bytes, bool]:
+  """Reads at most max_size bytes from a streamed response body.
+
+  Returns:
+    The body, and whether it was truncated.
+  """
+  body = bytearray()
+  async for chunk in response.aiter_bytes():
+    body += chunk
+    if len(body) > max_size:
+      return bytes(body[:max_size]), True
+  return bytes(body), False
+
 
 class RestApiTool(BaseTool):
   """A generic tool that interacts with a REST API.
@@ -198,6 +237,7 @@ class RestApiTool(BaseTool):
       auth_scheme: Optional[Union[AuthScheme, str]] = None,
       auth_credential: Optional[Union[AuthCredential, str]] = None,
       should_parse_operation=True,
+      http_client_pool: Optional[HttpClientPool] = None,
   ):
     """Initializes the RestApiTool with the given parameters.
 
@@ -225,6 +265,8 @@ class RestApiTool(BaseTool):
           (https://github.com/OAI/OpenAPI-Specification/blob/main/versions/3.1.0.md#security-scheme-object)
         auth_credential: The authentication credential of the tool.
         should_parse_operation: Whether to parse the operation.
+        http_client_pool: The pool of HTTP clients used to call the API. Tools
+          share a process wide pool by default.
     """
     # Gemini restrict the length of function name to be less than 64 characters
     self.name = name[:60]
@@ -246,6 +288,7 @@ class RestApiTool(BaseTool):
 
     # Private properties
     self.credential_exchanger = AutoAuthCredentialExchanger()
+    self._http_client_pool = http_client_pool
     if should_parse_operation:
       self._operation_parser = OperationParser(self.operation)
 
@@ -295,6 +338,9 @@ class RestApiTool(BaseTool):
   @override
   def _get_declaration(self) -> FunctionDeclaration:
     """Returns the function declaration in the Gemini Schema format."""
+    return self._get_cached_declaration(self._build_declaration)
+
+  def _build_declaration(self) -> FunctionDeclaration:
     schema_dict = self._operation_parser.get_json_schema()
     parameters = to_gemini_schema(schema_dict)
     function_decl = FunctionDeclaration(
@@ -328,6 +374,15 @@ class RestApiTool(BaseTool):
       auth_credential = AuthCredential.model_validate_json(auth_credential)
     self.auth_credential = auth_credential
 
+  def configure_http_client_pool(self, http_client_pool: HttpClientPool):
+    """Configures the pool of HTTP clients used for the API call.
+
+    Args:
+        http_client_pool: HttpClientPool - The pool of HTTP clients, usually
+          shared by all tools of a toolset.
+    """
+    self._http_client_pool = http_client_pool
+
   def _prepare_auth_request_params(
       self,
       auth_scheme: AuthScheme,
@@ -455,12 +510,53 @@ class RestApiTool(BaseTool):
   async def run_async(
       self, *, args: dict[str, Any], tool_context: Optional[ToolContext]
   ) -> Dict[str, Any]:
-    return self.call(args=args, tool_context=tool_context)
+    """Executes the REST API call without blocking the event loop.
+
+    Connections are reused across calls through the tool's HttpClientPool.
+
+    Args:
+        args: Keyword arguments representing the operation parameters.
+        tool_context: The tool context.
+
+    Returns:
+        The API response as a dictionary.
+    """
+    request_params = await self._prepare_call_request_params_async(
+        args, tool_context
+    )
+    if request_params is None:
+      return self._auth_pending_response()
+
+    http_client_pool = self._http_client_pool or _default_http_client_pool
+    client = http_client_pool.get_client(request_params["url"])
+    async with client.stream(
+        **_to_httpx_request_params(request_params)
+    ) as response:
+      body, truncated = await _read_response_body(
+          response, http_client_pool.config.max_response_size
+      )
+
+    # Parse API response
+    encoding = response.encoding or "utf-8"
+    if response.is_error:
+      return self._error_response(body.decode(encoding, errors="replace"))
+    if truncated:
+      return {
+          "text": body.decode(encoding, errors="ignore"),
+          "truncated": True,
+      }
+    try:
+      return json.loads(body)
+    except ValueError:
+      return {"text": body.decode(encoding, errors="replace")}
 
   def call(
       self, *, args: dict[str, Any], tool_context: Optional[ToolContext]
   ) -> Dict[str, Any]:
-    """Executes the REST API call.
+    """Executes the REST API call synchronously.
+
+    Prefer run_async, which doesn't block the event loop and reuses
+    connections.
 
     Args:
         args: Keyword arguments representing the operation parameters.
@@ -470,11 +566,48 @@ class RestApiTool(BaseTool):
     Returns:
         The API response as a dictionary.
     """
+    request_params = self._prepare_call_request_params(args, tool_context)
+    if request_params is None:
+      return self._auth_pending_response()
+    response = requests.request(**request_params)
+
+    # Parse API response
+    try:
+      response.raise_for_status()  # Raise HTTPError for bad responses
+      return response.json()  # Try to decode JSON
+    except requests.exceptions.HTTPError:
+      return self._error_response(response.content.decode("utf-8"))
+    except ValueError:
+      return {"text": response.text}  # Return text if not JSON
+
+  def _prepare_call_request_params(
+      self, args: dict[str, Any], tool_context: Optional[ToolContext]
+  ) -> Optional[Dict[str, Any]]:
+    """Prepares the request params of a call, with auth attached.
+
+    Returns:
+        The request params, or None if the auth is still pending.
+    """
     # Prepare auth credentials for the API call
     tool_auth_handler = ToolAuthHandler.from_tool_context(
         tool_context, self.auth_scheme, self.auth_credential
     )
     auth_result = tool_auth_handler.prepare_auth_credentials()
+    return self._prepare_authorized_request_params(args, auth_result)
+
+  async def _prepare_call_request_params_async(
+      self, args: dict[str, Any], tool_context: Optional[ToolContext]
+  ) -> Optional[Dict[str, Any]]:
+    """Like _prepare_call_request_params, but doesn't block the event loop."""
+    tool_auth_handler = ToolAuthHandler.from_tool_context(
+        tool_context, self.auth_scheme, self.auth_credential
+    )
+    auth_result = await tool_auth_handler.prepare_auth_credentials_async()
+    return self._prepare_authorized_request_params(args, auth_result)
+
+  def _prepare_authorized_request_params(
+      self, args: dict[str, Any], auth_result: AuthPreparationResult
+  ) -> Optional[Dict[str, Any]]:
     auth_state, auth_scheme, auth_credential = (
         auth_result.state,
         auth_result.auth_scheme,
@@ -482,10 +615,7 @@ class RestApiTool(BaseTool):
     )
 
     if auth_state == "pending":
-      return {
-          "pending": True,
-          "message": "Needs your authorization to access your data.",
-      }
+      return None
 
     # Attach parameters from auth into main parameters list
     api_params, api_args = self._operation_parser.get_parameters().copy(), args
@@ -498,26 +628,24 @@ class RestApiTool(BaseTool):
         api_params = [auth_param] + api_params
         api_args.update(auth_args)
 
-    # Got all parameters. Call the API.
-    request_params = self._prepare_request_params(api_params, api_args)
-    response = requests.request(**request_params)
+    # Got all parameters.
+    return self._prepare_request_params(api_params, api_args)
 
-    # Parse API response
-    try:
-      response.raise_for_status()  # Raise HTTPError for bad responses
-      return response.json()  # Try to decode JSON
-    except requests.exceptions.HTTPError:
-      error_details = response.content.decode("utf-8")
-      return {
-          "error": (
-              f"Tool {self.name} execution failed. Analyze this execution error"
-              " and your inputs. Retry with adjustments if applicable. But"
-              " make sure don't retry more than 3 times. Execution Error:"
-              f" {error_details}"
-          )
-      }
-    except ValueError:
-      return {"text": response.text}  # Return text if not JSON
+  def _auth_pending_response(self) -> Dict[str, Any]:
+    return {
+        "pending": True,
+        "message": "Needs your authorization to access your data.",
+    }
+
+  def _error_response(self, error_details: str) -> Dict[str, Any]:
+    return {
+        "error": (
+            f"Tool {self.name} execution failed. Analyze this execution error"
+            " and your inputs. Retry with adjustments if applicable. But"
+            " make sure don't retry more than 3 times. Execution Error:"
+            f" {error_details}"
+        )
+    }
 
   def __str__(self):
     return (
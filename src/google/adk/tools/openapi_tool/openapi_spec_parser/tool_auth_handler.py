@@ -150,7 +150,7 @@ class ToolAuthHandler:
       self,
   ) -> Optional[AuthPreparationResult]:
     """Checks for and returns an existing, exchanged credential."""
-    if self.credential_store:
+    if self._uses_credential_store():
       existing_credential = self.credential_store.get_credential(
           self.auth_scheme, self.auth_credential
       )
@@ -176,10 +176,36 @@ class ToolAuthHandler:
       logger.error("Failed to exchange credential: %s", e)
     return exchanged_credential
 
+  async def _exchange_credential_async(
+      self, auth_credential: AuthCredential
+  ) -> Optional[AuthCredential]:
+    """Like _exchange_credential, but doesn't block the event loop."""
+
+    exchanged_credential = None
+    try:
+      exchanged_credential = (
+          await self.credential_exchanger.exchange_credential_async(
+              self.auth_scheme, auth_credential
+          )
+      )
+    except Exception as e:
+      logger.error("Failed to exchange credential: %s", e)
+    return exchanged_credential
+
+  def _uses_credential_store(self) -> bool:
+    # Service account tokens are cached by their exchanger until they expire.
+    # The session state doesn't track the expiry, so they are not stored in
+    # it.
+    return bool(self.credential_store) and not (
+        self.auth_credential
+        and self.auth_credential.auth_type
+        == AuthCredentialTypes.SERVICE_ACCOUNT
+    )
+
   def _store_credential(self, auth_credential: AuthCredential) -> None:
     """stores the auth_credential."""
 
-    if self.credential_store:
+    if self._uses_credential_store():
       key = self.credential_store.get_credential_key(
           self.auth_scheme, self.auth_credential
       )
@@ -251,7 +277,31 @@ class ToolAuthHandler:
     fetched_credential = self._get_auth_response() or self.auth_credential
 
     exchanged_credential = self._exchange_credential(fetched_credential)
+    return self._complete_preparation(exchanged_credential)
 
+  async def prepare_auth_credentials_async(
+      self,
+  ) -> AuthPreparationResult:
+    """Like prepare_auth_credentials, but doesn't block the event loop."""
+
+    if not self.auth_scheme:
+      return AuthPreparationResult(state="done")
+
+    existing_result = self._handle_existing_credential()
+    if existing_result:
+      return existing_result
+
+    fetched_credential = self._get_auth_response() or self.auth_credential
+
+    exchanged_credential = await self._exchange_credential_async(
+        fetched_credential
+    )
+    return self._complete_preparation(exchanged_credential)
+
+  def _complete_preparation(
+      self, exchanged_credential: Optional[AuthCredential]
+  ) -> AuthPreparationResult:
+    """Stores the exchanged credential, or requests one from the user."""
     if exchanged_credential:
       self._store_credential(exchanged_credential)
       return AuthPreparationResult(
@@ -0,0 +1,75 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for cheap logging of large payloads."""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+MAX_LOG_LENGTH = 10_000
+"""The default maximum number of characters of a payload log."""
+
+
+def truncate(text: str, max_length: Optional[int] = MAX_LOG_LENGTH) -> str:
+  """Truncates the text to at most max_length characters plus a marker.
+
+  Args:
+    text: The text to truncate.
+    max_length: The maximum number of characters to keep. None keeps all.
+
+  Returns:
+    The text, truncated if it is too long.
+  """
+  if max_length is None or len(text) <= max_length:
+    return text
+  return (
+      f'{text[:max_length]}...[truncated {len(text) - max_length} characters]'
+  )
+
+
+class LazyLogMessage:
+  """A log argument that is only built when the log record is emitted.
+
+  Logging formats its arguments only if a handler emits the record, so large
+  payloads are not serialized at all when the log level is disabled.
+
+  Example:
+    logger.info('%s', LazyLogMessage(_build_request_log, llm_request))
+  """
+
+  __slots__ = ('_build', '_args', '_max_length')
+
+  def __init__(
+      self,
+      build: Callable[..., Any],
+      *args: Any,
+      max_length: Optional[int] = MAX_LOG_LENGTH,
+  ):
+    """Initializes the message.
+
+    Args:
+      build: Builds the message from args.
+      *args: The arguments of build.
+      max_length: The maximum number of characters of the message. None keeps
+        the whole message.
+    """
+    self._build = build
+    self._args = args
+    self._max_length = max_length
+
+  def __str__(self) -> str:
+    return truncate(str(self._build(*self._args)), self._max_length)
@@ -0,0 +1,103 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from google.adk.agents import LiveRequestQueue
+from google.adk.agents.live_request_queue import LiveRequest
+from google.genai import types
+import pytest
+
+
+def _pcm(data: bytes) -> types.Blob:
+  return types.Blob(mime_type='audio/pcm', data=data)
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_request():
+  queue = LiveRequestQueue()
+  get_task = asyncio.create_task(queue.get())
+  await asyncio.sleep(0.01)
+  assert not get_task.done()
+
+  queue.send_content(types.Content(parts=[types.Part(text='hello')]))
+
+  request = await asyncio.wait_for(get_task, timeout=1)
+  assert request.content.parts[0].text == 'hello'
+
+
+@pytest.mark.asyncio
+async def test_send_async_waits_while_full():
+  queue = LiveRequestQueue(max_size=2)
+  await queue.send_async(LiveRequest(blob=_pcm(b'1')))
+  await queue.send_async(LiveRequest(blob=_pcm(b'2')))
+  assert queue.full()
+
+  send_task = asyncio.create_task(queue.send_async(LiveRequest(close=True)))
+  await asyncio.sleep(0.01)
+  assert not send_task.done()
+  # The sync methods never wait.
+  queue.send_realtime(_pcm(b'3'))
+  assert queue.qsize() == 3
+
+  await queue.get()
+  await queue.get()
+  await asyncio.wait_for(send_task, timeout=1)
+  assert [(await queue.get()).blob.data, (await queue.get()).close] == [
+      b'3',
+      True,
+  ]
+
+
+@pytest.mark.asyncio
+async def test_get_batch_joins_consecutive_pcm_audio():
+  queue = LiveRequestQueue()
+  queue.send_realtime(_pcm(b'ab'))
+  queue.send_realtime(_pcm(b'cd'))
+  queue.send_realtime(_pcm(b'ef'))
+  queue.send_realtime(types.Blob(mime_type='image/jpeg', data=b'img'))
+  queue.send_realtime(_pcm(b'gh'))
+
+  first = await queue.get_batch(max_blob_bytes=1024)
+  second = await queue.get_batch(max_blob_bytes=1024)
+  third = await queue.get_batch(max_blob_bytes=1024)
+
+  assert first.blob == _pcm(b'abcdef')
+  assert second.blob.mime_type == 'image/jpeg'
+  assert third.blob == _pcm(b'gh')
+  assert queue.qsize() == 0
+
+
+@pytest.mark.asyncio
+async def test_get_batch_stops_at_max_bytes_and_other_requests():
+  queue = LiveRequestQueue()
+  queue.send_realtime(_pcm(b'ab'))
+  queue.send_realtime(_pcm(b'cd'))
+  queue.send_realtime(_pcm(b'ef'))
+  queue.send_realtime(types.Blob(mime_type='audio/pcm;rate=24000', data=b'gh'))
+  queue.send_content(types.Content(parts=[types.Part(text='hello')]))
+  queue.send_realtime(_pcm(b'ij'))
+
+  requests = [await queue.get_batch(max_blob_bytes=4) for _ in range(5)]
+
+  assert [
+      request.blob.data if request.blob else None for request in requests
+  ] == [
+      b'abcd',
+      b'ef',
+      b'gh',
+      None,
+      b'ij',
+  ]
+  assert requests[3].content.parts[0].text == 'hello'
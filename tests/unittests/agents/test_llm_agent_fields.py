@@ -229,3 +229,32 @@ def test_allow_transfer_by_default():
 
   assert not agent.disallow_transfer_to_parent
   assert not agent.disallow_transfer_to_peers
+
+
+def _tool_function(arg: str) -> str:
+  """A tool function."""
+  return arg
+
+
+def test_canonical_tools_are_reused():
+  agent = LlmAgent(name='test_agent', tools=[_tool_function])
+
+  tools = agent.canonical_tools
+
+  assert tools[0] is agent.canonical_tools[0]
+
+
+def test_canonical_tools_rebuilt_when_tools_change():
+  agent = LlmAgent(name='test_agent', tools=[_tool_function])
+  _ = agent.canonical_tools
+
+  agent.tools.append(_create_readonly_context)
+  assert [tool.name for tool in agent.canonical_tools] == [
+      '_tool_function',
+      '_create_readonly_context',
+  ]
+
+  agent.tools = [_create_readonly_context]
+  assert [tool.name for tool in agent.canonical_tools] == [
+      '_create_readonly_context'
+  ]
@@ -0,0 +1,112 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.agents.transcription_cache import BaseAudioTranscriber
+from google.adk.agents.transcription_cache import TranscriptionCache
+from google.adk.agents.transcription_entry import TranscriptionEntry
+from google.genai import types
+import pytest
+
+
+def _user_audio(
+    data: bytes, mime_type: str = 'audio/pcm'
+) -> TranscriptionEntry:
+  return TranscriptionEntry(
+      role='user', data=types.Blob(mime_type=mime_type, data=data)
+  )
+
+
+def _model_text(text: str) -> TranscriptionEntry:
+  return TranscriptionEntry(
+      role='model',
+      data=types.Content(role='model', parts=[types.Part(text=text)]),
+  )
+
+
+class _FakeTranscriber(BaseAudioTranscriber):
+
+  def __init__(self):
+    self.calls = []
+
+  async def transcribe_audio(self, audio, sample_rate_hertz):
+    self.calls.append((bytes(audio), sample_rate_hertz))
+    return [f'{len(audio)} bytes']
+
+
+def test_joins_consecutive_audio_of_a_speaker():
+  cache = TranscriptionCache()
+  cache.append(_user_audio(b'ab'))
+  cache.append(_user_audio(b'cd'))
+  cache.append(_user_audio(b''))
+  cache.append(_model_text('hello'))
+  cache.append(_user_audio(b'ef'))
+  cache.append(_user_audio(b'gh', mime_type='audio/pcm;rate=24000'))
+
+  segments = list(cache)
+
+  assert [(s.role, s.data) for s in segments[:3]] == [
+      ('user', bytearray(b'abcd')),
+      ('model', _model_text('hello').data),
+      ('user', bytearray(b'ef')),
+  ]
+  assert segments[3].sample_rate_hertz == 24000
+  assert len(cache) == 4
+
+
+def test_drops_oldest_audio_above_max_duration():
+  # 1s of 16kHz 16-bit audio is 32000 bytes.
+  cache = TranscriptionCache(max_audio_seconds=1.0)
+  cache.append(_user_audio(b'\x01' * 16000))
+  cache.append(_model_text('hello'))
+  cache.append(_user_audio(b'\x02' * 24000))
+
+  segments = list(cache)
+  assert len(segments) == 3
+  assert bytes(segments[0].data) == b'\x01' * 8000
+  assert cache.audio_seconds == pytest.approx(1.0)
+
+  cache.append(_user_audio(b'\x03' * 16000))
+
+  segments = list(cache)
+  # The oldest audio and the model content before the kept audio are dropped.
+  assert len(segments) == 1
+  assert bytes(segments[0].data) == b'\x02' * 16000 + b'\x03' * 16000
+  assert cache.audio_seconds == pytest.approx(1.0)
+
+
+def test_keeps_all_audio_without_max_duration():
+  cache = TranscriptionCache(max_audio_seconds=None)
+  for _ in range(10):
+    cache.append(_user_audio(b'\x00' * 32000))
+
+  assert cache.audio_seconds == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_transcribe_keeps_speaker_order():
+  cache = TranscriptionCache()
+  cache.append(_user_audio(b'ab'))
+  cache.append(_user_audio(b'cd'))
+  cache.append(_model_text('hello'))
+  cache.append(_user_audio(b'efgh', mime_type='audio/pcm;rate=24000'))
+  transcriber = _FakeTranscriber()
+
+  contents = await transcriber.transcribe(cache)
+
+  assert transcriber.calls == [(b'abcd', 16000), (b'efgh', 24000)]
+  assert contents == [
+      types.Content(role='user', parts=[types.Part(text='4 bytes')]),
+      _model_text('hello').data,
+      types.Content(role='user', parts=[types.Part(text='4 bytes')]),
+  ]
@@ -466,6 +466,26 @@ class TestParseAndStoreAuthResponse:
     assert state[credential_key] == mock_exchange_token.return_value
     assert mock_exchange_token.called
 
+  @pytest.mark.asyncio
+  @patch("google.adk.auth.auth_handler.AuthHandler.exchange_auth_token")
+  async def test_oauth_scheme_async(
+      self, mock_exchange_token, auth_config_with_exchanged
+  ):
+    """Test the async variant with an OAuth auth scheme."""
+    mock_exchange_token.return_value = AuthCredential(
+        auth_type=AuthCredentialTypes.OAUTH2,
+        oauth2=OAuth2Auth(access_token="exchanged_token"),
+    )
+
+    handler = AuthHandler(auth_config_with_exchanged)
+    state = MockState()
+
+    await handler.parse_and_store_auth_response_async(state)
+
+    credential_key = handler.get_credential_key()
+    assert state[credential_key] == mock_exchange_token.return_value
+    assert mock_exchange_token.called
+
 
 class TestExchangeAuthToken:
   """Tests for the exchange_auth_token method."""
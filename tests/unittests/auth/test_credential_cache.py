@@ -0,0 +1,213 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+
+from google.adk.auth.auth_credential import AuthCredential
+from google.adk.auth.auth_credential import AuthCredentialTypes
+from google.adk.auth.auth_credential import HttpAuth
+from google.adk.auth.auth_credential import HttpCredentials
+from google.adk.auth.credential_cache import CachedCredential
+from google.adk.auth.credential_cache import CredentialCache
+import pytest
+
+
+def _bearer(token: str) -> AuthCredential:
+  return AuthCredential(
+      auth_type=AuthCredentialTypes.HTTP,
+      http=HttpAuth(scheme='bearer', credentials=HttpCredentials(token=token)),
+  )
+
+
+class _TokenEndpoint:
+  """Issues numbered tokens living `lifetime` seconds."""
+
+  def __init__(self, lifetime=3600.0, latency=0.0):
+    self.lifetime = lifetime
+    self.latency = latency
+    self.fetches = 0
+    self._lock = threading.Lock()
+
+  def fetch(self) -> CachedCredential:
+    time.sleep(self.latency)
+    with self._lock:
+      self.fetches += 1
+      token = f'token_{self.fetches}'
+    expires_at = None if self.lifetime is None else time.time() + self.lifetime
+    return CachedCredential(_bearer(token), expires_at=expires_at)
+
+
+def _token(credential: AuthCredential) -> str:
+  return credential.http.credentials.token
+
+
+def test_get_key():
+  credential = _bearer('secret')
+
+  key = CredentialCache.get_key(None, credential)
+
+  assert key == CredentialCache.get_key(None, _bearer('secret'))
+  assert key != CredentialCache.get_key(None, _bearer('other'))
+  assert key != CredentialCache.get_key(None, None)
+  assert 'secret' not in key
+
+
+def test_get_or_fetch_reuses_credential_until_expiry():
+  cache = CredentialCache()
+  endpoint = _TokenEndpoint()
+
+  tokens = [_token(cache.get_or_fetch('key', endpoint.fetch)) for _ in range(5)]
+
+  assert tokens == ['token_1'] * 5
+  assert endpoint.fetches == 1
+
+
+def test_get_or_fetch_does_not_cache_credential_without_expiry():
+  cache = CredentialCache()
+  endpoint = _TokenEndpoint(lifetime=None)
+
+  cache.get_or_fetch('key', endpoint.fetch)
+  cache.get_or_fetch('key', endpoint.fetch)
+
+  assert endpoint.fetches == 2
+
+
+def test_get_or_fetch_fetches_expired_credential():
+  cache = CredentialCache()
+  endpoint = _TokenEndpoint(lifetime=0.05)
+
+  cache.get_or_fetch('key', endpoint.fetch)
+  time.sleep(0.1)
+  credential = cache.get_or_fetch('key', endpoint.fetch)
+
+  assert _token(credential) == 'token_2'
+
+
+def test_get_or_fetch_refreshes_in_background_before_expiry():
+  cache = CredentialCache(refresh_margin_seconds=10)
+  endpoint = _TokenEndpoint(lifetime=0.4)
+
+  cache.get_or_fetch('key', endpoint.fetch)
+  # Past half the lifetime, the credential is still returned while it's
+  # refreshed.
+  time.sleep(0.25)
+  credential = cache.get_or_fetch('key', endpoint.fetch)
+  for _ in range(100):
+    if endpoint.fetches == 2:
+      break
+    time.sleep(0.01)
+
+  assert _token(credential) == 'token_1'
+  assert endpoint.fetches == 2
+  assert _token(cache.get_or_fetch('key', endpoint.fetch)) == 'token_2'
+
+
+def test_get_or_fetch_collapses_concurrent_fetches():
+  cache = CredentialCache()
+  endpoint = _TokenEndpoint(latency=0.1)
+  tokens = []
+
+  def get():
+    tokens.append(_token(cache.get_or_fetch('key', endpoint.fetch)))
+
+  threads = [threading.Thread(target=get) for _ in range(10)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert tokens == ['token_1'] * 10
+  assert endpoint.fetches == 1
+
+
+def test_get_or_fetch_raises_error_to_all_waiters():
+  cache = CredentialCache()
+  errors = []
+  fetches = []
+
+  def fetch():
+    fetches.append(1)
+    time.sleep(0.1)
+    raise ValueError('invalid_grant')
+
+  def get():
+    try:
+      cache.get_or_fetch('key', fetch)
+    except ValueError as e:
+      errors.append(e)
+
+  threads = [threading.Thread(target=get) for _ in range(3)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert len(fetches) == 1
+  assert len(errors) == 3
+  # The failure isn't cached.
+  with pytest.raises(ValueError):
+    cache.get_or_fetch('key', fetch)
+  assert len(fetches) == 2
+
+
+def test_get_or_fetch_evicts_least_recently_used():
+  cache = CredentialCache(max_size=2)
+  endpoint = _TokenEndpoint()
+
+  cache.get_or_fetch('a', endpoint.fetch)
+  cache.get_or_fetch('b', endpoint.fetch)
+  cache.get_or_fetch('a', endpoint.fetch)
+  cache.get_or_fetch('c', endpoint.fetch)
+  assert endpoint.fetches == 3
+
+  cache.get_or_fetch('a', endpoint.fetch)
+  assert endpoint.fetches == 3
+  cache.get_or_fetch('b', endpoint.fetch)
+  assert endpoint.fetches == 4
+
+
+def test_invalidate():
+  cache = CredentialCache()
+  endpoint = _TokenEndpoint()
+  cache.get_or_fetch('key', endpoint.fetch)
+
+  cache.invalidate('key')
+
+  assert _token(cache.get_or_fetch('key', endpoint.fetch)) == 'token_2'
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_async_fetches_off_event_loop_once():
+  cache = CredentialCache()
+  endpoint = _TokenEndpoint(latency=0.1)
+  ticks = 0
+
+  async def tick():
+    nonlocal ticks
+    while True:
+      ticks += 1
+      await asyncio.sleep(0.01)
+
+  ticker = asyncio.create_task(tick())
+  credentials = await asyncio.gather(
+      *[cache.get_or_fetch_async('key', endpoint.fetch) for _ in range(20)]
+  )
+  ticker.cancel()
+
+  assert {_token(c) for c in credentials} == {'token_1'}
+  assert endpoint.fetches == 1
+  # The event loop kept running during the fetch.
+  assert ticks > 3
@@ -0,0 +1,87 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+
+from google.adk.agents import Agent
+from google.adk.cli.cli_eval import EvalMetric
+from google.adk.cli.cli_eval import EvalStatus
+from google.adk.cli.cli_eval import run_evals
+from google.adk.cli.cli_eval import run_evals_async
+
+from .. import utils
+
+
+def _write_eval_set(tmp_path):
+  eval_set_file = tmp_path / "weather.evalset.json"
+  eval_set_file.write_text(
+      json.dumps([
+          {
+              "name": f"eval_{i}",
+              "data": [{"query": f"q{i}", "expected_tool_use": []}],
+          }
+          for i in range(3)
+      ])
+  )
+  return str(eval_set_file)
+
+
+def _create_agent():
+  return Agent(
+      name="root_agent",
+      model=utils.MockModel.create(responses=["hello"] * 3),
+  )
+
+
+async def test_run_evals_async(tmp_path):
+  eval_set_file = _write_eval_set(tmp_path)
+  checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+
+  eval_results = [
+      eval_result
+      async for eval_result in run_evals_async(
+          {eval_set_file: ["eval_0", "eval_2"]},
+          _create_agent(),
+          None,
+          [EvalMetric(metric_name="tool_trajectory_avg_score", threshold=1.0)],
+          max_concurrency=2,
+          checkpoint_path=checkpoint_path,
+      )
+  ]
+
+  assert sorted(eval_result.eval_id for eval_result in eval_results) == [
+      "eval_0",
+      "eval_2",
+  ]
+  for eval_result in eval_results:
+    assert eval_result.eval_set_file == eval_set_file
+    assert eval_result.final_eval_status == EvalStatus.PASSED
+  with open(checkpoint_path) as f:
+    assert len(f.readlines()) == 2
+
+
+def test_run_evals(tmp_path):
+  eval_set_file = _write_eval_set(tmp_path)
+
+  eval_results = list(
+      run_evals(
+          {eval_set_file: []},
+          _create_agent(),
+          None,
+          [EvalMetric(metric_name="tool_trajectory_avg_score", threshold=1.0)],
+      )
+  )
+
+  assert len(eval_results) == 3
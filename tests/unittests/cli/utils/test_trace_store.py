@@ -0,0 +1,95 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the bounded trace store of the API server."""
+
+from unittest import mock
+
+from google.adk.cli.utils.trace_store import TraceStore
+
+
+def _attributes(event_id, payload_size=10):
+  return {
+      "gcp.vertex.agent.event_id": event_id,
+      "gcp.vertex.agent.llm_request": "x" * payload_size,
+      "trace_id": 2**100,
+  }
+
+
+def test_get():
+  store = TraceStore()
+  store["e1"] = _attributes("e1")
+
+  assert store.get("e1") == _attributes("e1")
+  assert store.get("e2") is None
+  assert "e1" in store
+
+
+def test_evicts_least_recently_used():
+  store = TraceStore(max_entries=2)
+  store["e1"] = _attributes("e1")
+  store["e2"] = _attributes("e2")
+  store.get("e1")
+  store["e3"] = _attributes("e3")
+
+  assert len(store) == 2
+  assert store.get("e2") is None
+  assert store.get("e1") is not None
+  assert store.get("e3") is not None
+
+
+def test_evicts_over_byte_budget():
+  store = TraceStore(max_bytes=5000)
+  for i in range(100):
+    store[f"e{i}"] = _attributes(f"e{i}", payload_size=1000)
+
+  assert store.size <= 5000
+  assert len(store) == 4
+  assert store.get("e99") is not None
+  assert store.get("e0") is None
+
+
+def test_expires_after_ttl():
+  store = TraceStore(ttl_seconds=10)
+  with mock.patch("time.time", return_value=1000):
+    store["e1"] = _attributes("e1")
+  with mock.patch("time.time", return_value=1009):
+    assert store.get("e1") is not None
+  with mock.patch("time.time", return_value=1011):
+    assert store.get("e1") is None
+  assert len(store) == 0
+
+
+def test_spills_evicted_traces(tmp_path):
+  store = TraceStore(max_entries=1, spill_db_path=str(tmp_path / "traces.db"))
+  store["e1"] = _attributes("e1")
+  store["e2"] = _attributes("e2")
+
+  assert len(store) == 1
+  assert store.get("e1") == _attributes("e1")
+  store.close()
+
+
+def test_spilled_traces_expire(tmp_path):
+  store = TraceStore(
+      max_entries=1,
+      ttl_seconds=10,
+      spill_db_path=str(tmp_path / "traces.db"),
+  )
+  with mock.patch("time.time", return_value=1000):
+    store["e1"] = _attributes("e1")
+    store["e2"] = _attributes("e2")
+  with mock.patch("time.time", return_value=1011):
+    assert store.get("e1") is None
+  store.close()
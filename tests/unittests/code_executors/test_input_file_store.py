@@ -0,0 +1,91 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from google.adk.agents import Agent
+from google.adk.code_executors import ArtifactInputFileStore
+from google.adk.code_executors import CodeExecutorContext
+from google.adk.code_executors import LocalInputFileStore
+from google.adk.code_executors.code_execution_utils import File
+from google.adk.code_executors.input_file_store import compute_content_hash
+import pytest
+
+from .. import utils
+
+
+@pytest.fixture
+def invocation_context():
+  agent = Agent(name='root_agent', model=utils.MockModel.create(responses=[]))
+  return utils.create_invocation_context(agent=agent)
+
+
+def test_local_store_put_and_get(tmp_path, invocation_context):
+  store = LocalInputFileStore(str(tmp_path))
+
+  content_hash = store.put(invocation_context, b'a,b\n1,2\n')
+
+  assert content_hash == compute_content_hash(b'a,b\n1,2\n')
+  assert store.get(invocation_context, content_hash) == b'a,b\n1,2\n'
+  assert store.get(invocation_context, compute_content_hash(b'')) is None
+
+
+def test_local_store_stores_content_once(tmp_path, invocation_context):
+  store = LocalInputFileStore(str(tmp_path))
+
+  first_hash = store.put(invocation_context, b'a,b\n1,2\n')
+  second_hash = store.put(invocation_context, b'a,b\n1,2\n')
+
+  assert first_hash == second_hash
+  assert len(list(tmp_path.rglob('*.*'))) == 0
+  assert len([p for p in tmp_path.rglob('*') if p.is_file()]) == 1
+
+
+def test_local_store_rejects_invalid_hash(tmp_path, invocation_context):
+  store = LocalInputFileStore(str(tmp_path))
+
+  with pytest.raises(ValueError):
+    store.get(invocation_context, '../secret')
+
+
+def test_artifact_store_put_and_get(invocation_context):
+  store = ArtifactInputFileStore()
+
+  content_hash = store.put(invocation_context, b'a,b\n1,2\n')
+  store.put(invocation_context, b'a,b\n1,2\n')
+  # A new store finds the file saved by the first one.
+  ArtifactInputFileStore().put(invocation_context, b'a,b\n1,2\n')
+
+  assert invocation_context.artifact_service.list_versions(
+      app_name=invocation_context.app_name,
+      user_id=invocation_context.user_id,
+      session_id=invocation_context.session.id,
+      filename=f'user:code_executor_input_files/{content_hash}',
+  ) == [0]
+  assert store.get(invocation_context, content_hash) == b'a,b\n1,2\n'
+  assert store.get(invocation_context, compute_content_hash(b'')) is None
+
+
+def test_context_keeps_only_hash_in_state():
+  state = {}
+  code_executor_context = CodeExecutorContext(state)
+
+  code_executor_context.add_input_files([
+      File(name='a.csv', content='YSxi', content_hash='hash_a'),
+      File(name='b.csv', content='YSxi'),
+  ])
+
+  assert code_executor_context.get_input_files() == [
+      File(name='a.csv', content='', content_hash='hash_a'),
+      File(name='b.csv', content='YSxi'),
+  ]
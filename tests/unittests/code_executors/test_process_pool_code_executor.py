@@ -0,0 +1,257 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import base64
+import gc
+import os
+import sys
+import time
+from unittest import mock
+import weakref
+
+from google.adk.code_executors import LocalInputFileStore
+from google.adk.code_executors import ProcessPoolCodeExecutor
+from google.adk.code_executors.code_execution_utils import CodeExecutionInput
+from google.adk.code_executors.code_execution_utils import File
+import pytest
+
+
+@pytest.fixture
+def executor():
+  executor = ProcessPoolCodeExecutor(pool_size=2, preload_modules=[])
+  yield executor
+  executor.close()
+
+
+def _execute(executor, code, **kwargs):
+  return executor.execute_code(None, CodeExecutionInput(code=code, **kwargs))
+
+
+def test_execute_code_captures_output(executor):
+  result = _execute(
+      executor, 'import sys\nprint("out")\nprint("err", file=sys.stderr)'
+  )
+
+  assert result.stdout == 'out\n'
+  assert result.stderr == 'err\n'
+
+
+def test_execute_code_returns_traceback(executor):
+  result = _execute(executor, 'x = 1\nraise ValueError("bad value")')
+
+  assert result.stdout == ''
+  assert 'ValueError: bad value' in result.stderr
+  assert '_process_pool_worker' not in result.stderr
+
+
+def test_stateless_executions_do_not_share_globals(executor):
+  _execute(executor, 'x = 1', execution_id='session_1')
+  result = _execute(executor, 'print(x)', execution_id='session_1')
+
+  assert 'NameError' in result.stderr
+
+
+def test_stateful_executions_share_globals_per_session():
+  executor = ProcessPoolCodeExecutor(
+      pool_size=2, preload_modules=[], stateful=True
+  )
+  try:
+    _execute(executor, 'x = 1', execution_id='session_1')
+    _execute(executor, 'x = 2', execution_id='session_2')
+
+    assert _execute(executor, 'print(x)', execution_id='session_1').stdout == (
+        '1\n'
+    )
+    assert _execute(executor, 'print(x)', execution_id='session_2').stdout == (
+        '2\n'
+    )
+  finally:
+    executor.close()
+
+
+def test_least_recently_used_stateful_executions_are_dropped():
+  executor = ProcessPoolCodeExecutor(
+      pool_size=1,
+      preload_modules=[],
+      stateful=True,
+      max_executions_per_worker=None,
+      max_stateful_executions=2,
+  )
+  try:
+    _execute(executor, 'x = 1', execution_id='session_1')
+    _execute(executor, 'x = 2', execution_id='session_2')
+    _execute(executor, 'print(x)', execution_id='session_1')
+    _execute(executor, 'x = 3', execution_id='session_3')
+
+    assert list(executor._sticky_workers) == ['session_1', 'session_3']
+    (worker,) = executor._workers
+    assert worker.execution_ids == {'session_1', 'session_3'}
+    assert _execute(executor, 'print(x)', execution_id='session_1').stdout == (
+        '1\n'
+    )
+    assert 'NameError' in (
+        _execute(executor, 'print(x)', execution_id='session_2').stderr
+    )
+  finally:
+    executor.close()
+
+
+def test_input_files_are_written_to_working_dir(executor):
+  file = File(name='data.csv', content=base64.b64encode(b'a,b\n1,2\n').decode())
+  result = _execute(
+      executor, 'print(open("data.csv").read())', input_files=[file]
+  )
+
+  assert result.stdout == 'a,b\n1,2\n\n'
+
+
+def test_workers_are_reused_and_recycled():
+  executor = ProcessPoolCodeExecutor(
+      pool_size=1, preload_modules=[], max_executions_per_worker=2
+  )
+  try:
+    pids = [
+        _execute(executor, 'import os; print(os.getpid())').stdout
+        for _ in range(3)
+    ]
+
+    assert pids[0] == pids[1]
+    assert pids[1] != pids[2]
+  finally:
+    executor.close()
+
+
+def test_timeout_kills_worker(executor):
+  executor.timeout_seconds = 0.5
+
+  result = _execute(executor, 'while True: pass')
+
+  assert result.stderr == 'Code execution timed out after 0.5 seconds.'
+  assert _execute(executor, 'print(1)').stdout == '1\n'
+
+
+def test_crashed_worker_is_replaced(executor):
+  result = _execute(executor, 'import os; os._exit(3)')
+
+  assert result.stderr == 'Code execution worker exited with code 3.'
+  assert _execute(executor, 'print(1)').stdout == '1\n'
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Unix only.')
+def test_memory_limit():
+  executor = ProcessPoolCodeExecutor(
+      pool_size=1, preload_modules=[], memory_limit_bytes=512 * 1024 * 1024
+  )
+  try:
+    result = _execute(executor, 'x = bytearray(1024 * 1024 * 1024)')
+
+    assert 'MemoryError' in result.stderr
+  finally:
+    executor.close()
+
+
+@pytest.mark.asyncio
+async def test_execute_code_async_runs_concurrently(executor):
+  # Warms the workers up.
+  await asyncio.gather(*[
+      executor.execute_code_async(None, CodeExecutionInput(code='pass'))
+      for _ in range(2)
+  ])
+
+  start = time.monotonic()
+  results = await asyncio.gather(*[
+      executor.execute_code_async(
+          None, CodeExecutionInput(code='import time; time.sleep(0.5)')
+      )
+      for _ in range(2)
+  ])
+
+  assert time.monotonic() - start < 0.9
+  assert all(not result.stderr for result in results)
+
+
+def test_input_files_are_sent_once_per_worker():
+  executor = ProcessPoolCodeExecutor(pool_size=1, preload_modules=[])
+  file = File(
+      name='data.csv',
+      content=base64.b64encode(b'a,b\n1,2\n').decode(),
+      content_hash='hash',
+  )
+  try:
+    _execute(executor, 'import os; os.remove("data.csv")', input_files=[file])
+    (worker,) = executor._workers
+
+    # The worker writes the file again from its cache.
+    assert 'content' not in executor._get_input_file_request(None, worker, file)
+    result = _execute(
+        executor, 'print(open("data.csv").read())', input_files=[file]
+    )
+    assert result.stdout == 'a,b\n1,2\n\n'
+  finally:
+    executor.close()
+
+
+def test_hash_only_input_files_are_loaded_for_workers_without_them(tmp_path):
+  store = LocalInputFileStore(str(tmp_path))
+  executor = ProcessPoolCodeExecutor(
+      pool_size=1, preload_modules=[], input_file_store=store
+  )
+  file = File(
+      name='data.csv', content='', content_hash=store.put(None, b'a,b\n1,2\n')
+  )
+  try:
+    with mock.patch.object(store, 'get', wraps=store.get) as get:
+      _execute(executor, 'pass', input_files=[file])
+      result = _execute(
+          executor, 'print(open("data.csv").read())', input_files=[file]
+      )
+
+    assert result.stdout == 'a,b\n1,2\n\n'
+    get.assert_called_once()
+  finally:
+    executor.close()
+
+
+def test_input_files_missing_from_the_store_are_skipped(tmp_path):
+  executor = ProcessPoolCodeExecutor(
+      pool_size=1,
+      preload_modules=[],
+      input_file_store=LocalInputFileStore(str(tmp_path)),
+  )
+  file = File(name='data.csv', content='', content_hash='missing')
+  try:
+    result = _execute(
+        executor,
+        'import os; print(os.path.exists("data.csv"))',
+        input_files=[file],
+    )
+
+    assert result.stdout == 'False\n'
+  finally:
+    executor.close()
+
+
+def test_discarded_executor_stops_its_workers():
+  executor = ProcessPoolCodeExecutor(pool_size=1, preload_modules=[])
+  _execute(executor, 'print(1)')
+  (worker,) = executor._workers
+  executor_ref = weakref.ref(executor)
+
+  del executor
+  gc.collect()
+
+  assert executor_ref() is None
+  assert worker.process.poll() is not None
+  assert not os.path.exists(worker.root_dir)
@@ -0,0 +1,240 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the EvaluationEngine."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import AsyncGenerator
+
+from google.adk.agents import Agent
+from google.adk.evaluation.evaluation_engine import EvalCase
+from google.adk.evaluation.evaluation_engine import EvaluationEngine
+from google.adk.evaluation.evaluation_engine import iterate_sync
+from google.adk.evaluation.evaluation_generator import EvaluationGenerator
+from google.adk.models import BaseLlm
+from google.adk.models import LlmRequest
+from google.adk.models import LlmResponse
+from google.genai import types
+import pytest
+
+
+class SlowEchoModel(BaseLlm):
+  """Echoes the query after a delay, calling get_weather for 'weather:' ones."""
+
+  model: str = "slow-echo"
+  delay: float = 0.2
+  running: int = 0
+  max_running: int = 0
+  calls: int = 0
+
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    self.calls += 1
+    self.running += 1
+    self.max_running = max(self.max_running, self.running)
+    try:
+      await asyncio.sleep(self.delay)
+    finally:
+      self.running -= 1
+
+    part = llm_request.contents[-1].parts[0]
+    if part.function_response:
+      text = part.function_response.response["result"]
+      yield LlmResponse(content=types.ModelContent(text))
+    elif part.text.startswith("weather:"):
+      yield LlmResponse(
+          content=types.ModelContent(
+              types.Part.from_function_call(
+                  name="get_weather", args={"city": part.text[8:]}
+              )
+          )
+      )
+    else:
+      yield LlmResponse(content=types.ModelContent(f"echo {part.text}"))
+
+
+def get_weather(city: str) -> str:
+  """Gets the weather of a city."""
+  return f"No weather for {city}"
+
+
+def _create_agent(**model_kwargs):
+  return Agent(
+      name="root_agent",
+      model=SlowEchoModel(**model_kwargs),
+      tools=[get_weather],
+  )
+
+
+def _weather_case(case_id, city, mock_output):
+  return EvalCase(
+      case_id=case_id,
+      data=[{
+          "query": f"weather:{city}",
+          "expected_tool_use": [{
+              "tool_name": "get_weather",
+              "tool_input": {"city": city},
+              "mock_tool_output": mock_output,
+          }],
+      }],
+  )
+
+
+async def test_cases_run_concurrently():
+  agent = _create_agent()
+  engine = EvaluationEngine(agent, max_concurrency=5)
+  eval_cases = [
+      EvalCase(case_id=str(i), data=[{"query": f"q{i}"}]) for i in range(10)
+  ]
+
+  start = time.monotonic()
+  results = [result async for result in engine.run(eval_cases)]
+
+  # 10 cases of 0.2s each take 2s one at a time, and 0.4s 5 at a time.
+  assert time.monotonic() - start < 1.5
+  assert agent.model.max_running == 5
+  assert sorted(result.case_id for result in results) == [
+      str(i) for i in range(10)
+  ]
+  for result in results:
+    assert result.responses[0]["response"] == f"echo q{result.case_id}"
+  assert len({result.session_id for result in results}) == 10
+
+
+async def test_cases_of_agent_with_reset_func_run_one_at_a_time(caplog):
+  agent = _create_agent(delay=0.05)
+  resets = []
+  engine = EvaluationEngine(
+      agent, reset_func=lambda: resets.append(1), max_concurrency=4
+  )
+  eval_cases = [
+      EvalCase(case_id=str(i), data=[{"query": f"q{i}"}]) for i in range(3)
+  ]
+
+  with caplog.at_level(logging.WARNING):
+    results = [result async for result in engine.run(eval_cases)]
+
+  assert engine.max_concurrency == 1
+  assert "one at a time" in caplog.text
+  assert agent.model.max_running == 1
+  assert len(resets) == 3
+  assert all(result.error is None for result in results)
+
+
+async def test_mock_tool_outputs_are_isolated_per_case():
+  engine = EvaluationEngine(_create_agent(), max_concurrency=2)
+  eval_cases = [
+      _weather_case("paris", "Paris", "sunny"),
+      _weather_case("london", "London", "rainy"),
+  ]
+
+  results = {result.case_id: result async for result in engine.run(eval_cases)}
+
+  assert results["paris"].responses[0]["response"] == "sunny"
+  assert results["paris"].responses[0]["actual_tool_use"] == [
+      {"tool_name": "get_weather", "tool_input": {"city": "Paris"}}
+  ]
+  assert results["london"].responses[0]["response"] == "rainy"
+
+
+async def test_resumes_from_checkpoint(tmp_path):
+  checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+  eval_cases = [
+      EvalCase(case_id=str(i), data=[{"query": f"q{i}"}]) for i in range(3)
+  ]
+  engine = EvaluationEngine(_create_agent(), checkpoint_path=checkpoint_path)
+  async for result in engine.run(eval_cases[:2]):
+    pass
+
+  agent = _create_agent()
+  engine = EvaluationEngine(agent, checkpoint_path=checkpoint_path)
+  results = [result async for result in engine.run(eval_cases)]
+
+  assert agent.model.calls == 1
+  assert [result.case_id for result in results] == ["0", "1", "2"]
+  assert results[0].responses[0]["response"] == "echo q0"
+
+
+async def test_changed_case_is_rerun_despite_checkpoint(tmp_path):
+  checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+  engine = EvaluationEngine(_create_agent(), checkpoint_path=checkpoint_path)
+  async for result in engine.run(
+      [EvalCase(case_id="0", data=[{"query": "a"}])]
+  ):
+    pass
+
+  agent = _create_agent()
+  engine = EvaluationEngine(agent, checkpoint_path=checkpoint_path)
+  (result,) = [
+      result
+      async for result in engine.run(
+          [EvalCase(case_id="0", data=[{"query": "b"}])]
+      )
+  ]
+
+  assert agent.model.calls == 1
+  assert result.responses[0]["response"] == "echo b"
+
+
+async def test_failed_case_is_not_checkpointed(tmp_path):
+  checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+  eval_cases = [EvalCase(case_id="0", data=[{"no_query": ""}])]
+  engine = EvaluationEngine(_create_agent(), checkpoint_path=checkpoint_path)
+
+  (result,) = [result async for result in engine.run(eval_cases)]
+
+  assert result.error
+  assert not (tmp_path / "checkpoint.jsonl").exists()
+
+
+def test_process_query_with_root_agent_runs_sync():
+  responses = EvaluationGenerator._process_query_with_root_agent(
+      data=[{"query": "hi"}, {"query": "bye"}],
+      root_agent=_create_agent(delay=0),
+      reset_func=None,
+  )
+
+  assert [response["response"] for response in responses] == [
+      "echo hi",
+      "echo bye",
+  ]
+
+
+def test_iterate_sync_yields_items_as_they_are_produced():
+  consumed = threading.Event()
+  cancelled = threading.Event()
+
+  async def produce():
+    yield 1
+    # Only continues once the first item reached the caller.
+    while not consumed.is_set():
+      await asyncio.sleep(0.01)
+    yield 2
+    try:
+      await asyncio.sleep(10)
+    finally:
+      cancelled.set()
+
+  items = iterate_sync(produce())
+  assert next(items) == 1
+  consumed.set()
+  assert next(items) == 2
+  items.close()
+
+  assert cancelled.is_set()
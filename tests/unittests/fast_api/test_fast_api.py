@@ -101,6 +101,7 @@ async def dummy_run_async(
     session_id,
     new_message,
     run_config: RunConfig = RunConfig(),
+    session=None,
 ) -> AsyncGenerator[Event, None]:
   # Immediately yield a dummy event with a text reply.
   yield event1
@@ -219,6 +220,69 @@ async def test_sse_endpoint():
       assert event_count == 3  # Expecting 3 events from dummy_run_async
 
 
+def test_run_batch_endpoint():
+  base_http_url = "http://127.0.0.1:8000"
+  user_id = "test_user"
+  session_id = "test_session"
+
+  # Ensure that the session exists (create if necessary).
+  url_create = (
+      f"{base_http_url}/apps/test_app/users/{user_id}/sessions/{session_id}"
+  )
+  httpx.post(url_create, json={"state": {}})
+
+  def run_request(session_id):
+    return json.loads(
+        AgentRunRequest(
+            app_name="test_app",
+            user_id=user_id,
+            session_id=session_id,
+            new_message=types.Content(parts=[types.Part(text="Hello")]),
+        ).model_dump_json(exclude_none=True)
+    )
+
+  response = httpx.post(
+      f"{base_http_url}/run_batch",
+      json={
+          "requests": [
+              run_request(session_id),
+              run_request("missing_session"),
+              run_request(session_id),
+          ]
+      },
+  )
+
+  assert response.status_code == 200
+  results = response.json()
+  assert [result["session_id"] for result in results] == [
+      session_id,
+      "missing_session",
+      session_id,
+  ]
+  assert len(results[0]["events"]) == 3
+  assert results[0]["events"][0]["content"]["parts"][0]["text"] == "LLM reply"
+  assert results[1]["events"] == []
+  assert results[1]["error"] == "Session not found"
+  assert len(results[2]["events"]) == 3
+
+
+def test_run_batch_endpoint_too_many_requests():
+  request = json.loads(
+      AgentRunRequest(
+          app_name="test_app",
+          user_id="test_user",
+          session_id="test_session",
+          new_message=types.Content(parts=[types.Part(text="Hello")]),
+      ).model_dump_json(exclude_none=True)
+  )
+
+  response = httpx.post(
+      "http://127.0.0.1:8000/run_batch", json={"requests": [request] * 101}
+  )
+
+  assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_websocket_endpoint():
   base_http_url = "http://127.0.0.1:8000"
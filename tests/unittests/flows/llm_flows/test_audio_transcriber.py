@@ -0,0 +1,81 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from unittest import mock
+
+from google.adk.flows.llm_flows import audio_transcriber
+from google.cloud import speech
+import pytest
+
+
+class _FakeSpeechClient:
+
+  def __init__(self):
+    self.chunks = []
+    self.config = None
+    self.thread = None
+
+  def streaming_recognize(self, config, requests):
+    self.config = config
+    self.thread = threading.current_thread()
+    self.chunks = [request.audio_content for request in requests]
+    return [
+        speech.StreamingRecognizeResponse(
+            results=[
+                speech.StreamingRecognitionResult(
+                    alternatives=[
+                        speech.SpeechRecognitionAlternative(transcript='hello')
+                    ]
+                )
+            ]
+        ),
+        speech.StreamingRecognizeResponse(
+            results=[
+                speech.StreamingRecognitionResult(
+                    alternatives=[
+                        speech.SpeechRecognitionAlternative(transcript='world')
+                    ]
+                )
+            ]
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_audio_streams_chunks_off_the_event_loop():
+  client = _FakeSpeechClient()
+  audio = bytearray(b'\x01' * (40 * 1024))
+
+  with mock.patch.object(audio_transcriber, '_get_client', return_value=client):
+    transcripts = await audio_transcriber.AudioTranscriber(
+        language_code='fr-FR'
+    ).transcribe_audio(audio, 24000)
+
+  assert transcripts == ['hello', 'world']
+  assert [len(chunk) for chunk in client.chunks] == [16384, 16384, 8192]
+  assert b''.join(client.chunks) == audio
+  assert client.config.config.sample_rate_hertz == 24000
+  assert client.config.config.language_code == 'fr-FR'
+  assert client.thread is not threading.main_thread()
+
+
+def test_speech_client_is_shared():
+  with (
+      mock.patch.object(audio_transcriber, '_client', None),
+      mock.patch.object(speech, 'SpeechClient') as speech_client,
+  ):
+    assert audio_transcriber._get_client() is audio_transcriber._get_client()
+
+  speech_client.assert_called_once()
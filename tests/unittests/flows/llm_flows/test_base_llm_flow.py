@@ -0,0 +1,138 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from google.adk.agents import Agent
+from google.adk.agents import LiveRequestQueue
+from google.adk.events import Event
+from google.adk.flows.llm_flows.base_llm_flow import _build_model_response_event
+from google.adk.flows.llm_flows.single_flow import SingleFlow
+from google.adk.models import LlmRequest
+from google.adk.models import LlmResponse
+from google.genai import types
+import pytest
+
+from ... import utils
+
+
+def _model_response_event():
+  return Event(
+      id=Event.new_id(),
+      invocation_id='invocation_id',
+      author='root_agent',
+      branch='root_agent',
+  )
+
+
+def _llm_response(parts, **kwargs):
+  return LlmResponse(
+      content=types.Content(role='model', parts=parts),
+      grounding_metadata=types.GroundingMetadata(
+          web_search_queries=['weather']
+      ),
+      **kwargs,
+  )
+
+
+def test_build_model_response_event_matches_validation():
+  model_response_event = _model_response_event()
+  model_response_event.actions.state_delta['key'] = 'value'
+  llm_response = _llm_response([types.Part(text='Hello')], partial=True)
+
+  event = _build_model_response_event(model_response_event, llm_response)
+
+  assert event == Event.model_validate({
+      **model_response_event.model_dump(exclude_none=True),
+      **llm_response.model_dump(exclude_none=True),
+  })
+  assert event.content is llm_response.content
+  assert event.actions is not model_response_event.actions
+
+
+def test_finalize_model_response_event_does_not_modify_llm_response():
+  llm_response = _llm_response(
+      [types.Part(function_call=types.FunctionCall(name='get_weather'))]
+  )
+
+  event = SingleFlow()._finalize_model_response_event(
+      LlmRequest(), llm_response, _model_response_event()
+  )
+
+  assert event.get_function_calls()[0].id.startswith('adk-')
+  assert llm_response.content.parts[0].function_call.id is None
+  assert event.long_running_tool_ids == set()
+
+
+class _RecordingLlmConnection(utils.MockLlmConnection):
+
+  def __init__(self):
+    super().__init__([])
+    self.sent = []
+    self.closed = False
+
+  async def send_content(self, content: types.Content):
+    self.sent.append(content)
+
+  async def send_realtime(self, blob: types.Blob):
+    self.sent.append(blob)
+
+  async def close(self):
+    self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_send_to_model_sends_queued_audio_in_batches():
+  agent = Agent(name='root_agent', model=utils.MockModel.create(responses=[]))
+  invocation_context = utils.create_invocation_context(agent)
+  invocation_context.live_request_queue = LiveRequestQueue()
+  for data in (b'a', b'b', b'c'):
+    invocation_context.live_request_queue.send_realtime(
+        types.Blob(mime_type='audio/pcm', data=data)
+    )
+  invocation_context.live_request_queue.send_content(
+      types.Content(role='user', parts=[types.Part(text='hello')])
+  )
+  invocation_context.live_request_queue.close()
+  llm_connection = _RecordingLlmConnection()
+
+  await asyncio.wait_for(
+      SingleFlow()._send_to_model(llm_connection, invocation_context),
+      timeout=1,
+  )
+
+  assert llm_connection.sent == [
+      types.Blob(mime_type='audio/pcm', data=b'abc'),
+      types.Content(role='user', parts=[types.Part(text='hello')]),
+  ]
+  assert llm_connection.closed
+  assert len(invocation_context.transcription_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_send_to_model_waits_for_requests():
+  agent = Agent(name='root_agent', model=utils.MockModel.create(responses=[]))
+  invocation_context = utils.create_invocation_context(agent)
+  invocation_context.live_request_queue = LiveRequestQueue()
+  llm_connection = _RecordingLlmConnection()
+
+  send_task = asyncio.create_task(
+      SingleFlow()._send_to_model(llm_connection, invocation_context)
+  )
+  await asyncio.sleep(0.01)
+  assert not send_task.done()
+  invocation_context.live_request_queue.close()
+
+  await asyncio.wait_for(send_task, timeout=1)
+  assert llm_connection.closed
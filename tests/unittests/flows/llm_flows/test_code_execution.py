@@ -0,0 +1,180 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import base64
+from unittest import mock
+
+from google.adk.agents import Agent
+from google.adk.code_executors import ArtifactInputFileStore
+from google.adk.code_executors import LocalInputFileStore
+from google.adk.code_executors import ProcessPoolCodeExecutor
+from google.adk.code_executors import UnsafeLocalCodeExecutor
+from google.adk.code_executors.base_code_executor import BaseCodeExecutor
+from google.adk.code_executors.code_execution_utils import CodeExecutionResult
+from google.adk.code_executors.input_file_store import compute_content_hash
+from google.adk.flows.llm_flows._code_execution import request_processor
+from google.adk.flows.llm_flows._code_execution import response_processor
+from google.adk.models import LlmRequest
+from google.adk.models import LlmResponse
+import pytest
+from google.genai import types
+
+from ... import utils
+
+
+class _CodeExecutor(BaseCodeExecutor):
+  """An executor that doesn't load the input files itself."""
+
+  def execute_code(self, invocation_context, code_execution_input):
+    return CodeExecutionResult()
+
+
+async def test_response_processor_executes_code_async():
+  code_executor = UnsafeLocalCodeExecutor()
+  agent = Agent(
+      name='root_agent',
+      model=utils.MockModel.create(responses=[]),
+      code_executor=code_executor,
+  )
+  invocation_context = utils.create_invocation_context(
+      agent=agent, user_content='hi'
+  )
+  llm_response = LlmResponse(
+      content=types.Content(
+          role='model',
+          parts=[types.Part(text='```python\nprint(1 + 1)\n```')],
+      )
+  )
+
+  with mock.patch.object(
+      UnsafeLocalCodeExecutor,
+      'execute_code_async',
+      mock.AsyncMock(return_value=CodeExecutionResult(stdout='2\n')),
+  ) as execute_code_async:
+    events = [
+        event
+        async for event in response_processor.run_async(
+            invocation_context, llm_response
+        )
+    ]
+
+  execute_code_async.assert_awaited_once()
+  assert execute_code_async.await_args.args[1].code == 'print(1 + 1)'
+  assert len(events) == 2
+  assert (
+      events[1].content.parts[0].code_execution_result.output
+      == 'Code execution result:\n2\n\n'
+  )
+  assert llm_response.content is None
+
+
+@pytest.mark.parametrize('use_local_store', [False, True])
+@pytest.mark.parametrize(
+    'code_executor_class', [ProcessPoolCodeExecutor, _CodeExecutor]
+)
+async def test_input_files_are_kept_out_of_session_state(
+    tmp_path, use_local_store, code_executor_class
+):
+  code_executor = code_executor_class(
+      optimize_data_file=True,
+      input_file_store=(
+          LocalInputFileStore(str(tmp_path))
+          if use_local_store
+          else ArtifactInputFileStore()
+      ),
+  )
+  agent = Agent(
+      name='root_agent',
+      model=utils.MockModel.create(responses=[]),
+      code_executor=code_executor,
+  )
+  invocation_context = utils.create_invocation_context(
+      agent=agent, user_content='hi'
+  )
+  data = b'a,b\n1,2\n'
+  llm_request = LlmRequest(
+      contents=[
+          types.Content(
+              role='user',
+              parts=[types.Part.from_bytes(data=data, mime_type='text/csv')],
+          )
+      ]
+  )
+
+  with mock.patch.object(
+      code_executor_class,
+      'execute_code_async',
+      mock.AsyncMock(return_value=CodeExecutionResult(stdout='ok')),
+  ) as execute_code_async:
+    async for _ in request_processor.run_async(invocation_context, llm_request):
+      pass
+    llm_response = LlmResponse(
+        content=types.Content(
+            role='model',
+            parts=[types.Part(text='```python\nprint(1)\n```')],
+        )
+    )
+    async for _ in response_processor.run_async(
+        invocation_context, llm_response
+    ):
+      pass
+
+  (state_file,) = invocation_context.session.state['_code_executor_input_files']
+  assert state_file['content'] == ''
+  assert state_file['content_hash'] == compute_content_hash(data)
+  encoded_data = base64.b64encode(data).decode()
+  preprocessing_call, execution_call = execute_code_async.await_args_list
+  (input_file,) = preprocessing_call.args[1].input_files
+  assert input_file.content == encoded_data
+  (input_file,) = execution_call.args[1].input_files
+  assert input_file.content_hash == compute_content_hash(data)
+  if code_executor_class is ProcessPoolCodeExecutor:
+    # Only loaded by the workers that don't have the file yet.
+    assert input_file.content == ''
+  else:
+    assert input_file.content == encoded_data
+
+
+async def test_input_files_are_kept_in_session_state_without_store():
+  agent = Agent(
+      name='root_agent',
+      model=utils.MockModel.create(responses=[]),
+      code_executor=_CodeExecutor(optimize_data_file=True),
+  )
+  invocation_context = utils.create_invocation_context(
+      agent=agent, user_content='hi'
+  )
+  data = b'a,b\n1,2\n'
+  llm_request = LlmRequest(
+      contents=[
+          types.Content(
+              role='user',
+              parts=[types.Part.from_bytes(data=data, mime_type='text/csv')],
+          )
+      ]
+  )
+
+  async for _ in request_processor.run_async(invocation_context, llm_request):
+    pass
+
+  (state_file,) = invocation_context.session.state['_code_executor_input_files']
+  assert state_file['content'] == base64.b64encode(data).decode()
+  assert state_file['content_hash'] is None
+  # The files aren't saved as artifacts unless the store is set.
+  assert not invocation_context.artifact_service.list_artifact_keys(
+      app_name=invocation_context.app_name,
+      user_id=invocation_context.user_id,
+      session_id=invocation_context.session.id,
+  )
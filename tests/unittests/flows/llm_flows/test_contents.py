@@ -0,0 +1,169 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.agents import Agent
+from google.adk.events import Event
+from google.adk.flows.llm_flows.contents import _ContentsCache
+from google.adk.flows.llm_flows.contents import _get_contents
+from google.adk.flows.llm_flows.contents import request_processor
+from google.adk.models import LlmRequest
+from google.genai import types
+
+from ... import utils
+
+
+def _text_event(author, text):
+  role = 'user' if author == 'user' else 'model'
+  return Event(
+      author=author,
+      content=types.Content(role=role, parts=[types.Part(text=text)]),
+  )
+
+
+def _function_call_event(call_id, name):
+  return Event(
+      author='root_agent',
+      content=types.Content(
+          role='model',
+          parts=[
+              types.Part(
+                  function_call=types.FunctionCall(
+                      id=call_id, name=name, args={}
+                  )
+              )
+          ],
+      ),
+  )
+
+
+def _function_response_event(call_id, name, response):
+  return Event(
+      author='root_agent',
+      content=types.Content(
+          role='user',
+          parts=[
+              types.Part(
+                  function_response=types.FunctionResponse(
+                      id=call_id, name=name, response=response
+                  )
+              )
+          ],
+      ),
+  )
+
+
+def _events():
+  return [
+      _text_event('user', 'hi'),
+      _function_call_event('call_1', 'get_time'),
+      _function_response_event('call_1', 'get_time', {'result': '10:00'}),
+      _text_event('root_agent', 'It is 10:00.'),
+      _text_event('other_agent', 'Hello from another agent.'),
+      _function_call_event('call_2', 'approve'),
+      _function_response_event('call_2', 'approve', {'status': 'pending'}),
+      _text_event('root_agent', 'Waiting for approval.'),
+      _text_event('user', 'Any update?'),
+      _function_response_event('call_2', 'approve', {'status': 'approved'}),
+      _text_event('root_agent', 'Approved.'),
+  ]
+
+
+def test_contents_cache_matches_full_build():
+  events = _events()
+  contents_cache = _ContentsCache(None, 'root_agent')
+  growing_events = []
+  for event in events:
+    growing_events.append(event)
+    assert contents_cache.get_contents(growing_events) == _get_contents(
+        None, list(growing_events), 'root_agent'
+    )
+
+
+def test_contents_cache_reuses_contents():
+  events = _events()[:4]
+  contents_cache = _ContentsCache(None, 'root_agent')
+  first_contents = contents_cache.get_contents(events[:3])
+  contents = contents_cache.get_contents(events)
+
+  assert len(contents) == 4
+  assert all(a is b for a, b in zip(first_contents, contents))
+
+
+def test_contents_cache_rearranges_async_function_response():
+  events = _events()[:10]
+  contents = _ContentsCache(None, 'root_agent').get_contents(events)
+
+  # The latest function response is merged right after its function call.
+  assert len(contents) == 7
+  assert contents[-2].parts[0].function_call.id == 'call_2'
+  assert contents[-1].parts[0].function_response.response == {
+      'status': 'approved'
+  }
+
+
+def test_contents_cache_resets_when_events_are_rewritten():
+  events = _events()[:4]
+  contents_cache = _ContentsCache(None, 'root_agent')
+  contents_cache.get_contents(events)
+
+  # E.g. the session was reloaded from storage with an edited history.
+  rewritten_events = [_text_event('user', 'hello')] + [
+      event.model_copy() for event in events[1:]
+  ]
+  contents = contents_cache.get_contents(rewritten_events)
+
+  assert contents[0].parts[0].text == 'hello'
+  assert len(contents) == 4
+
+
+async def test_request_processor_caches_contents_per_invocation():
+  agent = Agent(name='root_agent', model=utils.MockModel.create(responses=[]))
+  invocation_context = utils.create_invocation_context(
+      agent=agent, user_content='hi'
+  )
+  invocation_context.session.events.extend(_events()[:4])
+
+  llm_request = LlmRequest()
+  async for _ in request_processor.run_async(invocation_context, llm_request):
+    pass
+  first_contents = llm_request.contents
+
+  invocation_context.session.events.append(_text_event('user', 'thanks'))
+  llm_request = LlmRequest()
+  async for _ in request_processor.run_async(invocation_context, llm_request):
+    pass
+
+  assert len(llm_request.contents) == len(first_contents) + 1
+  assert llm_request.contents[:-1] == first_contents
+
+
+async def test_request_processor_hands_out_copies_of_cached_contents():
+  agent = Agent(name='root_agent', model=utils.MockModel.create(responses=[]))
+  invocation_context = utils.create_invocation_context(
+      agent=agent, user_content='hi'
+  )
+  invocation_context.session.events.extend(_events()[:4])
+
+  for _ in range(2):
+    llm_request = LlmRequest()
+    async for _ in request_processor.run_async(invocation_context, llm_request):
+      pass
+    # E.g. a before_model_callback editing the request in place.
+    llm_request.contents[0].parts[0].text += ' (edited)'
+    llm_request.contents[0].parts.append(types.Part(text='extra'))
+
+  assert [part.text for part in llm_request.contents[0].parts] == [
+      'hi (edited)',
+      'extra',
+  ]
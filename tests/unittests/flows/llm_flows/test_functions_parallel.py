@@ -0,0 +1,177 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+from google.adk.agents import Agent
+from google.adk.agents.run_config import RunConfig
+from google.genai import types
+import pytest
+
+from ... import utils
+
+
+async def _run(runner: utils.InMemoryRunner, run_config: RunConfig):
+  return [
+      event
+      async for event in runner.runner.run_async(
+          user_id='test_user',
+          session_id=runner.session_id,
+          new_message=utils.get_user_content('test'),
+          run_config=run_config,
+      )
+  ]
+
+
+def _create_runner(tools):
+  function_calls = [
+      types.Part.from_function_call(name=tool.__name__, args={'x': i})
+      for i, tool in enumerate(tools, start=1)
+  ]
+  mock_model = utils.MockModel.create(responses=[function_calls, 'response1'])
+  agent = Agent(name='root_agent', model=mock_model, tools=tools)
+  return utils.InMemoryRunner(agent)
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls_run_concurrently():
+  running = 0
+  max_running = 0
+
+  async def _sleep(x: int) -> int:
+    nonlocal running, max_running
+    running += 1
+    max_running = max(max_running, running)
+    # The later calls finish first.
+    await asyncio.sleep(0.1 - x * 0.03)
+    running -= 1
+    return x
+
+  async def slow_1(x: int) -> int:
+    return await _sleep(x)
+
+  async def slow_2(x: int) -> int:
+    return await _sleep(x)
+
+  async def slow_3(x: int) -> int:
+    return await _sleep(x)
+
+  runner = _create_runner([slow_1, slow_2, slow_3])
+  events = await _run(runner, RunConfig(parallel_tool_calls=True))
+
+  assert max_running == 3
+  # The merged response keeps the original call order.
+  assert utils.simplify_events(events)[1] == (
+      'root_agent',
+      [
+          types.Part.from_function_response(
+              name='slow_1', response={'result': 1}
+          ),
+          types.Part.from_function_response(
+              name='slow_2', response={'result': 2}
+          ),
+          types.Part.from_function_response(
+              name='slow_3', response={'result': 3}
+          ),
+      ],
+  )
+
+
+@pytest.mark.asyncio
+async def test_parallel_tool_calls_max_concurrency():
+  running = 0
+  max_running = 0
+
+  async def _sleep(x: int) -> int:
+    nonlocal running, max_running
+    running += 1
+    max_running = max(max_running, running)
+    await asyncio.sleep(0.01)
+    running -= 1
+    return x
+
+  async def slow_1(x: int) -> int:
+    return await _sleep(x)
+
+  async def slow_2(x: int) -> int:
+    return await _sleep(x)
+
+  async def slow_3(x: int) -> int:
+    return await _sleep(x)
+
+  runner = _create_runner([slow_1, slow_2, slow_3])
+  await _run(
+      runner, RunConfig(parallel_tool_calls=True, max_parallel_tool_calls=2)
+  )
+
+  assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_call_timeout():
+  async def fast(x: int) -> int:
+    return x
+
+  async def slow(x: int) -> int:
+    await asyncio.sleep(10)
+    return x
+
+  runner = _create_runner([fast, slow])
+  start = time.monotonic()
+  events = await _run(
+      runner, RunConfig(parallel_tool_calls=True, tool_call_timeout=0.1)
+  )
+
+  assert time.monotonic() - start < 5
+  assert utils.simplify_events(events)[1] == (
+      'root_agent',
+      [
+          types.Part.from_function_response(
+              name='fast', response={'result': 1}
+          ),
+          types.Part.from_function_response(
+              name='slow',
+              response={'error': 'Tool slow timed out after 0.1 seconds.'},
+          ),
+      ],
+  )
+
+
+@pytest.mark.asyncio
+async def test_failed_parallel_tool_call_cancels_the_others():
+  cancelled = asyncio.Event()
+
+  async def failing(x: int) -> int:
+    await asyncio.sleep(0.01)
+    raise ValueError('tool failed')
+
+  async def slow(x: int) -> int:
+    try:
+      await asyncio.sleep(10)
+    except asyncio.CancelledError:
+      cancelled.set()
+      raise
+    return x
+
+  runner = _create_runner([failing, slow])
+  with pytest.raises(ValueError, match='tool failed'):
+    await _run(runner, RunConfig(parallel_tool_calls=True))
+
+  assert cancelled.is_set()
+
+
+def test_invalid_max_parallel_tool_calls():
+  with pytest.raises(ValueError):
+    RunConfig(max_parallel_tool_calls=0)
@@ -0,0 +1,181 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest import mock
+
+from anthropic import types as anthropic_types
+from google.adk.models.anthropic_llm import _get_shared_anthropic_client
+from google.adk.models.anthropic_llm import Claude
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+import pytest
+
+
+class FakeAsyncStream:
+  """Mimics anthropic's AsyncStream of raw message events."""
+
+  def __init__(self, events):
+    self._events = events
+    self.closed = False
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, *args):
+    self.closed = True
+
+  async def __aiter__(self):
+    for event in self._events:
+      yield event
+
+
+STREAM_EVENTS = [
+    anthropic_types.RawContentBlockStartEvent(
+        type="content_block_start",
+        index=0,
+        content_block=anthropic_types.TextBlock(type="text", text=""),
+    ),
+    anthropic_types.RawContentBlockDeltaEvent(
+        type="content_block_delta",
+        index=0,
+        delta=anthropic_types.TextDelta(type="text_delta", text="Let me "),
+    ),
+    anthropic_types.RawContentBlockDeltaEvent(
+        type="content_block_delta",
+        index=0,
+        delta=anthropic_types.TextDelta(type="text_delta", text="check."),
+    ),
+    anthropic_types.RawContentBlockStopEvent(
+        type="content_block_stop", index=0
+    ),
+    anthropic_types.RawContentBlockStartEvent(
+        type="content_block_start",
+        index=1,
+        content_block=anthropic_types.ToolUseBlock(
+            type="tool_use", id="toolu_1", name="get_weather", input={}
+        ),
+    ),
+    anthropic_types.RawContentBlockDeltaEvent(
+        type="content_block_delta",
+        index=1,
+        delta=anthropic_types.InputJSONDelta(
+            type="input_json_delta", partial_json='{"city": "Par'
+        ),
+    ),
+    anthropic_types.RawContentBlockDeltaEvent(
+        type="content_block_delta",
+        index=1,
+        delta=anthropic_types.InputJSONDelta(
+            type="input_json_delta", partial_json='is"}'
+        ),
+    ),
+    anthropic_types.RawContentBlockStopEvent(
+        type="content_block_stop", index=1
+    ),
+]
+
+
+@pytest.fixture
+def llm_request():
+  return LlmRequest(
+      model="claude-3-5-sonnet-v2@20241022",
+      contents=[
+          types.Content(role="user", parts=[types.Part.from_text(text="Hello")])
+      ],
+      config=types.GenerateContentConfig(system_instruction="Be helpful."),
+  )
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async(llm_request):
+  claude = Claude()
+  message = anthropic_types.Message(
+      id="msg_1",
+      type="message",
+      role="assistant",
+      model="claude-3-5-sonnet-v2@20241022",
+      content=[anthropic_types.TextBlock(type="text", text="Hi there")],
+      stop_reason="end_turn",
+      usage=anthropic_types.Usage(input_tokens=1, output_tokens=2),
+  )
+  with mock.patch.object(
+      Claude, "_anthropic_client", new_callable=mock.PropertyMock
+  ) as mock_client_property:
+    mock_client = mock_client_property.return_value
+    mock_client.messages.create = mock.AsyncMock(return_value=message)
+
+    responses = [
+        response
+        async for response in claude.generate_content_async(llm_request)
+    ]
+
+  assert len(responses) == 1
+  assert responses[0].content.parts[0].text == "Hi there"
+  assert "stream" not in mock_client.messages.create.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_stream(llm_request):
+  claude = Claude()
+  stream = FakeAsyncStream(STREAM_EVENTS)
+  with mock.patch.object(
+      Claude, "_anthropic_client", new_callable=mock.PropertyMock
+  ) as mock_client_property:
+    mock_client = mock_client_property.return_value
+    mock_client.messages.create = mock.AsyncMock(return_value=stream)
+
+    responses = [
+        response
+        async for response in claude.generate_content_async(
+            llm_request, stream=True
+        )
+    ]
+
+  assert mock_client.messages.create.call_args.kwargs["stream"]
+  assert stream.closed
+  assert [r.partial for r in responses] == [True, True, None]
+  assert [r.content.parts[0].text for r in responses[:2]] == [
+      "Let me ",
+      "check.",
+  ]
+  final_parts = responses[2].content.parts
+  assert final_parts[0].text == "Let me check."
+  assert final_parts[1].function_call.id == "toolu_1"
+  assert final_parts[1].function_call.name == "get_weather"
+  assert final_parts[1].function_call.args == {"city": "Paris"}
+
+
+@pytest.mark.asyncio
+async def test_anthropic_client_is_shared():
+  assert _get_shared_anthropic_client(
+      "project", "us-east5"
+  ) is _get_shared_anthropic_client("project", "us-east5")
+  assert _get_shared_anthropic_client(
+      "project", "us-east5"
+  ) is not _get_shared_anthropic_client("project", "europe-west1")
+
+
+def test_anthropic_client_is_looked_up_per_event_loop(monkeypatch):
+  monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "project")
+  monkeypatch.setenv("GOOGLE_CLOUD_LOCATION", "us-east5")
+  claude = Claude()
+
+  async def get_client():
+    return claude._anthropic_client
+
+  first_client = asyncio.run(get_client())
+  second_client = asyncio.run(get_client())
+
+  assert first_client is not second_client
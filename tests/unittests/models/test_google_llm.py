@@ -12,14 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import logging
 import sys
 from unittest import mock
 
 from google.adk import version
 from google.adk.models.gemini_llm_connection import GeminiLlmConnection
+from google.adk.models.google_llm import _build_request_log
 from google.adk.models.google_llm import Gemini
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
+from google.adk.utils.log_utils import LazyLogMessage
 from google.genai import types
 from google.genai.types import Content
 from google.genai.types import Part
@@ -86,6 +90,30 @@ def test_client_version_header():
   )
 
 
+def test_api_client_is_shared():
+  client = Gemini(model="gemini-1.5-flash").api_client
+  assert Gemini(model="gemini-2.0-flash").api_client is client
+  assert (
+      Gemini(
+          model="gemini-1.5-flash",
+          http_options=types.HttpOptions(timeout=1000),
+      ).api_client
+      is not client
+  )
+
+
+def test_api_client_is_looked_up_per_event_loop():
+  model = Gemini(model="gemini-1.5-flash")
+
+  async def get_client():
+    return model.api_client
+
+  first_client = asyncio.run(get_client())
+  second_client = asyncio.run(get_client())
+
+  assert first_client is not second_client
+
+
 def test_maybe_append_user_content(gemini_llm, llm_request):
   # Test with user content already present
   gemini_llm._maybe_append_user_content(llm_request)
@@ -105,7 +133,11 @@ def test_maybe_append_user_content(gemini_llm, llm_request):
 async def test_generate_content_async(
     gemini_llm, llm_request, generate_content_response
 ):
-  with mock.patch.object(gemini_llm, "api_client") as mock_client:
+  with mock.patch.object(
+      Gemini, "api_client", new_callable=mock.PropertyMock
+  ) as mock_client_property:
+    mock_client = mock_client_property.return_value
+
     # Create a mock coroutine that returns the generate_content_response
     async def mock_coro():
       return generate_content_response
@@ -126,9 +158,53 @@ async def test_generate_content_async(
     mock_client.aio.models.generate_content.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_generate_content_async_skips_logs_when_disabled(
+    gemini_llm, llm_request, generate_content_response, caplog
+):
+  caplog.set_level(logging.WARNING, logger="google.adk.models.google_llm")
+  with (
+      mock.patch.object(
+          Gemini, "api_client", new_callable=mock.PropertyMock
+      ) as mock_client_property,
+      mock.patch(
+          "google.adk.models.google_llm._build_request_log"
+      ) as mock_build_request_log,
+      mock.patch(
+          "google.adk.models.google_llm._build_response_log"
+      ) as mock_build_response_log,
+  ):
+    mock_client = mock_client_property.return_value
+    mock_client.aio.models.generate_content = mock.AsyncMock(
+        return_value=generate_content_response
+    )
+
+    async for _ in gemini_llm.generate_content_async(llm_request):
+      pass
+
+  mock_build_request_log.assert_not_called()
+  mock_build_response_log.assert_not_called()
+
+
+def test_build_request_log_truncates_large_contents(llm_request):
+  llm_request.contents.append(
+      Content(role="user", parts=[Part.from_text(text="x" * 100_000)])
+  )
+
+  request_log = str(LazyLogMessage(_build_request_log, llm_request))
+
+  assert len(request_log) < 10_100
+  assert "[truncated" in request_log
+  assert "You are a helpful assistant" in request_log
+
+
 @pytest.mark.asyncio
 async def test_generate_content_async_stream(gemini_llm, llm_request):
-  with mock.patch.object(gemini_llm, "api_client") as mock_client:
+  with mock.patch.object(
+      Gemini, "api_client", new_callable=mock.PropertyMock
+  ) as mock_client_property:
+    mock_client = mock_client_property.return_value
+
     # Create mock stream responses
     class MockAsyncIterator:
 
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+import asyncio
+import time
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from google.adk.models.lite_llm import _content_to_message_param
@@ -34,6 +36,7 @@ from litellm.types.utils import ChatCompletionDeltaToolCall
 from litellm.types.utils import Choices
 from litellm.types.utils import Delta
 from litellm.types.utils import ModelResponse
+from litellm.types.utils import ModelResponseStream
 from litellm.types.utils import StreamingChoices
 import pytest
 
@@ -84,7 +87,7 @@ LLM_REQUEST_WITH_FUNCTION_DECLARATION = LlmRequest(
 
 
 STREAMING_MODEL_RESPONSE = [
-    ModelResponse(
+    ModelResponseStream(
         choices=[
             StreamingChoices(
                 finish_reason=None,
@@ -95,7 +98,7 @@ STREAMING_MODEL_RESPONSE = [
             )
         ]
     ),
-    ModelResponse(
+    ModelResponseStream(
         choices=[
             StreamingChoices(
                 finish_reason=None,
@@ -106,7 +109,7 @@ STREAMING_MODEL_RESPONSE = [
             )
         ]
     ),
-    ModelResponse(
+    ModelResponseStream(
         choices=[
             StreamingChoices(
                 finish_reason=None,
@@ -117,7 +120,7 @@ STREAMING_MODEL_RESPONSE = [
             )
         ]
     ),
-    ModelResponse(
+    ModelResponseStream(
         choices=[
             StreamingChoices(
                 finish_reason=None,
@@ -138,7 +141,7 @@ STREAMING_MODEL_RESPONSE = [
             )
         ]
     ),
-    ModelResponse(
+    ModelResponseStream(
         choices=[
             StreamingChoices(
                 finish_reason=None,
@@ -159,7 +162,7 @@ STREAMING_MODEL_RESPONSE = [
             )
         ]
     ),
-    ModelResponse(
+    ModelResponseStream(
         choices=[
             StreamingChoices(
                 finish_reason="tool_use",
@@ -168,6 +171,12 @@ STREAMING_MODEL_RESPONSE = [
     ),
 ]
 
+
+async def _async_iter(items):
+  for item in items:
+    yield item
+
+
 @pytest.fixture
 def mock_response():
   return ModelResponse(
@@ -720,7 +729,7 @@ def test_to_litellm_role():
             "stop",
         ),
         (
-            ModelResponse(
+            ModelResponseStream(
                 choices=[
                     StreamingChoices(
                         finish_reason=None,
@@ -809,7 +818,7 @@ async def test_acompletion_additional_args(mock_acompletion, mock_client):
 
 
 @pytest.mark.asyncio
-async def test_completion_additional_args(mock_completion, mock_client):
+async def test_completion_additional_args(mock_acompletion, mock_client):
   lite_llm_instance = LiteLlm(
       # valid args
       model="test_model",
@@ -828,7 +837,7 @@ async def test_completion_additional_args(mock_completion, mock_client):
       }],
   )
 
-  mock_completion.return_value = iter(STREAMING_MODEL_RESPONSE)
+  mock_acompletion.return_value = _async_iter(STREAMING_MODEL_RESPONSE)
 
   responses = [
       response
@@ -837,9 +846,9 @@ async def test_completion_additional_args(mock_completion, mock_client):
       )
   ]
   assert len(responses) == 4
-  mock_completion.assert_called_once()
+  mock_acompletion.assert_called_once()
 
-  _, kwargs = mock_completion.call_args
+  _, kwargs = mock_acompletion.call_args
 
   assert kwargs["model"] == "test_model"
   assert kwargs["messages"][0]["role"] == "user"
@@ -852,10 +861,10 @@ async def test_completion_additional_args(mock_completion, mock_client):
 
 @pytest.mark.asyncio
 async def test_generate_content_async_stream(
-    mock_completion, lite_llm_instance
+    mock_acompletion, lite_llm_instance
 ):
 
-  mock_completion.return_value = iter(STREAMING_MODEL_RESPONSE)
+  mock_acompletion.return_value = _async_iter(STREAMING_MODEL_RESPONSE)
 
   responses = [
       response
@@ -876,9 +885,9 @@ async def test_generate_content_async_stream(
       "test_arg": "test_value"
   }
   assert responses[3].content.parts[0].function_call.id == "test_tool_call_id"
-  mock_completion.assert_called_once()
+  mock_acompletion.assert_called_once()
 
-  _, kwargs = mock_completion.call_args
+  _, kwargs = mock_acompletion.call_args
   assert kwargs["model"] == "test_model"
   assert kwargs["messages"][0]["role"] == "user"
   assert kwargs["messages"][0]["content"] == "Test prompt"
@@ -893,3 +902,89 @@ async def test_generate_content_async_stream(
       ]
       == "string"
   )
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_stream_multiple_tool_calls(
+    mock_acompletion, lite_llm_instance
+):
+  def tool_call_delta(index, id, name, arguments):
+    return ModelResponseStream(
+        choices=[
+            StreamingChoices(
+                finish_reason=None,
+                delta=Delta(
+                    role="assistant",
+                    tool_calls=[
+                        ChatCompletionDeltaToolCall(
+                            type="function",
+                            id=id,
+                            function=Function(name=name, arguments=arguments),
+                            index=index,
+                        )
+                    ],
+                ),
+            )
+        ]
+    )
+
+  mock_acompletion.return_value = _async_iter([
+      tool_call_delta(0, "call_0", "test_function", '{"test_arg": '),
+      tool_call_delta(1, "call_1", "test_function", '{"test_arg": "b"}'),
+      tool_call_delta(0, None, None, '"a"}'),
+      ModelResponseStream(
+          choices=[StreamingChoices(finish_reason="tool_calls")]
+      ),
+  ])
+
+  responses = [
+      response
+      async for response in lite_llm_instance.generate_content_async(
+          LLM_REQUEST_WITH_FUNCTION_DECLARATION, stream=True
+      )
+  ]
+  assert len(responses) == 1
+  function_calls = [part.function_call for part in responses[0].content.parts]
+  assert [(fc.id, fc.args) for fc in function_calls] == [
+      ("call_0", {"test_arg": "a"}),
+      ("call_1", {"test_arg": "b"}),
+  ]
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_stream_does_not_block_event_loop(
+    mock_acompletion, lite_llm_instance
+):
+  chunk_delay = 0.02
+
+  async def fake_streaming_backend():
+    for response in STREAMING_MODEL_RESPONSE:
+      await asyncio.sleep(chunk_delay)
+      yield response
+
+  mock_acompletion.return_value = fake_streaming_backend()
+
+  max_lag = 0.0
+  streaming = True
+
+  async def measure_event_loop_lag():
+    nonlocal max_lag
+    interval = 0.005
+    while streaming:
+      start = time.perf_counter()
+      await asyncio.sleep(interval)
+      max_lag = max(max_lag, time.perf_counter() - start - interval)
+
+  monitor = asyncio.create_task(measure_event_loop_lag())
+  responses = [
+      response
+      async for response in lite_llm_instance.generate_content_async(
+          LLM_REQUEST_WITH_FUNCTION_DECLARATION, stream=True
+      )
+  ]
+  streaming = False
+  await monitor
+
+  assert len(responses) == 4
+  # A stream consumed synchronously would block the loop for all the chunks.
+  assert max_lag < len(STREAMING_MODEL_RESPONSE) * chunk_delay / 2
@@ -58,3 +58,11 @@ def test_non_exist_model():
   with pytest.raises(ValueError) as e_info:
     models.LLMRegistry.resolve('non-exist-model')
   assert 'Model non-exist-model not found.' in str(e_info.value)
+
+
+def test_get_llm_returns_shared_instance():
+  llm = LLMRegistry.get_llm('gemini-1.5-flash')
+
+  assert isinstance(llm, Gemini)
+  assert LLMRegistry.get_llm('gemini-1.5-flash') is llm
+  assert LLMRegistry.get_llm('gemini-2.0-flash') is not llm
@@ -0,0 +1,129 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events import Event
+from google.adk.sessions import _media_offload
+from google.genai import types
+
+_SESSION_KWARGS = dict(app_name='app', user_id='user', session_id='session')
+
+
+def _event(*parts: types.Part) -> Event:
+  return Event(
+      author='user',
+      invocation_id='invocation',
+      content=types.Content(role='user', parts=list(parts)),
+  )
+
+
+async def test_offload_inline_data_above_min_bytes():
+  artifact_service = InMemoryArtifactService()
+  image = types.Part.from_bytes(data=b'\x01' * 100, mime_type='image/png')
+  small_audio = types.Part.from_bytes(data=b'\x02' * 10, mime_type='audio/pcm')
+  event = _event(types.Part(text='look'), image, small_audio)
+  original_content = copy.deepcopy(event.content)
+
+  offloaded_event = await _media_offload.offload_inline_data(
+      event, artifact_service=artifact_service, min_bytes=50, **_SESSION_KWARGS
+  )
+
+  assert event.content == original_content
+  assert offloaded_event.id == event.id
+  parts = offloaded_event.content.parts
+  assert parts[0] == types.Part(text='look')
+  assert parts[1].inline_data is None
+  assert parts[1].file_data.mime_type == 'image/png'
+  assert parts[1].file_data.file_uri == f'artifact://media/{event.id}_1#0'
+  assert parts[2] is small_audio
+  assert artifact_service.load_artifact(
+      filename=f'media/{event.id}_1', **_SESSION_KWARGS
+  ) == types.Part(inline_data=image.inline_data)
+
+
+async def test_offload_inline_data_returns_event_without_large_data():
+  event = _event(types.Part(text='hello'))
+
+  assert (
+      await _media_offload.offload_inline_data(
+          event,
+          artifact_service=InMemoryArtifactService(),
+          min_bytes=1,
+          **_SESSION_KWARGS,
+      )
+      is event
+  )
+
+
+async def test_load_offloaded_data():
+  artifact_service = InMemoryArtifactService()
+  image = types.Part.from_bytes(data=b'\x01' * 100, mime_type='image/png')
+  event = await _media_offload.offload_inline_data(
+      _event(types.Part(text='look'), image),
+      artifact_service=artifact_service,
+      min_bytes=50,
+      **_SESSION_KWARGS,
+  )
+  content = copy.deepcopy(event.content)
+
+  await _media_offload.load_offloaded_data(
+      [content], artifact_service=artifact_service, **_SESSION_KWARGS
+  )
+
+  assert content.parts == [types.Part(text='look'), image]
+
+
+async def test_load_offloaded_data_missing_artifact():
+  event = await _media_offload.offload_inline_data(
+      _event(types.Part.from_bytes(data=b'\x01' * 100, mime_type='image/png')),
+      artifact_service=InMemoryArtifactService(),
+      min_bytes=50,
+      **_SESSION_KWARGS,
+  )
+  content = copy.deepcopy(event.content)
+
+  await _media_offload.load_offloaded_data(
+      [content], artifact_service=InMemoryArtifactService(), **_SESSION_KWARGS
+  )
+
+  assert content.parts == [
+      types.Part(text=f'Missing media: media/{event.id}_0')
+  ]
+
+
+async def test_load_offloaded_data_without_version_loads_latest():
+  artifact_service = InMemoryArtifactService()
+  image = types.Part.from_bytes(data=b'\x01' * 100, mime_type='image/png')
+  for data in (b'old', image.inline_data.data):
+    artifact_service.save_artifact(
+        filename='media/image',
+        artifact=types.Part.from_bytes(data=data, mime_type='image/png'),
+        **_SESSION_KWARGS,
+    )
+  content = types.Content(
+      role='user',
+      parts=[
+          types.Part.from_uri(
+              file_uri='artifact://media/image', mime_type='image/png'
+          )
+      ],
+  )
+
+  await _media_offload.load_offloaded_data(
+      [content], artifact_service=artifact_service, **_SESSION_KWARGS
+  )
+
+  assert content.parts == [image]
@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import enum
+from unittest import mock
+
 import pytest
+import sqlalchemy
 
 from google.adk.events import Event
 from google.adk.events import EventActions
@@ -183,7 +187,7 @@ def test_session_state(service_type):
 
 
 @pytest.mark.parametrize(
-    "service_type", [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
 )
 def test_create_new_session_will_merge_states(service_type):
   session_service = get_session_service(service_type)
@@ -298,3 +302,315 @@ def test_append_event_complete(service_type):
       )
       == session
   )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+)
+async def test_async_session_api(service_type):
+  session_service = get_session_service(service_type)
+  app_name = 'my_app'
+  user_id = 'user'
+
+  session = await session_service.create_session_async(
+      app_name=app_name, user_id=user_id, state={'key': 'value'}
+  )
+  event = Event(
+      invocation_id='invocation',
+      author='user',
+      content=types.Content(role='user', parts=[types.Part(text='text')]),
+      actions=EventActions(state_delta={'user:key': 'user_value'}),
+  )
+  await session_service.append_event_async(session=session, event=event)
+
+  got_session = await session_service.get_session_async(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert [e.id for e in got_session.events] == [event.id]
+  assert got_session.state == session.state
+  assert got_session.state.get('user:key') == 'user_value'
+
+  sessions = (
+      await session_service.list_sessions_async(
+          app_name=app_name, user_id=user_id
+      )
+  ).sessions
+  assert [s.id for s in sessions] == [session.id]
+
+  await session_service.delete_session_async(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert not await session_service.get_session_async(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+
+
+@pytest.mark.asyncio
+async def test_database_session_service_async_engine(tmp_path):
+  db_path = tmp_path / 'sessions.db'
+  session_service = DatabaseSessionService(
+      f'sqlite:///{db_path}', async_db_url=f'sqlite+aiosqlite:///{db_path}'
+  )
+  app_name = 'my_app'
+  user_id = 'user'
+
+  session = await session_service.create_session_async(
+      app_name=app_name, user_id=user_id
+  )
+  event = Event(
+      invocation_id='invocation',
+      author='user',
+      content=types.Content(role='user', parts=[types.Part(text='text')]),
+      actions=EventActions(state_delta={'app:key': 'value'}),
+  )
+  await session_service.append_event_async(session=session, event=event)
+
+  # Sessions written through the async engine are visible to the sync API.
+  got_session = session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert [e.id for e in got_session.events] == [event.id]
+  assert got_session.state.get('app:key') == 'value'
+  await session_service.async_db_engine.dispose()
+
+
+def test_database_session_service_write_behind():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:', write_behind=True
+  )
+  app_name = 'my_app'
+  user_id = 'user'
+  session = session_service.create_session(app_name=app_name, user_id=user_id)
+  commits = []
+  sqlalchemy.event.listen(
+      session_service.db_engine, 'commit', lambda conn: commits.append(conn)
+  )
+
+  function_call_event = Event(
+      invocation_id='invocation',
+      author='agent',
+      content=types.Content(
+          role='model',
+          parts=[types.Part.from_function_call(name='tool', args={})],
+      ),
+      actions=EventActions(state_delta={'key': 'value_1', 'app:key': 'value'}),
+  )
+  function_response_event = Event(
+      invocation_id='invocation',
+      author='agent',
+      content=types.Content(
+          role='user',
+          parts=[types.Part.from_function_response(name='tool', response={})],
+      ),
+      actions=EventActions(state_delta={'key': 'value_2'}),
+  )
+  final_event = Event(
+      invocation_id='invocation',
+      author='agent',
+      content=types.Content(role='model', parts=[types.Part(text='done')]),
+  )
+  session_service.append_event(session=session, event=function_call_event)
+  session_service.append_event(session=session, event=function_response_event)
+  assert not commits
+  assert session.state['key'] == 'value_2'
+
+  # The final response writes all the events of the turn in one transaction.
+  session_service.append_event(session=session, event=final_event)
+  assert len(commits) == 1
+
+  got_session = session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert [e.id for e in got_session.events] == [
+      function_call_event.id,
+      function_response_event.id,
+      final_event.id,
+  ]
+  assert got_session.state == {'key': 'value_2', 'app:key': 'value'}
+
+
+def test_database_session_service_write_behind_keeps_events_on_failure():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:', write_behind=True
+  )
+  app_name = 'my_app'
+  user_id = 'user'
+  sessions = [
+      session_service.create_session(app_name=app_name, user_id=user_id)
+      for _ in range(2)
+  ]
+  events = {}
+  for session in sessions:
+    # Not a final response, so the event stays buffered.
+    event = Event(
+        invocation_id='invocation',
+        author='agent',
+        content=types.Content(
+            role='model',
+            parts=[types.Part.from_function_call(name='tool', args={})],
+        ),
+    )
+    session_service.append_event(session=session, event=event)
+    events[session.id] = event
+
+  run = session_service._run
+  session_service._run = mock.Mock(side_effect=OSError('connection lost'))
+  with pytest.raises(OSError):
+    session_service.flush()
+  session_service._run = run
+
+  # The events of both sessions are written by the next flush.
+  session_service.flush()
+  for session in sessions:
+    got_session = session_service.get_session(
+        app_name=app_name, user_id=user_id, session_id=session.id
+    )
+    assert [e.id for e in got_session.events] == [events[session.id].id]
+
+
+@pytest.mark.asyncio
+async def test_database_session_service_write_behind_flushes_before_read():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:', write_behind=True
+  )
+  app_name = 'my_app'
+  user_id = 'user'
+  session = await session_service.create_session_async(
+      app_name=app_name, user_id=user_id
+  )
+  event = Event(
+      invocation_id='invocation',
+      author='user',
+      content=types.Content(role='user', parts=[types.Part(text='text')]),
+      actions=EventActions(state_delta={'user:key': 'value'}),
+  )
+  await session_service.append_event_async(session=session, event=event)
+
+  got_session = await session_service.get_session_async(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert [e.id for e in got_session.events] == [event.id]
+  assert got_session.state == {'user:key': 'value'}
+
+
+def test_database_session_service_bumps_update_time_without_state_delta():
+  session_service = DatabaseSessionService('sqlite:///:memory:')
+  session = session_service.create_session(app_name='my_app', user_id='user')
+  statements = []
+  sqlalchemy.event.listen(
+      session_service.db_engine,
+      'before_cursor_execute',
+      lambda conn, cursor, statement, *args: statements.append(statement),
+  )
+
+  session_service.append_event(
+      session=session,
+      event=Event(
+          invocation_id='invocation',
+          author='user',
+          content=types.Content(role='user', parts=[types.Part(text='text')]),
+      ),
+  )
+
+  assert any(
+      statement.startswith('UPDATE sessions SET update_time')
+      for statement in statements
+  )
+
+
+def _function_call_event() -> Event:
+  # Not a final response, so the event stays buffered in write-behind mode.
+  return Event(
+      invocation_id='invocation',
+      author='agent',
+      content=types.Content(
+          role='model',
+          parts=[types.Part.from_function_call(name='tool', args={})],
+      ),
+  )
+
+
+def test_database_session_service_write_behind_read_flushes_its_session():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:', write_behind=True
+  )
+  sessions = [
+      session_service.create_session(app_name='my_app', user_id='user')
+      for _ in range(2)
+  ]
+  for session in sessions:
+    session_service.append_event(session=session, event=_function_call_event())
+
+  session_service.get_session(
+      app_name='my_app', user_id='user', session_id=sessions[0].id
+  )
+
+  assert list(session_service._pending_events) == [
+      ('my_app', 'user', sessions[1].id)
+  ]
+
+
+@pytest.mark.asyncio
+async def test_database_session_service_write_behind_serializes_flushes():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:', write_behind=True
+  )
+  session = await session_service.create_session_async(
+      app_name='my_app', user_id='user'
+  )
+  event = _function_call_event()
+  await session_service.append_event_async(session=session, event=event)
+  flush_lock = session_service._get_flush_lock(('my_app', 'user', session.id))
+
+  # Another flush of the session is running.
+  flush_lock.acquire()
+  get_session = asyncio.create_task(
+      session_service.get_session_async(
+          app_name='my_app', user_id='user', session_id=session.id
+      )
+  )
+  await asyncio.sleep(0.05)
+  assert not get_session.done()
+  flush_lock.release()
+
+  got_session = await get_session
+  assert [e.id for e in got_session.events] == [event.id]
+
+
+def test_in_memory_get_session_shares_events():
+  session_service = InMemorySessionService()
+  app_name = 'my_app'
+  user_id = 'user'
+
+  session = session_service.create_session(app_name=app_name, user_id=user_id)
+  event = Event(
+      invocation_id='invocation',
+      author='user',
+      content=types.Content(role='user', parts=[types.Part(text='text')]),
+  )
+  session_service.append_event(session=session, event=event)
+
+  session_1 = session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  session_2 = session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  # Snapshots share the stored events instead of copying them.
+  assert session_1.events[0] is session_2.events[0]
+
+  # But appending to or changing the state of one snapshot doesn't leak into
+  # the other snapshots or the storage.
+  session_1.events.append(event)
+  session_1.state['key'] = 'value'
+  assert len(session_2.events) == 1
+  assert 'key' not in session_2.state
+  assert (
+      len(
+          session_service.get_session(
+              app_name=app_name, user_id=user_id, session_id=session.id
+          ).events
+      )
+      == 1
+  )
@@ -12,19 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import re
 import this
+import time
 from typing import Any
+import urllib.parse
 import uuid
 from dateutil.parser import isoparse
 from google.adk.events import Event
 from google.adk.events import EventActions
 from google.adk.sessions import Session
 from google.adk.sessions import VertexAiSessionService
+from google.adk.sessions.base_session_service import GetSessionConfig
 from google.genai import types
 import pytest
 
-
 MOCK_SESSION_JSON_1 = {
     'name': (
         'projects/test-project/locations/test-location/'
@@ -123,10 +126,25 @@ class MockApiClient:
     """Initializes MockClient."""
     this.session_dict: dict[str, Any] = {}
     this.event_dict: dict[str, list[Any]] = {}
+    # The (http_method, path) of the requests made.
+    self.requests: list[tuple[str, str]] = []
+    # The seconds each async request takes.
+    self.latency = 0.0
+    # The number of polls before the session creation operation is done.
+    self.lro_polls_until_done = 1
+    self.running = 0
+    self.max_running = 0
 
   def request(self, http_method: str, path: str, request_dict: dict[str, Any]):
     """Mocks the API Client request method."""
+    self.requests.append((http_method, path))
     if http_method == 'GET':
+      path, _, query = path.partition('?')
+      if query.startswith('filter=user_id='):
+        path += '?' + query
+      params = {
+          key: values[0] for key, values in urllib.parse.parse_qs(query).items()
+      }
       if re.match(SESSION_REGEX, path):
         match = re.match(SESSION_REGEX, path)
         if match:
@@ -147,20 +165,15 @@ class MockApiClient:
       elif re.match(EVENTS_REGEX, path):
         match = re.match(EVENTS_REGEX, path)
         if match:
-          return {
-              'sessionEvents': (
-                  self.event_dict[match.group(2)]
-                  if match.group(2) in self.event_dict
-                  else []
-              )
-          }
+          return self._list_events(match.group(2), params)
       elif re.match(LRO_REGEX, path):
+        self.lro_polls_until_done -= 1
         return {
             'name': (
                 'projects/test-project/locations/test-location/'
                 'reasoningEngines/123/sessions/4'
             ),
-            'done': True,
+            'done': self.lro_polls_until_done <= 0,
         }
       else:
         raise ValueError(f'Unsupported path: {path}')
@@ -192,6 +205,49 @@ class MockApiClient:
     else:
       raise ValueError(f'Unsupported http method: {http_method}')
 
+  async def async_request(
+      self, http_method: str, path: str, request_dict: dict[str, Any]
+  ):
+    """Mocks the API Client async_request method."""
+    self.running += 1
+    self.max_running = max(self.max_running, self.running)
+    try:
+      await asyncio.sleep(self.latency)
+      return self.request(http_method, path, request_dict)
+    finally:
+      self.running -= 1
+
+  def _list_events(self, session_id: str, params: dict[str, str]):
+    events = sorted(
+        self.event_dict.get(session_id, []),
+        key=lambda event: isoparse(event['timestamp']),
+    )
+    if 'filter' in params:
+      match = re.fullmatch(r'timestamp>="(.+)"', params['filter'])
+      events = [
+          event
+          for event in events
+          if isoparse(event['timestamp']) >= isoparse(match.group(1))
+      ]
+    start = int(params.get('pageToken', 0))
+    end = start + int(params.get('pageSize', len(events)))
+    response = {'sessionEvents': events[start:end]}
+    if end < len(events):
+      response['nextPageToken'] = str(end)
+    return response
+
+
+def _api_event(session_id: str, event_id: int, second: int):
+  return {
+      'name': (
+          'projects/test-project/locations/test-location/'
+          f'reasoningEngines/123/sessions/{session_id}/events/{event_id}'
+      ),
+      'invocationId': str(event_id),
+      'author': 'user',
+      'timestamp': f'2024-12-12T10:{second // 60:02}:{second % 60:02}Z',
+  }
+
 
 def mock_vertex_ai_session_service():
   """Creates a mock Vertex AI Session service for testing."""
@@ -261,3 +317,186 @@ def test_create_session():
   assert session == session_service.get_session(
       app_name='123', user_id='user', session_id=session_id
   )
+
+
+@pytest.mark.asyncio
+async def test_get_session_async():
+  session_service = mock_vertex_ai_session_service()
+
+  assert (
+      await session_service.get_session_async(
+          app_name='123', user_id='user', session_id='1'
+      )
+      == MOCK_SESSION
+  )
+
+
+@pytest.mark.asyncio
+async def test_get_session_async_fetches_session_and_events_concurrently():
+  session_service = mock_vertex_ai_session_service()
+  session_service.api_client.latency = 0.1
+
+  await session_service.get_session_async(
+      app_name='123', user_id='user', session_id='1'
+  )
+
+  assert session_service.api_client.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_get_session_async_pages_events():
+  session_service = mock_vertex_ai_session_service()
+  session_service.api_client.event_dict['2'] = [
+      _api_event('2', i, i) for i in range(250)
+  ]
+
+  session = await session_service.get_session_async(
+      app_name='123', user_id='user', session_id='2'
+  )
+
+  assert [event.id for event in session.events] == [str(i) for i in range(250)]
+  list_events_requests = [
+      path
+      for _, path in session_service.api_client.requests
+      if '/events' in path
+  ]
+  assert len(list_events_requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_session_async_only_lists_new_events_of_cached_session():
+  session_service = mock_vertex_ai_session_service()
+  api_client = session_service.api_client
+  api_client.event_dict['2'] = [_api_event('2', i, i) for i in range(150)]
+  await session_service.get_session_async(
+      app_name='123', user_id='user', session_id='2'
+  )
+  api_client.event_dict['2'].append(_api_event('2', 150, 150))
+  api_client.requests.clear()
+
+  session = await session_service.get_session_async(
+      app_name='123', user_id='user', session_id='2'
+  )
+
+  assert [event.id for event in session.events] == [str(i) for i in range(151)]
+  list_events_requests = [
+      path for _, path in api_client.requests if '/events' in path
+  ]
+  # Only the events from the last cached one are listed again.
+  assert len(list_events_requests) == 1
+  assert 'filter=timestamp' in list_events_requests[0]
+  assert 'pageToken' not in list_events_requests[0]
+
+
+@pytest.mark.asyncio
+async def test_get_session_async_lists_events_appended_out_of_order():
+  session_service = mock_vertex_ai_session_service()
+  api_client = session_service.api_client
+  api_client.event_dict['2'] = [_api_event('2', i, i * 10) for i in range(10)]
+  await session_service.get_session_async(
+      app_name='123', user_id='user', session_id='2'
+  )
+  # Appended by another writer, with a timestamp before the last cached event.
+  api_client.event_dict['2'].append(_api_event('2', 10, 85))
+
+  session = await session_service.get_session_async(
+      app_name='123', user_id='user', session_id='2'
+  )
+
+  assert [event.id for event in session.events] == [
+      str(i) for i in [0, 1, 2, 3, 4, 5, 6, 7, 8, 10, 9]
+  ]
+
+
+@pytest.mark.asyncio
+async def test_get_session_async_does_not_share_cached_events():
+  session_service = mock_vertex_ai_session_service()
+  session = await session_service.get_session_async(
+      app_name='123', user_id='user', session_id='1'
+  )
+  session.events[0].content.parts[0].text = 'changed'
+
+  session = await session_service.get_session_async(
+      app_name='123', user_id='user', session_id='1'
+  )
+
+  assert session == MOCK_SESSION
+
+
+@pytest.mark.asyncio
+async def test_get_session_async_filters_events_after_timestamp():
+  session_service = mock_vertex_ai_session_service()
+  api_client = session_service.api_client
+  api_client.event_dict['2'] = [_api_event('2', i, i) for i in range(250)]
+  after_timestamp = isoparse('2024-12-12T10:04:00Z').timestamp()
+
+  session = await session_service.get_session_async(
+      app_name='123',
+      user_id='user',
+      session_id='2',
+      config=GetSessionConfig(after_timestamp=after_timestamp),
+  )
+
+  assert [event.id for event in session.events] == [
+      str(i) for i in range(240, 250)
+  ]
+  # The events are filtered by the server, in a single page.
+  list_events_requests = [
+      path for _, path in api_client.requests if '/events' in path
+  ]
+  assert len(list_events_requests) == 1
+  assert 'filter=timestamp' in list_events_requests[0]
+
+
+@pytest.mark.asyncio
+async def test_get_session_async_num_recent_events():
+  session_service = mock_vertex_ai_session_service()
+  session_service.api_client.event_dict['2'] = [
+      _api_event('2', i, i) for i in range(250)
+  ]
+
+  session = await session_service.get_session_async(
+      app_name='123',
+      user_id='user',
+      session_id='2',
+      config=GetSessionConfig(num_recent_events=5),
+  )
+
+  assert [event.id for event in session.events] == [
+      str(i) for i in range(245, 250)
+  ]
+
+
+@pytest.mark.asyncio
+async def test_create_session_async_polls_operation_with_backoff():
+  session_service = mock_vertex_ai_session_service()
+  session_service.api_client.lro_polls_until_done = 3
+
+  start = time.monotonic()
+  session = await session_service.create_session_async(
+      app_name='123', user_id='user', state={'key': 'value'}
+  )
+
+  # Polled after 0.1s and 0.2s, instead of 1s each.
+  assert time.monotonic() - start < 1.0
+  assert session.state == {'key': 'value'}
+  assert session == await session_service.get_session_async(
+      app_name='123', user_id='user', session_id=session.id
+  )
+
+
+@pytest.mark.asyncio
+async def test_delete_session_async():
+  session_service = mock_vertex_ai_session_service()
+  await session_service.get_session_async(
+      app_name='123', user_id='user', session_id='1'
+  )
+
+  await session_service.delete_session_async(
+      app_name='123', user_id='user', session_id='1'
+  )
+
+  with pytest.raises(ValueError):
+    await session_service.get_session_async(
+        app_name='123', user_id='user', session_id='1'
+    )
@@ -0,0 +1,121 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.agents import Agent
+from google.adk.agents import RunConfig
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+import pytest
+
+from . import utils
+
+
+@pytest.mark.asyncio
+async def test_run_async_with_session_does_not_fetch_session():
+  agent = Agent(name='root_agent', model=utils.MockModel.create(['response']))
+  runner = InMemoryRunner(agent, app_name='test_app')
+  session = runner.session_service.create_session(
+      app_name='test_app', user_id='test_user'
+  )
+
+  with mock.patch.object(
+      type(runner.session_service), 'get_session_async'
+  ) as get_session_async:
+    events = [
+        event
+        async for event in runner.run_async(
+            user_id='test_user',
+            session_id=session.id,
+            new_message=utils.UserContent('hello'),
+            session=session,
+        )
+    ]
+
+  get_session_async.assert_not_called()
+  assert utils.simplify_events(events) == [('root_agent', 'response')]
+  assert utils.simplify_events(session.events) == [
+      ('user', 'hello'),
+      ('root_agent', 'response'),
+  ]
+
+
+@pytest.mark.asyncio
+async def test_run_async_with_session_of_other_user_raises():
+  agent = Agent(name='root_agent', model=utils.MockModel.create(['response']))
+  runner = InMemoryRunner(agent, app_name='test_app')
+  session = runner.session_service.create_session(
+      app_name='test_app', user_id='other_user'
+  )
+
+  with pytest.raises(ValueError, match='does not match'):
+    async for _ in runner.run_async(
+        user_id='test_user',
+        session_id=session.id,
+        new_message=utils.UserContent('hello'),
+        session=session,
+    ):
+      pass
+
+
+@pytest.mark.asyncio
+async def test_run_async_offloads_inline_data_to_artifacts():
+  model = utils.MockModel.create(['response1', 'response2'])
+  agent = Agent(name='root_agent', model=model)
+  runner = InMemoryRunner(agent, app_name='test_app')
+  session = runner.session_service.create_session(
+      app_name='test_app', user_id='test_user'
+  )
+  image = types.Part.from_bytes(data=b'\x01' * 1000, mime_type='image/png')
+  run_config = RunConfig(offload_inline_data_min_bytes=100)
+
+  for text in ('first', 'second'):
+    async for _ in runner.run_async(
+        user_id='test_user',
+        session_id=session.id,
+        new_message=types.Content(
+            role='user', parts=[types.Part(text=text), image]
+        ),
+        run_config=run_config,
+    ):
+      pass
+
+  session = runner.session_service.get_session(
+      app_name='test_app', user_id='test_user', session_id=session.id
+  )
+  stored_parts = [
+      session.events[0].content.parts,
+      session.events[2].content.parts,
+  ]
+  for parts in stored_parts:
+    assert parts[1].inline_data is None
+    assert parts[1].file_data.file_uri.startswith('artifact://media/')
+  assert (
+      len(
+          runner.artifact_service.list_artifact_keys(
+              app_name='test_app', user_id='test_user', session_id=session.id
+          )
+      )
+      == 2
+  )
+  # The model gets the data back.
+  assert model.requests[-1].contents[0].parts == [
+      types.Part(text='first'),
+      image,
+  ]
+  assert model.requests[-1].contents[2].parts == [
+      types.Part(text='second'),
+      image,
+  ]
@@ -0,0 +1,154 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest import mock
+
+from google.adk import telemetry
+from google.adk.agents import Agent
+from google.adk.models import LlmRequest
+from google.adk.models import LlmResponse
+from google.adk.telemetry import PayloadCaptureMode
+from google.adk.telemetry import TelemetryConfig
+from google.genai import types
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+import pytest
+
+from . import utils
+
+
+@pytest.fixture(autouse=True)
+def reset_telemetry_config():
+  yield
+  telemetry.set_telemetry_config(TelemetryConfig())
+
+
+@pytest.fixture
+def invocation_context():
+  agent = Agent(name='root_agent', model=utils.MockModel.create(responses=[]))
+  return utils.create_invocation_context(agent=agent, user_content='hi')
+
+
+def _llm_request():
+  return LlmRequest(
+      model='gemini-2.0-flash',
+      config=types.GenerateContentConfig(),
+      contents=[
+          types.Content(role='user', parts=[types.Part(text='x' * 1000)])
+      ],
+  )
+
+
+def _llm_response():
+  return LlmResponse(
+      content=types.Content(role='model', parts=[types.Part(text='hello')])
+  )
+
+
+def _trace_call_llm(invocation_context, tracer_provider=None):
+  tracer = (tracer_provider or TracerProvider()).get_tracer('test')
+  with tracer.start_as_current_span('call_llm') as span:
+    telemetry.trace_call_llm(
+        invocation_context, 'event_id', _llm_request(), _llm_response()
+    )
+  return span
+
+
+def test_trace_call_llm_full(invocation_context):
+  span = _trace_call_llm(invocation_context)
+
+  request = json.loads(span.attributes['gcp.vertex.agent.llm_request'])
+  assert request['contents'][0]['parts'][0]['text'] == 'x' * 1000
+  assert 'hello' in span.attributes['gcp.vertex.agent.llm_response']
+
+
+def test_trace_call_llm_off(invocation_context):
+  telemetry.set_telemetry_config(
+      TelemetryConfig(payload_capture=PayloadCaptureMode.OFF)
+  )
+
+  with mock.patch.object(
+      telemetry, '_build_llm_request_for_trace'
+  ) as mock_build:
+    span = _trace_call_llm(invocation_context)
+
+  mock_build.assert_not_called()
+  assert span.attributes['gcp.vertex.agent.llm_request'] == '{}'
+  assert span.attributes['gcp.vertex.agent.llm_response'] == '{}'
+  assert span.attributes['gcp.vertex.agent.event_id'] == 'event_id'
+
+
+def test_trace_call_llm_truncated(invocation_context):
+  telemetry.set_telemetry_config(
+      TelemetryConfig(
+          payload_capture=PayloadCaptureMode.TRUNCATED, max_payload_length=100
+      )
+  )
+
+  span = _trace_call_llm(invocation_context)
+
+  request = span.attributes['gcp.vertex.agent.llm_request']
+  assert request.startswith('{"model": "gemini-2.0-flash"')
+  assert request[100:].startswith('...[truncated ')
+
+
+@pytest.mark.parametrize('sample_rate', [0.0, 1.0])
+def test_trace_call_llm_sampled(invocation_context, sample_rate):
+  telemetry.set_telemetry_config(
+      TelemetryConfig(
+          payload_capture=PayloadCaptureMode.SAMPLED,
+          payload_sample_rate=sample_rate,
+      )
+  )
+
+  span = _trace_call_llm(invocation_context)
+
+  captured = span.attributes['gcp.vertex.agent.llm_request'] != '{}'
+  assert captured == bool(sample_rate)
+
+
+def test_trace_call_llm_skipped_when_span_is_not_recording(
+    invocation_context,
+):
+  with mock.patch.object(
+      telemetry, '_build_llm_request_for_trace'
+  ) as mock_build:
+    span = _trace_call_llm(
+        invocation_context, TracerProvider(sampler=ALWAYS_OFF)
+    )
+
+  mock_build.assert_not_called()
+  assert not span.is_recording()
+
+
+def test_trace_call_llm_serializes_request_once_per_span(invocation_context):
+  tracer = TracerProvider().get_tracer('test')
+  with mock.patch.object(
+      telemetry,
+      '_build_llm_request_for_trace',
+      wraps=telemetry._build_llm_request_for_trace,
+  ) as mock_build:
+    with tracer.start_as_current_span('call_llm'):
+      for _ in range(3):
+        telemetry.trace_call_llm(
+            invocation_context, 'event_id', _llm_request(), _llm_response()
+        )
+
+  assert mock_build.call_count == 1
+
+
+def test_invalid_sample_rate():
+  with pytest.raises(ValueError):
+    TelemetryConfig(payload_sample_rate=2)
@@ -47,7 +47,10 @@ def mock_rest_api_tool():
       "required": ["user_id", "page_size", "filter", "connection_name"],
   }
   mock_tool._operation_parser = mock_parser
-  mock_tool.call.return_value = {"status": "success", "data": "mock_data"}
+  mock_tool.run_async.return_value = {
+      "status": "success",
+      "data": "mock_data",
+  }
   return mock_tool
 
 
@@ -116,8 +119,8 @@ async def test_run_async(integration_tool, mock_rest_api_tool):
 
   result = await integration_tool.run_async(args=input_args, tool_context=None)
 
-  # Assert the underlying rest_api_tool.call was called correctly
-  mock_rest_api_tool.call.assert_called_once_with(
+  # Assert the underlying rest_api_tool.run_async was called correctly
+  mock_rest_api_tool.run_async.assert_awaited_once_with(
       args=expected_call_args, tool_context=None
   )
 
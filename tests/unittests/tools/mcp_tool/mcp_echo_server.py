@@ -0,0 +1,36 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A stdio MCP server for tests, echoing the text with its process id."""
+
+import asyncio
+import os
+
+try:
+  from mcp.server.fastmcp import FastMCP as MCPServer
+except ImportError:
+  from mcp.server.mcpserver import MCPServer
+
+server = MCPServer('echo')
+
+
+@server.tool()
+async def echo(text: str, delay: float = 0) -> str:
+  """Echoes the text, prefixed with the process id of the server."""
+  await asyncio.sleep(delay)
+  return f'{os.getpid()}:{text}'
+
+
+if __name__ == '__main__':
+  server.run()
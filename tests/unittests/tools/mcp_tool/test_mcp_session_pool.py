@@ -0,0 +1,141 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import signal
+import sys
+
+import pytest
+
+pytest.importorskip('mcp')
+
+from google.adk.tools.mcp_tool.mcp_session_pool import MCPSessionPool
+from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
+from mcp import StdioServerParameters
+
+_CONNECTION_PARAMS = StdioServerParameters(
+    command=sys.executable,
+    args=[os.path.join(os.path.dirname(__file__), 'mcp_echo_server.py')],
+)
+
+
+def _pid(result):
+  return result.content[0].text.split(':')[0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_spread_over_connections():
+  tools, exit_stack = await MCPToolset.from_server(
+      connection_params=_CONNECTION_PARAMS, pool_size=3
+  )
+  try:
+    echo = next(tool for tool in tools if tool.name == 'echo')
+
+    results = await asyncio.gather(*[
+        echo.run_async(args={'text': str(i), 'delay': 0.2}, tool_context=None)
+        for i in range(9)
+    ])
+  finally:
+    await exit_stack.aclose()
+
+  assert [r.content[0].text.split(':')[1] for r in results] == [
+      str(i) for i in range(9)
+  ]
+  assert len({_pid(r) for r in results}) == 3
+
+
+@pytest.mark.asyncio
+async def test_list_tools_is_cached():
+  pool = MCPSessionPool(connection_params=_CONNECTION_PARAMS)
+  await pool.start()
+  try:
+    result = await pool.list_tools()
+    assert await pool.list_tools() is result
+
+    pool.list_tools_ttl = 0
+    pool._list_tools_expire_time = 0
+    assert await pool.list_tools() is not result
+  finally:
+    await pool.close()
+
+  assert [tool.name for tool in result.tools] == ['echo']
+
+
+@pytest.mark.asyncio
+async def test_crashed_connection_is_replaced_once():
+  pool = MCPSessionPool(connection_params=_CONNECTION_PARAMS, size=2)
+  await pool.start()
+  try:
+    old_pids = {
+        _pid(result)
+        for result in await asyncio.gather(*[
+            pool.call_tool('echo', {'text': 'a', 'delay': 0.2})
+            for _ in range(2)
+        ])
+    }
+    os.kill(int(old_pids.pop()), signal.SIGKILL)
+
+    results = await asyncio.gather(
+        *[pool.call_tool('echo', {'text': 'b', 'delay': 0.2}) for _ in range(6)]
+    )
+    new_pids = {_pid(result) for result in results}
+  finally:
+    await pool.close()
+
+  assert len(new_pids) == 2
+  assert old_pids < new_pids
+
+
+@pytest.mark.asyncio
+async def test_exited_server_is_reconnected_without_a_call():
+  pool = MCPSessionPool(connection_params=_CONNECTION_PARAMS)
+  await pool.start()
+  try:
+    connection = pool._connections[0]
+    old_pid = _pid(await pool.call_tool('echo', {'text': 'a'}))
+    os.kill(int(old_pid), signal.SIGKILL)
+
+    for _ in range(100):
+      if pool._connections[0] is not connection:
+        break
+      await asyncio.sleep(0.1)
+    assert pool._connections[0] is not connection
+    assert pool._connections[0].is_alive
+
+    new_pid = _pid(await pool.call_tool('echo', {'text': 'b'}))
+  finally:
+    await pool.close()
+
+  assert new_pid != old_pid
+
+
+@pytest.mark.asyncio
+async def test_check_health_replaces_dead_connection():
+  pool = MCPSessionPool(connection_params=_CONNECTION_PARAMS)
+  await pool.start()
+  try:
+    connection = pool._connections[0]
+    # Stops the connection without the pool noticing.
+    connection._stop.set()
+    await connection.task
+
+    await pool.check_health()
+
+    assert pool._connections[0] is not connection
+    result = await pool.call_tool('echo', {'text': 'a'})
+  finally:
+    await pool.close()
+
+  assert result.content[0].text.endswith(':a')
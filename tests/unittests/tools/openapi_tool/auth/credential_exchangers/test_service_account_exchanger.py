@@ -14,6 +14,8 @@
 
 """Unit tests for the service account credential exchanger."""
 
+import asyncio
+import datetime
 from unittest.mock import MagicMock
 
 from google.adk.auth.auth_credential import AuthCredential
@@ -22,6 +24,7 @@ from google.adk.auth.auth_credential import ServiceAccount
 from google.adk.auth.auth_credential import ServiceAccountCredential
 from google.adk.auth.auth_schemes import AuthScheme
 from google.adk.auth.auth_schemes import AuthSchemeType
+from google.adk.auth.credential_cache import CredentialCache
 from google.adk.tools.openapi_tool.auth.credential_exchangers.base_credential_exchanger import AuthCredentialMissingError
 from google.adk.tools.openapi_tool.auth.credential_exchangers.service_account_exchanger import ServiceAccountCredentialExchanger
 import google.auth
@@ -194,3 +197,98 @@ def test_exchange_credential_exchange_failure(
     service_account_exchanger.exchange_credential(auth_scheme, auth_credential)
   assert "Failed to exchange service account token" in str(exc_info.value)
   mock_from_service_account_info.assert_called_once()
+
+
+def _mock_default_credentials(
+    monkeypatch, expires_in=datetime.timedelta(hours=1)
+):
+  """Mocks the default credentials, issuing a new token on each refresh."""
+  mock_credentials = MagicMock()
+  mock_credentials.expiry = None
+
+  def refresh(request):
+    mock_credentials.token = f"token_{mock_credentials.refresh.call_count}"
+    mock_credentials.expiry = datetime.datetime.utcnow() + expires_in
+
+  mock_credentials.refresh = MagicMock(side_effect=refresh)
+  monkeypatch.setattr(
+      google.auth, "default", MagicMock(return_value=(mock_credentials, None))
+  )
+  return mock_credentials
+
+
+def _default_service_account_credential():
+  return AuthCredential(
+      auth_type=AuthCredentialTypes.SERVICE_ACCOUNT,
+      service_account=ServiceAccount(
+          use_default_credential=True,
+          scopes=["https://www.googleapis.com/auth/cloud-platform"],
+      ),
+  )
+
+
+def test_exchange_credential_caches_token_until_expiry(
+    auth_scheme, monkeypatch
+):
+  """Test that the token is fetched once while it's valid."""
+  mock_credentials = _mock_default_credentials(monkeypatch)
+  exchanger = ServiceAccountCredentialExchanger(
+      credential_cache=CredentialCache()
+  )
+
+  results = [
+      exchanger.exchange_credential(
+          auth_scheme, _default_service_account_credential()
+      )
+      for _ in range(3)
+  ]
+
+  assert [r.http.credentials.token for r in results] == ["token_1"] * 3
+  mock_credentials.refresh.assert_called_once()
+
+
+def test_exchange_credential_fetches_expired_token(auth_scheme, monkeypatch):
+  """Test that an expired token is fetched again."""
+  _mock_default_credentials(
+      monkeypatch, expires_in=-datetime.timedelta(seconds=1)
+  )
+  exchanger = ServiceAccountCredentialExchanger(
+      credential_cache=CredentialCache()
+  )
+
+  exchanger.exchange_credential(
+      auth_scheme, _default_service_account_credential()
+  )
+  result = exchanger.exchange_credential(
+      auth_scheme, _default_service_account_credential()
+  )
+
+  assert result.http.credentials.token == "token_2"
+
+
+@pytest.mark.asyncio
+async def test_exchange_credential_async(auth_scheme, monkeypatch):
+  """Test that concurrent async exchanges fetch one token."""
+  mock_credentials = _mock_default_credentials(monkeypatch)
+  exchanger = ServiceAccountCredentialExchanger(
+      credential_cache=CredentialCache()
+  )
+
+  results = await asyncio.gather(*[
+      exchanger.exchange_credential_async(
+          auth_scheme, _default_service_account_credential()
+      )
+      for _ in range(5)
+  ])
+
+  assert {r.http.credentials.token for r in results} == {"token_1"}
+  mock_credentials.refresh.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_exchange_credential_async_missing_auth_credential(
+    service_account_exchanger, auth_scheme
+):
+  """Test missing auth credential during async exchange."""
+  with pytest.raises(AuthCredentialMissingError):
+    await service_account_exchanger.exchange_credential_async(auth_scheme, None)
@@ -0,0 +1,154 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import threading
+import time
+from unittest import mock
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from fastapi.openapi.models import Operation
+from fastapi.openapi.models import Schema as OpenAPISchema
+from google.adk.tools.openapi_tool.common.common import ApiParameter
+from google.adk.tools.openapi_tool.openapi_spec_parser.http_client_pool import HttpClientConfig
+from google.adk.tools.openapi_tool.openapi_spec_parser.http_client_pool import HttpClientPool
+from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_spec_parser import OperationEndpoint
+from google.adk.tools.openapi_tool.openapi_spec_parser.operation_parser import OperationParser
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
+import pytest
+
+
+class _Handler(BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+  # Buffers each response into a single write.
+  wbufsize = -1
+
+  def do_GET(self):
+    self.server.client_ports.add(self.client_address[1])
+    url = urlsplit(self.path)
+    query = parse_qs(url.query)
+    if url.path == "/large":
+      body = b"x" * int(query["size"][0])
+      content_type = "text/plain"
+    elif url.path == "/error":
+      self.send_response(500)
+      self.send_header("Content-Length", "6")
+      self.end_headers()
+      self.wfile.write(b"broken")
+      return
+    else:
+      time.sleep(0.01)
+      body = json.dumps({"echo": query["value"][0]}).encode()
+      content_type = "application/json"
+    self.send_response(200)
+    self.send_header("Content-Type", content_type)
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, *args):
+    pass
+
+
+@pytest.fixture
+def server():
+  server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+  server.client_ports = set()
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  yield server
+  server.shutdown()
+  server.server_close()
+
+
+def _tool(server, path, http_client_pool):
+  tool = RestApiTool(
+      name="test_tool",
+      description="Test tool",
+      endpoint=OperationEndpoint(
+          base_url=f"http://127.0.0.1:{server.server_port}",
+          path=path,
+          method="GET",
+      ),
+      operation=Operation(operationId="testOperation"),
+      should_parse_operation=False,
+      http_client_pool=http_client_pool,
+  )
+  tool._operation_parser = mock.MagicMock(spec=OperationParser)
+  tool._operation_parser.get_parameters.return_value = [
+      ApiParameter(
+          original_name=name,
+          param_location="query",
+          param_schema=OpenAPISchema(type="string"),
+      )
+      for name in ("value", "size")
+  ]
+  return tool
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_reuse_bounded_connections(server):
+  pool = HttpClientPool(
+      HttpClientConfig(max_connections=4, max_keepalive_connections=4)
+  )
+  tool = _tool(server, "/echo", pool)
+
+  results = await asyncio.gather(*[
+      tool.run_async(args={"value": str(i)}, tool_context=None)
+      for i in range(50)
+  ])
+  await pool.close()
+
+  assert results == [{"echo": str(i)} for i in range(50)]
+  assert len(server.client_ports) <= 4
+
+
+@pytest.mark.asyncio
+async def test_large_response_is_truncated(server):
+  pool = HttpClientPool(HttpClientConfig(max_response_size=1000))
+  tool = _tool(server, "/large", pool)
+
+  result = await tool.run_async(args={"size": 100_000}, tool_context=None)
+  await pool.close()
+
+  assert result == {"text": "x" * 1000, "truncated": True}
+
+
+@pytest.mark.asyncio
+async def test_error_response(server):
+  pool = HttpClientPool()
+  tool = _tool(server, "/error", pool)
+
+  result = await tool.run_async(args={}, tool_context=None)
+  await pool.close()
+
+  assert result["error"].endswith("Execution Error: broken")
+
+
+@pytest.mark.asyncio
+async def test_get_client_is_shared_per_host():
+  pool = HttpClientPool()
+
+  client = pool.get_client("https://example.com/a")
+
+  assert pool.get_client("https://example.com/b?c=d") is client
+  assert pool.get_client("https://example.org/a") is not client
+  await pool.close()
+  assert client.is_closed
+  assert pool.get_client("https://example.com/a") is not client
+  await pool.close()
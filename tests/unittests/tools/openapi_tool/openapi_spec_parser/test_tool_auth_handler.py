@@ -22,12 +22,14 @@ from google.adk.auth.auth_credential import AuthCredentialTypes
 from google.adk.auth.auth_credential import HttpAuth
 from google.adk.auth.auth_credential import HttpCredentials
 from google.adk.auth.auth_credential import OAuth2Auth
+from google.adk.auth.auth_credential import ServiceAccount
 from google.adk.auth.auth_schemes import AuthScheme
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.sessions.session import Session
 from google.adk.tools.openapi_tool.auth.auth_helpers import openid_dict_to_scheme_credential
 from google.adk.tools.openapi_tool.auth.auth_helpers import token_to_scheme_credential
 from google.adk.tools.openapi_tool.auth.credential_exchangers.auto_auth_credential_exchanger import OAuth2CredentialExchanger
+from google.adk.tools.openapi_tool.auth.credential_exchangers.base_credential_exchanger import BaseAuthCredentialExchanger
 from google.adk.tools.openapi_tool.openapi_spec_parser.tool_auth_handler import ToolAuthHandler
 from google.adk.tools.openapi_tool.openapi_spec_parser.tool_auth_handler import ToolContextCredentialStore
 from google.adk.tools.tool_context import ToolContext
@@ -199,3 +201,89 @@ def test_openid_connect_existing_token(
   result = handler.prepare_auth_credentials()
   assert result.state == 'done'
   assert result.auth_credential == existing_credential
+
+
+@pytest.mark.asyncio
+async def test_openid_connect_with_auth_response_async(
+    openid_connect_scheme, openid_connect_credential, monkeypatch
+):
+  mock_exchanger = MockOpenIdConnectCredentialExchanger(
+      openid_connect_scheme,
+      openid_connect_credential,
+      'test_access_token',
+  )
+  tool_context = create_mock_tool_context()
+
+  mock_auth_handler = MagicMock()
+  mock_auth_handler.get_auth_response.return_value = AuthCredential(
+      auth_type=AuthCredentialTypes.OPEN_ID_CONNECT,
+      oauth2=OAuth2Auth(auth_response_uri='test_auth_response_uri'),
+  )
+  mock_auth_handler_path = 'google.adk.tools.tool_context.AuthHandler'
+  monkeypatch.setattr(
+      mock_auth_handler_path, lambda *args, **kwargs: mock_auth_handler
+  )
+
+  credential_store = ToolContextCredentialStore(tool_context=tool_context)
+  handler = ToolAuthHandler(
+      tool_context,
+      openid_connect_scheme,
+      openid_connect_credential,
+      credential_exchanger=mock_exchanger,
+      credential_store=credential_store,
+  )
+  result = await handler.prepare_auth_credentials_async()
+  assert result.state == 'done'
+  assert 'test_access_token' in result.auth_credential.http.credentials.token
+  stored_credential = credential_store.get_credential(
+      openid_connect_scheme, openid_connect_credential
+  )
+  assert stored_credential == result.auth_credential
+
+
+class MockServiceAccountCredentialExchanger(BaseAuthCredentialExchanger):
+
+  def __init__(self):
+    self.exchanges = 0
+
+  def exchange_credential(
+      self,
+      auth_scheme: AuthScheme,
+      auth_credential: Optional[AuthCredential] = None,
+  ) -> AuthCredential:
+    self.exchanges += 1
+    _, credential = token_to_scheme_credential(
+        'oauth2Token', 'header', 'bearer', f'token_{self.exchanges}'
+    )
+    return credential
+
+
+@pytest.mark.asyncio
+async def test_service_account_token_not_stored_in_state(
+    openid_connect_scheme,
+):
+  service_account_credential = AuthCredential(
+      auth_type=AuthCredentialTypes.SERVICE_ACCOUNT,
+      service_account=ServiceAccount(
+          use_default_credential=True,
+          scopes=['https://www.googleapis.com/auth/cloud-platform'],
+      ),
+  )
+  exchanger = MockServiceAccountCredentialExchanger()
+  tool_context = create_mock_tool_context()
+
+  for _ in range(2):
+    handler = ToolAuthHandler.from_tool_context(
+        tool_context,
+        openid_connect_scheme,
+        service_account_credential,
+        credential_exchanger=exchanger,
+    )
+    result = await handler.prepare_auth_credentials_async()
+    assert result.state == 'done'
+
+  # The token is exchanged (and cached by the real exchanger) each time, as
+  # the state doesn't know when it expires.
+  assert exchanger.exchanges == 2
+  assert result.auth_credential.http.credentials.token == 'token_2'
+  assert not tool_context.state.to_dict()
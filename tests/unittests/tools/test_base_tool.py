@@ -139,3 +139,32 @@ async def test_process_llm_request_with_builtin_tool_and_another_declaration():
 
   # function_declaration is added to existing types.Tool with function_declaration.
   assert llm_request.config.tools[1].function_declarations[1] == declaration
+
+
+class _ComparableTool(BaseTool):
+  """A tool that is not hashable, as it defines __eq__ without __hash__."""
+
+  def __init__(self):
+    super().__init__(name='test_tool', description='test_description')
+    self.builds = 0
+
+  def __eq__(self, other):
+    return isinstance(other, _ComparableTool) and self.name == other.name
+
+  def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+    return self._get_cached_declaration(self._build_declaration)
+
+  def _build_declaration(self) -> types.FunctionDeclaration:
+    self.builds += 1
+    return types.FunctionDeclaration(name=self.name)
+
+
+def test_get_cached_declaration_of_unhashable_tool():
+  tool = _ComparableTool()
+
+  declaration = tool._get_declaration()
+
+  assert tool._get_declaration() is declaration
+  assert tool.builds == 1
+  # The cache is per tool.
+  assert _ComparableTool()._get_declaration() is not declaration
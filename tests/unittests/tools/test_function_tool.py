@@ -12,9 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import threading
 from unittest.mock import MagicMock
 
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import Agent
+from google.adk.agents.run_config import RunConfig
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session
+from google.adk.tools import function_tool
 from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.function_tool import ToolExecutionMode
+from google.adk.tools.tool_context import ToolContext
+from google.adk.tools.transfer_to_agent_tool import transfer_to_agent
 import pytest
 
 
@@ -65,6 +76,18 @@ def function_for_testing_with_4_arg_and_no_tool_context(arg1, arg2, arg3, arg4):
   pass
 
 
+def function_for_testing_thread_and_process():
+  """Function for testing which thread and process it runs in."""
+  return {"thread": threading.get_ident(), "pid": os.getpid()}
+
+
+def _tool_context(agent_mode=None):
+  tool_context = MagicMock()
+  tool_context._invocation_context.run_config = RunConfig()
+  tool_context._invocation_context.agent.tool_execution_mode = agent_mode
+  return tool_context
+
+
 def test_init():
   """Test that the FunctionTool is initialized correctly."""
   tool = FunctionTool(function_for_testing_with_no_args)
@@ -236,3 +259,127 @@ async def test_run_async_with_optional_args_not_set_async_func():
   args = {"arg1": "test_value_1", "arg3": "test_value_3"}
   result = await tool.run_async(args=args, tool_context=MagicMock())
   assert result == "test_value_1,test_value_3"
+
+
+@pytest.mark.asyncio
+async def test_run_async_sync_func_inline_by_default():
+  """Test that a sync function runs in the event loop thread by default."""
+  tool = FunctionTool(function_for_testing_thread_and_process)
+  result = await tool.run_async(args={}, tool_context=_tool_context())
+  assert result["thread"] == threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_run_async_sync_func_in_thread():
+  """Test that a sync function runs in a worker thread in THREAD mode."""
+  tool = FunctionTool(
+      function_for_testing_thread_and_process,
+      execution_mode=ToolExecutionMode.THREAD,
+  )
+  result = await tool.run_async(args={}, tool_context=_tool_context())
+  assert result["thread"] != threading.get_ident()
+  assert result["pid"] == os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_run_async_sync_func_uses_agent_execution_mode():
+  """Test that the agent's tool_execution_mode applies to tools without one."""
+  tool = FunctionTool(function_for_testing_thread_and_process)
+  result = await tool.run_async(
+      args={}, tool_context=_tool_context(ToolExecutionMode.THREAD)
+  )
+  assert result["thread"] != threading.get_ident()
+
+  tool = FunctionTool(
+      function_for_testing_thread_and_process,
+      execution_mode=ToolExecutionMode.INLINE,
+  )
+  result = await tool.run_async(
+      args={}, tool_context=_tool_context(ToolExecutionMode.THREAD)
+  )
+  assert result["thread"] == threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_run_async_sync_func_in_process():
+  """Test that a sync function runs in a worker process in PROCESS mode."""
+  tool = FunctionTool(
+      function_for_testing_thread_and_process,
+      execution_mode=ToolExecutionMode.PROCESS,
+  )
+  result = await tool.run_async(args={}, tool_context=_tool_context())
+  assert result["pid"] != os.getpid()
+
+
+def test_process_pool_spawns_its_workers():
+  """Test that the worker processes aren't forked from a threaded process."""
+  executor = function_tool._get_executor(ToolExecutionMode.PROCESS, None)
+  assert executor._mp_context.get_start_method() == "spawn"
+
+
+def test_executor_of_another_pool_size_replaces_the_previous_one():
+  """Test that changing the pool size doesn't leak the previous pool."""
+  executor = function_tool._get_executor(ToolExecutionMode.THREAD, 2)
+  assert function_tool._get_executor(ToolExecutionMode.THREAD, 2) is executor
+
+  new_executor = function_tool._get_executor(ToolExecutionMode.THREAD, 3)
+
+  assert new_executor is not executor
+  assert executor._shutdown
+  assert function_tool._executors[ToolExecutionMode.THREAD] == (new_executor, 3)
+
+
+def test_process_mode_rejects_tool_context():
+  """Test that a function taking tool_context can't run in PROCESS mode."""
+  with pytest.raises(ValueError):
+    FunctionTool(
+        function_for_testing_with_1_arg_and_tool_context,
+        execution_mode=ToolExecutionMode.PROCESS,
+    )
+
+
+@pytest.mark.asyncio
+async def test_agent_process_mode_runs_tool_context_func_in_thread():
+  """Test that a function taking tool_context keeps its changes to it."""
+  agent = Agent(name="agent", tool_execution_mode=ToolExecutionMode.PROCESS)
+  tool_context = ToolContext(
+      InvocationContext(
+          invocation_id="invocation_id",
+          agent=agent,
+          session=Session(app_name="app", user_id="user", id="session"),
+          session_service=InMemorySessionService(),
+          run_config=RunConfig(),
+      )
+  )
+  tool = FunctionTool(transfer_to_agent)
+
+  await tool.run_async(
+      args={"agent_name": "other_agent"}, tool_context=tool_context
+  )
+
+  assert tool_context.actions.transfer_to_agent == "other_agent"
+
+
+def test_signature_is_cached():
+  """Test that the signature and mandatory args are only computed once."""
+  tool = FunctionTool(function_for_testing_with_2_arg_and_no_tool_context)
+  assert tool._get_mandatory_args() == ["arg1", "arg2"]
+  assert tool._signature is tool._signature
+  assert tool._get_mandatory_args() is tool._get_mandatory_args()
+
+
+def test_get_declaration_is_cached_per_api_variant(monkeypatch):
+  def get_weather(city: str) -> str:
+    return city
+
+  tool = FunctionTool(get_weather)
+
+  monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "1")
+  vertex_declaration = tool._get_declaration()
+  monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "0")
+  gemini_declaration = tool._get_declaration()
+
+  assert tool._get_declaration() is gemini_declaration
+  assert vertex_declaration is not gemini_declaration
+  monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "1")
+  assert tool._get_declaration() is vertex_declaration